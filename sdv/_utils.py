@@ -1,14 +1,18 @@
 """Miscellaneous utility functions."""
 
+import contextlib
 import inspect
 import operator
+import os
 import uuid
 import warnings
 from collections import defaultdict
 from collections.abc import Iterable
 from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_float, is_integer
 from pandas.core.tools.datetimes import _guess_datetime_format_for_array
@@ -24,6 +28,7 @@ except ImportError:
 
 
 MODELABLE_SDTYPES = ['categorical', 'numerical', 'datetime', 'boolean']
+PRECISIONS = ('float64', 'float32')
 
 
 def _cast_to_iterable(value):
@@ -513,3 +518,147 @@ def _validate_correct_synthesizer_loading(synthesizer, cls):
             f"but got '{synthesizer_name}'. Please ensure you are loading the correct "
             f'synthesizer type.'
         )
+
+
+def _validate_n_jobs(n_jobs):
+    """Validate the ``n_jobs`` parameter and return the number of processes to use.
+
+    Args:
+        n_jobs (int or None):
+            Number of processes to use. ``None`` and ``1`` mean no parallelism and negative
+            values count backwards from the number of CPUs, so ``-1`` uses all of them.
+
+    Returns:
+        int:
+            The number of processes to use.
+    """
+    if n_jobs is None:
+        return 1
+
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int) or n_jobs == 0:
+        raise SynthesizerInputError(
+            f"Invalid value '{n_jobs}' for parameter 'n_jobs'. Please provide a positive "
+            'integer, or a negative integer to use all the CPUs but (n_jobs + 1) of them.'
+        )
+
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+
+    return n_jobs
+
+
+def _validate_precision(precision):
+    """Validate the ``precision`` parameter.
+
+    Args:
+        precision (str):
+            The float precision, either ``'float64'`` or ``'float32'``.
+    """
+    if precision not in PRECISIONS:
+        raise SynthesizerInputError(
+            f"Invalid value '{precision}' for parameter 'precision'. Please provide one of "
+            f'{list(PRECISIONS)}.'
+        )
+
+
+def _cast_float_columns(data, source_dtype, target_dtype):
+    """Cast the columns of a dataframe that have one float dtype to another one.
+
+    Args:
+        data (pandas.DataFrame):
+            Data to cast.
+        source_dtype (str):
+            The dtype of the columns to cast.
+        target_dtype (str):
+            The dtype to cast them to.
+
+    Returns:
+        pandas.DataFrame:
+            The data with the columns cast, or the same data if there is nothing to cast.
+    """
+    if source_dtype == target_dtype:
+        return data
+
+    columns = [column for column, dtype in data.dtypes.items() if dtype == source_dtype]
+    if not columns:
+        return data
+
+    return data.astype(dict.fromkeys(columns, target_dtype))
+
+
+@contextlib.contextmanager
+def _share_dataframe(data):
+    """Copy the numerical columns of a ``pandas.DataFrame`` to shared memory.
+
+    The yielded description can be sent to other processes, which read the data with
+    ``_read_shared_dataframe`` without copying the numerical columns. The other columns are
+    part of the description, so they are copied to every process. The shared memory is
+    released when leaving the context.
+
+    Args:
+        data (pandas.DataFrame):
+            The data to share. Its index is not shared.
+
+    Yields:
+        dict:
+            The description of the shared data.
+    """
+    shared_memories = []
+    columns = []
+    try:
+        for column, column_data in data.items():
+            dtype = column_data.dtype
+            if not isinstance(dtype, np.dtype) or dtype.kind not in 'biuf':
+                columns.append((column, None, column_data.reset_index(drop=True)))
+                continue
+
+            values = column_data.to_numpy()
+            shared_memory = SharedMemory(create=True, size=max(values.nbytes, 1))
+            shared_memories.append(shared_memory)
+            np.ndarray(values.shape, dtype=dtype, buffer=shared_memory.buf)[:] = values
+            columns.append((column, shared_memory.name, dtype.str))
+
+        yield {'num_rows': len(data), 'columns': columns}
+
+    finally:
+        for shared_memory in shared_memories:
+            shared_memory.close()
+            shared_memory.unlink()
+
+
+@contextlib.contextmanager
+def _read_shared_dataframe(description):
+    """Read a ``pandas.DataFrame`` shared by ``_share_dataframe``.
+
+    The numerical columns of the yielded data are backed by the shared memory, so they must
+    not be modified or used after leaving the context.
+
+    Args:
+        description (dict):
+            The description of the shared data.
+
+    Yields:
+        pandas.DataFrame:
+            The shared data, with a ``RangeIndex``.
+    """
+    shared_memories = []
+    columns = {}
+    try:
+        for column, name, values in description['columns']:
+            if name is not None:
+                shared_memory = SharedMemory(name=name)
+                shared_memories.append(shared_memory)
+                values = np.ndarray(
+                    description['num_rows'], dtype=np.dtype(values), buffer=shared_memory.buf
+                )
+
+            columns[column] = values
+
+        yield pd.DataFrame(columns, copy=False)
+
+    finally:
+        columns.clear()
+        for shared_memory in shared_memories:
+            with contextlib.suppress(BufferError):
+                # The memory is released once the arrays that still use it are collected
+                shared_memory.close()
@@ -249,10 +249,16 @@ class BaseConstraint:
                 for column in self._original_data_columns[table_name]
                 if column in table.columns
             ]
-            dtypes = {col: self._dtypes[table_name][col] for col in valid_columns}
+            # Only the columns whose dtype changed are cast, so that categorical and arrow
+            # columns that were already restored are not copied again.
+            dtypes = {
+                col: self._dtypes[table_name][col]
+                for col in valid_columns
+                if table[col].dtype != self._dtypes[table_name][col]
+            }
             table = table[valid_columns]
             try:
-                reverse_transformed[table_name] = table.astype(dtypes)
+                reverse_transformed[table_name] = table.astype(dtypes) if dtypes else table
             except pd.errors.IntCastingNaNError:
                 # iterate over the columns and cast individually
                 self._table_as_type_by_col(reverse_transformed, table, table_name)
@@ -2,10 +2,16 @@
 
 import json
 import logging
+import math
+import numbers
 import warnings
+import weakref
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import rdt
 from pandas.api.types import is_float_dtype, is_integer_dtype
@@ -13,19 +19,64 @@ from pandas.errors import IntCastingNaNError
 from rdt.transformers import AnonymizedFaker, get_default_transformers
 from rdt.transformers.pii.anonymization import get_anonymized_transformer
 
-from sdv._utils import MODELABLE_SDTYPES, _get_transformer_init_kwargs
+from sdv._utils import (
+    MODELABLE_SDTYPES,
+    _cast_float_columns,
+    _get_transformer_init_kwargs,
+    _validate_n_jobs,
+    _validate_precision,
+)
 from sdv.constraints import Constraint
 from sdv.constraints.base import get_subclasses
 from sdv.data_processing.datetime_formatter import DatetimeFormatter
 from sdv.data_processing.errors import InvalidConstraintsError, NotFittedError
 from sdv.data_processing.numerical_formatter import NumericalFormatter
+from sdv.data_processing.transform_cache import TransformCache, get_memory_size
 from sdv.data_processing.utils import load_module_from_path
 from sdv.errors import SynthesizerInputError
 from sdv.metadata.single_table import SingleTableMetadata
+from sdv.sampling.profiling import profile_stage
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _get_field_columns(field):
+    """Get the columns of a field, which is a column or a tuple of columns."""
+    return list(field) if isinstance(field, tuple) else [field]
+
+
+def _get_bounds_arrays(formatters, dtype):
+    """Get the lower and upper bounds of the given formatters as arrays of the given dtype.
+
+    Missing bounds are replaced with the widest values of the dtype.
+
+    Args:
+        formatters (list[NumericalFormatter]):
+            The numerical formatters.
+        dtype (numpy.dtype):
+            The numerical dtype of the arrays.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]:
+            The lower and upper bounds.
+    """
+    if dtype.kind == 'f':
+        min_value, max_value = -np.inf, np.inf
+    else:
+        min_value, max_value = np.iinfo(dtype).min, np.iinfo(dtype).max
+
+    lower_bounds = []
+    upper_bounds = []
+    for formatter in formatters:
+        lower, upper = formatter.get_bounds()
+        lower = min_value if lower is None or pd.isna(lower) else max(lower, min_value)
+        upper = max_value if upper is None or pd.isna(upper) else min(upper, max_value)
+        lower_bounds.append(lower)
+        upper_bounds.append(upper)
+
+    return np.array(lower_bounds, dtype=dtype), np.array(upper_bounds, dtype=dtype)
+
+
 class DataProcessor:
     """Single table data processor.
 
@@ -58,6 +109,20 @@ class DataProcessor:
         id_columns_use_old_behavior (list):
             List of ID column names that should use the old behavior instead of automatically
             getting assigned UniformEncoder. Defaults to None.
+        n_jobs (int or None):
+            Number of processes used to fit the formatters and to create the configuration of
+            the ``rdt.HyperTransformer``, which are learned per column. Negative values count
+            backwards from the number of CPUs. The learned state does not depend on it.
+            Defaults to ``None``, which does not use any parallelism.
+        precision (str):
+            The dtype of the float columns returned by ``transform``, either ``'float64'`` or
+            ``'float32'``. The data given to ``reverse_transform`` is cast back to ``float64``
+            before being reverse transformed. Defaults to ``'float64'``.
+
+    If enabled with ``set_transform_cache_size``, the fitted formatters and transformers of
+    every column, and the transformed columns, are kept in a ``TransformCache`` looked up by
+    the content of the data, so that fitting again only fits and transforms the columns whose
+    data or transformer changed.
     """
 
     _DTYPE_TO_SDTYPE = {
@@ -111,7 +176,10 @@ class DataProcessor:
         table_name=None,
         locales=['en_US'],
         id_columns_use_old_behavior=None,
+        n_jobs=None,
+        precision='float64',
     ):
+        _validate_precision(precision)
         self.metadata = metadata
         self._enforce_rounding = enforce_rounding
         self._enforce_min_max_values = enforce_min_max_values
@@ -130,6 +198,8 @@ class DataProcessor:
         self.grouped_columns_to_transformers = self._detect_multi_column_transformers()
         self._update_numerical_transformer(enforce_rounding, enforce_min_max_values)
         self._hyper_transformer = rdt.HyperTransformer()
+        self._field_hyper_transformers = None
+        self._field_input_columns = None
         self.table_name = table_name or ''
         self._dtypes = None
         self.fitted = False
@@ -137,6 +207,11 @@ class DataProcessor:
         self._primary_key = self.metadata.primary_key
         self._warned_overflow = False
         self._prepared_for_fitting = False
+        self._sampling_profiler = None
+        self._sampling_plan = None
+        self._n_jobs = _validate_n_jobs(n_jobs)
+        self._precision = precision
+        self._transform_cache = TransformCache()
         self._keys = deepcopy(self.metadata.alternate_keys)
         if self._primary_key:
             self._keys.append(self._primary_key)
@@ -743,6 +818,50 @@ class DataProcessor:
 
         return self._get_fallback_column_config(column, data)
 
+    def _map_column_chunks(self, method, data, columns):
+        """Call a method on chunks of the given columns in a pool of ``n_jobs`` processes.
+
+        The columns are split in up to ``n_jobs`` contiguous chunks, so the results can be
+        merged in the same order as if the method had been called on all the columns at once.
+
+        Args:
+            method (callable):
+                Method that takes a ``pandas.DataFrame`` and a list of its columns.
+            data (pandas.DataFrame):
+                The input data.
+            columns (list):
+                The columns to split in chunks.
+
+        Returns:
+            list:
+                The results of the method for each chunk, in the order of the columns.
+        """
+        n_jobs = min(getattr(self, '_n_jobs', 1), len(columns))
+        if n_jobs <= 1:
+            return [method(data, columns)]
+
+        chunk_size = math.ceil(len(columns) / n_jobs)
+        chunks = [
+            columns[start : start + chunk_size] for start in range(0, len(columns), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            return list(executor.map(method, [data[chunk] for chunk in chunks], chunks))
+
+    def _get_columns_config(self, data, columns):
+        """Get the configuration (sdtype and transformer) for each of the given columns.
+
+        Args:
+            data (pandas.DataFrame):
+                The input data.
+            columns (list):
+                Column names.
+
+        Returns:
+            dict:
+                Mapping of each column name to its (sdtype, transformer) tuple.
+        """
+        return {column: self._get_column_config(column, data) for column in columns}
+
     def _create_config(self, data):
         """Create a configuration for the HyperTransformer.
 
@@ -756,8 +875,13 @@ class DataProcessor:
         """
         sdtypes = {}
         transformers = {}
-        for column in set(data.columns):
-            sdtypes[column], transformer = self._get_column_config(column, data)
+        columns = list(set(data.columns))
+        columns_config = {}
+        for chunk_config in self._map_column_chunks(self._get_columns_config, data, columns):
+            columns_config.update(chunk_config)
+
+        for column in columns:
+            sdtypes[column], transformer = columns_config[column]
             if column not in self._get_grouped_columns():
                 transformers[column] = transformer
 
@@ -790,45 +914,427 @@ class DataProcessor:
             warnings.filterwarnings('ignore', module='rdt.hyper_transformer')
             self._hyper_transformer.update_transformers(column_name_to_transformer)
 
+        self._field_hyper_transformers = None
         self.grouped_columns_to_transformers = {
             col_tuple: transformer
             for col_tuple, transformer in self._hyper_transformer.field_transformers.items()
             if isinstance(col_tuple, tuple)
         }
 
+    def _get_transform_cache(self):
+        """Get the ``TransformCache`` of the data processor, creating it if it does not exist."""
+        if getattr(self, '_transform_cache', None) is None:
+            self._transform_cache = TransformCache()
+
+        return self._transform_cache
+
+    def clear_transform_cache(self):
+        """Remove the cached formatters, transformers and transformed data."""
+        self._get_transform_cache().clear()
+
+    def set_transform_cache_size(self, max_size):
+        """Set the maximum memory used by the cached transformations.
+
+        The cache is disabled by default. When enabled, every column of the fitted data is
+        hashed on each call, and the cached data stays in memory until it is evicted.
+
+        Args:
+            max_size (int):
+                Maximum memory, in bytes, used by the cached transformations. ``0`` disables
+                the cache.
+        """
+        self._get_transform_cache().set_max_size(max_size)
+
+    def _get_fields(self, data):
+        """Get the fields of the ``rdt.HyperTransformer`` in the order in which they are fitted.
+
+        A field is either a column or the tuple of columns of a multi-column transformer.
+        """
+        column_to_field = {}
+        for field in self._hyper_transformer.field_transformers:
+            if isinstance(field, tuple):
+                column_to_field.update(dict.fromkeys(field, field))
+
+        return list(dict.fromkeys(column_to_field.get(column, column) for column in data))
+
+    def _get_field_key(self, field, fingerprints):
+        """Get the cache key of the fitted transformers of a field and its transformed data.
+
+        Args:
+            field (str or tuple):
+                The column, or columns, of the field.
+            fingerprints (dict):
+                The fingerprint of each column of the data.
+
+        Returns:
+            tuple or None:
+                The key, or ``None`` if any of the columns could not be fingerprinted.
+        """
+        columns = _get_field_columns(field)
+        column_fingerprints = tuple(fingerprints.get(column) for column in columns)
+        if None in column_fingerprints:
+            return None
+
+        field_sdtypes = self._hyper_transformer.field_sdtypes
+        transformer = self._hyper_transformer.field_transformers[field]
+        transformer_class = type(transformer)
+        return (
+            'transformer',
+            field,
+            tuple(field_sdtypes[column] for column in columns),
+            transformer_class.__module__,
+            transformer_class.__qualname__,
+            repr(transformer),
+            column_fingerprints,
+        )
+
+    def _fit_field(self, data, field):
+        """Fit a new ``rdt.HyperTransformer`` to a single field of the data.
+
+        Args:
+            data (pandas.DataFrame):
+                The data to fit.
+            field (str or tuple):
+                The column, or columns, of the field.
+
+        Returns:
+            tuple:
+                A copy of the fitted ``rdt.HyperTransformer``, the transformed data of the
+                field and the ``rdt.HyperTransformer`` after transforming it.
+        """
+        columns = _get_field_columns(field)
+        field_sdtypes = self._hyper_transformer.field_sdtypes
+        hyper_transformer = rdt.HyperTransformer()
+        hyper_transformer.set_config({
+            'sdtypes': {column: field_sdtypes[column] for column in columns},
+            'transformers': {field: self._hyper_transformer.field_transformers[field]},
+        })
+        field_data = data[columns]
+        hyper_transformer.fit(field_data)
+        fitted = deepcopy(hyper_transformer)
+        return fitted, hyper_transformer.transform(field_data), hyper_transformer
+
+    def _set_field_hyper_transformer(self, index, hyper_transformer):
+        """Use the given fitted ``rdt.HyperTransformer`` for the field at the given index.
+
+        The transformer of the field in the configuration of the ``rdt.HyperTransformer`` of
+        the table is replaced with the fitted one, as fitting the table would do.
+        """
+        field, output_columns, _ = self._field_hyper_transformers[index]
+        self._field_hyper_transformers[index] = (field, output_columns, hyper_transformer)
+        transformer = hyper_transformer.field_transformers[field]
+        self._hyper_transformer.field_transformers[field] = transformer
+        if field in self.grouped_columns_to_transformers:
+            self.grouped_columns_to_transformers[field] = transformer
+
     def _fit_hyper_transformer(self, data):
-        """Create and return a new ``rdt.HyperTransformer`` instance.
+        """Fit the ``rdt.HyperTransformer`` to the data.
 
-        First get the ``dtypes`` and then use them to build a transformer dictionary
-        to be used by the ``HyperTransformer``.
+        If the cache is enabled, every field is fitted by its own ``rdt.HyperTransformer``
+        instead, and the data is transformed by combining them as ``transform_subset`` does.
+        The fitted ``rdt.HyperTransformer`` of each field is cached with its transformed data,
+        looked up by the data, sdtype and transformer of the field, so that fitting again only
+        fits the fields that changed, and ``transform`` reuses the transformed data of the
+        fitted data. If the output columns of a field clash with other columns, which the
+        transformers solve by renaming them, the ``rdt.HyperTransformer`` of the table is
+        fitted on all the data instead.
+
+        Args:
+            data (pandas.DataFrame):
+                Data to fit.
+        """
+        self._field_hyper_transformers = None
+        cache = self._get_transform_cache()
+        cache.last_fit = None
+        fingerprints = cache.get_fingerprints(data)
+        if not fingerprints or set(data.columns) != set(self._hyper_transformer.field_sdtypes):
+            self._hyper_transformer.fit(data)
+            return
+
+        entries = []
+        data_columns = set(data.columns)
+        for field in self._get_fields(data):
+            key = self._get_field_key(field, fingerprints)
+            entry = cache.get(key)
+            if entry is None:
+                entry = self._fit_field(data, field)
+                cache.set(key, entry, get_memory_size(entry[1]))
+
+            columns = set(_get_field_columns(field))
+            other_columns = data_columns - columns
+            output_columns = set(entry[1].columns)
+            if not other_columns.isdisjoint(output_columns - columns):
+                self._hyper_transformer.fit(data)
+                return
+
+            data_columns = other_columns | output_columns
+            entries.append((field, entry))
+
+        self._field_hyper_transformers = [
+            (field, list(output.columns), None) for field, (_, output, _) in entries
+        ]
+        self._field_input_columns = list(data.columns)
+        for index, (_, (fitted, _, _)) in enumerate(entries):
+            self._set_field_hyper_transformer(index, deepcopy(fitted))
+
+        fitted_outputs = [entry[1:] for _, entry in entries]
+        cache.last_fit = (weakref.ref(data), fitted_outputs)
+
+    def _get_input_columns(self):
+        """Get the columns that the transformers were fitted on."""
+        if getattr(self, '_field_hyper_transformers', None) is None:
+            return self._hyper_transformer._input_columns
+
+        return self._field_input_columns
+
+    def _get_output_columns(self):
+        """Get the columns returned by the fitted transformers."""
+        if getattr(self, '_field_hyper_transformers', None) is None:
+            return self._hyper_transformer._output_columns
+
+        return [
+            column
+            for _, output_columns, _ in self._field_hyper_transformers
+            for column in output_columns
+        ]
+
+    def _transform_fields(self, data, fitted_outputs=None):
+        """Transform the data with the ``rdt.HyperTransformer`` of every field.
 
         Args:
             data (pandas.DataFrame):
                 Data to transform.
+            fitted_outputs (list or None):
+                The transformed data of every field and its ``rdt.HyperTransformer`` after
+                transforming it, if the data is the one that was just fitted. Defaults to
+                ``None``.
 
         Returns:
-            rdt.HyperTransformer
+            pandas.DataFrame:
+                The transformed data, as ``rdt.HyperTransformer.transform_subset`` returns it.
         """
-        self._hyper_transformer.fit(data)
+        unknown_columns = set(data.columns) - set(self._field_input_columns)
+        if unknown_columns:
+            raise rdt.errors.InvalidDataError(
+                'Unexpected column names in the data you are trying to transform: '
+                f"{sorted(unknown_columns)}. Use 'get_config()' to see the acceptable column "
+                'names.'
+            )
 
-    def _fit_formatters(self, data):
-        """Fit ``NumericalFormatter`` and ``DatetimeFormatter`` for each column in the data."""
-        for column_name in data:
+        outputs = []
+        for index, (field, _, hyper_transformer) in enumerate(self._field_hyper_transformers):
+            columns = [column for column in _get_field_columns(field) if column in data.columns]
+            if not columns:
+                continue
+
+            if fitted_outputs is not None and columns == _get_field_columns(field):
+                output, transformed = fitted_outputs[index]
+                output = output.copy(deep=False)
+                output.index = data.index
+                self._set_field_hyper_transformer(index, deepcopy(transformed))
+            else:
+                output = hyper_transformer.transform_subset(data[columns])
+
+            outputs.append(output)
+
+        if not outputs:
+            return pd.DataFrame(index=data.index)
+
+        return pd.concat(outputs, axis=1)
+
+    def _reverse_transform_fields(self, data):
+        """Reverse transform the data with the ``rdt.HyperTransformer`` of every field.
+
+        Args:
+            data (pandas.DataFrame):
+                Data to reverse transform.
+
+        Returns:
+            pandas.DataFrame:
+                The reversed data, as ``rdt.HyperTransformer.reverse_transform_subset``
+                returns it.
+        """
+        reversed_fields = []
+        for _, output_columns, hyper_transformer in self._field_hyper_transformers:
+            columns = [column for column in output_columns if column in data.columns]
+            if columns:
+                reversed_fields.append(hyper_transformer.reverse_transform_subset(data[columns]))
+
+        reversed_data = pd.DataFrame(index=data.index)
+        if reversed_fields:
+            reversed_data = pd.concat(reversed_fields, axis=1)
+
+        input_columns = [
+            column for column in self._field_input_columns if column in reversed_data.columns
+        ]
+        return reversed_data[input_columns]
+
+    def _create_anonymized_columns(self, num_rows, column_names):
+        """Create the anonymized columns with the fitted transformers.
+
+        Args:
+            num_rows (int):
+                Number of rows to create.
+            column_names (list):
+                Names of the columns to create.
+
+        Returns:
+            pandas.DataFrame:
+                A DataFrame with the created columns.
+        """
+        if getattr(self, '_field_hyper_transformers', None) is None:
+            return self._hyper_transformer.create_anonymized_columns(
+                num_rows=num_rows, column_names=column_names
+            )
+
+        generated = []
+        for field, _, hyper_transformer in self._field_hyper_transformers:
+            columns = [column for column in _get_field_columns(field) if column in column_names]
+            if columns:
+                generated.append(
+                    hyper_transformer.create_anonymized_columns(
+                        num_rows=num_rows, column_names=columns
+                    )
+                )
+
+        if not generated:
+            return pd.DataFrame(index=range(num_rows))
+
+        return pd.concat(generated, axis=1)
+
+    def _get_formatters(self, data, columns):
+        """Get the fitted formatters of the given columns.
+
+        Args:
+            data (pandas.DataFrame):
+                The input data.
+            columns (list):
+                Column names.
+
+        Returns:
+            dict:
+                Mapping of the column names that need a formatter to the fitted formatter.
+        """
+        formatters = {}
+        for column_name in columns:
             column_metadata = self.metadata.columns.get(column_name)
             sdtype = column_metadata.get('sdtype')
             if sdtype == 'numerical' and column_name != self._primary_key:
                 representation = column_metadata.get('computer_representation', 'Float')
-                self.formatters[column_name] = NumericalFormatter(
+                formatters[column_name] = NumericalFormatter(
                     enforce_rounding=self._enforce_rounding,
                     enforce_min_max_values=self._enforce_min_max_values,
                     computer_representation=representation,
                 )
-                self.formatters[column_name].learn_format(data[column_name])
+                formatters[column_name].learn_format(data[column_name])
 
             elif sdtype == 'datetime' and column_name != self._primary_key:
                 datetime_format = column_metadata.get('datetime_format')
-                self.formatters[column_name] = DatetimeFormatter(datetime_format=datetime_format)
-                self.formatters[column_name].learn_format(data[column_name])
+                formatters[column_name] = DatetimeFormatter(datetime_format=datetime_format)
+                formatters[column_name].learn_format(data[column_name])
+
+        return formatters
+
+    def update_numerical_formats(self, chunk, formatters):
+        """Update the numerical formats learned from the previous chunks of the data.
+
+        Args:
+            chunk (pandas.DataFrame):
+                Chunk of the table data.
+            formatters (dict):
+                Mapping of the numerical column names to the ``NumericalFormatter`` learned
+                from the previous chunks, which is updated in place.
+
+        Returns:
+            dict:
+                The updated formatters.
+        """
+        for column_name in chunk:
+            column_metadata = self.metadata.columns.get(column_name, {})
+            if column_metadata.get('sdtype') != 'numerical' or column_name == self._primary_key:
+                continue
+
+            if column_name not in formatters:
+                formatters[column_name] = NumericalFormatter(
+                    enforce_rounding=self._enforce_rounding,
+                    enforce_min_max_values=self._enforce_min_max_values,
+                    computer_representation=column_metadata.get('computer_representation', 'Float'),
+                )
+
+            formatters[column_name].update_format(chunk[column_name])
+
+        return formatters
+
+    def set_numerical_formats(self, formatters):
+        """Replace the learned numerical formats with the given ones.
+
+        The min and max values and the rounding digits of the fitted ``NumericalFormatter``
+        and ``rdt.transformers.FloatFormatter`` of each column are replaced with the ones of
+        the given formatters.
+
+        Args:
+            formatters (dict):
+                Mapping of the numerical column names to their ``NumericalFormatter``.
+        """
+        field_transformers = self._hyper_transformer.field_transformers
+        for column_name, formatter in formatters.items():
+            learned = [self.formatters.get(column_name), field_transformers.get(column_name)]
+            for learned_format in learned:
+                if isinstance(learned_format, NumericalFormatter):
+                    enforce_rounding = learned_format.enforce_rounding
+                elif isinstance(learned_format, rdt.transformers.FloatFormatter):
+                    enforce_rounding = learned_format.learn_rounding_scheme
+                else:
+                    continue
+
+                if learned_format.enforce_min_max_values:
+                    learned_format._min_value = formatter._min_value
+                    learned_format._max_value = formatter._max_value
+
+                if enforce_rounding:
+                    learned_format._rounding_digits = formatter._rounding_digits
+
+    def _get_formatter_key(self, column, fingerprint):
+        if fingerprint is None:
+            return None
+
+        column_metadata = self.metadata.columns.get(column, {})
+        return (
+            'formatter',
+            column,
+            repr(sorted(column_metadata.items())),
+            column == self._primary_key,
+            self._enforce_rounding,
+            self._enforce_min_max_values,
+            fingerprint,
+        )
+
+    def _fit_formatters(self, data):
+        """Fit ``NumericalFormatter`` and ``DatetimeFormatter`` for each column in the data.
+
+        The formatters of the columns whose data did not change since they were cached are
+        taken from the cache.
+        """
+        cache = self._get_transform_cache()
+        fingerprints = cache.get_fingerprints(data)
+        keys = {}
+        formatters = {}
+        for column in data.columns:
+            keys[column] = self._get_formatter_key(column, fingerprints.get(column))
+            cached = cache.get(keys[column])
+            if cached is not None:
+                formatters[column] = deepcopy(cached[0])
+
+        columns = [column for column in data.columns if column not in formatters]
+        for chunk_formatters in self._map_column_chunks(self._get_formatters, data, columns):
+            formatters.update(chunk_formatters)
+
+        for column in columns:
+            cache.set(keys[column], (deepcopy(formatters.get(column)),))
+
+        for column in data.columns:
+            if formatters.get(column) is not None:
+                self.formatters[column] = formatters[column]
 
     def prepare_for_fitting(self, data):
         """Prepare the ``DataProcessor`` for fitting.
@@ -845,6 +1351,7 @@ class DataProcessor:
         if not self._prepared_for_fitting:
             LOGGER.info(f'Fitting table {self.table_name} metadata')
             self._dtypes = data[list(data.columns)].dtypes
+            self._sampling_plan = None
 
             self.formatters = {}
             LOGGER.info(f'Fitting formatters for table {self.table_name}')
@@ -873,15 +1380,39 @@ class DataProcessor:
         if data.empty:
             raise ValueError('The fit dataframe is empty, synthesizer will not be fitted.')
         self._prepared_for_fitting = False
-        self.prepare_for_fitting(data)
-        LOGGER.info(f'Fitting HyperTransformer for table {self.table_name}')
-        self._fit_hyper_transformer(data)
+        with self._get_transform_cache().fingerprint_scope():
+            self.prepare_for_fitting(data)
+            LOGGER.info(f'Fitting HyperTransformer for table {self.table_name}')
+            self._fit_hyper_transformer(data)
+
+        self._sampling_plan = None
         self.fitted = True
 
     def reset_sampling(self):
         """Reset the sampling state for the anonymized columns and primary keys."""
         self._hyper_transformer.reset_randomization()
 
+    def _get_sampling_plan(self):
+        """Get the per-column information used by every ``reverse_transform`` call.
+
+        The plan is computed once after fitting, so sampling does not have to look up the
+        order and dtypes of the columns on every call.
+
+        Returns:
+            dict:
+                The ``column_order`` of the metadata and the ``dtypes`` and ``is_integer``
+                flags of every fitted column.
+        """
+        if getattr(self, '_sampling_plan', None) is None:
+            dtypes = {} if self._dtypes is None else dict(self._dtypes)
+            self._sampling_plan = {
+                'column_order': list(self.metadata.columns),
+                'dtypes': dtypes,
+                'is_integer': {column: is_integer_dtype(dtype) for column, dtype in dtypes.items()},
+            }
+
+        return self._sampling_plan
+
     def generate_keys(self, num_rows, reset_keys=False):
         """Generate the columns that are identified as ``keys``.
 
@@ -895,12 +1426,74 @@ class DataProcessor:
             pandas.DataFrame:
                 A dataframe with the newly generated primary keys of the size ``num_rows``.
         """
-        generated_keys = self._hyper_transformer.create_anonymized_columns(
+        generated_keys = self._create_anonymized_columns(
             num_rows=num_rows,
             column_names=self._keys,
         )
         return generated_keys
 
+    def set_random_state(self, seed):
+        """Set the random state used by the transformers when sampling.
+
+        Args:
+            seed (int):
+                Seed for the ``transform`` random state, used to transform the conditions,
+                and the ``reverse_transform`` random state of every transformer.
+        """
+        for transformer in self._hyper_transformer.field_transformers.values():
+            if transformer is not None and getattr(transformer, 'random_states', None):
+                for method_name in ('transform', 'reverse_transform'):
+                    transformer.set_random_state(np.random.RandomState(seed), method_name)
+
+    def regenerate_anonymized_columns(self, data, exclude_columns=None):
+        """Replace the key and anonymized columns of the data with newly generated values.
+
+        Rows that were sampled in different processes are generated by independent copies of
+        the generators, which would repeat the same values. This generates those columns again
+        with the generators of this instance so that, for instance, keys are still unique.
+
+        Args:
+            data (pandas.DataFrame):
+                Reverse transformed data.
+            exclude_columns (set or None):
+                Columns to keep as they are, such as the ones set by conditions.
+                Defaults to ``None``.
+
+        Returns:
+            pandas.DataFrame:
+                The data with the generated columns replaced.
+        """
+        exclude_columns = exclude_columns or set()
+        column_names = [
+            column
+            for column, transformer in self._hyper_transformer.field_transformers.items()
+            if isinstance(column, str)
+            and column in data.columns
+            and column not in exclude_columns
+            and transformer is not None
+            and transformer.is_generator()
+        ]
+        if data.empty or not column_names:
+            return data
+
+        generated_data = self._create_anonymized_columns(
+            num_rows=len(data), column_names=column_names
+        )
+        generated_data.index = data.index
+        for column_name in column_names:
+            column_data = generated_data[column_name]
+            try:
+                column_data = column_data.astype(self._dtypes[column_name])
+            except (IntCastingNaNError, ValueError, OverflowError):
+                LOGGER.debug(f"Unable to cast the generated column '{column_name}' back.")
+
+            if column_name in self.formatters:
+                column_data = self.formatters[column_name].format_data(column_data)
+
+            data[column_name] = column_data
+
+        return data
+
     def transform(self, data, is_condition=False):
         """Transform the given data.
 
@@ -912,6 +1505,12 @@ class DataProcessor:
             pandas.DataFrame:
                 Transformed data.
         """
+        cache = self._get_transform_cache()
+        last_fit, cache.last_fit = cache.last_fit, None
+        fitted_outputs = None
+        if last_fit is not None and last_fit[0]() is data and not is_condition:
+            fitted_outputs = last_fit[1]
+
         data = data.copy()
         if not self.fitted:
             raise NotFittedError()
@@ -927,12 +1526,188 @@ class DataProcessor:
             data = data.set_index(self._primary_key, drop=False)
 
         try:
-            transformed = self._hyper_transformer.transform_subset(data)
+            if getattr(self, '_field_hyper_transformers', None) is None:
+                transformed = self._hyper_transformer.transform_subset(data)
+            else:
+                transformed = self._transform_fields(data, fitted_outputs)
         except (rdt.errors.NotFittedError, rdt.errors.ConfigNotSetError):
             transformed = data
 
+        if not is_condition:
+            precision = getattr(self, '_precision', 'float64')
+            transformed = _cast_float_columns(transformed, 'float64', precision)
+
         return transformed
 
+    def _get_block_key(self, column, column_data, dtype):
+        """Get the key of the block in which a column can be restored.
+
+        Only the columns formatted by a ``NumericalFormatter`` and restored to a ``numpy``
+        numerical dtype can be restored in blocks, if they were reverse transformed as floats
+        or as that same dtype. For integer dtypes, the bounds of the formatter must also be
+        integers.
+
+        Args:
+            column (str):
+                Column name.
+            column_data (pandas.Series):
+                The reverse transformed data of the column.
+            dtype (numpy.dtype or str):
+                The dtype to restore.
+
+        Returns:
+            tuple or None:
+                The dtype, the rounding digits and whether the data is float, or ``None`` if
+                the column has to be restored on its own.
+        """
+        formatter = self.formatters.get(column)
+        if (
+            type(formatter) is not NumericalFormatter
+            or not isinstance(dtype, np.dtype)
+            or dtype.kind not in 'iuf'
+            or formatter._dtype != dtype
+        ):
+            return None
+
+        from_float = column_data.dtype.kind == 'f'
+        if not from_float and column_data.dtype != dtype:
+            return None
+
+        if dtype.kind == 'f':
+            rounding_digits = formatter._rounding_digits if formatter.enforce_rounding else None
+            return dtype, rounding_digits, from_float
+
+        bounds = formatter.get_bounds()
+        if all(bound is None or isinstance(bound, numbers.Integral) for bound in bounds):
+            return dtype, None, from_float
+
+        return None
+
+    @staticmethod
+    def _split_integer_block(columns, values, dtype):
+        """Split rounded float values restored to an integer dtype by the columns with NaNs.
+
+        The columns without missing values are cast to the integer dtype and the ones with
+        missing values are kept as floats, as ``reverse_transform`` does when it gets an
+        ``IntCastingNaNError``. Columns with infinite values or values that do not fit in
+        the dtype are left out.
+
+        Args:
+            columns (list):
+                The column names.
+            values (numpy.ndarray):
+                The rounded values of the columns.
+            dtype (numpy.dtype):
+                The integer dtype.
+
+        Returns:
+            list[tuple]:
+                The column names and values of each block.
+        """
+        info = np.iinfo(dtype)
+        is_nan = np.isnan(values)
+        fits_dtype = (is_nan | ((values >= info.min) & (values < info.max + 1))).all(axis=0)
+        has_nans = is_nan.any(axis=0)
+        blocks = []
+        for with_nans in (False, True):
+            selected = fits_dtype & (has_nans == with_nans)
+            if not selected.any():
+                continue
+
+            block_columns = [column for column, keep in zip(columns, selected) if keep]
+            block = values[:, selected]
+            if with_nans:
+                for column in block_columns:
+                    LOGGER.debug(
+                        f"The real data in '{column}' was stored as '{dtype}' but the synthetic "
+                        'data could not be cast back to this type. If this is a problem, please '
+                        'check your input data and metadata settings.'
+                    )
+            else:
+                block = block.astype(dtype)
+
+            blocks.append((block_columns, block))
+
+        return blocks
+
+    def _is_formatted_datetime(self, column_name, column_data):
+        """Check whether a datetime column was already formatted by its transformer.
+
+        The ``rdt.transformers.UnixTimestampEncoder`` writes the values back with its
+        ``datetime_format``, so when it is the same format of the ``DatetimeFormatter`` and
+        no constraint has modified the column, the values do not need to be checked again.
+
+        Args:
+            column_name (str):
+                Name of the column.
+            column_data (pandas.Series):
+                The reverse transformed data of the column.
+
+        Returns:
+            bool:
+                Whether the column is already in the learned format and dtype.
+        """
+        formatter = self.formatters.get(column_name)
+        if not isinstance(formatter, DatetimeFormatter) or self._constraints_to_reverse:
+            return False
+
+        transformer = self._hyper_transformer.field_transformers.get(column_name)
+        return (
+            isinstance(transformer, rdt.transformers.UnixTimestampEncoder)
+            and formatter.datetime_format is not None
+            and transformer.datetime_format == formatter.datetime_format
+            and column_data.dtype == formatter._dtype
+        )
+
+    def _restore_numerical_columns(self, reversed_data, columns, dtypes):
+        """Restore the dtypes and format the numerical columns in blocks of the same dtype.
+
+        The columns are grouped by their dtype and rounding digits, and every group is cast,
+        clipped and rounded at once as a single ``numpy`` array, with the same result as
+        restoring and formatting the columns one by one. Integer columns with infinite values
+        or values that do not fit in their dtype are not restored here, so they go through the
+        error handling of ``reverse_transform``.
+
+        Args:
+            reversed_data (pandas.DataFrame):
+                The reverse transformed data.
+            columns (list):
+                The columns to restore.
+            dtypes (dict):
+                Mapping of the column names to the dtypes to restore.
+
+        Returns:
+            dict:
+                Mapping of the names of the restored columns to their values.
+        """
+        groups = defaultdict(list)
+        for column in columns:
+            key = self._get_block_key(column, reversed_data[column], dtypes.get(column))
+            if key is not None:
+                groups[key].append(column)
+
+        restored_columns = {}
+        for (dtype, rounding_digits, from_float), group_columns in groups.items():
+            values = reversed_data[group_columns].to_numpy(dtype='float64' if from_float else dtype)
+            if dtype.kind == 'f':
+                blocks = [(group_columns, values.astype(dtype, copy=False))]
+            elif from_float:
+                blocks = self._split_integer_block(group_columns, np.round(values), dtype)
+            else:
+                blocks = [(group_columns, values)]
+
+            for block_columns, block in blocks:
+                formatters = [self.formatters[column] for column in block_columns]
+                lower_bounds, upper_bounds = _get_bounds_arrays(formatters, block.dtype)
+                block = np.clip(block, lower_bounds, upper_bounds)
+                if rounding_digits is not None:
+                    block = np.round(block, rounding_digits)
+
+                for index, column in enumerate(block_columns):
+                    restored_columns[column] = block[:, index]
+
+        return restored_columns
+
     def reverse_transform(self, data, reset_keys=False, conditions=None):
         """Reverse the transformed data to the original format.
 
@@ -951,15 +1726,22 @@ class DataProcessor:
             raise NotFittedError()
 
         reversible_columns = [
-            column for column in self._hyper_transformer._output_columns if column in data.columns
+            column for column in self._get_output_columns() if column in data.columns
         ]
 
+        profiler = getattr(self, '_sampling_profiler', None)
+        precision = getattr(self, '_precision', 'float64')
+        data = _cast_float_columns(data, precision, 'float64')
         reversed_data = data
         try:
             if not data.empty:
-                reversed_data = self._hyper_transformer.reverse_transform_subset(
-                    data[reversible_columns]
-                )
+                with profile_stage(profiler, 'reverse_transform.hyper_transformer', len(data)):
+                    if getattr(self, '_field_hyper_transformers', None) is None:
+                        reversed_data = self._hyper_transformer.reverse_transform_subset(
+                            data[reversible_columns]
+                        )
+                    else:
+                        reversed_data = self._reverse_transform_fields(data[reversible_columns])
         except rdt.errors.NotFittedError:
             LOGGER.info(f'HyperTransformer has not been fitted for table {self.table_name}')
 
@@ -993,9 +1775,11 @@ class DataProcessor:
                 missing_columns = [col for col in missing_columns if col not in conditions]
 
             if missing_columns:
-                anonymized_data = self._hyper_transformer.create_anonymized_columns(
-                    num_rows=num_rows, column_names=missing_columns
-                )
+                with profile_stage(profiler, 'reverse_transform.anonymized_columns', num_rows):
+                    anonymized_data = self._create_anonymized_columns(
+                        num_rows=num_rows, column_names=missing_columns
+                    )
+
                 sampled_columns.extend(missing_columns)
                 reversed_data[anonymized_data.columns] = anonymized_data[anonymized_data.notna()]
 
@@ -1004,7 +1788,9 @@ class DataProcessor:
             reversed_data[conditional_data.columns] = conditional_data
 
         if self._keys and num_rows:
-            generated_keys = self.generate_keys(num_rows, reset_keys)
+            with profile_stage(profiler, 'reverse_transform.keys', num_rows):
+                generated_keys = self.generate_keys(num_rows, reset_keys)
+
             sampled_columns.extend(self._keys)
             reversed_data[generated_keys.columns] = generated_keys[generated_keys.notna()]
 
@@ -1020,55 +1806,75 @@ class DataProcessor:
         # In multitable there may be missing columns in the sample such as foreign keys
         # And alternate keys. Thats the reason of ensuring that the metadata column is within
         # The sampled columns.
+        sampling_plan = self._get_sampling_plan()
+        sampled_columns = set(sampled_columns)
         sampled_columns = [
-            column for column in self.metadata.columns.keys() if column in sampled_columns
+            column for column in sampling_plan['column_order'] if column in sampled_columns
         ]
-        for column_name in sampled_columns:
-            column_data = reversed_data[column_name]
+        with profile_stage(profiler, 'reverse_transform.dtypes', num_rows):
+            restored_columns = self._restore_numerical_columns(
+                reversed_data, sampled_columns, sampling_plan['dtypes']
+            )
+            remaining_columns = [
+                column for column in sampled_columns if column not in restored_columns
+            ]
+            for column_name in remaining_columns:
+                column_data = reversed_data[column_name]
 
-            dtype = self._dtypes[column_name]
-            if is_integer_dtype(dtype) and is_float_dtype(column_data.dtype):
-                column_data = column_data.round()
+                dtype = sampling_plan['dtypes'][column_name]
+                if sampling_plan['is_integer'][column_name] and is_float_dtype(column_data.dtype):
+                    column_data = column_data.round()
 
-            reversed_data[column_name] = column_data[column_data.notna()]
-            try:
-                reversed_data[column_name] = reversed_data[column_name].astype(dtype)
-            except (IntCastingNaNError, ValueError) as e:
-                message = (
-                    f"The real data in '{column_name}' was stored as '{dtype}' but the "
-                    'synthetic data could not be cast back to this type. If this is a '
-                    'problem, please check your input data and metadata settings.'
-                )
-                if isinstance(e, IntCastingNaNError):
-                    LOGGER.debug(message)
+                if column_data.dtype == object and column_data.hasnans:
+                    column_data = column_data.where(column_data.notna())
+
+                restored_columns[column_name] = column_data
+                if column_data.dtype == dtype:
                     continue
 
-                # Handle the ValueError case
-                column_metadata = self.metadata.columns.get(column_name)
-                sdtype = column_metadata.get('sdtype')
-                if sdtype not in self._DTYPE_TO_SDTYPE.values():
-                    LOGGER.info(message)
-                    if column_name in self.formatters:
-                        self.formatters.pop(column_name)
-                else:
-                    raise ValueError(e)
-            except OverflowError:
-                if not self._warned_overflow:
-                    warnings.warn(
-                        f"The real data in '{self.table_name}' and column '{column_name}' was "
-                        f"stored as '{dtype}' but the synthetic data overflowed when casting back "
-                        'to this type. If this is a problem, please check your input data '
-                        'and metadata settings.'
+                try:
+                    restored_columns[column_name] = column_data.astype(dtype)
+                except (IntCastingNaNError, ValueError) as e:
+                    message = (
+                        f"The real data in '{column_name}' was stored as '{dtype}' but the "
+                        'synthetic data could not be cast back to this type. If this is a '
+                        'problem, please check your input data and metadata settings.'
                     )
-                self._warned_overflow = True
+                    if isinstance(e, IntCastingNaNError):
+                        LOGGER.debug(message)
+                        continue
+
+                    # Handle the ValueError case
+                    sdtype = self.metadata.columns[column_name]['sdtype']
+                    if sdtype not in self._DTYPE_TO_SDTYPE.values():
+                        LOGGER.info(message)
+                        if column_name in self.formatters:
+                            self.formatters.pop(column_name)
+                    else:
+                        raise ValueError(e)
+                except OverflowError:
+                    if not self._warned_overflow:
+                        warnings.warn(
+                            f"The real data in '{self.table_name}' and column '{column_name}' "
+                            f"was stored as '{dtype}' but the synthetic data overflowed when "
+                            'casting back to this type. If this is a problem, please check your '
+                            'input data and metadata settings.'
+                        )
+                    self._warned_overflow = True
 
         # reformat columns using the formatters
-        for column in sampled_columns:
-            if column in self.formatters:
-                data_to_format = reversed_data[column]
-                reversed_data[column] = self.formatters[column].format_data(data_to_format)
-
-        return reversed_data[sampled_columns]
+        with profile_stage(profiler, 'reverse_transform.formatters', num_rows):
+            for column in remaining_columns:
+                if column in self.formatters:
+                    data_to_format = restored_columns[column]
+                    if self._is_formatted_datetime(column, data_to_format):
+                        continue
+
+                    restored_columns[column] = self.formatters[column].format_data(data_to_format)
+
+        # The sampled table is built once from the restored columns, in the metadata order,
+        # instead of assigning every column back to the reverse transformed data.
+        return pd.DataFrame(restored_columns, index=reversed_data.index, columns=sampled_columns)
 
     def filter_valid(self, data):
         """Filter the data using the constraints and return only the valid rows.
@@ -1,5 +1,6 @@
 """Formatter for datetime data."""
 
+import warnings
 from functools import partial
 
 import pandas as pd
@@ -32,6 +33,42 @@ class DatetimeFormatter:
         if self.datetime_format is None:
             self.datetime_format = _get_datetime_format(column)
 
+    def _values_match_format(self, column):
+        """Check whether all the non null values of a column are written in the learned format.
+
+        A value matches the format when parsing it with the format and writing it back returns
+        the same value. All the values are parsed and written back at once, and each value is
+        only checked on its own if the values can not be parsed together (for example, when
+        they have different timezone offsets).
+
+        Args:
+            column (pandas.Series):
+                Data to check.
+
+        Returns:
+            bool:
+                Whether all the non null values match the format.
+        """
+        values = column[column.notna()]
+        if values.empty:
+            return True
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)
+                parsed = pd.to_datetime(
+                    values.astype(str), format=self.datetime_format, errors='coerce'
+                )
+
+            formatted = parsed.dt.strftime(self.datetime_format)
+        except (AttributeError, ValueError):
+            check_function = partial(
+                _datetime_string_matches_format, datetime_format=self.datetime_format
+            )
+            return all(values.apply(check_function))
+
+        return bool((formatted == values).all())
+
     def format_data(self, column):
         """Format a column according to the learned format.
 
@@ -48,11 +85,7 @@ class DatetimeFormatter:
             return column
 
         if self.datetime_format:
-            check_function = partial(
-                _datetime_string_matches_format, datetime_format=self.datetime_format
-            )
-            values_match_format = column.apply(check_function)
-            if dtype_match and all(values_match_format):
+            if dtype_match and self._values_match_format(column):
                 return column
 
             try:
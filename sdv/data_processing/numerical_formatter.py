@@ -3,7 +3,9 @@
 import logging
 import sys
 
+import numpy as np
 import pandas as pd
+from rdt.transformers import utils as rdt_utils
 from rdt.transformers.utils import learn_rounding_digits
 
 LOGGER = logging.getLogger(__name__)
@@ -43,6 +45,7 @@ class NumericalFormatter:
     _min_value = None
     _max_value = None
     _rounding_digits = None
+    _highest_int = None
 
     def __init__(
         self, enforce_rounding=False, enforce_min_max_values=False, computer_representation='Float'
@@ -66,6 +69,72 @@ class NumericalFormatter:
         if self.enforce_rounding:
             self._rounding_digits = learn_rounding_digits(column)
 
+    def update_format(self, column):
+        """Update the learned format with another chunk of a column.
+
+        Learning the format of every chunk of a column with this method, starting from an
+        unfitted formatter, gives the same format as ``learn_format`` on the whole column.
+
+        Args:
+            column (pandas.Series):
+                Chunk of the data to learn the format.
+        """
+        if self._dtype is None:
+            self._dtype = column.dtype
+
+        if self.enforce_min_max_values:
+            min_values = [self._min_value, column.min()]
+            max_values = [self._max_value, column.max()]
+            min_values = [value for value in min_values if value is not None and not pd.isna(value)]
+            max_values = [value for value in max_values if value is not None and not pd.isna(value)]
+            self._min_value = min(min_values) if min_values else column.min()
+            self._max_value = max(max_values) if max_values else column.max()
+
+        if self.enforce_rounding:
+            self._update_rounding_digits(column)
+
+    def _update_rounding_digits(self, column):
+        if str(column.dtype).endswith('[pyarrow]'):
+            column = column.to_numpy()
+
+        roundable_data = column[~(np.isinf(column.astype(float)) | pd.isna(column))]
+        if len(roundable_data) == 0:
+            return
+
+        highest_int = int(np.max(np.abs(roundable_data.astype(float))))
+        is_first_chunk = self._highest_int is None
+        can_round = is_first_chunk or self._rounding_digits is not None
+        self._highest_int = highest_int if is_first_chunk else max(self._highest_int, highest_int)
+        if not can_round:
+            return
+
+        rounding_digits = learn_rounding_digits(column)
+        if rounding_digits is not None and not is_first_chunk:
+            rounding_digits = max(rounding_digits, self._rounding_digits)
+            most_digits = len(str(self._highest_int)) if self._highest_int != 0 else 0
+            if rounding_digits > max(0, rdt_utils.MAX_DECIMALS - most_digits):
+                rounding_digits = None
+
+        self._rounding_digits = rounding_digits
+
+    def get_bounds(self):
+        """Get the bounds that the formatted data is clipped to.
+
+        Returns:
+            tuple:
+                The lower and upper bounds, which are the learned min and max values if
+                ``enforce_min_max_values`` is ``True``, the bounds of the
+                ``computer_representation`` if it is an integer one and ``(None, None)``
+                otherwise.
+        """
+        if self.enforce_min_max_values:
+            return self._min_value, self._max_value
+
+        if not self.computer_representation.startswith('Float'):
+            return INTEGER_BOUNDS[self.computer_representation]
+
+        return None, None
+
     def format_data(self, column):
         """Format a column according to the learned format.
 
@@ -78,11 +147,8 @@ class NumericalFormatter:
                 containing the formatted data.
         """
         column = column.copy()
-        if self.enforce_min_max_values:
-            column = column.clip(self._min_value, self._max_value)
-        elif not self.computer_representation.startswith('Float'):
-            min_bound, max_bound = INTEGER_BOUNDS[self.computer_representation]
-            column = column.clip(min_bound, max_bound)
+        if self.enforce_min_max_values or not self.computer_representation.startswith('Float'):
+            column = column.clip(*self.get_bounds())
 
         is_integer = pd.api.types.is_integer_dtype(self._dtype)
         np_integer_with_nans = (
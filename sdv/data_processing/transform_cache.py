@@ -0,0 +1,231 @@
+"""Cache of the transformations of a table, looked up by the content of the data."""
+
+import contextlib
+import hashlib
+import sys
+import weakref
+from collections import OrderedDict
+
+import pandas as pd
+
+DEFAULT_MAX_SIZE = 0
+ENTRY_OVERHEAD = 1024
+_NUM_SIZE_SAMPLES = 1000
+
+
+def get_column_fingerprint(column_data):
+    """Get a fingerprint of the name, dtype and values of a column.
+
+    Args:
+        column_data (pandas.Series):
+            The column to fingerprint.
+
+    Returns:
+        str or None:
+            The fingerprint, which does not depend on the index of the column, or ``None`` if
+            the values of the column cannot be hashed.
+    """
+    try:
+        hashes = pd.util.hash_pandas_object(column_data, index=False).to_numpy()
+    except (TypeError, ValueError):
+        return None
+
+    digest = hashlib.blake2b(hashes.tobytes(), digest_size=16)
+    digest.update(repr((column_data.name, column_data.dtype)).encode())
+    return digest.hexdigest()
+
+
+def get_memory_size(data):
+    """Estimate the memory used by a ``pandas.DataFrame``.
+
+    The size of the values of the object columns is estimated from their first values.
+
+    Args:
+        data (pandas.DataFrame):
+            The data to measure.
+
+    Returns:
+        int:
+            The estimated size in bytes.
+    """
+    size = int(data.memory_usage(index=False, deep=False).sum()) + data.index.memory_usage()
+    for _, column_data in data.select_dtypes('object').items():
+        sample = column_data.iloc[:_NUM_SIZE_SAMPLES]
+        if len(sample):
+            sample_size = sum(sys.getsizeof(value) for value in sample)
+            size += int(sample_size * len(column_data) / len(sample))
+
+    return size
+
+
+class TransformCache:
+    """Least recently used cache of transformations, bounded by the memory of its entries.
+
+    The entries are looked up by keys built from the fingerprints of the data, so that fitting
+    again on the same data can reuse the transformations that did not change. The entries are
+    not pickled, so a pickled cache is always empty.
+
+    The ``last_fit`` attribute keeps the transformations of the data that was fitted last, so
+    that transforming that same data right after fitting it reuses them.
+
+    Args:
+        max_size (int):
+            Maximum memory, in bytes, used by the cached entries. ``0`` disables the cache.
+            Defaults to 0.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._entries = OrderedDict()
+        self._fingerprints = {}
+        self._scope_depth = 0
+        self.last_fit = None
+
+    def __getstate__(self):
+        """Drop the cached entries when pickling the cache."""
+        return {'max_size': self.max_size}
+
+    def __setstate__(self, state):
+        """Create an empty cache with the pickled ``max_size``."""
+        self.__init__(max_size=state['max_size'])
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def _evict(self):
+        while self._entries and self.size > self.max_size:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.size -= size
+
+    def get(self, key):
+        """Get the value cached under the given key.
+
+        Args:
+            key (hashable or None):
+                The key of the entry.
+
+        Returns:
+            The cached value, or ``None`` if there is no entry for the key.
+        """
+        if key is None or key not in self._entries:
+            return None
+
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def set(self, key, value, size=0):
+        """Cache a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (hashable or None):
+                The key of the entry. If ``None``, the value is not cached.
+            value:
+                The value to cache.
+            size (int):
+                The memory, in bytes, used by the value. Defaults to 0.
+        """
+        if key is None:
+            return
+
+        size += ENTRY_OVERHEAD
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+
+        if size <= self.max_size:
+            self._entries[key] = (value, size)
+            self.size += size
+            self._evict()
+
+    def set_max_size(self, max_size):
+        """Set the maximum memory used by the cache, evicting entries if needed.
+
+        Args:
+            max_size (int):
+                Maximum memory, in bytes, used by the cached entries.
+        """
+        self.max_size = max_size
+        self._evict()
+
+    def clear(self):
+        """Remove all the cached entries."""
+        self._entries.clear()
+        self._fingerprints.clear()
+        self.size = 0
+        self.last_fit = None
+
+    @contextlib.contextmanager
+    def fingerprint_scope(self):
+        """Remember the fingerprints of the data until leaving the outermost scope.
+
+        The fingerprints are only remembered inside a scope, since the data could be modified
+        in place between two calls made by the user.
+        """
+        self._scope_depth += 1
+        try:
+            yield
+        finally:
+            self._scope_depth -= 1
+            if not self._scope_depth:
+                self._fingerprints.clear()
+
+    def remember_fingerprints(self, data, fingerprints):
+        """Remember the fingerprints of the columns of the data in the current scope.
+
+        Args:
+            data (pandas.DataFrame):
+                The data.
+            fingerprints (dict):
+                The fingerprint of each column of the data.
+        """
+        if self._scope_depth:
+            self._fingerprints[id(data)] = (weakref.ref(data), fingerprints)
+
+    def get_fingerprints(self, data):
+        """Get the fingerprint of every column of the data.
+
+        Args:
+            data (pandas.DataFrame):
+                The data.
+
+        Returns:
+            dict:
+                Mapping of each column name to its fingerprint, or to ``None`` if it cannot be
+                fingerprinted. Empty if the cache is disabled.
+        """
+        if not self.max_size:
+            return {}
+
+        reference, fingerprints = self._fingerprints.get(id(data), (None, None))
+        if reference is None or reference() is not data:
+            fingerprints = {
+                column: get_column_fingerprint(column_data) for column, column_data in data.items()
+            }
+            self.remember_fingerprints(data, fingerprints)
+
+        return fingerprints
+
+    def get_fingerprint(self, data):
+        """Get a fingerprint of the index, columns and values of the data.
+
+        Args:
+            data (pandas.DataFrame):
+                The data.
+
+        Returns:
+            str or None:
+                The fingerprint, or ``None`` if the data cannot be fingerprinted or the cache
+                is disabled.
+        """
+        fingerprints = self.get_fingerprints(data)
+        if not fingerprints or None in fingerprints.values():
+            return None
+
+        index_fingerprint = get_column_fingerprint(data.index.to_series())
+        if index_fingerprint is None:
+            return None
+
+        digest = hashlib.blake2b(index_fingerprint.encode(), digest_size=16)
+        digest.update(repr(list(fingerprints.items())).encode())
+        return digest.hexdigest()
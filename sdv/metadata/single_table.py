@@ -140,6 +140,7 @@ class SingleTableMetadata:
     _DEFAULT_SDTYPES = list(_SDTYPE_KWARGS) + list(SDTYPE_ANONYMIZERS)
     _MIN_ROWS_FOR_PREDICTION = 5
     _NUMERICAL_DTYPES = frozenset(['i', 'f', 'u'])
+    _STRING_DTYPES = frozenset(['O', 'U'])
 
     def _validate_numerical(self, column_name, **kwargs):
         representation = kwargs.get('computer_representation')
@@ -613,7 +614,7 @@ class SingleTableMetadata:
                         column_data, valid_potential_primary_key
                     )
 
-                elif dtype == 'O':
+                elif dtype in self._STRING_DTYPES:
                     sdtype, pk_candidate = self._determine_sdtype_for_objects(
                         column_data, valid_potential_primary_key
                     )
@@ -711,7 +712,7 @@ class SingleTableMetadata:
                 if sdtype_in_reference and sdtype != 'id':
                     column_dict['pii'] = True
 
-                if sdtype == 'datetime' and dtype == 'O':
+                if sdtype == 'datetime' and dtype in self._STRING_DTYPES:
                     datetime_format = _get_datetime_format(column_data.iloc[:100])
                     column_dict['datetime_format'] = datetime_format
             else:
@@ -15,6 +15,7 @@ from tqdm import tqdm
 from sdv import version
 from sdv._utils import (
     _validate_correct_synthesizer_loading,
+    _validate_n_jobs,
     check_sdv_versions_and_warn,
     check_synthesizer_version,
     generate_synthesizer_id,
@@ -147,6 +148,7 @@ class BaseMultiTableSynthesizer:
         self._initialize_models()
         self._fitted = False
         self._constraints_fitted = False
+        self._n_jobs = 1
         self._creation_date = datetime.datetime.today().strftime('%Y-%m-%d')
         self._fitted_date = None
         self._fitted_sdv_version = None
@@ -597,13 +599,19 @@ class BaseMultiTableSynthesizer:
         """
         raise NotImplementedError()
 
-    def fit_processed_data(self, processed_data):
+    def fit_processed_data(self, processed_data, n_jobs=None):
         """Fit this model to the transformed data.
 
         Args:
             processed_data (dict):
                 Dictionary mapping each table name to a preprocessed ``pandas.DataFrame``.
+            n_jobs (int or None):
+                Number of processes used to learn the relationships between the tables, for
+                the synthesizers that can learn them in parallel, such as the
+                ``HMASynthesizer``. ``-1`` uses all the CPUs. The fitted synthesizer is the
+                same as without parallelism. Defaults to ``None``, which uses a single process.
         """
+        n_jobs = _validate_n_jobs(n_jobs)
         total_rows = 0
         total_columns = 0
         for table in processed_data.values():
@@ -621,6 +629,7 @@ class BaseMultiTableSynthesizer:
         })
 
         check_synthesizer_version(self, is_fit_method=True, compare_operator=operator.lt)
+        self._n_jobs = n_jobs
         with disable_single_table_logger():
             augmented_data = self._augment_tables(processed_data)
             self._model_tables(augmented_data)
@@ -630,14 +639,20 @@ class BaseMultiTableSynthesizer:
         self._fitted_sdv_version = getattr(version, 'community', None)
         self._fitted_sdv_enterprise_version = getattr(version, 'enterprise', None)
 
-    def fit(self, data):
+    def fit(self, data, n_jobs=None):
         """Fit this model to the original data.
 
         Args:
             data (dict):
                 Dictionary mapping each table name to a ``pandas.DataFrame`` in the raw format
                 (before any transformations).
+            n_jobs (int or None):
+                Number of processes used to learn the relationships between the tables, for
+                the synthesizers that can learn them in parallel, such as the
+                ``HMASynthesizer``. ``-1`` uses all the CPUs. The fitted synthesizer is the
+                same as without parallelism. Defaults to ``None``, which uses a single process.
         """
+        n_jobs = _validate_n_jobs(n_jobs)
         empty_tables = [table_name for table_name, table_data in data.items() if table_data.empty]
         if empty_tables:
             raise ValueError(
@@ -666,7 +681,7 @@ class BaseMultiTableSynthesizer:
         self._fitted = False
         processed_data = self.preprocess(data)
         self._print(text='\n', end='')
-        self.fit_processed_data(processed_data)
+        self.fit_processed_data(processed_data, n_jobs=n_jobs)
 
     def reset_sampling(self):
         """Reset the sampling to the state that was left right after fitting."""
@@ -1,24 +1,453 @@
 """Hierarchical Modeling Algorithms."""
 
+import inspect
 import logging
 import warnings
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from itertools import repeat
 
 import numpy as np
 import pandas as pd
+from copulas.univariate import GaussianUnivariate, ParametricType, UniformUnivariate
+from copulas.univariate.base import ScipyModel
+from copulas.utils import EPSILON
 from rdt.transformers import FloatFormatter
+from scipy import stats
 from tqdm import tqdm
 
-from sdv._utils import _get_root_tables
+from sdv._utils import (
+    _get_root_tables,
+    _read_shared_dataframe,
+    _share_dataframe,
+    _validate_precision,
+)
 from sdv.errors import SynthesizerInputError
 from sdv.multi_table.base import BaseMultiTableSynthesizer
 from sdv.sampling import BaseHierarchicalSampler
+from sdv.single_table.base import FIXED_RNG_SEED
+from sdv.single_table.copulas import GaussianCopulaSynthesizer
+from sdv.single_table.utils import flatten_dict, unflatten_dict
 
 LOGGER = logging.getLogger(__name__)
 PERFORMANCE_ALERT_DISPLAY_CAP = 1_000_000
 DEFAULT_EXTENDED_COLUMNS_DISTRIBUTION = 'truncnorm'
 MAX_NUMBER_OF_COLUMNS = 1000
+CHUNKS_PER_PROCESS = 4
+
+
+def _add_numerical_distributions(synthesizer, numerical_distributions):
+    existing = getattr(synthesizer, 'numerical_distributions', {}) or {}
+    merged = {**existing, **numerical_distributions}
+    synthesizer._set_numerical_distributions(merged)
+
+
+def _fit_extension_rows(
+    synthesizer_class,
+    table_metadata,
+    table_parameters,
+    extended_columns_distributions,
+    prefix,
+    child_data,
+    groups,
+):
+    """Fit a synthesizer to the child rows of each parent and flatten its parameters.
+
+    Args:
+        synthesizer_class (type):
+            The synthesizer to fit to the child rows of each parent.
+        table_metadata (sdv.metadata.Metadata):
+            The metadata of the child table.
+        table_parameters (dict):
+            The parameters used to create the synthesizer.
+        extended_columns_distributions (dict):
+            The distributions of the extended columns of the child table.
+        prefix (str):
+            The prefix of the extension columns.
+        child_data (pandas.DataFrame):
+            The child rows, without the foreign keys, sorted by foreign key value.
+        groups (list[tuple]):
+            The foreign key value and the positions of the first and after the last child
+            rows of each parent.
+
+    Yields:
+        tuple:
+            * The foreign key value.
+            * pandas.Series or None:
+                The extension row, or ``None`` if the synthesizer could not be fitted.
+            * BaseSynthesizer or None:
+                The synthesizer, only if the foreign key value is null.
+    """
+    for foreign_key_value, start, stop in groups:
+        child_rows = child_data.iloc[start:stop]
+        is_null = pd.isna(foreign_key_value)
+        row = synthesizer = None
+        try:
+            if child_rows.empty and not is_null:
+                row = pd.Series({'num_rows': len(child_rows)})
+            else:
+                synthesizer = synthesizer_class(table_metadata, **table_parameters)
+                if extended_columns_distributions:
+                    _add_numerical_distributions(synthesizer, extended_columns_distributions)
+
+                if not child_rows.empty:
+                    synthesizer.fit_processed_data(child_rows.reset_index(drop=True))
+                    row = pd.Series(synthesizer._get_parameters())
+                    if len(child_rows) == 1 and not is_null:
+                        scale_columns = [column for column in row.index if column.endswith('scale')]
+                        row.loc[scale_columns] = None
+
+            if row is not None:
+                row.index = prefix + row.index
+
+        except Exception:
+            # Skip children rows subsets that fail
+            row = synthesizer = None
+
+        yield foreign_key_value, row, synthesizer if is_null else None
+
+
+def _fit_groups_in_worker(function, shared_child_data, groups, arguments):
+    """Fit the given parents reading the child rows from shared memory.
+
+    Args:
+        function (callable):
+            The function that fits the parents, either ``_fit_extension_rows`` or
+            ``_fit_univariates_per_group``.
+        shared_child_data (dict):
+            The description of the child rows shared by ``_share_dataframe``.
+        groups (list[tuple]):
+            The parents to fit and the positions of their child rows.
+        arguments (tuple):
+            The other arguments of ``function``.
+
+    Returns:
+        list:
+            The results of ``function``.
+    """
+    with _read_shared_dataframe(shared_child_data) as child_data:
+        return list(function(*arguments, child_data, groups))
+
+
+def _fit_groups_in_parallel(function, child_data, groups, arguments, n_jobs, pbar_args):
+    """Fit the given parents in a pool of ``n_jobs`` processes.
+
+    The child rows are shared with the processes without copying their numerical
+    columns, and the parents are split in contiguous chunks whose results are put back
+    together in order, so the results are the same as when fitting in a single process.
+
+    Args:
+        function (callable):
+            The function that fits the parents, either ``_fit_extension_rows`` or
+            ``_fit_univariates_per_group``.
+        child_data (pandas.DataFrame):
+            The child rows, without the foreign keys, sorted by foreign key value.
+        groups (list[tuple]):
+            The parents to fit and the positions of their child rows.
+        arguments (tuple):
+            The other arguments of ``function``.
+        n_jobs (int):
+            Number of processes to use.
+        pbar_args (dict):
+            The arguments of the progress bar.
+
+    Returns:
+        list:
+            The results of ``function`` for all the parents.
+    """
+    num_chunks = min(len(groups), n_jobs * CHUNKS_PER_PROCESS)
+    bounds = np.linspace(0, len(groups), num_chunks + 1).astype(int)
+    chunks = [groups[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    results = []
+    with _share_dataframe(child_data) as shared_child_data:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunk_results = executor.map(
+                _fit_groups_in_worker,
+                repeat(function),
+                repeat(shared_child_data),
+                chunks,
+                repeat(arguments),
+            )
+            with tqdm(total=len(groups), **pbar_args) as progress_bar:
+                for chunk_result in chunk_results:
+                    results.extend(chunk_result)
+                    progress_bar.update(len(chunk_result))
+
+    return results
+
+
+def _fit_univariates_per_group(model, distributions, columns, child_data, groups):
+    """Fit the univariates of the given columns to the child rows of each parent.
+
+    Args:
+        model (copulas.multivariate.GaussianMultivariate):
+            The model used to fit the univariates.
+        distributions (dict):
+            The univariate distribution of each column.
+        columns (list):
+            The columns whose univariates are fitted.
+        child_data (pandas.DataFrame):
+            The child rows, without the foreign keys, sorted by foreign key value.
+        groups (list[tuple]):
+            The position of each parent and the positions of the first and after the last
+            of its child rows.
+
+    Yields:
+        tuple:
+            * The position of the parent.
+            * numpy.ndarray or None:
+                The cumulative probabilities of the child rows in each column, or ``None``
+                if any of the univariates could not be fitted.
+            * list or None:
+                The flattened parameters of the univariate of each column.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', module='scipy')
+        for group_index, start, stop in groups:
+            try:
+                probabilities = np.empty((stop - start, len(columns)))
+                parameters = []
+                for index, column in enumerate(columns):
+                    column_data = child_data[column].iloc[start:stop]
+                    univariate = model._fit_column(column_data, distributions[column], column)
+                    probabilities[:, index] = univariate.cdf(column_data.to_numpy(np.float64))
+                    parameters.append(flatten_dict(univariate.to_dict()))
+
+            except Exception:
+                # Skip children rows subsets that fail
+                yield group_index, None, None
+                continue
+
+            yield group_index, probabilities, parameters
+
+
+def _get_groupwise_correlations(probabilities, starts, counts, is_constant):
+    """Compute the correlations of the normal scores of the child rows of every parent.
+
+    The normal scores are the ones used by ``GaussianMultivariate._get_correlation``, and the
+    correlations of a constant column, which are ``NaN``, are set to 0 as it does.
+
+    Args:
+        probabilities (numpy.ndarray):
+            The cumulative probabilities of the child rows, sorted by parent.
+        starts (numpy.ndarray):
+            The position of the first child row of each parent.
+        counts (numpy.ndarray):
+            The number of child rows of each parent.
+        is_constant (numpy.ndarray):
+            Whether each column is constant within the child rows of each parent.
+
+    Returns:
+        dict:
+            The flattened lower triangle of the correlation matrices, mapping each
+            ``correlation__{row}__{column}`` key to the correlations of every parent.
+    """
+    normal = stats.norm.ppf(np.clip(probabilities, EPSILON, 1 - EPSILON))
+    means = np.add.reduceat(normal, starts) / counts[:, np.newaxis]
+    centered = normal - np.repeat(means, counts, axis=0)
+    centered[np.repeat(is_constant, counts, axis=0)] = 0.0
+    squares = np.add.reduceat(centered**2, starts)
+    correlations = {}
+    for row in range(1, normal.shape[1]):
+        products = np.add.reduceat(centered[:, [row]] * centered[:, :row], starts)
+        correlation = np.nan_to_num(
+            products / np.sqrt(squares[:, [row]] * squares[:, :row]), nan=0.0
+        )
+        for column in range(row):
+            correlations[f'correlation__{row - 1}__{column}'] = correlation[:, column]
+
+    return correlations
+
+
+def _fit_extension_groupwise(
+    synthesizer_class,
+    table_metadata,
+    table_parameters,
+    extended_columns_distributions,
+    prefix,
+    child_data,
+    groups,
+    pbar_args=None,
+    n_jobs=1,
+):
+    """Compute the extension rows of all the parents at once.
+
+    The rows are the flattened parameters of a ``GaussianCopulaSynthesizer`` fitted to the
+    child rows of each parent, as computed by ``_fit_extension_rows``, but the ``norm`` and
+    ``uniform`` univariates, the correlations and the number of rows are computed for all the
+    parents at once with segment reductions over the sorted child rows. The other
+    distributions are learned by maximum likelihood, so only their univariates are fitted for
+    each parent, in a pool of ``n_jobs`` processes if it is greater than 1.
+
+    Args:
+        synthesizer_class (type):
+            The synthesizer to fit to the child rows of each parent.
+        table_metadata (sdv.metadata.Metadata):
+            The metadata of the child table.
+        table_parameters (dict):
+            The parameters used to create the synthesizer.
+        extended_columns_distributions (dict):
+            The distributions of the extended columns of the child table.
+        prefix (str):
+            The prefix of the extension columns.
+        child_data (pandas.DataFrame):
+            The child rows, without the foreign keys, sorted by foreign key value.
+        groups (list[tuple]):
+            The foreign key value and the positions of the first and after the last child
+            rows of each parent.
+        pbar_args (dict or None):
+            The arguments of the progress bar. Defaults to ``None``, which disables it.
+        n_jobs (int):
+            Number of processes used to fit the univariates of each parent. Defaults to 1.
+
+    Returns:
+        pandas.DataFrame or None:
+            The extension rows indexed by foreign key value, without the null foreign key
+            value and the parents that fail to fit, or ``None`` if the synthesizer can not be
+            fitted groupwise and ``_fit_extension_rows`` has to be used instead.
+    """
+    is_numerical = all(
+        isinstance(dtype, np.dtype) and dtype.kind in 'iuf' for dtype in child_data.dtypes
+    )
+    if synthesizer_class is not GaussianCopulaSynthesizer or not groups or not is_numerical:
+        return None
+
+    foreign_key_values = [value for value, _, _ in groups]
+    starts = np.array([start for _, start, _ in groups])
+    counts = np.array([stop - start for _, start, stop in groups])
+    is_valid = ~pd.isna(np.array(foreign_key_values, dtype=object))
+    if child_data.columns.empty:
+        index = [value for value, valid in zip(foreign_key_values, is_valid) if valid]
+        return pd.DataFrame({f'{prefix}num_rows': counts[is_valid]}, index=index)
+
+    try:
+        synthesizer = synthesizer_class(table_metadata, **table_parameters)
+        if extended_columns_distributions:
+            _add_numerical_distributions(synthesizer, extended_columns_distributions)
+    except Exception:
+        return None
+
+    columns = list(child_data.columns)
+    distributions = synthesizer._get_numerical_distributions(child_data)
+    is_parametric = all(
+        distributions[column].PARAMETRIC == ParametricType.PARAMETRIC for column in columns
+    )
+    if synthesizer.correlation_rank is not None or not is_parametric:
+        return None
+
+    values = child_data.to_numpy(dtype=np.float64)
+    is_valid &= ~np.logical_or.reduceat(np.isnan(values).any(axis=1), starts)
+    minimums = np.minimum.reduceat(values, starts)
+    maximums = np.maximum.reduceat(values, starts)
+    is_constant = minimums == maximums
+    means = np.add.reduceat(values, starts) / counts[:, np.newaxis]
+    deviations = values - np.repeat(means, counts, axis=0)
+    stds = np.sqrt(np.add.reduceat(deviations**2, starts) / counts[:, np.newaxis])
+
+    univariates = {}
+    probabilities = np.full(values.shape, np.nan)
+    fitted_columns = []
+    for index, column in enumerate(columns):
+        if distributions[column] is GaussianUnivariate:
+            loc = np.where(is_constant[:, index], minimums[:, index], means[:, index])
+            scale = np.where(is_constant[:, index], 0.0, stds[:, index])
+            cdf = stats.norm.cdf
+        elif distributions[column] is UniformUnivariate:
+            loc = minimums[:, index]
+            scale = maximums[:, index] - minimums[:, index]
+            cdf = stats.uniform.cdf
+        else:
+            fitted_columns.append(index)
+            continue
+
+        univariates[column] = {'loc': loc, 'scale': scale}
+        with np.errstate(invalid='ignore'):
+            probabilities[:, index] = cdf(
+                values[:, index], np.repeat(loc, counts), np.repeat(scale, counts)
+            )
+
+    signatures = [()] * len(groups)
+    fitted_parameters = defaultdict(lambda: np.full(len(groups), np.nan))
+    pbar_args = pbar_args or {'disable': True}
+    fitted_groups = []
+    if fitted_columns:
+        fitted_groups = [
+            (group_index, start, stop)
+            for group_index, (_, start, stop) in enumerate(groups)
+            if is_valid[group_index]
+        ]
+
+    n_jobs = min(n_jobs, len(fitted_groups))
+    if not fitted_groups:
+        with tqdm(total=len(groups), **pbar_args) as progress_bar:
+            progress_bar.update(len(groups))
+
+        results = []
+    else:
+        arguments = (
+            synthesizer._initialize_model(distributions),
+            distributions,
+            [columns[index] for index in fitted_columns],
+        )
+        if n_jobs > 1:
+            results = _fit_groups_in_parallel(
+                _fit_univariates_per_group, child_data, fitted_groups, arguments, n_jobs, pbar_args
+            )
+        else:
+            results = tqdm(
+                _fit_univariates_per_group(*arguments, child_data, fitted_groups),
+                total=len(fitted_groups),
+                **pbar_args,
+            )
+
+    for group_index, group_probabilities, group_parameters in results:
+        if group_parameters is None:
+            is_valid[group_index] = False
+            continue
+
+        start = starts[group_index]
+        probabilities[start : start + counts[group_index], fitted_columns] = group_probabilities
+        signatures[group_index] = tuple(map(tuple, group_parameters))
+        for index, parameters in zip(fitted_columns, group_parameters):
+            for name, value in parameters.items():
+                fitted_parameters[columns[index], name][group_index] = value
+
+    if not is_valid.any():
+        return pd.DataFrame([], index=[])
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        extension = _get_groupwise_correlations(probabilities, starts, counts, is_constant)
+
+    precision = getattr(synthesizer, 'precision', 'float64')
+    for key, correlation in extension.items():
+        extension[key] = correlation.astype(precision).astype(np.float64)
+
+    # Add the parameters in the order in which they first appear, like the rows of
+    # ``_fit_extension_rows`` do when put in a DataFrame
+    valid_signatures = [signature for signature, valid in zip(signatures, is_valid) if valid]
+    for signature in dict.fromkeys(valid_signatures):
+        fitted_names = iter(signature)
+        for index, column in enumerate(columns):
+            if index in fitted_columns:
+                parameters = {name: fitted_parameters[column, name] for name in next(fitted_names)}
+            else:
+                parameters = univariates[column]
+
+            for name, parameter in parameters.items():
+                extension.setdefault(f'univariates__{column}__{name}', parameter)
+
+        extension.setdefault('num_rows', counts.astype(np.float64))
+
+    for key, parameter in extension.items():
+        parameter = parameter[is_valid]
+        if key.endswith('scale'):
+            parameter[counts[is_valid] == 1] = np.nan
+
+        extension[key] = parameter
+
+    index = [value for value, valid in zip(foreign_key_values, is_valid) if valid]
+    return pd.DataFrame(extension, index=index).add_prefix(prefix)
 
 
 class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
@@ -32,6 +461,11 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             Defaults to ``['en_US']``.
         verbose (bool):
             Whether to print progress for fitting or not.
+        precision (str):
+            The float dtype of the processed and augmented tables, either ``'float64'`` or
+            ``'float32'``. It is also passed to the ``GaussianCopulaSynthesizer`` of every
+            table, unless set otherwise with ``set_table_parameters``. ``'float32'`` halves
+            the memory used by the extension columns. Defaults to ``'float64'``.
     """
 
     DEFAULT_SYNTHESIZER_KWARGS = {'default_distribution': 'beta'}
@@ -184,7 +618,9 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             table_name: sum(columns_list) for table_name, columns_list in columns_per_table.items()
         }
 
-    def __init__(self, metadata, locales=['en_US'], verbose=True):
+    def __init__(self, metadata, locales=['en_US'], verbose=True, precision='float64'):
+        _validate_precision(precision)
+        self.precision = precision
         BaseMultiTableSynthesizer.__init__(self, metadata, locales=locales)
         self._table_sizes = {}
         self._max_child_rows = {}
@@ -205,6 +641,19 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             self.set_table_parameters(child_table_name, {'default_distribution': 'norm'})
         self._print_estimate_warning()
 
+    def _get_precision_parameters(self):
+        precision = getattr(self, 'precision', 'float64')
+        return {} if precision == 'float64' else {'precision': precision}
+
+    def _initialize_models(self):
+        precision_parameters = self._get_precision_parameters()
+        if precision_parameters:
+            for table_name in self._modified_multi_table_metadata.tables:
+                table_parameters = self._table_parameters[table_name]
+                self._table_parameters[table_name] = {**precision_parameters, **table_parameters}
+
+        super()._initialize_models()
+
     def set_table_parameters(self, table_name, table_parameters):
         """Update the table's synthesizer instantiation parameters.
 
@@ -226,6 +675,7 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
                 'algorithm such as HSA.'
             )
 
+        table_parameters = {**self._get_precision_parameters(), **table_parameters}
         super().set_table_parameters(table_name, table_parameters)
 
     def get_learned_distributions(self, table_name):
@@ -314,23 +764,30 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
 
         return processed_data
 
-    def _set_extended_columns_distributions(self, synthesizer, table_name, valid_columns):
+    def _get_extended_columns_distributions(self, table_name, valid_columns):
         numerical_distributions = {}
         for extended_column in self._parent_extended_columns[table_name]:
             if extended_column in valid_columns:
                 numerical_distributions[extended_column] = DEFAULT_EXTENDED_COLUMNS_DISTRIBUTION
 
+        return numerical_distributions
+
+    def _set_extended_columns_distributions(self, synthesizer, table_name, valid_columns):
+        numerical_distributions = self._get_extended_columns_distributions(
+            table_name, valid_columns
+        )
         if numerical_distributions:
-            existing = getattr(synthesizer, 'numerical_distributions', {}) or {}
-            merged = {**existing, **numerical_distributions}
-            synthesizer._set_numerical_distributions(merged)
+            _add_numerical_distributions(synthesizer, numerical_distributions)
 
     def _get_extension(self, child_name, child_table, foreign_key, progress_bar_desc):
         """Generate the extension columns for this child table.
 
         The resulting dataframe will have an index that contains all the foreign key values.
         The values for a given index are generated by flattening a synthesizer fitted with
-        the child rows with that foreign key value.
+        the child rows with that foreign key value. For a ``GaussianCopulaSynthesizer``, they
+        are computed for all the foreign key values at once. If the synthesizer was fitted with
+        ``n_jobs``, the univariates that are learned by maximum likelihood, or the synthesizers
+        if they cannot be computed at once, are fitted in a pool of processes.
 
         Args:
             child_name (str):
@@ -346,63 +803,54 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             pandas.DataFrame
         """
         table_meta = self._table_synthesizers[child_name].get_metadata()
-
-        extension_rows = []
         foreign_key_columns = self.metadata._get_all_foreign_keys(child_name)
-        foreign_key_values = child_table[foreign_key].unique()
-        child_table = child_table.set_index(foreign_key)
+        codes, foreign_key_values = pd.factorize(child_table[foreign_key], use_na_sentinel=False)
+        counts = np.bincount(codes, minlength=len(foreign_key_values))
+        stops = np.cumsum(counts)
+        groups = list(zip(foreign_key_values, (stops - counts).tolist(), stops.tolist()))
+        data_columns = child_table.columns.drop(foreign_key).difference(foreign_key_columns)
+        child_data = child_table[data_columns].take(np.argsort(codes, kind='stable'))
+        child_data = child_data.reset_index(drop=True)
+        arguments = (
+            self._synthesizer,
+            table_meta,
+            self._table_parameters[child_name],
+            self._get_extended_columns_distributions(child_name, data_columns),
+            f'__{child_name}__{foreign_key}__',
+        )
 
-        index = []
-        scale_columns = None
         pbar_args = self._get_pbar_args(desc=progress_bar_desc)
+        n_jobs = min(getattr(self, '_n_jobs', 1), len(groups))
+        extension = _fit_extension_groupwise(*arguments, child_data, groups, pbar_args, n_jobs)
+        if extension is not None:
+            null_groups = [group for group in groups if pd.isna(group[0])]
+            results = _fit_extension_rows(*arguments, child_data, null_groups)
+        elif n_jobs > 1:
+            results = _fit_groups_in_parallel(
+                _fit_extension_rows, child_data, groups, arguments, n_jobs, pbar_args
+            )
+        else:
+            results = tqdm(
+                _fit_extension_rows(*arguments, child_data, groups),
+                total=len(groups),
+                **pbar_args,
+            )
 
-        for foreign_key_value in tqdm(foreign_key_values, **pbar_args):
-            try:
-                child_rows = child_table.loc[[foreign_key_value]]
-            except KeyError:
-                # pre pandas 2.1 df.loc[[np.nan]] causes error
-                if pd.isna(foreign_key_value):
-                    child_rows = child_table[child_table.index.isna()]
-                else:
-                    raise
-            child_rows = child_rows[child_rows.columns.difference(foreign_key_columns)]
-            try:
-                if child_rows.empty and not pd.isna(foreign_key_value):
-                    row = pd.Series({'num_rows': len(child_rows)})
-                    row.index = f'__{child_name}__{foreign_key}__' + row.index
-                else:
-                    synthesizer = self._synthesizer(
-                        table_meta,
-                        **self._table_parameters[child_name],
-                    )
-                    self._set_extended_columns_distributions(
-                        synthesizer, child_name, child_rows.columns
-                    )
-                    if not child_rows.empty:
-                        synthesizer.fit_processed_data(child_rows.reset_index(drop=True))
-                        row = synthesizer._get_parameters()
-                        row = pd.Series(row)
-                        row.index = f'__{child_name}__{foreign_key}__' + row.index
-
-                    if not pd.isna(foreign_key_value):
-                        if scale_columns is None:
-                            scale_columns = [
-                                column for column in row.index if column.endswith('scale')
-                            ]
-
-                        if len(child_rows) == 1:
-                            row.loc[scale_columns] = None
-
-                if pd.isna(foreign_key_value):
+        extension_rows = []
+        index = []
+        for foreign_key_value, row, synthesizer in results:
+            if pd.isna(foreign_key_value):
+                if synthesizer is not None:
                     self._null_child_synthesizers[f'__{child_name}__{foreign_key}'] = synthesizer
-                else:
-                    extension_rows.append(row)
-                    index.append(foreign_key_value)
-            except Exception:
-                # Skip children rows subsets that fail
-                pass
 
-        return pd.DataFrame(extension_rows, index=index)
+            elif row is not None:
+                extension_rows.append(row)
+                index.append(foreign_key_value)
+
+        if extension is None:
+            extension = pd.DataFrame(extension_rows, index=index)
+
+        return extension
 
     @staticmethod
     def _clear_nans(table_data, ignore_cols=None):
@@ -411,7 +859,7 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             columns = columns - set(ignore_cols)
         for column in columns:
             column_data = table_data[column]
-            if column_data.dtype in (int, float):
+            if column_data.dtype in (int, float, np.float32):
                 fill_value = 0 if column_data.isna().all() else column_data.mean()
             else:
                 fill_value = column_data.mode()[0]
@@ -455,8 +903,9 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
                 extension = self._get_extension(
                     child_name, child_table.copy(), foreign_key, progress_bar_desc
                 )
+                precision = getattr(self, 'precision', 'float64')
                 for column in extension.columns:
-                    extension[column] = extension[column].astype(float)
+                    extension[column] = extension[column].astype(precision)
                     if extension[column].isna().all():
                         extension[column] = extension[column].fillna(1e-6)
 
@@ -625,6 +1074,136 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
 
         return synthesizer
 
+    def _sample_raw_child_rows(self, child_name, parent_name, parent_rows, num_rows):
+        """Sample the child rows of a block of parent rows from their ``GaussianCopula`` models.
+
+        The models that ``_recreate_child_synthesizer`` creates for each parent row are
+        stacked instead: the parameters of every univariate are arrays with one value per
+        parent row, and the correlation matrices are rebuilt and factored at once. Every
+        recreated child synthesizer samples with a random state seeded with
+        ``FIXED_RNG_SEED``, so the normal samples of each parent row are the first rows of
+        the same draws.
+
+        Args:
+            child_name (str):
+                The name of the child table.
+            parent_name (str):
+                The name of the parent table.
+            parent_rows (pandas.DataFrame):
+                The rows from the parent table to sample for from the child table.
+            num_rows (numpy.ndarray):
+                The number of child rows to sample for each parent row.
+
+        Returns:
+            pandas.DataFrame or None:
+                The sampled rows of all the parent rows, in order, or ``None`` if the child
+                synthesizers are not ``GaussianCopulaSynthesizer`` with parametric univariates.
+        """
+        if self._synthesizer is not GaussianCopulaSynthesizer:
+            return None
+
+        foreign_key = self.metadata._get_foreign_keys(parent_name, child_name)[0]
+        table_meta = self.metadata.get_table_metadata(child_name)
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message=".*The 'SingleTableMetadata' is deprecated.*")
+            synthesizer = self._synthesizer(table_meta, **self._table_parameters[child_name])
+
+        extended_columns = getattr(self, '_parent_extended_columns', {}).get(child_name, [])
+        if extended_columns:
+            self._set_extended_columns_distributions(synthesizer, child_name, extended_columns)
+
+        prefix = f'__{child_name}__{foreign_key}__'
+        flat_parameters = {}
+        for key in parent_rows.columns:
+            if key.startswith(prefix) and key != f'{prefix}num_rows':
+                float_formatter = self.extended_columns[child_name][key]
+                parameter = parent_rows[key].astype(float).fillna(1e-6).to_numpy()
+                flat_parameters[key[len(prefix) :]] = np.clip(
+                    parameter, float_formatter._min_value, float_formatter._max_value
+                )
+
+        parameters = unflatten_dict(flat_parameters)
+        univariates = parameters.get('univariates', {})
+        if not univariates:
+            return None if parameters else pd.DataFrame(index=range(num_rows.sum()))
+
+        default_parameters = getattr(self, '_default_parameters', {}).get(child_name, {})
+        default_univariates = unflatten_dict(default_parameters).get('univariates', {})
+        default_distribution = synthesizer.get_distribution_class(synthesizer.default_distribution)
+        distributions = {}
+        for column, univariate in univariates.items():
+            distribution = synthesizer._numerical_distributions.get(column, default_distribution)
+            if not issubclass(distribution, ScipyModel):
+                return None
+
+            model = distribution.MODEL_CLASS
+            if hasattr(model, '_argcheck'):
+                to_check = {
+                    parameter: univariate[parameter]
+                    for parameter in inspect.signature(model._argcheck).parameters.keys()
+                    if parameter in univariate
+                }
+                is_valid = np.broadcast_to(model._argcheck(**to_check), (len(parent_rows),))
+                default = default_univariates.get(column)
+                if default is not None and not is_valid.all():
+                    if set(default) != set(univariate):
+                        return None
+
+                    for parameter, values in univariate.items():
+                        univariate[parameter] = np.where(is_valid, values, default[parameter])
+
+            if 'scale' in univariate:
+                univariate['scale'] = np.where(univariate['scale'] > 0, univariate['scale'], 0)
+
+            distributions[column] = distribution
+
+        size = len(univariates)
+        correlation = parameters.get('correlation', [])
+        if len(correlation) + 1 != size:
+            return None
+
+        lower_triangles = np.array([values for row in correlation for values in row]).T
+        correlations = synthesizer._rebuild_correlation_matrices(
+            lower_triangles.reshape(len(parent_rows), -1), size
+        )
+        _, singular_values, right_vectors = np.linalg.svd(correlations)
+        precision = getattr(synthesizer, 'precision', 'float64')
+        factors = (np.sqrt(singular_values)[:, :, np.newaxis] * right_vectors).astype(precision)
+
+        positions = np.repeat(np.arange(len(parent_rows)), num_rows)
+        row_numbers = np.arange(len(positions)) - np.repeat(
+            np.cumsum(num_rows) - num_rows, num_rows
+        )
+        random_state = np.random.RandomState(FIXED_RNG_SEED)
+        draws = random_state.standard_normal(size=num_rows.max(initial=0) * size)
+        if precision == 'float64':
+            indices = row_numbers[:, np.newaxis] * size + np.arange(size)
+        else:
+            indices = np.arange(size) * num_rows[positions, np.newaxis] + row_numbers[:, None]
+
+        samples = draws[indices].astype(precision)
+        correlated = np.zeros_like(samples)
+        for index in range(size):
+            correlated += samples[:, index, np.newaxis] * factors[positions, index]
+
+        output = {}
+        for (column, univariate), column_samples in zip(univariates.items(), correlated.T):
+            distribution = distributions[column]()
+            distribution._params = univariate
+            is_constant = np.broadcast_to(distribution._is_constant(), (len(parent_rows),))
+            constants = np.broadcast_to(distribution._extract_constant(), (len(parent_rows),))
+            cdf = stats.norm.cdf(column_samples.astype(np.float64))
+            with np.errstate(all='ignore'), warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                values = distribution.MODEL_CLASS.ppf(
+                    cdf, **{name: value[positions] for name, value in univariate.items()}
+                )
+
+            values = np.where(is_constant[positions], constants[positions], values)
+            output[column] = values.astype(precision)
+
+        return pd.DataFrame(output)
+
     @staticmethod
     def _find_parent_id(likelihoods, num_rows):
         """Find the parent id for one row based on the likelihoods of parent id values.
@@ -1,13 +1,20 @@
 """SDV Sampling module."""
 
+from sdv.sampling.async_sampler import AsyncSampler
 from sdv.sampling.hierarchical_sampler import BaseHierarchicalSampler
 from sdv.sampling.independent_sampler import BaseIndependentSampler
+from sdv.sampling.sinks import ArrowIPCSink, BaseSink, CSVSink, ParquetSink
 from sdv.sampling.tabular import Condition, DataFrameCondition, MultiTableCondition
 
 __all__ = [
+    'ArrowIPCSink',
+    'AsyncSampler',
     'BaseHierarchicalSampler',
     'BaseIndependentSampler',
+    'BaseSink',
+    'CSVSink',
     'Condition',
     'DataFrameCondition',
     'MultiTableCondition',
+    'ParquetSink',
 ]
@@ -0,0 +1,179 @@
+"""Sampling from synthesizers without blocking an asyncio event loop."""
+
+import asyncio
+import os
+import uuid
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import cloudpickle
+
+_WORKER_TOKEN = None
+_WORKER_SYNTHESIZER = None
+_DEFAULT_SAMPLERS = weakref.WeakKeyDictionary()
+
+
+def _load_worker_synthesizer(token, serialized_synthesizer):
+    """Load the copy of the synthesizer used by the current worker process."""
+    global _WORKER_TOKEN, _WORKER_SYNTHESIZER
+    if _WORKER_TOKEN != token:
+        if serialized_synthesizer is None:
+            raise RuntimeError('The synthesizer was not loaded by this worker.')
+
+        _WORKER_SYNTHESIZER = cloudpickle.loads(serialized_synthesizer)
+        _WORKER_TOKEN = token
+
+    return _WORKER_SYNTHESIZER
+
+
+def _run_in_worker(token, serialized_synthesizer, seed, method_name, args):
+    """Seed the worker's copy of the synthesizer and call the given method on it."""
+    synthesizer = _load_worker_synthesizer(token, serialized_synthesizer)
+    synthesizer._set_sampling_seed(seed)
+    return getattr(synthesizer, method_name)(*args)
+
+
+class AsyncSampler:
+    """Run the sampling calls of a synthesizer in an executor without blocking the event loop.
+
+    The fitted synthesizer is copied when the sampler is created, and each worker of the
+    executor loads its own copy, so calls running at the same time never share any state.
+    Every call is seeded with a seed spawned from the synthesizer's seed sequence when the
+    call is made, and its key and anonymized columns are then generated again by the
+    synthesizer in the order in which the calls were made. This makes the results only
+    depend on the order of the calls, not on the order in which they finish.
+
+    Args:
+        synthesizer (sdv.single_table.base.BaseSingleTableSynthesizer):
+            The fitted synthesizer to sample from. The sampler must be created again if the
+            synthesizer is fitted again.
+        executor (concurrent.futures.Executor or None):
+            The executor to run the calls in, which must run them in separate processes
+            because the models and transformers use the global random state of ``numpy``.
+            The synthesizer is sent with every call and loaded once by each process of the
+            executor. If ``None``, a pool of
+            ``max_concurrency`` processes that load the synthesizer when they start is
+            created on the first call and shut down by ``close``. Defaults to ``None``.
+        max_concurrency (int or None):
+            Maximum number of calls running in the executor at the same time. The other
+            calls wait for a free slot, in order. Defaults to the number of CPUs.
+    """
+
+    def __init__(self, synthesizer, executor=None, max_concurrency=None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("'max_concurrency' must be a positive integer.")
+
+        if isinstance(executor, ThreadPoolExecutor):
+            raise ValueError(
+                "The 'executor' must run the calls in separate processes. Please use a "
+                "'concurrent.futures.ProcessPoolExecutor' instead."
+            )
+
+        self.synthesizer = synthesizer
+        self.executor = executor
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._owns_executor = executor is None
+        self._token = uuid.uuid4().hex
+        self._serialized_synthesizer = cloudpickle.dumps(synthesizer)
+        self._semaphore = None
+        self._last_call = None
+
+    def _get_executor(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_concurrency,
+                initializer=_load_worker_synthesizer,
+                initargs=(self._token, self._serialized_synthesizer),
+            )
+
+        return self.executor
+
+    async def _run(self, method_name, *args, postprocess=None):
+        """Call a method of a copy of the synthesizer in the executor.
+
+        Args:
+            method_name (str):
+                Name of the synthesizer method to call.
+            *args:
+                Arguments passed to the method.
+            postprocess (callable or None):
+                Function applied to the result in the event loop, in the order in which
+                the calls were made. Defaults to ``None``.
+
+        Returns:
+            The result of the method, after being postprocessed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        seed = self.synthesizer._spawn_sampling_seeds(1)[0]
+        previous_call = self._last_call
+        this_call = self._last_call = loop.create_future()
+        serialized_synthesizer = None if self._owns_executor else self._serialized_synthesizer
+        try:
+            async with self._semaphore:
+                result = await loop.run_in_executor(
+                    self._get_executor(),
+                    _run_in_worker,
+                    self._token,
+                    serialized_synthesizer,
+                    seed,
+                    method_name,
+                    args,
+                )
+
+            if previous_call is not None:
+                await previous_call
+
+            if postprocess is not None:
+                result = postprocess(result)
+
+        finally:
+            this_call.set_result(None)
+
+        return result
+
+    def close(self):
+        """Shut down the executor if it was created by this sampler."""
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    async def __aenter__(self):
+        """Return the sampler, which is closed when leaving the context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the sampler."""
+        self.close()
+
+
+def get_default_async_sampler(synthesizer):
+    """Get the ``AsyncSampler`` used by the ``asample`` methods of the given synthesizer.
+
+    Args:
+        synthesizer (sdv.single_table.base.BaseSingleTableSynthesizer):
+            The fitted synthesizer.
+
+    Returns:
+        AsyncSampler:
+            The sampler, which is created on the first call.
+    """
+    sampler = _DEFAULT_SAMPLERS.get(synthesizer)
+    if sampler is None:
+        sampler = _DEFAULT_SAMPLERS[synthesizer] = AsyncSampler(synthesizer)
+
+    return sampler
+
+
+def discard_default_async_sampler(synthesizer):
+    """Shut down and forget the default ``AsyncSampler`` of the given synthesizer, if any.
+
+    Args:
+        synthesizer (sdv.single_table.base.BaseSingleTableSynthesizer):
+            The synthesizer.
+    """
+    sampler = _DEFAULT_SAMPLERS.pop(synthesizer, None)
+    if sampler is not None:
+        sampler.close()
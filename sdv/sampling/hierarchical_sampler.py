@@ -7,6 +7,47 @@ import numpy as np
 import pandas as pd
 
 LOGGER = logging.getLogger(__name__)
+SAMPLING_BLOCK_SIZE = 10_000
+
+
+def _get_num_rows_adjustments(capacities, total):
+    """Distribute ``total`` unit adjustments in rounds over the given number of rows.
+
+    Every round adjusts by 1 each number of rows that still has capacity left, so after
+    ``k`` rounds each one has been adjusted by ``min(k, capacity)``. The last incomplete
+    round adjusts the first numbers of rows that still have capacity left. If the total
+    is larger than all the capacities, the rest is spread evenly over all of them.
+
+    Args:
+        capacities (numpy.ndarray):
+            The number of adjustments each number of rows can take, in order.
+        total (int):
+            The total number of adjustments to distribute.
+
+    Returns:
+        numpy.ndarray:
+            The adjustment of each number of rows.
+    """
+    num_values = len(capacities)
+    sorted_capacities = np.sort(capacities)
+    previous_capacities = np.cumsum(sorted_capacities) - sorted_capacities
+    # Total adjustment after as many rounds as each capacity
+    filled = previous_capacities + sorted_capacities * (num_values - np.arange(num_values))
+    if total >= filled[-1]:
+        rounds, remainder = divmod(total - filled[-1], num_values)
+        adjustments = capacities + rounds
+        adjustments[:remainder] += 1
+        return adjustments
+
+    index = np.searchsorted(filled, total, side='right') - 1
+    base_rounds = sorted_capacities[index] if index >= 0 else 0
+    base_filled = filled[index] if index >= 0 else 0
+    num_open = np.count_nonzero(capacities > base_rounds)
+    rounds = base_rounds + (total - base_filled) // num_open
+    adjustments = np.minimum(capacities, rounds)
+    remainder = total - adjustments.sum()
+    adjustments[np.flatnonzero(capacities > rounds)[:remainder]] += 1
+    return adjustments
 
 
 class BaseHierarchicalSampler:
@@ -57,6 +98,29 @@ class BaseHierarchicalSampler:
         """
         raise NotImplementedError()
 
+    def _sample_raw_child_rows(self, child_name, parent_name, parent_rows, num_rows):
+        """Sample the child rows of a block of parent rows from the child models at once.
+
+        The rows are sampled in the space of the model, before being reverse transformed.
+        Samplers that can not recreate the child models of many parent rows at once return
+        ``None``, and the child rows are then sampled for one parent row at a time.
+
+        Args:
+            child_name (str):
+                The name of the child table.
+            parent_name (str):
+                The name of the parent table.
+            parent_rows (pandas.DataFrame):
+                The rows from the parent table to sample for from the child table.
+            num_rows (numpy.ndarray):
+                The number of child rows to sample for each parent row.
+
+        Returns:
+            pandas.DataFrame or None:
+                The sampled rows of all the parent rows, in order, or ``None``.
+        """
+        return None
+
     def _sample_rows(self, synthesizer, num_rows=None):
         """Sample ``num_rows`` from ``synthesizer``.
 
@@ -75,7 +139,7 @@ class BaseHierarchicalSampler:
 
         return synthesizer._sample_batch(round(num_rows), keep_extra_columns=True)
 
-    def _add_child_rows(self, child_name, parent_name, parent_row, sampled_data, num_rows=None):
+    def _add_child_rows(self, child_name, parent_name, parent_row, child_rows, num_rows=None):
         """Sample the child rows that reference the parent row.
 
         Args:
@@ -85,8 +149,9 @@ class BaseHierarchicalSampler:
                 The name of the parent table.
             parent_row (pd.Series):
                 The row from the parent table to sample for from the child table.
-            sampled_data (dict):
-                A dictionary mapping table names to sampled data (pd.DataFrame).
+            child_rows (list):
+                The blocks of rows sampled so far for the child table (pd.DataFrame). The
+                sampled rows are appended to it.
             num_rows (int):
                 Number of rows to sample. If None, infers number of child rows to sample
                 from the parent row. Defaults to None.
@@ -110,13 +175,79 @@ class BaseHierarchicalSampler:
                     parent_row[parent_key] if parent_row is not None else np.nan
                 )
 
-            previous = sampled_data.get(child_name)
-            if previous is None:
-                sampled_data[child_name] = sampled_rows
-            else:
-                sampled_data[child_name] = pd.concat([previous, sampled_rows]).reset_index(
-                    drop=True
+            child_rows.append(sampled_rows)
+
+    def _add_child_rows_in_batch(self, child_name, parent_name, parent_rows, child_rows):
+        """Sample the child rows that reference a block of parent rows at once.
+
+        The rows of all the parent rows are sampled from their child models with
+        ``_sample_raw_child_rows`` and then reverse transformed at once. The parent rows
+        that end up with fewer valid rows than requested are sampled again one at a time,
+        like ``_add_child_rows`` does.
+
+        Args:
+            child_name (str):
+                The name of the child table.
+            parent_name (str):
+                The name of the parent table.
+            parent_rows (pandas.DataFrame):
+                The rows from the parent table to sample for from the child table.
+            child_rows (list):
+                The blocks of rows sampled so far for the child table (pd.DataFrame). The
+                sampled rows are appended to it.
+
+        Returns:
+            bool:
+                Whether the child rows could be sampled at once.
+        """
+        foreign_key = self.metadata._get_foreign_keys(parent_name, child_name)[0]
+        num_rows_key = f'__{child_name}__{foreign_key}__num_rows'
+        num_rows = parent_rows[num_rows_key].to_numpy(dtype=float).round().clip(0).astype(int)
+        if not num_rows.any():
+            return True
+
+        raw_sampled = self._sample_raw_child_rows(child_name, parent_name, parent_rows, num_rows)
+        if raw_sampled is None:
+            return False
+
+        synthesizer = self._table_synthesizers[child_name]
+        raw_sampled.index = pd.RangeIndex(len(raw_sampled))
+        if raw_sampled.columns.empty:
+            sampled_rows = synthesizer._data_processor.reverse_transform(raw_sampled)
+        else:
+            sampled_rows = synthesizer._reverse_transform_sampled(
+                raw_sampled, keep_extra_columns=True
+            )
+            sampled_rows = synthesizer._data_processor.filter_valid(sampled_rows)
+
+        positions = np.repeat(np.arange(len(parent_rows)), num_rows)[sampled_rows.index]
+        num_valid_rows = np.bincount(positions, minlength=len(parent_rows))
+        incomplete = np.flatnonzero(num_valid_rows < num_rows)
+        if len(incomplete):
+            is_complete = ~np.isin(positions, incomplete)
+            resampled = [sampled_rows[is_complete]]
+            resampled_positions = [positions[is_complete]]
+            for position in incomplete:
+                parent_row = parent_rows.iloc[position].astype(object)
+                child_synthesizer = self._recreate_child_synthesizer(
+                    child_name, parent_name, parent_row
                 )
+                rows = self._sample_rows(child_synthesizer, num_rows[position])
+                resampled.append(rows)
+                resampled_positions.append(np.full(len(rows), position))
+
+            positions = np.concatenate(resampled_positions)
+            order = np.argsort(positions, kind='stable')
+            sampled_rows = pd.concat(resampled, ignore_index=True).take(order)
+            positions = positions[order]
+
+        if len(sampled_rows):
+            parent_key = self.metadata.tables[parent_name].primary_key
+            sampled_rows = sampled_rows.reset_index(drop=True)
+            sampled_rows[foreign_key] = parent_rows[parent_key].to_numpy()[positions]
+            child_rows.append(sampled_rows)
+
+        return True
 
     def _enforce_table_size(self, child_name, table_name, scale, sampled_data):
         """Ensure the child table has the same size as in the real data times the scale factor.
@@ -130,11 +261,14 @@ class BaseHierarchicalSampler:
 
         1. Sort the `__num_rows` column.
         2. If the sum of the values is lower than the target, add 1 to the values from the lowest
-           to the highest until the sum is reached, while respecting the maximum values obsverved
-           in the real data when possible.
+           to the highest, in rounds, until the sum is reached, while respecting the maximum
+           values observed in the real data when possible.
         3. If the sum of the values is higher than the target, subtract 1 from the values from the
-           highest to the lowest until the sum is reached, while respecting the minimum values
-           observed in the real data when possible.
+           highest to the lowest, in rounds, until the sum is reached, while respecting the
+           minimum values observed in the real data when possible.
+
+        The adjustments of all the rounds are computed at once with
+        ``_get_num_rows_adjustments``.
 
         Args:
             child_name (str):
@@ -155,47 +289,26 @@ class BaseHierarchicalSampler:
             min_rows = getattr(self, '_min_child_rows', {num_rows_key: 0})[num_rows_key]
             max_rows = self._max_child_rows[num_rows_key]
             key_data = sampled_data[table_name][num_rows_key].fillna(0).round()
-            sampled_data[table_name][num_rows_key] = key_data.clip(min_rows, max_rows).astype(int)
-
-            while sum(sampled_data[table_name][num_rows_key]) != total_parent_rows:
-                num_rows_column = sampled_data[table_name][num_rows_key].argsort()
-
-                if sum(sampled_data[table_name][num_rows_key]) < total_parent_rows:
-                    for i in num_rows_column:
-                        # If the number of rows is already at the maximum, skip
-                        # The exception is when the smallest value is already at the maximum,
-                        # in which case we ignore the boundary
-                        if (
-                            sampled_data[table_name].loc[i, num_rows_key] >= max_rows
-                            and sampled_data[table_name][num_rows_key].min() < max_rows
-                        ):
-                            break
-
-                        sampled_data[table_name].loc[i, num_rows_key] += 1
-                        if sum(sampled_data[table_name][num_rows_key]) == total_parent_rows:
-                            break
-
-                else:
-                    for i in num_rows_column[::-1]:
-                        # If the number of rows is already at the minimum, skip
-                        # The exception is when the highest value is already at the minimum,
-                        # in which case we ignore the boundary
-                        if (
-                            sampled_data[table_name].loc[i, num_rows_key] <= min_rows
-                            and sampled_data[table_name][num_rows_key].max() > min_rows
-                        ):
-                            break
-
-                        sampled_data[table_name].loc[i, num_rows_key] -= 1
-                        if sum(sampled_data[table_name][num_rows_key]) == total_parent_rows:
-                            break
+            num_rows = key_data.clip(min_rows, max_rows).to_numpy(dtype=int)
+            difference = total_parent_rows - num_rows.sum()
+            if difference > 0 and len(num_rows):
+                order = np.argsort(num_rows, kind='stable')
+                capacities = (max_rows - num_rows[order]).astype(int)
+                num_rows[order] += _get_num_rows_adjustments(capacities, difference)
+            elif difference < 0 and len(num_rows):
+                order = np.argsort(-num_rows, kind='stable')
+                capacities = (num_rows[order] - min_rows).astype(int)
+                num_rows[order] -= _get_num_rows_adjustments(capacities, -difference)
+
+            sampled_data[table_name][num_rows_key] = num_rows
 
     def _sample_children(self, table_name, sampled_data, scale=1.0):
         """Recursively sample the children of a table.
 
         This method will loop through the children of a table and sample rows for that child for
         every primary key value in the parent. If the child has already been sampled by another
-        parent, this method will skip it.
+        parent, this method will skip it. The rows sampled for a child are collected in blocks
+        and concatenated once, before sampling the children of the child.
 
         Args:
             table_name (string):
@@ -207,17 +320,24 @@ class BaseHierarchicalSampler:
             self._enforce_table_size(child_name, table_name, scale, sampled_data)
 
             if child_name not in sampled_data:  # Sample based on only 1 parent
-                for _, row in sampled_data[table_name].astype(object).iterrows():
-                    self._add_child_rows(
-                        child_name=child_name,
-                        parent_name=table_name,
-                        parent_row=row,
-                        sampled_data=sampled_data,
-                    )
+                child_rows = []
+                parent_rows = sampled_data[table_name]
+                for start in range(0, len(parent_rows), SAMPLING_BLOCK_SIZE):
+                    block = parent_rows.iloc[start : start + SAMPLING_BLOCK_SIZE]
+                    if self._add_child_rows_in_batch(child_name, table_name, block, child_rows):
+                        continue
+
+                    for _, row in block.astype(object).iterrows():
+                        self._add_child_rows(
+                            child_name=child_name,
+                            parent_name=table_name,
+                            parent_row=row,
+                            child_rows=child_rows,
+                        )
 
                 foreign_key = self.metadata._get_foreign_keys(table_name, child_name)[0]
 
-                if child_name not in sampled_data:  # No child rows sampled, force row creation
+                if not child_rows:  # No child rows sampled, force row creation
                     num_rows_key = f'__{child_name}__{foreign_key}__num_rows'
                     max_num_child_index = pd.to_numeric(
                         sampled_data[table_name][num_rows_key], errors='coerce'
@@ -228,7 +348,7 @@ class BaseHierarchicalSampler:
                         child_name=child_name,
                         parent_name=table_name,
                         parent_row=parent_row,
-                        sampled_data=sampled_data,
+                        child_rows=child_rows,
                         num_rows=1,
                     )
 
@@ -241,10 +361,13 @@ class BaseHierarchicalSampler:
                         child_name=child_name,
                         parent_name=table_name,
                         parent_row=None,
-                        sampled_data=sampled_data,
+                        child_rows=child_rows,
                         num_rows=num_null_rows,
                     )
 
+                if child_rows:
+                    sampled_data[child_name] = pd.concat(child_rows, ignore_index=True)
+
                 self._sample_children(table_name=child_name, sampled_data=sampled_data, scale=scale)
 
     def _finalize(self, sampled_data):
@@ -271,7 +394,7 @@ class BaseHierarchicalSampler:
             dtypes = synthesizer._data_processor._dtypes
             for name in column_names:
                 dtype = dtypes.get(name)
-                if dtype is None:
+                if dtype is None or table_rows[name].dtype == dtype:
                     continue
 
                 try:
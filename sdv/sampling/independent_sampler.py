@@ -107,7 +107,7 @@ class BaseIndependentSampler:
             dtypes_to_sdtype = synthesizer._data_processor._DTYPE_TO_SDTYPE
             for name in column_names:
                 dtype = dtypes.get(name)
-                if dtype is None:
+                if dtype is None or table_rows[name].dtype == dtype:
                     continue
 
                 try:
@@ -0,0 +1,139 @@
+"""Profiling of the stages of the sampling pipeline."""
+
+import contextlib
+import time
+import tracemalloc
+
+import pandas as pd
+
+PROFILE_COLUMNS = ['stage', 'try', 'batch', 'seconds', 'rows_in', 'rows_out', 'allocated_bytes']
+_SUMMED_COLUMNS = PROFILE_COLUMNS[3:]
+
+
+class SamplingProfiler:
+    """Record the wall time, number of rows and allocated memory of the sampling stages.
+
+    Args:
+        track_memory (bool):
+            Whether to trace the bytes allocated by each stage using ``tracemalloc``, which
+            slows down sampling. Defaults to ``True``.
+    """
+
+    def __init__(self, track_memory=True):
+        self.track_memory = track_memory
+        self.records = []
+        self.current_try = None
+        self._started_tracing = False
+
+    def start(self):
+        """Clear the recorded stages and start tracing the memory allocations if needed."""
+        self.records = []
+        self.current_try = None
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        """Stop tracing the memory allocations if they were traced by this profiler."""
+        self.current_try = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextlib.contextmanager
+    def stage(self, name, rows_in=None):
+        """Record the execution of a stage.
+
+        Args:
+            name (str):
+                Name of the stage.
+            rows_in (int or None):
+                Number of rows passed to the stage. Defaults to ``None``.
+
+        Yields:
+            dict:
+                The record of the stage, where the number of rows returned by the stage
+                can be stored under ``rows_out``.
+        """
+        record = {
+            'stage': name,
+            'try': self.current_try,
+            'batch': None,
+            'rows_in': rows_in,
+            'rows_out': None,
+        }
+        is_tracing = self.track_memory and tracemalloc.is_tracing()
+        start_memory = tracemalloc.get_traced_memory()[0] if is_tracing else None
+        start_time = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start_time
+            record['allocated_bytes'] = None
+            if is_tracing and tracemalloc.is_tracing():
+                record['allocated_bytes'] = tracemalloc.get_traced_memory()[0] - start_memory
+
+            self.records.append(record)
+
+    def add_records(self, records, batch=None):
+        """Add the stages recorded by another profiler, such as the one of a worker process.
+
+        Args:
+            records (list[dict]):
+                The records of the stages to add.
+            batch (int or None):
+                Number of the batch the stages were recorded for. Defaults to ``None``.
+        """
+        for record in records:
+            self.records.append({**record, 'batch': batch})
+
+    def get_profile(self):
+        """Get the recorded stages.
+
+        Returns:
+            pandas.DataFrame:
+                A row for each execution of a stage, in the order in which they finished,
+                with its ``stage`` name, reject-sampling ``try`` (if any), ``batch`` (if it
+                was sampled by a worker process), wall time in ``seconds``, ``rows_in``,
+                ``rows_out`` and net ``allocated_bytes``.
+        """
+        return pd.DataFrame(self.records, columns=PROFILE_COLUMNS)
+
+    def get_summary(self):
+        """Get the total time, rows and allocated memory of each stage.
+
+        Returns:
+            dict:
+                Mapping of each stage name to its number of ``calls`` and the sum of the
+                ``seconds``, ``rows_in``, ``rows_out`` and ``allocated_bytes`` of its calls.
+        """
+        profile = self.get_profile()
+        summary = {}
+        for stage, records in profile.groupby('stage', sort=False):
+            summary[stage] = {'calls': len(records)}
+            for column in _SUMMED_COLUMNS:
+                total = records[column].sum(min_count=1)
+                summary[stage][column] = None if pd.isna(total) else float(total)
+
+        return summary
+
+
+def profile_stage(profiler, name, rows_in=None):
+    """Record a stage with the given profiler, or do nothing if it is ``None``.
+
+    Args:
+        profiler (SamplingProfiler or None):
+            The profiler to record the stage with.
+        name (str):
+            Name of the stage.
+        rows_in (int or None):
+            Number of rows passed to the stage. Defaults to ``None``.
+
+    Returns:
+        contextlib.AbstractContextManager:
+            A context manager that yields the record of the stage.
+    """
+    if profiler is None:
+        return contextlib.nullcontext({})
+
+    return profiler.stage(name, rows_in)
@@ -0,0 +1,331 @@
+"""Sinks used to store the sampled rows while sampling."""
+
+import os
+
+import pandas as pd
+
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as error:
+        raise ImportError(
+            "Writing the sampled rows to a Parquet or Arrow file requires 'pyarrow'. "
+            "Please install it using 'pip install pyarrow'."
+        ) from error
+
+    return pa
+
+
+class BaseSink:
+    """Base class for the sinks that store the sampled rows while sampling.
+
+    Args:
+        output_file_path (str):
+            Path of the file to write the sampled rows to.
+    """
+
+    def __init__(self, output_file_path):
+        self.output_file_path = output_file_path
+
+    def write(self, sampled_rows):
+        """Write the given sampled rows.
+
+        Args:
+            sampled_rows (pandas.DataFrame):
+                The rows to write.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Write any buffered rows and finalize the file."""
+
+
+class CSVSink(BaseSink):
+    """Sink that appends the sampled rows to a CSV file as soon as they are written."""
+
+    def write(self, sampled_rows):
+        """Append the given rows to the file, writing the header if it is empty.
+
+        Args:
+            sampled_rows (pandas.DataFrame):
+                The rows to write.
+        """
+        append_kwargs = {'mode': 'a', 'header': False}
+        append_kwargs = append_kwargs if os.path.getsize(self.output_file_path) > 0 else {}
+        sampled_rows.to_csv(self.output_file_path, index=False, **append_kwargs)
+
+
+class BaseArrowSink(BaseSink):
+    """Base class for the sinks that write the sampled rows in an Arrow based format.
+
+    The rows are buffered and written in groups of ``row_group_size`` rows, so the dtypes are
+    kept and every batch does not need to be encoded on its own. The type of every column is
+    the one of its fitted dtype in ``dtypes``, with the integer columns written as 64 bit
+    integers, or the type of its values if the dtype is ``object``. The columns that only have
+    missing values take the type of the first group that has values, and until then the
+    groups are kept in memory.
+
+    If a group has values that do not fit the type of their column, such as floats in an
+    integer column or values of different types in an ``object`` column, the type is promoted
+    to ``float64`` if both are numerical or to ``string`` otherwise. If rows were already
+    written, the file is then written again with the promoted types.
+
+    The file is only complete after ``close`` is called, which the synthesizers do even if
+    sampling fails or is interrupted. Unlike a CSV file, the file is not readable if the
+    process is killed before that, and the rows that were buffered are lost.
+
+    Args:
+        output_file_path (str):
+            Path of the file to write the sampled rows to.
+        row_group_size (int):
+            Number of rows to buffer before writing them to the file.
+            Defaults to ``100_000``.
+        dtypes (dict or None):
+            The dtypes of the columns of the sampled rows, used to get the types of the
+            columns and to write an empty file with the right columns when no rows are
+            sampled. Defaults to ``None``.
+    """
+
+    def __init__(self, output_file_path, row_group_size=DEFAULT_ROW_GROUP_SIZE, dtypes=None):
+        super().__init__(output_file_path)
+        self._pa = _import_pyarrow()
+        self.row_group_size = row_group_size
+        self.dtypes = dtypes
+        self._buffer = []
+        self._num_buffered_rows = 0
+        self._pending_tables = []
+        self._schema = None
+        self._writer = None
+
+    def _create_writer(self, schema):
+        raise NotImplementedError()
+
+    def _write_table(self, table):
+        raise NotImplementedError()
+
+    def _read_tables(self, file_path):
+        raise NotImplementedError()
+
+    def _get_dtype_type(self, dtype):
+        """Get the type of the values of a dtype, or ``None`` if it depends on the values."""
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if dtype.kind == 'u' and dtype.itemsize == 8:
+            return self._pa.uint64()
+
+        if dtype.kind in 'iu':
+            return self._pa.int64()
+
+        if dtype.kind in 'bfmM':
+            return self._pa.array(pd.Series(dtype=dtype)).type
+
+        return None
+
+    def _get_field_type(self, column):
+        if self._schema is not None:
+            return self._schema.field(column).type
+
+        dtype = (self.dtypes or {}).get(column)
+        return None if dtype is None else self._get_dtype_type(dtype)
+
+    def _promote_type(self, field_type, other_type):
+        """Get a type that can hold the values of both types."""
+        types = self._pa.types
+        if field_type.equals(other_type) or types.is_null(other_type):
+            return field_type
+
+        if types.is_null(field_type):
+            return other_type
+
+        is_numeric = [
+            types.is_integer(type_) or types.is_floating(type_)
+            for type_ in (field_type, other_type)
+        ]
+        return self._pa.float64() if all(is_numeric) else self._pa.string()
+
+    def _to_array(self, column_data, field_type):
+        """Convert a column to an Arrow array, of the given type if its values fit in it."""
+        arrow_errors = (
+            self._pa.ArrowInvalid,
+            self._pa.ArrowTypeError,
+            self._pa.ArrowNotImplementedError,
+        )
+        if field_type is not None:
+            try:
+                return self._pa.array(column_data, type=field_type, from_pandas=True)
+            except arrow_errors:
+                pass
+
+        try:
+            return self._pa.array(column_data, from_pandas=True)
+        except arrow_errors:
+            values = column_data.where(column_data.isna(), column_data.astype(str))
+            return self._pa.array(values, type=self._pa.string(), from_pandas=True)
+
+    def _to_table(self, data):
+        arrays = [
+            self._to_array(column_data, self._get_field_type(column))
+            for column, column_data in data.items()
+        ]
+        return self._pa.Table.from_arrays(arrays, names=list(data.columns))
+
+    def _get_schema(self, tables):
+        """Get a schema that can hold the values of the written rows and the given tables."""
+        fields = []
+        for index, column in enumerate(tables[0].column_names):
+            field_type = self._pa.null()
+            if self._schema is not None:
+                field_type = self._schema.field(index).type
+
+            for table in tables:
+                field_type = self._promote_type(field_type, table.schema.field(index).type)
+
+            fields.append(self._pa.field(column, field_type))
+
+        return self._pa.schema(fields)
+
+    def _get_empty_schema(self):
+        fields = []
+        for column, dtype in (self.dtypes or {}).items():
+            field_type = self._get_dtype_type(dtype)
+            fields.append((column, self._pa.null() if field_type is None else field_type))
+
+        return self._pa.schema(fields)
+
+    def _rewrite(self, schema):
+        """Write the rows that were already written to the file again with the given schema."""
+        self._writer.close()
+        self._writer = None
+        temp_file_path = f'{self.output_file_path}.tmp'
+        os.replace(self.output_file_path, temp_file_path)
+        try:
+            self._writer = self._create_writer(schema)
+            for table in self._read_tables(temp_file_path):
+                self._write_table(table.cast(schema))
+        finally:
+            os.remove(temp_file_path)
+
+    def _flush(self, final=False):
+        if self._buffer:
+            data = pd.concat(self._buffer, ignore_index=True)
+            self._buffer = []
+            self._num_buffered_rows = 0
+            self._pending_tables.append(self._to_table(data))
+
+        if not self._pending_tables:
+            return
+
+        schema = self._get_schema(self._pending_tables)
+        if self._writer is None:
+            has_null_fields = any(self._pa.types.is_null(field.type) for field in schema)
+            if has_null_fields and not final:
+                return
+
+            self._writer = self._create_writer(schema)
+        elif not schema.equals(self._schema):
+            self._rewrite(schema)
+
+        self._schema = schema
+        for table in self._pending_tables:
+            self._write_table(table.cast(schema))
+
+        self._pending_tables = []
+
+    def write(self, sampled_rows):
+        """Buffer the given rows and write them once there are enough for a row group.
+
+        Args:
+            sampled_rows (pandas.DataFrame):
+                The rows to write.
+        """
+        if len(sampled_rows) == 0:
+            return
+
+        self._buffer.append(sampled_rows)
+        self._num_buffered_rows += len(sampled_rows)
+        if self._num_buffered_rows >= self.row_group_size:
+            self._flush()
+
+    def close(self):
+        """Write the buffered rows and the file footer.
+
+        If no rows were written, an empty file with the columns of ``dtypes`` is written.
+        """
+        try:
+            self._flush(final=True)
+            if self._writer is None:
+                self._schema = self._get_empty_schema()
+                self._writer = self._create_writer(self._schema)
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+class ParquetSink(BaseArrowSink):
+    """Sink that writes the sampled rows to a Parquet file, one row group at a time."""
+
+    def _create_writer(self, schema):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(self.output_file_path, schema)
+
+    def _write_table(self, table):
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+
+    def _read_tables(self, file_path):
+        import pyarrow.parquet as pq
+
+        with pq.ParquetFile(file_path) as parquet_file:
+            for index in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(index)
+
+
+class ArrowIPCSink(BaseArrowSink):
+    """Sink that writes the sampled rows to an Arrow IPC (Feather V2) file."""
+
+    def _create_writer(self, schema):
+        return self._pa.ipc.new_file(self.output_file_path, schema)
+
+    def _write_table(self, table):
+        self._writer.write_table(table, max_chunksize=self.row_group_size)
+
+    def _read_tables(self, file_path):
+        with self._pa.OSFile(str(file_path), 'rb') as source:
+            reader = self._pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                yield self._pa.Table.from_batches([reader.get_batch(index)])
+
+
+SINKS_BY_EXTENSION = {
+    '.parquet': ParquetSink,
+    '.arrow': ArrowIPCSink,
+    '.feather': ArrowIPCSink,
+    '.ipc': ArrowIPCSink,
+}
+
+
+def create_sink(output_file_path, dtypes=None):
+    """Create the sink for the given file based on its extension.
+
+    Args:
+        output_file_path (str):
+            Path of the file to write the sampled rows to. Files ending in ``.parquet`` are
+            written as Parquet, the ones ending in ``.arrow``, ``.feather`` or ``.ipc`` as
+            Arrow IPC and any other file as CSV.
+        dtypes (dict or None):
+            The dtypes of the columns of the sampled rows, used by the Parquet and Arrow
+            sinks to get the types of the columns. Defaults to ``None``.
+
+    Returns:
+        BaseSink:
+            The sink that writes to the given file.
+    """
+    extension = os.path.splitext(output_file_path)[1].lower()
+    sink_class = SINKS_BY_EXTENSION.get(extension)
+    if sink_class is None:
+        return CSVSink(output_file_path)
+
+    return sink_class(output_file_path, dtypes=dtypes)
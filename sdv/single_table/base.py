@@ -1,15 +1,16 @@
 """Base Synthesizer class."""
 
+import contextlib
 import datetime
 import functools
 import inspect
 import logging
 import math
 import operator
-import os
 import uuid
 import warnings
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
 import cloudpickle
@@ -25,6 +26,7 @@ from sdv._utils import (
     _check_regex_format,
     _groupby_list,
     _validate_correct_synthesizer_loading,
+    _validate_n_jobs,
     check_sdv_versions_and_warn,
     check_synthesizer_version,
     generate_synthesizer_id,
@@ -38,6 +40,7 @@ from sdv.cag._utils import (
 )
 from sdv.cag.programmable_constraint import ProgrammableConstraint, ProgrammableConstraintHarness
 from sdv.data_processing.data_processor import DataProcessor
+from sdv.data_processing.transform_cache import get_memory_size
 from sdv.errors import (
     ConstraintsNotMetError,
     InvalidDataError,
@@ -50,7 +53,17 @@ from sdv.metadata.errors import InvalidMetadataError
 from sdv.metadata.metadata import Metadata
 from sdv.metadata.single_table import SingleTableMetadata
 from sdv.sampling import Condition, DataFrameCondition
-from sdv.single_table.utils import check_num_rows, handle_sampling_error, validate_file_path
+from sdv.sampling.async_sampler import discard_default_async_sampler, get_default_async_sampler
+from sdv.sampling.profiling import SamplingProfiler, profile_stage
+from sdv.sampling.sinks import create_sink
+from sdv.single_table.utils import (
+    _initialize_sampling_worker,
+    _sample_batch_in_worker,
+    check_num_rows,
+    handle_sampling_error,
+    update_reservoir_sample,
+    validate_file_path,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -197,6 +210,10 @@ class BaseSynthesizer:
         self._chained_constraints = []  # chain of constraints used to preprocess the data
         self._reject_sampling_constraints = []  # constraints used only for reject sampling
         self._constraints_fitted = False
+        self._constraints_fingerprint = None
+        self._n_jobs = 1
+        self._sampling_profiler = None
+        self._log_sampling_profile = False
         self._synthesizer_id = generate_synthesizer_id(self)
         SYNTHESIZER_LOGGER.info({
             'EVENT': 'Instance',
@@ -360,7 +377,7 @@ class BaseSynthesizer:
         """
         self._data_processor.load_custom_constraint_classes(filepath, class_names)
 
-    def auto_assign_transformers(self, data):
+    def auto_assign_transformers(self, data, n_jobs=None):
         """Automatically assign the required transformers for the given data and constraints.
 
         This method will automatically set a configuration to the ``rdt.HyperTransformer``
@@ -369,10 +386,51 @@ class BaseSynthesizer:
         Args:
             data (pandas.DataFrame):
                 The raw data (before any transformations) that will be used to fit the model.
+            n_jobs (int or None):
+                Number of processes used to fit the formatters and assign the transformers
+                of the columns in parallel. ``-1`` uses all the CPUs. The result is the same
+                as without parallelism. Defaults to ``None``, which processes the columns
+                sequentially.
         """
-        self.validate(data)
-        data = self._validate_transform_constraints(data)
-        self._data_processor.prepare_for_fitting(data)
+        self._data_processor._n_jobs = _validate_n_jobs(n_jobs)
+        with self._data_processor._get_transform_cache().fingerprint_scope():
+            self.validate(data)
+            data = self._validate_transform_constraints(data)
+            self._data_processor.prepare_for_fitting(data)
+
+    def clear_transform_cache(self):
+        """Clear the cached transformations of the data.
+
+        If the cache is enabled with ``set_transform_cache_size``, ``fit``, ``preprocess`` and
+        ``auto_assign_transformers`` cache the data transformed by the constraints, and the
+        fitted formatters and transformers of every column with its transformed data, so that
+        calling them again on the same data only fits and transforms the columns whose data
+        or transformer changed.
+        """
+        self._data_processor.clear_transform_cache()
+
+    def set_transform_cache_size(self, max_size):
+        """Set the maximum memory used by the cached transformations of the data.
+
+        The cache is disabled by default. Enabling it is only worth it when calling ``fit``,
+        ``preprocess`` or ``auto_assign_transformers`` several times on the same data, for
+        instance after updating the transformers of some columns: every column of the data is
+        hashed on each call, and the data transformed by the constraints and the transformed
+        columns are kept in memory, up to ``max_size`` bytes, until they are evicted or the
+        cache is cleared with ``clear_transform_cache``.
+
+        Args:
+            max_size (int):
+                Maximum memory, in bytes, used by the cached transformations. ``0`` disables
+                the cache.
+        """
+        if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size < 0:
+            raise SynthesizerInputError(
+                f"Invalid value '{max_size}' for parameter 'max_size'. Please provide a "
+                'non-negative integer.'
+            )
+
+        self._data_processor.set_transform_cache_size(max_size)
 
     def get_transformers(self):
         """Get a dictionary mapping of ``column_name``  and ``rdt.transformers``.
@@ -474,12 +532,15 @@ class BaseSynthesizer:
                 except ConstraintNotMetError:
                     raise e
 
+        cache_size = self._data_processor._get_transform_cache().max_size
+        self._constraints_fingerprint = None
         self._data_processor = DataProcessor(
             metadata=self.metadata._convert_to_single_table(),
             enforce_rounding=self.enforce_rounding,
             enforce_min_max_values=self.enforce_min_max_values,
             locales=self.locales,
         )
+        self._data_processor.set_transform_cache_size(cache_size)
 
     def get_constraints(self):
         """Get a list of constraint-augmented generation constraints applied to the synthesizer."""
@@ -532,14 +593,36 @@ class BaseSynthesizer:
                 The data to validate.
             enforce_constraint_fitting (bool):
                 Whether to enforce fitting the constraints again. If set to ``True``, the
-                constraints will be fitted again even if they have already been fitted.
-                Defaults to ``False``.
+                constraints will be fitted again even if they have already been fitted,
+                unless they were fitted on the same data. Defaults to ``False``.
         """
+        cache = self._data_processor._get_transform_cache()
+        fingerprint = None
+        if getattr(self, '_chained_constraints', None) or getattr(
+            self, '_reject_sampling_constraints', None
+        ):
+            fingerprint = cache.get_fingerprint(data)
+
+        fitted_fingerprint = getattr(self, '_constraints_fingerprint', None)
+        if fingerprint is not None and fingerprint == fitted_fingerprint:
+            enforce_constraint_fitting = False
+
         if self._constraints_fitted and not enforce_constraint_fitting:
+            key = None
+            if fingerprint is not None and fitted_fingerprint is not None:
+                key = ('constraints', fitted_fingerprint, fingerprint)
+
+            cached = cache.get(key)
+            if cached is not None:
+                transformed, fingerprints = cached
+                transformed = transformed.copy(deep=False)
+                cache.remember_fingerprints(transformed, fingerprints)
+                return transformed
+
             for constraint in self._chained_constraints:
                 data = constraint.transform(data)
 
-            return data
+            return self._cache_constraints_output(key, data)
 
         metadata = getattr(self, '_original_metadata', self.metadata)
         if hasattr(self, '_reject_sampling_constraints'):
@@ -553,17 +636,35 @@ class BaseSynthesizer:
                 data = constraint.transform(data)
 
         self._constraints_fitted = True
-        return data
+        self._constraints_fingerprint = fingerprint
+        key = None if fingerprint is None else ('constraints', fingerprint, fingerprint)
+        return self._cache_constraints_output(key, data)
 
-    def validate(self, data):
-        """Validate data.
+    def _cache_constraints_output(self, key, data):
+        """Cache the data transformed by the constraints.
 
-        This method will validate the data against:
-        - The metadata
-        - The constraints
+        Args:
+            key (tuple or None):
+                The cache key of the transformed data. If ``None``, it is not cached.
+            data (pandas.DataFrame):
+                The data transformed by the constraints.
 
-        To make it work with the cags we temporarily set the metadata to the original one
-        and then restore it.
+        Returns:
+            pandas.DataFrame:
+                A shallow copy of the transformed data, so that the cached data is not modified.
+        """
+        if key is None or not getattr(self, '_chained_constraints', None):
+            return data
+
+        cache = self._data_processor._get_transform_cache()
+        fingerprints = cache.get_fingerprints(data)
+        cache.set(key, (data, fingerprints), get_memory_size(data))
+        transformed = data.copy(deep=False)
+        cache.remember_fingerprints(transformed, fingerprints)
+        return transformed
+
+    def _validate_original_metadata(self, data):
+        """Validate the data against the metadata given by the user.
 
         Args:
             data (pandas.DataFrame):
@@ -581,6 +682,22 @@ class BaseSynthesizer:
                 self._original_metadata.validate_data({self._table_name: data})
         else:
             self._original_metadata.validate_data({self._table_name: data})
+
+    def validate(self, data):
+        """Validate data.
+
+        This method will validate the data against:
+        - The metadata
+        - The constraints
+
+        To make it work with the cags we temporarily set the metadata to the original one
+        and then restore it.
+
+        Args:
+            data (pandas.DataFrame):
+                The data to validate.
+        """
+        self._validate_original_metadata(data)
         self._validate_transform_constraints(data, enforce_constraint_fitting=True)
 
         # Retaining the logic of returning errors and raising them here to maintain consistency
@@ -617,20 +734,28 @@ class BaseSynthesizer:
 
         return data
 
-    def preprocess(self, data):
+    def preprocess(self, data, n_jobs=None):
         """Transform the raw data to numerical space.
 
         Args:
             data (pandas.DataFrame):
                 The raw data to be transformed.
+            n_jobs (int or None):
+                Number of processes used to fit the formatters and assign the transformers
+                of the columns in parallel. ``-1`` uses all the CPUs. The result is the same
+                as without parallelism. Defaults to ``None``, which processes the columns
+                sequentially.
 
         Returns:
             pandas.DataFrame:
                 The preprocessed data.
         """
+        self._data_processor._n_jobs = _validate_n_jobs(n_jobs)
         is_converted = self._store_and_convert_original_cols(data)
-        data = self._preprocess_helper(data)
-        preprocess_data = self._preprocess(data)
+        with self._data_processor._get_transform_cache().fingerprint_scope():
+            data = self._preprocess_helper(data)
+            preprocess_data = self._preprocess(data)
+
         if is_converted:
             data.columns = self._original_columns
 
@@ -645,13 +770,19 @@ class BaseSynthesizer:
         """
         raise NotImplementedError()
 
-    def fit_processed_data(self, processed_data):
+    def fit_processed_data(self, processed_data, n_jobs=None):
         """Fit this model to the transformed data.
 
         Args:
             processed_data (pandas.DataFrame):
                 The transformed data used to fit the model to.
+            n_jobs (int or None):
+                Number of processes used to fit the model, for the synthesizers that can fit
+                it in parallel, such as the ``GaussianCopulaSynthesizer``. ``-1`` uses all the
+                CPUs. The fitted model is the same as without parallelism. Defaults to
+                ``None``, which fits the model in a single process.
         """
+        n_jobs = _validate_n_jobs(n_jobs)
         SYNTHESIZER_LOGGER.info({
             'EVENT': 'Fit processed data',
             'TIMESTAMP': datetime.datetime.now(),
@@ -663,21 +794,30 @@ class BaseSynthesizer:
         })
 
         check_synthesizer_version(self, is_fit_method=True, compare_operator=operator.lt)
+        self._n_jobs = n_jobs
         if not processed_data.empty:
             self._fit(processed_data)
 
         self._fitted = True
         self._fitted_date = datetime.datetime.today().strftime('%Y-%m-%d')
+        discard_default_async_sampler(self)
         self._fitted_sdv_version = getattr(version, 'community', None)
         self._fitted_sdv_enterprise_version = getattr(version, 'enterprise', None)
 
-    def fit(self, data):
+    def fit(self, data, n_jobs=None):
         """Fit this model to the original data.
 
         Args:
             data (pandas.DataFrame):
                 The raw data (before any transformations) to fit the model to.
+            n_jobs (int or None):
+                Number of processes used to fit the formatters and assign the transformers
+                of the columns in parallel, and to fit the model for the synthesizers that
+                support it, such as the ``GaussianCopulaSynthesizer``. ``-1`` uses all the
+                CPUs. The fitted synthesizer is the same as without parallelism. Defaults to
+                ``None``, which processes the columns sequentially.
         """
+        n_jobs = _validate_n_jobs(n_jobs)
         SYNTHESIZER_LOGGER.info({
             'EVENT': 'Fit',
             'TIMESTAMP': datetime.datetime.now(),
@@ -693,12 +833,71 @@ class BaseSynthesizer:
         self._fitted = False
         self._data_processor.reset_sampling()
         self._random_state_set = False
+        self._sampling_seed_sequence = None
         is_converted = self._store_and_convert_original_cols(data)
-        processed_data = self.preprocess(data)
-        self.fit_processed_data(processed_data)
+        processed_data = self.preprocess(data, n_jobs=n_jobs)
+        self.fit_processed_data(processed_data, n_jobs=n_jobs)
         if is_converted:
             data.columns = self._original_columns
 
+    def fit_from_chunks(self, chunks, max_rows=1_000_000):
+        """Fit this model to data that is read in chunks, in a single pass over them.
+
+        The min and max values and the rounding digits of the numerical columns are learned
+        from all the rows of the chunks. The rest of the synthesizer is fitted on a uniform
+        random sample of up to ``max_rows`` rows, which is the only data kept in memory. If
+        the synthesizer has constraints, the numerical formats are also learned from the
+        sample, because the constraints may change the numerical columns.
+
+        Every chunk is validated against the metadata, while the constraints are validated
+        once, on the sample that is fitted. The sample is drawn with a random state seeded
+        with ``FIXED_RNG_SEED``, so the same chunks always fit the same model.
+
+        Args:
+            chunks (iterable[pandas.DataFrame]):
+                The chunks of the raw data (before any transformations) to fit the model to,
+                such as the result of ``pandas.read_csv`` with ``chunksize``.
+            max_rows (int):
+                The maximum number of rows used to fit the model. Defaults to 1,000,000.
+        """
+        if isinstance(max_rows, bool) or not isinstance(max_rows, int) or max_rows < 1:
+            raise SynthesizerInputError(
+                f"Invalid value '{max_rows}' for parameter 'max_rows'. Please provide a "
+                'positive integer.'
+            )
+
+        formatters = {}
+        sample = None
+        sample_keys = None
+        random_state = np.random.default_rng(FIXED_RNG_SEED)
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+
+            chunk = chunk.copy(deep=False)
+            self._store_and_convert_original_cols(chunk)
+            self._validate_original_metadata(chunk)
+            synthesizer_errors = self._validate(chunk)
+            if synthesizer_errors:
+                raise InvalidDataError(synthesizer_errors)
+
+            self._data_processor.update_numerical_formats(chunk, formatters)
+            sample, sample_keys = update_reservoir_sample(
+                sample, sample_keys, chunk, max_rows, random_state
+            )
+
+        if sample is None:
+            raise ValueError('The fit dataframe is empty, synthesizer will not be fitted.')
+
+        self.fit(sample)
+        has_constraints = (
+            self._data_processor._constraints
+            or self._chained_constraints
+            or self._reject_sampling_constraints
+        )
+        if not has_constraints:
+            self._data_processor.set_numerical_formats(formatters)
+
     def _validate_fit_before_save(self):
         """Validate that the synthesizer has been fitted before saving."""
         if not self._fitted:
@@ -809,6 +1008,107 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         """Reset the sampling to the state that was left right after fitting."""
         self._data_processor.reset_sampling()
         self._random_state_set = False
+        self._sampling_seed_sequence = None
+
+    def _spawn_sampling_seeds(self, num_seeds):
+        """Spawn independent seeds from the synthesizer's seed sequence.
+
+        The seed sequence starts from ``FIXED_RNG_SEED`` and is reset by ``reset_sampling``, so
+        the seeds are reproducible while consecutive calls still return different seeds.
+
+        Args:
+            num_seeds (int):
+                Number of seeds to spawn.
+
+        Returns:
+            list[int]:
+                The spawned seeds.
+        """
+        if getattr(self, '_sampling_seed_sequence', None) is None:
+            self._sampling_seed_sequence = np.random.SeedSequence(FIXED_RNG_SEED)
+
+        return [
+            int(seed_sequence.generate_state(1)[0])
+            for seed_sequence in self._sampling_seed_sequence.spawn(num_seeds)
+        ]
+
+    def _set_sampling_seed(self, seed):
+        """Seed both the model and the data processor random states for sampling."""
+        if self._model:
+            self._set_random_state(seed)
+
+        self._data_processor.set_random_state(seed)
+
+    def enable_sampling_profiling(self, log_profile=False, track_memory=True):
+        """Record the time spent on each stage of the following sampling calls.
+
+        The stages are the model sampling, the reverse transformation of the data and its
+        steps, the constraints and the filtering of the valid rows. When sampling with
+        ``n_jobs``, the stages are recorded by each worker process and tagged with the number
+        of the ``batch`` they sampled.
+
+        Args:
+            log_profile (bool):
+                Whether to also log a summary of each sampling call with the ``SDV`` logger.
+                Defaults to ``False``.
+            track_memory (bool):
+                Whether to record the bytes allocated by each stage using ``tracemalloc``,
+                which slows down sampling. Defaults to ``True``.
+        """
+        self._sampling_profiler = SamplingProfiler(track_memory=track_memory)
+        self._log_sampling_profile = log_profile
+
+    def disable_sampling_profiling(self):
+        """Stop recording the stages of the sampling calls."""
+        self._sampling_profiler = None
+        self._log_sampling_profile = False
+
+    def get_sampling_profile(self):
+        """Get the stages recorded during the last sampling call.
+
+        Returns:
+            pandas.DataFrame:
+                A row for each executed stage with its ``stage`` name, reject-sampling ``try``,
+                ``batch`` sampled by a worker process, wall time in ``seconds``, ``rows_in``,
+                ``rows_out`` and ``allocated_bytes``.
+
+        Raises:
+            ValueError:
+                If the sampling profiling has not been enabled.
+        """
+        if getattr(self, '_sampling_profiler', None) is None:
+            raise ValueError(
+                "Sampling profiling is not enabled. Please call 'enable_sampling_profiling' "
+                'before sampling.'
+            )
+
+        return self._sampling_profiler.get_profile()
+
+    @contextlib.contextmanager
+    def _profile_sampling(self):
+        """Record the stages of a sampling call if the sampling profiling is enabled."""
+        profiler = getattr(self, '_sampling_profiler', None)
+        self._data_processor._sampling_profiler = profiler
+        if profiler is None:
+            yield
+            return
+
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            if self._log_sampling_profile:
+                SYNTHESIZER_LOGGER.info({
+                    'EVENT': 'Sampling profile',
+                    'TIMESTAMP': datetime.datetime.now(),
+                    'SYNTHESIZER CLASS NAME': self.__class__.__name__,
+                    'SYNTHESIZER ID': self._synthesizer_id,
+                    'PROFILE': profiler.get_summary(),
+                })
+
+    def _profile_stage(self, name, rows_in=None):
+        return profile_stage(getattr(self, '_sampling_profiler', None), name, rows_in)
 
     @staticmethod
     def _filter_conditions(sampled, conditions, float_rtol):
@@ -842,13 +1142,44 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
         return sampled
 
+    def _reverse_transform_sampled(self, raw_sampled, conditions=None, keep_extra_columns=False):
+        """Reverse transform the rows sampled from the model and the constraints.
+
+        Args:
+            raw_sampled (pandas.DataFrame):
+                The rows sampled from the model.
+            conditions (dict):
+                The dictionary of conditioning values in the original format.
+            keep_extra_columns (bool):
+                Whether to keep extra columns from the sampled data. Defaults to False.
+
+        Returns:
+            pandas.DataFrame:
+                The reverse transformed rows, with the same index as the sampled ones.
+        """
+        with self._profile_stage('reverse_transform', len(raw_sampled)) as stage:
+            sampled = self._data_processor.reverse_transform(raw_sampled, conditions=conditions)
+            stage['rows_out'] = len(sampled)
+
+        with self._profile_stage('reverse_transform_constraints', len(sampled)) as stage:
+            sampled = self.reverse_transform_constraints(sampled)
+            stage['rows_out'] = len(sampled)
+
+        if keep_extra_columns:
+            input_columns = self._data_processor._get_input_columns()
+            missing_cols = list(
+                set(raw_sampled.columns) - set(input_columns) - set(sampled.columns)
+            )
+            sampled = pd.concat([sampled, raw_sampled.loc[sampled.index, missing_cols]], axis=1)
+
+        return sampled
+
     def _sample_rows(
         self,
         num_rows,
         conditions=None,
         transformed_conditions=None,
         float_rtol=0.1,
-        previous_rows=None,
         keep_extra_columns=False,
     ):
         """Sample rows with the given conditions.
@@ -876,8 +1207,6 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                 The dictionary of conditioning values transformed to the model format.
             float_rtol (float):
                 Maximum tolerance when considering a float match.
-            previous_rows (pandas.DataFrame):
-                Valid rows sampled in the previous iterations.
             keep_extra_columns (bool):
                 Whether to keep extra columns from the sampled data. Defaults to False.
 
@@ -892,28 +1221,27 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             self._set_random_state(FIXED_RNG_SEED)
         need_sample = self._data_processor.get_sdtypes(primary_keys=False) or keep_extra_columns
         if self._model and need_sample:
-            if conditions is None:
-                raw_sampled = self._sample(num_rows)
-            else:
-                try:
-                    raw_sampled = self._sample(num_rows, transformed_conditions)
-                except NotImplementedError:
+            with self._profile_stage('model_sample', num_rows) as stage:
+                if conditions is None:
                     raw_sampled = self._sample(num_rows)
-            sampled = self._data_processor.reverse_transform(raw_sampled, conditions=conditions)
-            sampled = self.reverse_transform_constraints(sampled)
-            if keep_extra_columns:
-                input_columns = self._data_processor._hyper_transformer._input_columns
-                missing_cols = list(
-                    set(raw_sampled.columns) - set(input_columns) - set(sampled.columns)
-                )
-                sampled = pd.concat([sampled, raw_sampled.loc[sampled.index, missing_cols]], axis=1)
+                else:
+                    try:
+                        raw_sampled = self._sample(num_rows, transformed_conditions)
+                    except NotImplementedError:
+                        raw_sampled = self._sample(num_rows)
 
-            if previous_rows is not None:
-                sampled = pd.concat([previous_rows, sampled], ignore_index=True)
-            sampled = self._data_processor.filter_valid(sampled)
+                stage['rows_out'] = len(raw_sampled)
+
+            sampled = self._reverse_transform_sampled(raw_sampled, conditions, keep_extra_columns)
+
+            with self._profile_stage('filter_valid', len(sampled)) as stage:
+                sampled = self._data_processor.filter_valid(sampled)
+                stage['rows_out'] = len(sampled)
 
             if conditions is not None:
-                sampled = self._filter_conditions(sampled, conditions, float_rtol)
+                with self._profile_stage('filter_conditions', len(sampled)) as stage:
+                    sampled = self._filter_conditions(sampled, conditions, float_rtol)
+                    stage['rows_out'] = len(sampled)
 
             num_valid = len(sampled)
 
@@ -921,7 +1249,10 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
         else:
             sampled = pd.DataFrame(index=range(num_rows))
-            sampled = self._data_processor.reverse_transform(sampled)
+            with self._profile_stage('reverse_transform', num_rows) as stage:
+                sampled = self._data_processor.reverse_transform(sampled)
+                stage['rows_out'] = len(sampled)
+
             return sampled, num_rows
 
     def _sample_batch(
@@ -932,7 +1263,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         transformed_conditions=None,
         float_rtol=0.01,
         progress_bar=None,
-        output_file_path=None,
+        output_sink=None,
         keep_extra_columns=False,
     ):
         """Sample a batch of rows with the given conditions.
@@ -970,8 +1301,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             progress_bar (tqdm.tqdm or None):
                 The progress bar to update when sampling. If None, a new tqdm progress
                 bar will be created.
-            output_file_path (str or None):
-                The file to periodically write sampled rows to. If None, does not write
+            output_sink (sdv.sampling.sinks.BaseSink or None):
+                The sink to periodically write sampled rows to. If None, does not write
                 rows anywhere.
             keep_extra_columns (bool):
                 Whether to keep extra columns from the sampled data. Defaults to False.
@@ -984,37 +1315,40 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
         counter = 0
         num_valid = 0
-        prev_num_valid = None
         remaining = batch_size
-        sampled = pd.DataFrame()
+        sampled_chunks = []
+        empty_sample = pd.DataFrame()
 
+        # Only the newly sampled rows are filtered on each try. The valid ones are accumulated
+        # and materialized once at the end, which keeps reject sampling linear in the number
+        # of tries instead of re-filtering all the previously accepted rows every time.
+        profiler = getattr(self, '_sampling_profiler', None)
         while num_valid < batch_size and counter < max_tries:
-            prev_num_valid = num_valid
-            sampled, num_valid = self._sample_rows(
+            if profiler is not None:
+                profiler.current_try = counter + 1
+
+            new_sampled, num_new_valid_rows = self._sample_rows(
                 num_rows_to_sample,
                 conditions,
                 transformed_conditions,
                 float_rtol,
-                sampled,
-                keep_extra_columns,
+                keep_extra_columns=keep_extra_columns,
             )
 
-            num_new_valid_rows = num_valid - prev_num_valid
-            num_increase = min(num_new_valid_rows, remaining)
-            num_sampled = min(len(sampled), batch_size)
+            new_sampled = new_sampled.head(remaining)
+            num_increase = len(new_sampled)
             if num_increase > 0:
-                if output_file_path:
-                    append_kwargs = {'mode': 'a', 'header': False}
-                    append_kwargs = append_kwargs if os.path.getsize(output_file_path) > 0 else {}
-                    sampled.head(num_sampled).tail(num_increase).to_csv(
-                        output_file_path,
-                        index=False,
-                        **append_kwargs,
-                    )
+                sampled_chunks.append(new_sampled)
+                if output_sink is not None:
+                    output_sink.write(new_sampled)
 
                 if progress_bar is not None:
                     progress_bar.update(num_increase)
 
+            elif not sampled_chunks:
+                empty_sample = new_sampled
+
+            num_valid += num_increase
             remaining = batch_size - num_valid
             valid_rate = max(num_new_valid_rows, 1) / max(num_rows_to_sample, 1)
             num_rows_to_sample = min(10 * batch_size, int(remaining / valid_rate))
@@ -1026,7 +1360,13 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
             counter += 1
 
-        return sampled.head(min(len(sampled), batch_size))
+        if profiler is not None:
+            profiler.current_try = None
+
+        if not sampled_chunks:
+            return empty_sample
+
+        return pd.concat(sampled_chunks, ignore_index=True)
 
     @staticmethod
     def _make_condition_dfs(conditions):
@@ -1070,20 +1410,20 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         transformed_conditions=None,
         float_rtol=0.01,
         progress_bar=None,
-        output_file_path=None,
+        output_sink=None,
         keep_extra_columns=False,
     ):
         sampled = []
         batch_size = batch_size if num_rows > batch_size else num_rows
         for step in range(math.ceil(num_rows / batch_size)):
             sampled_rows = self._sample_batch(
-                batch_size=batch_size,
+                batch_size=min(batch_size, num_rows - step * batch_size),
                 max_tries=max_tries_per_batch,
                 conditions=conditions,
                 transformed_conditions=transformed_conditions,
                 float_rtol=float_rtol,
                 progress_bar=progress_bar,
-                output_file_path=output_file_path,
+                output_sink=output_sink,
                 keep_extra_columns=keep_extra_columns,
             )
             sampled.append(sampled_rows)
@@ -1091,6 +1431,60 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         sampled = pd.concat(sampled, ignore_index=True) if len(sampled) > 0 else pd.DataFrame()
         return sampled.head(num_rows)
 
+    def _sample_in_parallel(
+        self,
+        num_rows,
+        batch_size,
+        max_tries_per_batch,
+        n_jobs,
+        progress_bar=None,
+        output_sink=None,
+    ):
+        """Sample the batches in a pool of ``n_jobs`` processes.
+
+        The fitted synthesizer is serialized once and loaded by each worker when it starts.
+        Every batch is sampled with its own seed spawned from the synthesizer's seed sequence,
+        so the result only depends on the seed and the batch size, not on ``n_jobs``. The
+        key and anonymized columns are generated again in this process, in the batch order,
+        to avoid repeating the values generated by the different workers. The stages recorded
+        by the workers are added to the sampling profile, if enabled, tagged with their batch.
+        """
+        num_batches = math.ceil(num_rows / batch_size)
+        batch_sizes = [batch_size] * (num_batches - 1)
+        batch_sizes.append(num_rows - batch_size * (num_batches - 1))
+        seeds = self._spawn_sampling_seeds(num_batches)
+
+        sampled = []
+        executor = ProcessPoolExecutor(
+            max_workers=min(n_jobs, num_batches),
+            initializer=_initialize_sampling_worker,
+            initargs=(cloudpickle.dumps(self),),
+        )
+        try:
+            futures = [
+                executor.submit(_sample_batch_in_worker, size, max_tries_per_batch, seed)
+                for size, seed in zip(batch_sizes, seeds)
+            ]
+            profiler = getattr(self, '_sampling_profiler', None)
+            for batch, future in enumerate(futures, start=1):
+                sampled_rows, records = future.result()
+                if profiler is not None and records is not None:
+                    profiler.add_records(records, batch=batch)
+
+                sampled_rows = self._data_processor.regenerate_anonymized_columns(sampled_rows)
+                if output_sink is not None and len(sampled_rows) > 0:
+                    output_sink.write(sampled_rows)
+
+                if progress_bar is not None:
+                    progress_bar.update(len(sampled_rows))
+
+                sampled.append(sampled_rows)
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return pd.concat(sampled, ignore_index=True)
+
     def _conditionally_sample_rows(
         self,
         dataframe,
@@ -1101,7 +1495,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         float_rtol=0.01,
         graceful_reject_sampling=True,
         progress_bar=None,
-        output_file_path=None,
+        output_sink=None,
         keep_extra_columns=False,
     ):
         batch_size = batch_size or len(dataframe)
@@ -1113,7 +1507,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             transformed_conditions=transformed_condition,
             float_rtol=float_rtol,
             progress_bar=progress_bar,
-            output_file_path=output_file_path,
+            output_sink=output_sink,
             keep_extra_columns=keep_extra_columns,
         )
 
@@ -1140,6 +1534,19 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
         return sampled_rows
 
+    def _get_sampled_dtypes(self):
+        """Get the dtypes of the columns of the sampled rows, in the order of the metadata.
+
+        Returns:
+            dict:
+                Mapping of every column name to the dtype of its data when it was fitted, or
+                ``object`` if it is not known.
+        """
+        dtypes = self._data_processor._dtypes
+        dtypes = {} if dtypes is None else dict(dtypes)
+        columns = self._original_metadata.get_column_names(table_name=self._table_name)
+        return {column: dtypes.get(column, 'object') for column in columns}
+
     def _sample_with_progress_bar(
         self,
         num_rows,
@@ -1147,31 +1554,53 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         batch_size=None,
         output_file_path=None,
         show_progress_bar=True,
+        n_jobs=None,
     ):
         if num_rows is None:
             raise ValueError('You must specify the number of rows to sample (e.g. num_rows=100).')
 
+        n_jobs = _validate_n_jobs(n_jobs)
         sampled = pd.DataFrame()
         if num_rows == 0:
             return sampled
 
         output_file_path = validate_file_path(output_file_path)
+        output_sink = None
+        if output_file_path:
+            output_sink = create_sink(output_file_path, self._get_sampled_dtypes())
+        if n_jobs > 1 and not batch_size:
+            batch_size = math.ceil(num_rows / n_jobs)
+
         batch_size = min(batch_size, num_rows) if batch_size else num_rows
 
         try:
             with tqdm.tqdm(total=num_rows, disable=not show_progress_bar) as progress_bar:
                 progress_bar.set_description('Sampling rows')
-                sampled = self._sample_in_batches(
-                    num_rows=num_rows,
-                    batch_size=batch_size,
-                    max_tries_per_batch=max_tries_per_batch,
-                    progress_bar=progress_bar,
-                    output_file_path=output_file_path,
-                )
+                if n_jobs > 1 and num_rows > batch_size:
+                    sampled = self._sample_in_parallel(
+                        num_rows=num_rows,
+                        batch_size=batch_size,
+                        max_tries_per_batch=max_tries_per_batch,
+                        n_jobs=n_jobs,
+                        progress_bar=progress_bar,
+                        output_sink=output_sink,
+                    )
+                else:
+                    sampled = self._sample_in_batches(
+                        num_rows=num_rows,
+                        batch_size=batch_size,
+                        max_tries_per_batch=max_tries_per_batch,
+                        progress_bar=progress_bar,
+                        output_sink=output_sink,
+                    )
 
         except (Exception, KeyboardInterrupt) as error:
             handle_sampling_error(output_file_path, error)
 
+        finally:
+            if output_sink is not None:
+                output_sink.close()
+
         return sampled
 
     def _validate_fit_before_sample(self):
@@ -1181,7 +1610,14 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                 ' sampling synthetic data.'
             )
 
-    def sample(self, num_rows, max_tries_per_batch=100, batch_size=None, output_file_path=None):
+    def sample(
+        self,
+        num_rows,
+        max_tries_per_batch=100,
+        batch_size=None,
+        output_file_path=None,
+        n_jobs=None,
+    ):
         """Sample rows from this table.
 
         Args:
@@ -1190,10 +1626,17 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             max_tries_per_batch (int):
                 Number of times to retry sampling until the batch size is met. Defaults to 100.
             batch_size (int or None):
-                The batch size to sample. Defaults to ``num_rows``, if None.
+                The batch size to sample. Defaults to ``num_rows``, if None. When ``n_jobs``
+                is greater than 1, defaults to splitting the rows evenly across the processes.
             output_file_path (str or None):
-                The file to periodically write sampled rows to. If None, does not
-                write rows anywhere.
+                The file to periodically write sampled rows to. Files ending in ``.parquet``
+                are written as Parquet and the ones ending in ``.arrow``, ``.feather`` or
+                ``.ipc`` as Arrow IPC, which requires ``pyarrow``. Any other file is written
+                as CSV. If None, does not write rows anywhere.
+            n_jobs (int or None):
+                Number of processes used to sample the batches in parallel. ``-1`` uses all
+                the CPUs. The result is reproducible but differs from the one obtained
+                without parallelism. Defaults to ``None``, which samples sequentially.
 
         Returns:
             pandas.DataFrame:
@@ -1206,14 +1649,147 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         has_batches = batch_size is not None and batch_size != num_rows
         show_progress_bar = has_constraints or has_batches
 
-        sampled_data = self._sample_with_progress_bar(
+        with self._profile_sampling():
+            sampled_data = self._sample_with_progress_bar(
+                num_rows,
+                max_tries_per_batch,
+                batch_size,
+                output_file_path,
+                show_progress_bar=show_progress_bar,
+                n_jobs=n_jobs,
+            )
+
+        original_columns = getattr(self, '_original_columns', pd.Index([]))
+        if not original_columns.empty:
+            sampled_data.columns = self._original_columns
+
+        SYNTHESIZER_LOGGER.info({
+            'EVENT': 'Sample',
+            'TIMESTAMP': sample_timestamp,
+            'SYNTHESIZER CLASS NAME': self.__class__.__name__,
+            'SYNTHESIZER ID': self._synthesizer_id,
+            'TOTAL NUMBER OF TABLES': 1,
+            'TOTAL NUMBER OF ROWS': len(sampled_data),
+            'TOTAL NUMBER OF COLUMNS': len(sampled_data.columns),
+        })
+
+        return sampled_data
+
+    def _sample_iter(self, num_rows, batch_size, max_tries_per_batch, show_progress_bar):
+        sample_timestamp = datetime.datetime.now()
+        original_columns = getattr(self, '_original_columns', pd.Index([]))
+        num_sampled_rows = 0
+        num_columns = 0
+        try:
+            with self._profile_sampling():
+                with tqdm.tqdm(total=num_rows, disable=not show_progress_bar) as progress_bar:
+                    progress_bar.set_description('Sampling rows')
+                    for step in range(math.ceil(num_rows / batch_size)):
+                        sampled_rows = self._sample_batch(
+                            batch_size=min(batch_size, num_rows - step * batch_size),
+                            max_tries=max_tries_per_batch,
+                            progress_bar=progress_bar,
+                        )
+                        if len(sampled_rows) == 0:
+                            continue
+
+                        sampled_rows.index = pd.RangeIndex(
+                            num_sampled_rows, num_sampled_rows + len(sampled_rows)
+                        )
+                        if not original_columns.empty:
+                            sampled_rows.columns = original_columns
+
+                        num_sampled_rows += len(sampled_rows)
+                        num_columns = len(sampled_rows.columns)
+                        yield sampled_rows
+
+        finally:
+            SYNTHESIZER_LOGGER.info({
+                'EVENT': 'Sample',
+                'TIMESTAMP': sample_timestamp,
+                'SYNTHESIZER CLASS NAME': self.__class__.__name__,
+                'SYNTHESIZER ID': self._synthesizer_id,
+                'TOTAL NUMBER OF TABLES': 1,
+                'TOTAL NUMBER OF ROWS': num_sampled_rows,
+                'TOTAL NUMBER OF COLUMNS': num_columns,
+            })
+
+    def sample_iter(self, num_rows, batch_size, max_tries_per_batch=100):
+        """Sample rows from this table, yielding them in batches.
+
+        Unlike ``sample``, the batches are not concatenated, so only one batch is held in
+        memory at a time.
+
+        Args:
+            num_rows (int):
+                Number of rows to sample. This parameter is required.
+            batch_size (int):
+                Maximum number of rows in each of the yielded batches. This parameter is
+                required.
+            max_tries_per_batch (int):
+                Number of times to retry sampling until the batch size is met. Defaults to 100.
+
+        Returns:
+            generator:
+                A generator of ``pandas.DataFrame`` batches, whose index continues from the
+                previous batch. Fewer than ``num_rows`` rows may be sampled in total if
+                ``max_tries_per_batch`` is not enough to produce a complete batch.
+        """
+        self._validate_fit_before_sample()
+        self._check_input_metadata_updated()
+        if num_rows is None:
+            raise ValueError('You must specify the number of rows to sample (e.g. num_rows=100).')
+
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError(
+                f"Invalid value '{batch_size}' for parameter 'batch_size'. Please provide a "
+                'positive integer.'
+            )
+
+        has_constraints = bool(self._data_processor._constraints)
+        show_progress_bar = has_constraints or batch_size < num_rows
+        return self._sample_iter(num_rows, batch_size, max_tries_per_batch, show_progress_bar)
+
+    async def asample(self, num_rows, max_tries_per_batch=100, batch_size=None, sampler=None):
+        """Sample rows from this table without blocking the event loop.
+
+        The rows are sampled by a copy of the synthesizer in another process, so many calls
+        can be awaited at the same time. The result of each call only depends on the order
+        in which the calls were made.
+
+        Args:
+            num_rows (int):
+                Number of rows to sample. This parameter is required.
+            max_tries_per_batch (int):
+                Number of times to retry sampling until the batch size is met. Defaults to 100.
+            batch_size (int or None):
+                The batch size to sample. Defaults to ``num_rows``, if None.
+            sampler (sdv.sampling.AsyncSampler or None):
+                The sampler that runs the call, which sets the executor and the maximum
+                number of calls running at the same time. Defaults to a sampler that uses as
+                many processes as CPUs, which is created on the first call and discarded
+                when the synthesizer is fitted again.
+
+        Returns:
+            pandas.DataFrame:
+                Sampled data.
+        """
+        self._validate_fit_before_sample()
+        self._check_input_metadata_updated()
+        if num_rows is None:
+            raise ValueError('You must specify the number of rows to sample (e.g. num_rows=100).')
+
+        sample_timestamp = datetime.datetime.now()
+        sampler = sampler or get_default_async_sampler(self)
+        sampled_data = await sampler._run(
+            '_sample_with_progress_bar',
             num_rows,
             max_tries_per_batch,
             batch_size,
-            output_file_path,
-            show_progress_bar=show_progress_bar,
+            None,
+            False,
+            postprocess=self._data_processor.regenerate_anonymized_columns,
         )
-
         original_columns = getattr(self, '_original_columns', pd.Index([]))
         if not original_columns.empty:
             sampled_data.columns = self._original_columns
@@ -1252,7 +1828,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         max_tries_per_batch,
         batch_size,
         progress_bar=None,
-        output_file_path=None,
+        output_sink=None,
         keep_extra_columns=False,
     ):
         """Sample rows with conditions.
@@ -1266,8 +1842,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                 The batch size to use for each sampling call.
             progress_bar (tqdm.tqdm or None):
                 The progress bar to update.
-            output_file_path (str or None):
-                The file to periodically write sampled rows to. Defaults to None.
+            output_sink (sdv.sampling.sinks.BaseSink or None):
+                The sink to periodically write sampled rows to. Defaults to None.
             keep_extra_columns (bool):
                 Whether to keep extra columns from the sampled data. Defaults to False.
 
@@ -1325,7 +1901,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                     max_tries_per_batch=max_tries_per_batch,
                     batch_size=batch_size,
                     progress_bar=progress_bar,
-                    output_file_path=output_file_path,
+                    output_sink=output_sink,
                     keep_extra_columns=keep_extra_columns,
                 )
                 all_sampled_rows.append(sampled_rows)
@@ -1345,7 +1921,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                         max_tries_per_batch=max_tries_per_batch,
                         batch_size=batch_size,
                         progress_bar=progress_bar,
-                        output_file_path=output_file_path,
+                        output_sink=output_sink,
                         keep_extra_columns=keep_extra_columns,
                     )
                     all_sampled_rows.append(sampled_rows)
@@ -1401,7 +1977,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             batch_size (int):
                 The batch size to use per sampling call.
             output_file_path (str or None):
-                The file to periodically write sampled rows to. Defaults to None.
+                The file to periodically write sampled rows to. The format is chosen from
+                the extension as in ``sample``. Defaults to None.
 
         Returns:
             pandas.DataFrame:
@@ -1417,6 +1994,9 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         """
         self._validate_fit_before_sample()
         output_file_path = validate_file_path(output_file_path)
+        output_sink = None
+        if output_file_path:
+            output_sink = create_sink(output_file_path, self._get_sampled_dtypes())
 
         num_rows = functools.reduce(
             lambda num_rows, condition: condition.get_num_rows() + num_rows, conditions, 0
@@ -1427,7 +2007,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
         sampled = pd.DataFrame()
         try:
-            with tqdm.tqdm(total=num_rows) as progress_bar:
+            with self._profile_sampling(), tqdm.tqdm(total=num_rows) as progress_bar:
                 progress_bar.set_description('Sampling conditions')
                 for condition_dataframe in conditions:
                     sampled_for_condition = self._sample_with_conditions(
@@ -1435,7 +2015,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                         max_tries_per_batch,
                         batch_size,
                         progress_bar,
-                        output_file_path,
+                        output_sink,
                     )
                     sampled = pd.concat([sampled, sampled_for_condition], ignore_index=True)
 
@@ -1452,6 +2032,78 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         except (Exception, KeyboardInterrupt) as error:
             handle_sampling_error(output_file_path, error)
 
+        finally:
+            if output_sink is not None:
+                output_sink.close()
+
+        return sampled
+
+    def _sample_condition_dataframes(self, conditions, max_tries_per_batch, batch_size):
+        sampled = [
+            self._sample_with_conditions(condition_dataframe, max_tries_per_batch, batch_size)
+            for condition_dataframe in conditions
+        ]
+        return pd.concat(sampled, ignore_index=True)
+
+    async def asample_from_conditions(
+        self, conditions, max_tries_per_batch=100, batch_size=None, sampler=None
+    ):
+        """Sample rows from this table with the given conditions without blocking the event loop.
+
+        The rows are sampled as in ``asample``.
+
+        Args:
+            conditions (list[sdv.sampling.Condition, sdv.sampling.DataFrameCondition]):
+                A list of sdv.sampling.Condition and sdv.sampling.DataFrameCondition objects,
+                which specify the column values in a condition, along with the number of
+                rows for that condition.
+            max_tries_per_batch (int):
+                Number of times to retry sampling until the batch size is met. Defaults to 100.
+            batch_size (int):
+                The batch size to use per sampling call.
+            sampler (sdv.sampling.AsyncSampler or None):
+                The sampler that runs the call. Defaults to the one used by ``asample``.
+
+        Returns:
+            pandas.DataFrame:
+                Sampled data.
+
+        Raises:
+            ConstraintsNotMetError:
+                If the conditions are not valid for the given constraints.
+            ValueError:
+                If any of the following happens:
+                    * any of the conditions' columns are not valid.
+                    * no rows could be generated.
+        """
+        self._validate_fit_before_sample()
+        num_rows = functools.reduce(
+            lambda num_rows, condition: condition.get_num_rows() + num_rows, conditions, 0
+        )
+        conditions = self._make_condition_dfs(conditions)
+        self._validate_conditions(conditions)
+        condition_columns = {column for condition in conditions for column in condition.columns}
+        sampler = sampler or get_default_async_sampler(self)
+        sampled = await sampler._run(
+            '_sample_condition_dataframes',
+            conditions,
+            max_tries_per_batch,
+            batch_size,
+            postprocess=functools.partial(
+                self._data_processor.regenerate_anonymized_columns,
+                exclude_columns=condition_columns,
+            ),
+        )
+        is_reject_sampling = bool(
+            hasattr(self, '_model') and not isinstance(self._model, GaussianMultivariate)
+        )
+        check_num_rows(
+            num_rows=len(sampled),
+            expected_num_rows=num_rows,
+            is_reject_sampling=is_reject_sampling,
+            max_tries_per_batch=max_tries_per_batch,
+        )
+
         return sampled
 
     def _validate_known_columns(self, conditions):
@@ -1473,7 +2125,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             batch_size (int):
                 The batch size to use per sampling call.
             output_file_path (str or None):
-                The file to periodically write sampled rows to. Defaults to None.
+                The file to periodically write sampled rows to. The format is chosen from
+                the extension as in ``sample``. Defaults to None.
 
         Returns:
             pandas.DataFrame:
@@ -1488,15 +2141,18 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                     * no rows could be generated.
         """
         output_file_path = validate_file_path(output_file_path)
+        output_sink = None
+        if output_file_path:
+            output_sink = create_sink(output_file_path, self._get_sampled_dtypes())
 
         known_columns = known_columns.copy()
         self._validate_known_columns(known_columns)
         sampled = pd.DataFrame()
         try:
-            with tqdm.tqdm(total=len(known_columns)) as progress_bar:
+            with self._profile_sampling(), tqdm.tqdm(total=len(known_columns)) as progress_bar:
                 progress_bar.set_description('Sampling remaining columns')
                 sampled = self._sample_with_conditions(
-                    known_columns, max_tries_per_batch, batch_size, progress_bar, output_file_path
+                    known_columns, max_tries_per_batch, batch_size, progress_bar, output_sink
                 )
 
             is_reject_sampling = hasattr(self, '_model') and not isinstance(
@@ -1513,4 +2169,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         except (Exception, KeyboardInterrupt) as error:
             handle_sampling_error(output_file_path, error)
 
+        finally:
+            if output_sink is not None:
+                output_sink.close()
+
         return sampled
@@ -2,7 +2,11 @@
 
 import inspect
 import logging
+import math
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from copy import deepcopy
 
 import copulas.univariate
@@ -10,11 +14,15 @@ import numpy as np
 import pandas as pd
 import scipy
 from copulas import multivariate
+from copulas.utils import check_valid_values, get_qualified_name, set_random_state
+from pandas.api.types import is_float_dtype
 from rdt.transformers import OneHotEncoder
 
-from sdv.errors import NonParametricError
-from sdv.single_table.base import BaseSingleTableSynthesizer
+from sdv._utils import _cast_float_columns, _validate_precision
+from sdv.errors import NonParametricError, SynthesizerInputError
+from sdv.single_table.base import FIXED_RNG_SEED, BaseSingleTableSynthesizer
 from sdv.single_table.utils import (
+    _fit_univariates_in_worker,
     flatten_dict,
     unflatten_dict,
     validate_numerical_distributions,
@@ -24,6 +32,264 @@ from sdv.single_table.utils import (
 LOGGER = logging.getLogger(__name__)
 
 
+class LowRankGaussianMultivariate(multivariate.GaussianMultivariate):
+    """Gaussian copula whose correlation matrix is a low rank matrix plus a diagonal.
+
+    The correlation matrix is ``loadings @ loadings.T + diag(uniqueness)``, where the
+    ``loadings`` are the top eigenvectors of the correlation matrix of the data scaled by the
+    square root of their eigenvalues, and the ``uniqueness`` sets its diagonal to 1s. This is
+    always a valid correlation matrix, and it is learned, stored and sampled with
+    ``O(d * k)`` memory, where ``d`` is the number of columns and ``k`` the rank, without
+    building the dense ``d x d`` matrix. The dense matrix is only built when it is needed,
+    such as when sampling with conditions.
+
+    Args:
+        distribution (str or dict):
+            Fully qualified name of the class to be used for modeling the marginal
+            distributions or a dictionary mapping column names to the fully qualified
+            distribution names.
+        rank (int or float):
+            The rank of the low rank matrix or, if it is a float between 0 and 1, the
+            smallest rank that explains that fraction of the variance of the data.
+            Defaults to ``0.9``.
+        random_state (int, numpy.random.RandomState or None):
+            Seed or ``RandomState`` for the random generator. Defaults to ``None``.
+    """
+
+    _INITIAL_RANK = 16
+    _OVERSAMPLING = 10
+    _POWER_ITERATIONS = 4
+
+    loadings = None
+    uniqueness = None
+    _correlation = None
+
+    def __init__(self, distribution=copulas.univariate.Univariate, rank=0.9, random_state=None):
+        super().__init__(distribution=distribution, random_state=random_state)
+        self.rank = rank
+
+    def __repr__(self):
+        """Produce printable representation of the object."""
+        return f'LowRankGaussianMultivariate(rank={self.rank})'
+
+    def __getstate__(self):
+        """Drop the dense correlation matrix when pickling the model."""
+        state = self.__dict__.copy()
+        state.pop('_correlation', None)
+        return state
+
+    @property
+    def correlation(self):
+        """pandas.DataFrame: The dense correlation matrix, built the first time it is used."""
+        if self.loadings is None:
+            return None
+
+        if self._correlation is None:
+            correlation = self.loadings @ self.loadings.T
+            correlation[np.diag_indices_from(correlation)] += self.uniqueness
+            self._correlation = pd.DataFrame(correlation, index=self.columns, columns=self.columns)
+
+        return self._correlation
+
+    def _get_top_eigenpairs(self, scaled_data, rank):
+        """Get the top eigenvalues and eigenvectors of ``scaled_data.T @ scaled_data``.
+
+        They are computed with a randomized range finder with a fixed seed, which only
+        multiplies the data by ``O(rank)`` vectors, or with a singular value decomposition of
+        the data if the rank is close to the number of rows or columns.
+
+        Args:
+            scaled_data (numpy.ndarray):
+                The data, with one column per variable.
+            rank (int):
+                The number of eigenpairs to compute.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]:
+                The eigenvalues, in descending order, and their eigenvectors as columns.
+        """
+        num_components = rank + self._OVERSAMPLING
+        if num_components >= min(scaled_data.shape):
+            _, singular_values, right_vectors = np.linalg.svd(scaled_data, full_matrices=False)
+            return singular_values[:rank] ** 2, right_vectors[:rank].T
+
+        random_generator = np.random.default_rng(0)
+        basis = random_generator.standard_normal((scaled_data.shape[1], num_components))
+        basis, _ = np.linalg.qr(basis)
+        for _ in range(self._POWER_ITERATIONS):
+            basis, _ = np.linalg.qr(scaled_data.T @ (scaled_data @ basis))
+
+        _, singular_values, right_vectors = np.linalg.svd(scaled_data @ basis, full_matrices=False)
+        return singular_values[:rank] ** 2, basis @ right_vectors[:rank].T
+
+    def _get_eigenpairs(self, scaled_data):
+        """Get the eigenpairs of the rank of the model.
+
+        If the rank is a fraction of the variance, the number of computed eigenpairs is
+        doubled until they explain that fraction.
+
+        Args:
+            scaled_data (numpy.ndarray):
+                The data, with one column per variable.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]:
+                The eigenvalues, in descending order, and their eigenvectors as columns.
+        """
+        max_rank = min(scaled_data.shape)
+        if not isinstance(self.rank, float):
+            return self._get_top_eigenpairs(scaled_data, min(self.rank, max_rank))
+
+        total_variance = np.square(scaled_data).sum()
+        rank = min(self._INITIAL_RANK, max_rank)
+        while True:
+            eigenvalues, eigenvectors = self._get_top_eigenpairs(scaled_data, rank)
+            explained_variance = np.ones(rank)
+            if total_variance > 0:
+                explained_variance = np.cumsum(eigenvalues) / total_variance
+
+            if explained_variance[-1] >= self.rank or rank == max_rank:
+                rank = min(np.searchsorted(explained_variance, self.rank) + 1, rank)
+                return eigenvalues[:rank], eigenvectors[:, :rank]
+
+            rank = min(2 * rank, max_rank)
+
+    def _fit_correlation(self, X):
+        """Learn the loadings and uniqueness of the correlation matrix of the data.
+
+        Args:
+            X (pandas.DataFrame):
+                Data whose univariate distributions were already fitted.
+        """
+        normal = self._transform_to_normal(X)
+        normal = normal - normal.mean(axis=0)
+        scale = normal.std(axis=0, ddof=1) * np.sqrt(len(normal) - 1)
+        is_constant = ~(scale > 0)
+        scaled_data = np.divide(
+            normal, scale, out=np.zeros_like(normal), where=~is_constant[np.newaxis]
+        )
+        eigenvalues, eigenvectors = self._get_eigenpairs(scaled_data)
+        loadings = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+        norms = np.sqrt(np.square(loadings).sum(axis=1))
+        loadings /= np.maximum(norms, 1)[:, np.newaxis]
+        self.loadings = loadings
+        self.uniqueness = np.clip(1 - np.square(loadings).sum(axis=1), 0, None)
+        self._correlation = None
+
+    def _validate_input(self, X):
+        """Validate the input data, which cannot have infinite values."""
+        X = super()._validate_input(X)
+        if np.isinf(X.to_numpy()).any():
+            raise ValueError('There are infinite values in your data.')
+
+        return X
+
+    @check_valid_values
+    def fit(self, X):
+        """Compute the distribution for each variable and then its correlation matrix.
+
+        Args:
+            X (pandas.DataFrame):
+                Values of the random variables.
+
+        Raises:
+            ValueError:
+                If the data is empty, or has non-numerical, missing or infinite values.
+        """
+        X = self._validate_input(X)
+        self.columns, self.univariates = self._fit_columns(X)
+        self._fit_correlation(X)
+        self.fitted = True
+
+    def _sample_normal(self, num_rows, dtype=np.float64):
+        """Draw rows from the multivariate normal distribution of the correlation matrix.
+
+        Args:
+            num_rows (int):
+                Number of rows to sample.
+            dtype (str or numpy.dtype):
+                The float dtype of the samples. Defaults to ``numpy.float64``.
+
+        Returns:
+            numpy.ndarray:
+                The samples, with one column per variable.
+        """
+        samples = np.empty((num_rows, len(self.columns)), dtype=dtype)
+        for index in range(samples.shape[1]):
+            samples[:, index] = np.random.standard_normal(size=num_rows)
+
+        factors = np.random.standard_normal(size=(num_rows, self.loadings.shape[1]))
+        samples *= np.sqrt(self.uniqueness).astype(dtype)
+        samples += factors.astype(dtype) @ self.loadings.T.astype(dtype)
+        return samples
+
+    def _get_normal_samples(self, num_rows, conditions):
+        if conditions is None:
+            samples = self._sample_normal(num_rows)
+            return pd.DataFrame(samples, columns=self.columns)
+
+        return super()._get_normal_samples(num_rows, conditions)
+
+    def to_dict(self):
+        """Return a ``dict`` with the parameters to replicate this object.
+
+        Returns:
+            dict:
+                Parameters of this distribution.
+        """
+        self.check_fit()
+        return {
+            'loadings': self.loadings.tolist(),
+            'uniqueness': self.uniqueness.tolist(),
+            'rank': self.rank,
+            'univariates': [univariate.to_dict() for univariate in self.univariates],
+            'columns': self.columns,
+            'type': get_qualified_name(self),
+        }
+
+    @classmethod
+    def from_dict(cls, copula_dict):
+        """Create a new instance from a parameters dictionary.
+
+        Args:
+            copula_dict (dict):
+                Parameters of the distribution, in the same format as the one returned by the
+                ``to_dict`` method.
+
+        Returns:
+            LowRankGaussianMultivariate:
+                Instance of the distribution defined on the parameters.
+        """
+        instance = cls(rank=copula_dict['rank'])
+        instance.columns = copula_dict['columns']
+        instance.univariates = [
+            copulas.univariate.Univariate.from_dict(parameters)
+            for parameters in copula_dict['univariates']
+        ]
+        instance.loadings = np.array(copula_dict['loadings'], dtype=np.float64)
+        instance.loadings = instance.loadings.reshape(len(instance.columns), -1)
+        instance.uniqueness = np.array(copula_dict['uniqueness'], dtype=np.float64)
+        instance.fitted = True
+        return instance
+
+
+@check_valid_values
+def _validate_model_input(model, X):
+    """Validate the data to fit as ``fit`` of the copulas model does.
+
+    Args:
+        model (copulas.multivariate.GaussianMultivariate):
+            The model to fit.
+        X (pandas.DataFrame):
+            The data to fit.
+
+    Raises:
+        ValueError:
+            If the data is not valid for the model.
+    """
+    model._validate_input(X)
+
+
 class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
     """Model wrapping ``copulas.multivariate.GaussianMultivariate`` copula.
 
@@ -65,6 +331,24 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
                 * ``gaussian_kde``: Use a GaussianKDE distribution. This model is non-parametric,
                   so using this will make ``get_parameters`` unusable.
              Defaults to ``beta``.
+        precision (str):
+            The float dtype of the transformed data, the learned correlation (or the loadings
+            and uniqueness when ``correlation_rank`` is set) and the sampled data before it is
+            reverse transformed, either ``'float64'`` or ``'float32'``. With ``'float32'`` the
+            univariate distributions are learned from the ``float32`` transformed data, which
+            keeps about 7 significant digits, and the normal samples are drawn and correlated
+            in ``float32``. Only the conversion of one column at a time through its univariate
+            distribution is computed in ``float64``. The ``HMASynthesizer`` also rounds the
+            correlations that it learns for each parent row to ``float32``. The overall quality
+            report score is expected to stay within ``0.05`` of the one obtained with
+            ``'float64'``. Defaults to ``'float64'``.
+        correlation_rank (int, float or None):
+            If given, the correlation matrix is modeled as a low rank matrix plus a diagonal,
+            using a ``LowRankGaussianMultivariate``, which takes ``O(d * k)`` memory and time
+            to learn and sample instead of ``O(d^2)``, where ``d`` is the number of columns.
+            An int sets the rank ``k``, and a float between 0 and 1 uses the smallest rank
+            that explains that fraction of the variance of the data. Defaults to ``None``,
+            which models the full correlation matrix.
     """
 
     _DISTRIBUTIONS = {
@@ -76,6 +360,8 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
         'gaussian_kde': copulas.univariate.GaussianKDE,
     }
 
+    _CONDITIONAL_FACTORS_CACHE_SIZE = 32
+
     @classmethod
     def get_distribution_class(cls, distribution):
         """Return the corresponding distribution class from ``copulas.univariate``.
@@ -102,7 +388,11 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
         locales=['en_US'],
         numerical_distributions=None,
         default_distribution=None,
+        precision='float64',
+        correlation_rank=None,
     ):
+        _validate_precision(precision)
+        self._validate_correlation_rank(correlation_rank)
         super().__init__(
             metadata,
             enforce_min_max_values=enforce_min_max_values,
@@ -119,6 +409,24 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
 
         self._set_numerical_distributions(numerical_distributions)
         self._num_rows = None
+        self._conditional_factors = OrderedDict()
+        self._correlation_factor = None
+        self.precision = precision
+        self._data_processor._precision = precision
+        self.correlation_rank = correlation_rank
+
+    @staticmethod
+    def _validate_correlation_rank(correlation_rank):
+        if correlation_rank is None:
+            return
+
+        is_rank = isinstance(correlation_rank, int) and correlation_rank > 0
+        is_fraction = isinstance(correlation_rank, float) and 0 < correlation_rank < 1
+        if isinstance(correlation_rank, bool) or not (is_rank or is_fraction):
+            raise SynthesizerInputError(
+                f"Invalid value '{correlation_rank}' for parameter 'correlation_rank'. Please "
+                'provide a positive integer, a float between 0 and 1, or None.'
+            )
 
     def _set_numerical_distributions(self, numerical_distributions):
         self.numerical_distributions = numerical_distributions or {}
@@ -136,6 +444,8 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
         """
         warn_missing_numerical_distributions(self.numerical_distributions, processed_data.columns)
         self._num_rows = self._learn_num_rows(processed_data)
+        self._conditional_factors = OrderedDict()
+        self._correlation_factor = None
         numerical_distributions = self._get_numerical_distributions(processed_data)
         self._model = self._initialize_model(numerical_distributions)
         self._fit_model(processed_data)
@@ -154,12 +464,82 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
         return numerical_distributions
 
     def _initialize_model(self, numerical_distributions):
+        correlation_rank = getattr(self, 'correlation_rank', None)
+        if correlation_rank is not None:
+            return LowRankGaussianMultivariate(
+                distribution=numerical_distributions, rank=correlation_rank
+            )
+
         return multivariate.GaussianMultivariate(distribution=numerical_distributions)
 
-    def _fit_model(self, processed_data):
+    def add_constraints(self, constraints):
+        """Add the list of constraint-augmented generation constraints to the synthesizer.
+
+        Args:
+            constraints (list):
+                A list of constraints to apply to the synthesizer.
+        """
+        super().add_constraints(constraints)
+        self._data_processor._precision = self.precision
+
+    def _fit_univariates_in_parallel(self, processed_data, n_jobs):
+        """Fit the univariate distributions of the model in a pool of ``n_jobs`` processes.
+
+        The columns are split in up to ``n_jobs`` contiguous chunks, and then the correlation
+        is computed as ``GaussianMultivariate.fit`` does, so the fitted model is the same as
+        when fitting all the columns in a single process. The data is validated as
+        ``GaussianMultivariate.fit`` does before starting the processes.
+
+        Args:
+            processed_data (pandas.DataFrame):
+                Data to be learned.
+            n_jobs (int):
+                Number of processes to use.
+        """
+        _validate_model_input(self._model, processed_data)
+        columns = list(processed_data.columns)
+        chunk_size = math.ceil(len(columns) / n_jobs)
+        chunks = [
+            processed_data.iloc[:, start : start + chunk_size]
+            for start in range(0, len(columns), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(
+                executor.map(_fit_univariates_in_worker, [self._model] * len(chunks), chunks)
+            )
+
+        self._model.columns = [column for chunk_columns, _ in results for column in chunk_columns]
+        self._model.univariates = [
+            univariate for _, chunk_univariates in results for univariate in chunk_univariates
+        ]
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', module='scipy')
-            self._model.fit(processed_data)
+            if isinstance(self._model, LowRankGaussianMultivariate):
+                self._model._fit_correlation(processed_data)
+            else:
+                self._model.correlation = self._model._get_correlation(processed_data)
+
+        self._model.fitted = True
+
+    def _fit_model(self, processed_data):
+        n_jobs = getattr(self, '_n_jobs', 1)
+        if n_jobs > 1 and len(processed_data.columns) > 1:
+            n_jobs = min(n_jobs, len(processed_data.columns))
+            self._fit_univariates_in_parallel(processed_data, n_jobs)
+        else:
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', module='scipy')
+                self._model.fit(processed_data)
+
+        precision = getattr(self, 'precision', 'float64')
+        if precision == 'float64':
+            return
+
+        if isinstance(self._model, LowRankGaussianMultivariate):
+            self._model.loadings = self._model.loadings.astype(precision)
+            self._model.uniqueness = self._model.uniqueness.astype(precision)
+        else:
+            self._model.correlation = self._model.correlation.astype(precision)
 
     def _warn_quality_and_performance(self, column_name_to_transformer):
         """Raise warning if the quality/performance may be impacted.
@@ -190,7 +570,401 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
             pandas.DataFrame:
                 Sampled data.
         """
-        return self._model.sample(num_rows, conditions=conditions)
+        precision = getattr(self, 'precision', 'float64')
+        if conditions:
+            sampled = self._sample_conditioned(num_rows, conditions)
+            if precision == 'float64':
+                return sampled
+
+            return _cast_float_columns(sampled, 'float64', precision)
+
+        return self._sample_with_precision(num_rows, precision)
+
+    @staticmethod
+    def _get_covariance_factor(covariance):
+        """Get a matrix ``L`` such that ``L @ L.T`` is the given covariance matrix.
+
+        Args:
+            covariance (numpy.ndarray):
+                Symmetric positive semi-definite matrix.
+
+        Returns:
+            numpy.ndarray:
+                The lower triangular Cholesky factor of the matrix or, if it is singular, the
+                eigenvectors scaled by the square root of the eigenvalues.
+        """
+        try:
+            return np.linalg.cholesky(covariance)
+        except np.linalg.LinAlgError:
+            # The covariance is singular when some columns are fully determined by the others
+            eigenvalues, eigenvectors = scipy.linalg.eigh(covariance)
+            return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+    def _get_correlation_factor(self):
+        """Get the factor used to correlate the standard normal samples of the model.
+
+        The factor is computed from the correlation matrix the same way as
+        ``numpy.random.multivariate_normal`` does, so the samples do not change, but only
+        once. It is kept, and saved with the synthesizer, until the model is fitted or its
+        parameters are set again.
+
+        Returns:
+            numpy.ndarray:
+                A matrix ``F`` such that ``F.T @ F`` is the correlation matrix.
+        """
+        if getattr(self, '_correlation_factor', None) is None:
+            correlation = self._model.correlation.to_numpy(dtype=np.float64)
+            _, singular_values, right_vectors = np.linalg.svd(correlation)
+            self._correlation_factor = np.sqrt(singular_values)[:, np.newaxis] * right_vectors
+
+        return self._correlation_factor
+
+    def _sample_with_precision(self, num_rows, precision):
+        """Sample from the model keeping the sampled matrix in the given float precision.
+
+        The normal samples are drawn and correlated in ``precision`` with the factor of the
+        correlation matrix, which is only computed once. Each column is then converted to the
+        uniform space and sampled from its univariate distribution in ``float64``, one column
+        at a time, so only a single column is held in ``float64``.
+
+        Args:
+            num_rows (int):
+                Amount of rows to sample.
+            precision (str):
+                The float dtype of the sampled data.
+
+        Returns:
+            pandas.DataFrame:
+                Sampled data.
+        """
+        model = self._model
+        model.check_fit()
+        random_state = nullcontext()
+        if model.random_state is not None:
+            random_state = set_random_state(model.random_state, model.set_random_state)
+
+        if isinstance(model, LowRankGaussianMultivariate):
+            with random_state:
+                samples = model._sample_normal(num_rows, dtype=precision)
+
+        else:
+            correlation_factor = self._get_correlation_factor().astype(precision, copy=False)
+            with random_state:
+                if precision == 'float64':
+                    samples = np.random.standard_normal(size=(num_rows, len(model.columns)))
+                else:
+                    samples = np.empty((num_rows, len(model.columns)), dtype=precision)
+                    for index in range(samples.shape[1]):
+                        samples[:, index] = np.random.standard_normal(size=num_rows)
+
+            samples = samples @ correlation_factor
+
+        output = {}
+        for column_name, univariate, column_samples in zip(
+            model.columns, model.univariates, samples.T
+        ):
+            cdf = scipy.stats.norm.cdf(column_samples.astype(np.float64))
+            output[column_name] = univariate.percent_point(cdf).astype(precision)
+
+        return pd.DataFrame(output)
+
+    def _get_conditional_factors(self, condition_columns):
+        """Get the factors of the normal distribution conditioned on the given columns.
+
+        The mean of the conditioned distribution is the product of the regression matrix and
+        the condition values in the normal space, and its covariance does not depend on them.
+        The factors are cached by the set of condition columns, keeping the ones of the
+        ``_CONDITIONAL_FACTORS_CACHE_SIZE`` most recently used sets, until the model changes.
+
+        Args:
+            condition_columns (list):
+                Model columns that are being conditioned on.
+
+        Returns:
+            tuple:
+                * list:
+                    Model columns that are sampled.
+                * numpy.ndarray:
+                    Regression matrix of the sampled columns on the condition columns,
+                    in the order of the model columns.
+                * numpy.ndarray:
+                    Lower triangular factor of the covariance matrix of the sampled columns.
+        """
+        if not hasattr(self, '_conditional_factors'):
+            self._conditional_factors = OrderedDict()
+
+        key = frozenset(condition_columns)
+        if key in self._conditional_factors:
+            self._conditional_factors.move_to_end(key)
+            return self._conditional_factors[key]
+
+        correlation = self._model.correlation
+        condition_columns = [column for column in self._model.columns if column in key]
+        columns = [column for column in self._model.columns if column not in key]
+        sigma11 = correlation.loc[columns, columns].to_numpy()
+        sigma12 = correlation.loc[columns, condition_columns].to_numpy()
+        sigma22 = correlation.loc[condition_columns, condition_columns].to_numpy()
+        regression = np.linalg.solve(sigma22, sigma12.T).T
+        covariance = sigma11 - regression @ sigma12.T
+        covariance_factor = self._get_covariance_factor(covariance)
+
+        factors = (columns, regression, covariance_factor)
+        self._conditional_factors[key] = factors
+        if len(self._conditional_factors) > self._CONDITIONAL_FACTORS_CACHE_SIZE:
+            self._conditional_factors.popitem(last=False)
+
+        return factors
+
+    def _sample_conditioned(self, num_rows, conditions):
+        """Sample rows from the model conditioned on the same values.
+
+        This samples the same distribution as ``GaussianMultivariate.sample`` with
+        ``conditions``, but the factors of the conditioned distribution are taken from
+        ``_get_conditional_factors``, so they are only computed once for every set of
+        condition columns.
+
+        Args:
+            num_rows (int):
+                Amount of rows to sample.
+            conditions (dict):
+                Mapping of the model columns to the values to condition on.
+
+        Returns:
+            pandas.DataFrame:
+                Sampled data in the model format.
+        """
+        model = self._model
+        model.check_fit()
+        condition_columns = [column for column in model.columns if column in conditions]
+        # Like the batch path, leave the model to reject conditions that fix every column
+        if len(condition_columns) == len(model.columns):
+            return model.sample(num_rows, conditions=conditions)
+
+        normal_conditions = model._transform_to_normal(pd.Series(conditions)[condition_columns])
+        columns, regression, covariance_factor = self._get_conditional_factors(condition_columns)
+        random_state = nullcontext()
+        if model.random_state is not None:
+            random_state = set_random_state(model.random_state, model.set_random_state)
+
+        with random_state:
+            samples = np.random.standard_normal(size=(num_rows, len(columns)))
+
+        samples = samples @ covariance_factor.T + normal_conditions @ regression.T
+
+        output = {}
+        sampled_columns = dict(zip(columns, samples.T))
+        for column_name, univariate in zip(model.columns, model.univariates):
+            if column_name in sampled_columns:
+                cdf = scipy.stats.norm.cdf(sampled_columns[column_name])
+                output[column_name] = univariate.percent_point(cdf)
+            else:
+                output[column_name] = np.full(num_rows, conditions[column_name])
+
+        return pd.DataFrame(output)
+
+    def _sample_conditions_in_batch(self, transformed_conditions):
+        """Sample one row for each row of conditions with a single draw from the model.
+
+        Args:
+            transformed_conditions (pandas.DataFrame):
+                Conditions in the model format, one row for each row to sample.
+
+        Returns:
+            pandas.DataFrame:
+                Sampled data in the model format.
+        """
+        model = self._model
+        condition_columns = [column for column in model.columns if column in transformed_conditions]
+        transformed_conditions = transformed_conditions[condition_columns]
+        normal_conditions = model._transform_to_normal(transformed_conditions)
+        columns, regression, covariance_factor = self._get_conditional_factors(condition_columns)
+
+        num_rows = len(transformed_conditions)
+        with set_random_state(model.random_state, model.set_random_state):
+            samples = np.random.standard_normal(size=(num_rows, len(columns)))
+
+        samples = samples @ covariance_factor.T + normal_conditions @ regression.T
+
+        output = {}
+        sampled_columns = dict(zip(columns, samples.T))
+        for column_name, univariate in zip(model.columns, model.univariates):
+            if column_name in sampled_columns:
+                cdf = scipy.stats.norm.cdf(sampled_columns[column_name])
+                output[column_name] = univariate.percent_point(cdf)
+            else:
+                output[column_name] = transformed_conditions[column_name].to_numpy()
+
+        return pd.DataFrame(output)
+
+    @staticmethod
+    def _filter_matching_conditions(sampled, conditions, float_rtol):
+        """Filter the sampled rows that match the condition values in the same position.
+
+        Float values closer than ``float_rtol`` to the condition are considered a match and
+        replaced by the exact condition value.
+
+        Args:
+            sampled (pandas.DataFrame):
+                The sampled rows, reverse transformed.
+            conditions (pandas.DataFrame):
+                The condition values for each sampled row.
+            float_rtol (float):
+                Maximum tolerance when considering a float match.
+
+        Returns:
+            pandas.DataFrame:
+                Rows from the sampled data that match their conditions.
+        """
+        is_match = np.ones(len(sampled), dtype=bool)
+        for column in conditions.columns:
+            condition_values = conditions[column].to_numpy()
+            column_values = sampled[column]
+            if is_float_dtype(column_values.dtype):
+                condition_values = condition_values.astype(float)
+                distance = np.abs(condition_values) * float_rtol
+                is_match &= np.abs(column_values.to_numpy() - condition_values) <= distance
+                condition_values = pd.Series(
+                    condition_values, index=sampled.index, dtype=column_values.dtype
+                )
+                sampled = sampled.assign(**{column: condition_values})
+            else:
+                is_match &= column_values.to_numpy() == condition_values
+
+        return sampled[is_match]
+
+    def _can_sample_conditions_in_batch(self, conditions, keep_extra_columns):
+        if keep_extra_columns or not self._model or conditions.isna().to_numpy().any():
+            return False
+
+        if getattr(self, '_chained_constraints', None) or self._data_processor._constraints:
+            return False
+
+        columns = self._data_processor.metadata.columns
+        return all(
+            columns.get(column, {}).get('sdtype') in ('boolean', 'categorical', 'numerical')
+            for column in conditions.columns
+        )
+
+    def _sample_with_conditions(
+        self,
+        conditions,
+        max_tries_per_batch,
+        batch_size,
+        progress_bar=None,
+        output_sink=None,
+        keep_extra_columns=False,
+    ):
+        """Sample rows with conditions.
+
+        The distinct conditions are transformed together and every row is drawn from its
+        conditional distribution in one pass over the model, instead of sampling each group
+        of conditions on its own. Rows that do not match their conditions after being reverse
+        transformed go through the reject-sampling loop of the base synthesizer.
+
+        Args:
+            conditions (pandas.DataFrame):
+                A DataFrame representing the conditions to be sampled.
+            max_tries_per_batch (int):
+                Number of times to retry sampling until the batch size is met. Defaults to 100.
+            batch_size (int):
+                The maximum number of rows to draw from the model at once.
+            progress_bar (tqdm.tqdm or None):
+                The progress bar to update.
+            output_sink (sdv.sampling.sinks.BaseSink or None):
+                The sink to periodically write sampled rows to. Defaults to None.
+            keep_extra_columns (bool):
+                Whether to keep extra columns from the sampled data. Defaults to False.
+
+        Returns:
+            pandas.DataFrame:
+                Sampled data.
+        """
+        if not self._can_sample_conditions_in_batch(conditions, keep_extra_columns):
+            return super()._sample_with_conditions(
+                conditions,
+                max_tries_per_batch,
+                batch_size,
+                progress_bar=progress_bar,
+                output_sink=output_sink,
+                keep_extra_columns=keep_extra_columns,
+            )
+
+        condition_columns = list(conditions.columns)
+        grouped_conditions = conditions.groupby(condition_columns, sort=False)
+        distinct_conditions = conditions.loc[~conditions.duplicated(condition_columns)]
+        transformed_conditions = self._transform_conditions(distinct_conditions)
+        # The conditions must map to model columns and leave at least one column to sample
+        if not set(transformed_conditions.columns) < set(self._model.columns):
+            return super()._sample_with_conditions(
+                conditions,
+                max_tries_per_batch,
+                batch_size,
+                progress_bar=progress_bar,
+                output_sink=output_sink,
+            )
+
+        if not self._random_state_set:
+            self._set_random_state(FIXED_RNG_SEED)
+
+        transformed_conditions = transformed_conditions.iloc[grouped_conditions.ngroup()]
+        batch_size = batch_size or len(conditions)
+        all_sampled_rows = []
+        unmatched = []
+        for start in range(0, len(conditions), batch_size):
+            batch_conditions = conditions.iloc[start : start + batch_size]
+            with self._profile_stage('model_sample', len(batch_conditions)) as stage:
+                raw_sampled = self._sample_conditions_in_batch(
+                    transformed_conditions.iloc[start : start + batch_size].reset_index(drop=True)
+                )
+                stage['rows_out'] = len(raw_sampled)
+
+            with self._profile_stage('reverse_transform', len(raw_sampled)) as stage:
+                sampled = self._data_processor.reverse_transform(raw_sampled)
+                stage['rows_out'] = len(sampled)
+
+            with self._profile_stage('reverse_transform_constraints', len(sampled)) as stage:
+                sampled = self.reverse_transform_constraints(sampled)
+                stage['rows_out'] = len(sampled)
+
+            with self._profile_stage('filter_valid', len(sampled)) as stage:
+                sampled = self._data_processor.filter_valid(sampled)
+                stage['rows_out'] = len(sampled)
+
+            with self._profile_stage('filter_conditions', len(sampled)) as stage:
+                sampled = self._filter_matching_conditions(
+                    sampled, batch_conditions.iloc[sampled.index], float_rtol=0.01
+                )
+                stage['rows_out'] = len(sampled)
+
+            positions = sampled.index.to_numpy()
+            sampled.index = batch_conditions.index[positions]
+            is_unmatched = np.ones(len(batch_conditions), dtype=bool)
+            is_unmatched[positions] = False
+            unmatched.append(batch_conditions[is_unmatched])
+            if len(sampled) > 0:
+                if output_sink is not None:
+                    output_sink.write(sampled)
+
+                if progress_bar is not None:
+                    progress_bar.update(len(sampled))
+
+                all_sampled_rows.append(sampled)
+
+        unmatched = pd.concat(unmatched)
+        if len(unmatched) > 0:
+            all_sampled_rows.append(
+                super()._sample_with_conditions(
+                    unmatched,
+                    max_tries_per_batch,
+                    batch_size,
+                    progress_bar=progress_bar,
+                    output_sink=output_sink,
+                )
+            )
+
+        all_sampled_rows = pd.concat(all_sampled_rows) if all_sampled_rows else pd.DataFrame()
+        all_sampled_rows.index.name = None
+        return all_sampled_rows.sort_index()
 
     def _get_valid_columns_from_metadata(self, columns):
         valid_columns = []
@@ -262,6 +1036,11 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
                 raise NonParametricError('This GaussianCopula uses non parametric distributions')
 
         params = self._model.to_dict()
+        if isinstance(self._model, LowRankGaussianMultivariate):
+            for key in ('loadings', 'uniqueness', 'rank'):
+                params.pop(key)
+
+            params['correlation'] = self._model.correlation.to_numpy().tolist()
 
         correlation = []
         for index, row in enumerate(params['correlation'][1:]):
@@ -274,46 +1053,88 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
         return flatten_dict(params)
 
     @staticmethod
-    def _get_nearest_correlation_matrix(matrix):
+    def _get_nearest_correlation_matrix(matrix, tolerance=1e-8, max_iterations=100):
         """Find the nearest correlation matrix.
 
-        If the given matrix is not Positive Semi-definite, which means
-        that any of its eigenvalues is negative, find the nearest PSD matrix
-        by setting the negative eigenvalues to 0 and rebuilding the matrix
-        from the same eigenvectors and the modified eigenvalues.
-
-        After this, the matrix will be PSD but may not have 1s in the diagonal,
-        so the diagonal is replaced by 1s and then the PSD condition of the
-        matrix is validated again, repeating the process until the built matrix
-        contains 1s in all the diagonal and is PSD.
+        The matrix is returned unmodified if it is already Positive Semi-definite, which is
+        checked with a Cholesky decomposition and, only if that fails because the matrix is
+        singular, with its eigenvalues.
 
-        After 10 iterations, the last step is skipped and the current PSD matrix
-        is returned even if it does not have all 1s in the diagonal.
+        Otherwise, the nearest correlation matrix is found with the alternating projections
+        method of Higham (2002), which alternates between projecting onto the PSD matrices,
+        by setting the negative eigenvalues to 0, and onto the matrices with 1s in the
+        diagonal, using Dykstra's correction. The iterations stop once the relative change of
+        the matrix is below ``tolerance``, and the last PSD projection is rescaled so its
+        diagonal is exactly 1.
 
-        Insipired by: https://stackoverflow.com/a/63131250
-        """
-        eigenvalues, eigenvectors = scipy.linalg.eigh(matrix)
-        negative = eigenvalues < 0
-        identity = np.identity(len(matrix))
+        Based on: Higham, N. J. (2002). Computing the nearest correlation matrix - a problem
+        from finance. IMA Journal of Numerical Analysis, 22(3), 329-343.
 
-        iterations = 0
-        while np.any(negative):
-            eigenvalues[negative] = 0
-            matrix = eigenvectors.dot(np.diag(eigenvalues)).dot(eigenvectors.T)
-            if iterations >= 10:
-                break
+        Args:
+            matrix (numpy.ndarray):
+                A symmetric matrix, or an array of shape ``(num_matrices, size, size)`` to
+                repair many matrices at once.
+            tolerance (float):
+                Eigenvalues above ``-tolerance`` are considered non negative, and the
+                iterations stop when the relative change is below it. Defaults to ``1e-8``.
+            max_iterations (int):
+                Maximum number of alternating projections. Defaults to 100.
 
-            matrix = matrix - matrix * identity + identity
+        Returns:
+            numpy.ndarray:
+                The nearest correlation matrix, or matrices, with the same shape as the input.
+        """
+        matrices = matrix if matrix.ndim == 3 else matrix[np.newaxis]
+        try:
+            np.linalg.cholesky(matrices)
+            return matrix
+        except np.linalg.LinAlgError:
+            min_eigenvalues = np.linalg.eigvalsh(matrices).min(axis=1)
+            to_repair = np.flatnonzero(min_eigenvalues < -tolerance)
+            if not len(to_repair):
+                return matrix
+
+        original = matrices[to_repair].astype(float)
+        original = (original + np.swapaxes(original, 1, 2)) / 2
+        diagonal = np.arange(original.shape[1])
+        remaining = np.arange(len(original))
+        repaired = np.empty_like(original)
+        unit_diagonal = projected = original
+        correction = np.zeros_like(original)
+        for _ in range(max_iterations):
+            residual = unit_diagonal - correction
+            eigenvalues, eigenvectors = np.linalg.eigh(residual)
+            eigenvalues = np.clip(eigenvalues, 0, None)[:, np.newaxis]
+            projected = (eigenvectors * eigenvalues) @ np.swapaxes(eigenvectors, 1, 2)
+            correction = projected - residual
+            previous = unit_diagonal
+            unit_diagonal = projected.copy()
+            unit_diagonal[:, diagonal, diagonal] = 1
+            change = np.linalg.norm(unit_diagonal - previous, axis=(1, 2))
+            converged = change <= tolerance * np.linalg.norm(unit_diagonal, axis=(1, 2))
+            if converged.any():
+                repaired[remaining[converged]] = projected[converged]
+                pending = ~converged
+                remaining = remaining[pending]
+                unit_diagonal = unit_diagonal[pending]
+                correction = correction[pending]
+                projected = projected[pending]
+                if not len(remaining):
+                    break
 
-            max_value = np.abs(np.abs(matrix).max())
-            if max_value > 1:
-                matrix /= max_value
+        repaired[remaining] = projected
+        scale = np.sqrt(repaired[:, diagonal, diagonal])
+        scale[scale == 0] = 1
+        repaired = repaired / scale[:, :, np.newaxis] / scale[:, np.newaxis, :]
+        repaired = (repaired + np.swapaxes(repaired, 1, 2)) / 2
+        repaired[:, diagonal, diagonal] = 1
 
-            eigenvalues, eigenvectors = scipy.linalg.eigh(matrix)
-            negative = eigenvalues < 0
-            iterations += 1
+        if matrix.ndim == 2:
+            return repaired[0]
 
-        return matrix
+        result = matrices.astype(float)
+        result[to_repair] = repaired
+        return result
 
     @classmethod
     def _rebuild_correlation_matrix(cls, triangular_correlation):
@@ -338,23 +1159,39 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
             numpy.ndarray:
                 rebuilt correlation matrix.
         """
-        zero = [0.0]
         size = len(triangular_correlation) + 1
-        left = np.zeros((size, size))
-        right = np.zeros((size, size))
-        for idx, values in enumerate(triangular_correlation):
-            values = values + zero * (size - idx - 1)
-            left[idx + 1, :] = values
-            right[:, idx + 1] = values
+        lower_triangle = [value for values in triangular_correlation for value in values]
+        correlation = cls._rebuild_correlation_matrices(np.array([lower_triangle]), size)
+
+        return correlation[0].tolist()
 
-        correlation = left + right
-        max_value = np.abs(correlation).max()
-        if max_value > 1:
-            correlation /= max_value
+    @classmethod
+    def _rebuild_correlation_matrices(cls, lower_triangles, size):
+        """Rebuild a batch of valid correlation matrices from their lower half triangles.
 
-        correlation += np.identity(size)
+        Each matrix is rebuilt like ``_rebuild_correlation_matrix`` does, but the nearest
+        correlation matrices are found for the whole batch at once.
+
+        Args:
+            lower_triangles (numpy.ndarray):
+                Array of shape ``(num_matrices, size * (size - 1) / 2)`` with the values below
+                the diagonal of each matrix, row by row.
+            size (int):
+                The size of the correlation matrices.
+
+        Returns:
+            numpy.ndarray:
+                Array of shape ``(num_matrices, size, size)`` with the rebuilt matrices.
+        """
+        rows, columns = np.tril_indices(size, -1)
+        correlations = np.zeros((len(lower_triangles), size, size))
+        correlations[:, rows, columns] = lower_triangles
+        correlations[:, columns, rows] = lower_triangles
+        max_values = np.abs(correlations).max(axis=(1, 2))
+        correlations[max_values > 1] /= max_values[max_values > 1, np.newaxis, np.newaxis]
+        correlations += np.identity(size)
 
-        return cls._get_nearest_correlation_matrix(correlation).tolist()
+        return cls._get_nearest_correlation_matrix(correlations)
 
     def _rebuild_gaussian_copula(self, model_parameters, default_params=None):
         """Rebuild the model params to recreate a Gaussian Multivariate instance.
@@ -444,3 +1281,5 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
         if parameters:
             parameters = self._rebuild_gaussian_copula(parameters, default_params)
             self._model = multivariate.GaussianMultivariate.from_dict(parameters)
+            self._conditional_factors = OrderedDict()
+            self._correlation_factor = None
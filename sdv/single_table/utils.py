@@ -3,13 +3,16 @@
 import os
 import warnings
 
+import cloudpickle
 import numpy as np
+import pandas as pd
 
 from sdv.errors import SynthesizerInputError
 from sdv.metadata import Metadata
 
 DISABLE_TMP_FILE = 'disable'
 IGNORED_DICT_KEYS = ['fitted', 'distribution', 'type']
+_WORKER_SYNTHESIZER = None
 
 
 def detect_discrete_columns(metadata, data, transformers):
@@ -112,6 +115,61 @@ def handle_sampling_error(output_file_path, sampling_error):
     raise sampling_error
 
 
+def _initialize_sampling_worker(serialized_synthesizer):
+    """Load the synthesizer shipped to a sampling worker process once, when it starts."""
+    global _WORKER_SYNTHESIZER
+    _WORKER_SYNTHESIZER = cloudpickle.loads(serialized_synthesizer)
+
+
+def _sample_batch_in_worker(batch_size, max_tries, seed):
+    """Sample a batch with the synthesizer of the current worker process.
+
+    Args:
+        batch_size (int):
+            Number of rows to sample for this batch.
+        max_tries (int):
+            Number of times to retry sampling until the batch size is met.
+        seed (int):
+            Seed of the random stream used for this batch.
+
+    Returns:
+        tuple:
+            The sampled ``pandas.DataFrame`` and the stages recorded by the sampling profiler
+            of the synthesizer, or ``None`` if the sampling profiling is not enabled.
+    """
+    synthesizer = _WORKER_SYNTHESIZER
+    synthesizer._set_sampling_seed(seed)
+    profiler = getattr(synthesizer, '_sampling_profiler', None)
+    if profiler is None:
+        return synthesizer._sample_batch(batch_size=batch_size, max_tries=max_tries), None
+
+    profiler.start()
+    try:
+        sampled = synthesizer._sample_batch(batch_size=batch_size, max_tries=max_tries)
+    finally:
+        profiler.stop()
+
+    return sampled, profiler.records
+
+
+def _fit_univariates_in_worker(model, data):
+    """Fit the univariate distributions of the columns of the data in a worker process.
+
+    Args:
+        model (copulas.multivariate.GaussianMultivariate):
+            The model whose distributions are fitted.
+        data (pandas.DataFrame):
+            The columns to fit.
+
+    Returns:
+        tuple[list, list]:
+            The fitted columns and their fitted univariate distributions.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', module='scipy')
+        return model._fit_columns(data)
+
+
 def check_num_rows(num_rows, expected_num_rows, is_reject_sampling, max_tries_per_batch):
     """Check the number of sampled rows against the expected number of rows.
 
@@ -158,6 +216,46 @@ def check_num_rows(num_rows, expected_num_rows, is_reject_sampling, max_tries_pe
             warnings.warn(user_msg)
 
 
+def update_reservoir_sample(sample, sample_keys, chunk, max_rows, random_state):
+    """Update a uniform random sample of the rows of the chunks of data seen so far.
+
+    Every row gets a random key and the ``max_rows`` rows with the smallest keys are kept,
+    which is a uniform sample without replacement of all the rows, kept in their original order.
+
+    Args:
+        sample (pandas.DataFrame or None):
+            The sample of the previous chunks, or ``None`` for the first chunk.
+        sample_keys (numpy.ndarray or None):
+            The random keys of the rows of the sample.
+        chunk (pandas.DataFrame):
+            The new chunk of data.
+        max_rows (int):
+            The maximum number of rows of the sample.
+        random_state (numpy.random.Generator):
+            The random generator used to draw the keys of the rows.
+
+    Returns:
+        tuple[pandas.DataFrame, numpy.ndarray]:
+            The updated sample and the random keys of its rows.
+    """
+    keys = random_state.random(len(chunk))
+    if sample is not None:
+        if len(sample) == max_rows:
+            is_candidate = keys < sample_keys.max()
+            chunk = chunk[is_candidate]
+            keys = keys[is_candidate]
+
+        chunk = pd.concat([sample, chunk], ignore_index=True)
+        keys = np.concatenate([sample_keys, keys])
+
+    if len(chunk) > max_rows:
+        kept_rows = np.sort(np.argpartition(keys, max_rows - 1)[:max_rows])
+        chunk = chunk.iloc[kept_rows]
+        keys = keys[kept_rows]
+
+    return chunk.reset_index(drop=True), keys
+
+
 def validate_file_path(output_file_path):
     """Validate the user-passed output file arg, and create the file."""
     output_path = None
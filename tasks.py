@@ -41,6 +41,11 @@ def benchmark_dtypes(c):
     c.run('python -m pytest ./tests/benchmark/supported_dtypes_benchmark.py')
 
 
+@task
+def benchmark_sampling_latency(c):
+    c.run('python -m pytest ./tests/benchmark/sampling_latency_benchmark.py --log-cli-level=INFO')
+
+
 def _get_minimum_versions(dependencies, python_version):
     min_versions = {}
     for dependency in dependencies:
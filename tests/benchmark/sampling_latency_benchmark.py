@@ -0,0 +1,63 @@
+"""Benchmark for the latency of sampling a small number of rows."""
+
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdv.metadata import SingleTableMetadata
+from sdv.single_table import GaussianCopulaSynthesizer
+
+LOGGER = logging.getLogger(__name__)
+
+NUM_CALLS = 200
+NUM_WARMUP_CALLS = 10
+
+
+def _get_data(num_rows=1000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'id': np.arange(num_rows),
+        'age': rng.integers(18, 90, num_rows),
+        'salary': rng.normal(50_000, 10_000, num_rows).round(2),
+        'score': rng.uniform(0, 1, num_rows),
+        'city': rng.choice(['Boston', 'Madrid', 'Paris', 'Tokyo'], num_rows),
+        'active': rng.choice([True, False], num_rows),
+        'signup': pd.to_datetime('2020-01-01')
+        + pd.to_timedelta(rng.integers(0, 1000, num_rows), unit='D'),
+        'signup_date': (
+            pd.to_datetime('2020-01-01') + pd.to_timedelta(rng.integers(0, 1000, num_rows), 'D')
+        ).strftime('%Y-%m-%d'),
+    })
+
+
+@pytest.fixture(scope='module')
+def synthesizer():
+    data = _get_data()
+    metadata = SingleTableMetadata()
+    metadata.detect_from_dataframe(data)
+    metadata.update_column('id', sdtype='id')
+    metadata.update_column('signup_date', sdtype='datetime', datetime_format='%Y-%m-%d')
+    metadata.set_primary_key('id')
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    return synthesizer
+
+
+@pytest.mark.parametrize('num_rows', [1, 10, 100])
+def test_sampling_latency(synthesizer, num_rows):
+    """Report the p50 and p99 latency of ``sample`` for a small number of rows."""
+    for _ in range(NUM_WARMUP_CALLS):
+        synthesizer.sample(num_rows)
+
+    latencies = []
+    for _ in range(NUM_CALLS):
+        start = time.perf_counter()
+        sampled = synthesizer.sample(num_rows)
+        latencies.append(time.perf_counter() - start)
+
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    LOGGER.info(f'Sampling {num_rows} rows: p50 {p50:.2f} ms, p99 {p99:.2f} ms')
+    assert len(sampled) == num_rows
@@ -4,15 +4,16 @@ import logging
 import math
 import re
 import warnings
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import faker
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from faker import Faker
 from rdt.transformers import FloatFormatter
-from sdmetrics.reports.multi_table import DiagnosticReport
+from sdmetrics.reports.multi_table import DiagnosticReport, QualityReport
 
 from sdv import version
 from sdv.cag import FixedCombinations, Inequality
@@ -24,6 +25,7 @@ from sdv.evaluation.multi_table import evaluate_quality, get_column_pair_plot, g
 from sdv.metadata import MultiTableMetadata
 from sdv.metadata.metadata import Metadata
 from sdv.multi_table import HMASynthesizer
+from sdv.multi_table.hma import _fit_groups_in_parallel, _fit_univariates_per_group
 from tests.integration.single_table.custom_constraints import MyConstraint
 from tests.utils import catch_sdv_logs
 
@@ -180,6 +182,8 @@ class TestHMASynthesizer:
             'enforce_rounding': True,
             'locales': ['en_US'],
             'numerical_distributions': {},
+            'precision': 'float64',
+            'correlation_rank': None,
         }
         families_params = hmasynthesizer.get_table_parameters('guests')
         assert families_params['synthesizer_name'] == 'GaussianCopulaSynthesizer'
@@ -189,6 +193,8 @@ class TestHMASynthesizer:
             'enforce_rounding': True,
             'locales': ['en_US'],
             'numerical_distributions': {},
+            'precision': 'float64',
+            'correlation_rank': None,
         }
         assert hmasynthesizer._table_synthesizers['hotels'].default_distribution == 'gamma'
         assert hmasynthesizer._table_synthesizers['guests'].default_distribution == 'uniform'
@@ -2856,3 +2862,177 @@ def test_datetime_warning_doesnt_repeat():
     )
     matching_warnings = [warning for warning in w if str(warning.message) == msg]
     assert len(matching_warnings) == 1
+
+
+def test_hma_precision_float32():
+    """Test that the augmented tables are ``float32`` and the quality is kept."""
+    # Setup
+    rng = np.random.default_rng(0)
+    parent = pd.DataFrame({
+        'parent_id': range(100),
+        'value': rng.normal(size=100).round(2),
+        'category': rng.choice(['a', 'b', 'c'], size=100),
+    })
+    child = pd.DataFrame({
+        'child_id': range(1000),
+        'parent_id': rng.integers(0, 100, size=1000),
+        'amount': rng.gamma(2, size=1000).round(3),
+    })
+    child['amount'] += parent['value'].to_numpy()[child['parent_id']]
+    data = {'parent': parent, 'child': child}
+    metadata = Metadata.detect_from_dataframes(data)
+    scores = {}
+
+    # Run
+    for precision in ('float64', 'float32'):
+        synthesizer = HMASynthesizer(metadata, precision=precision, verbose=False)
+        synthesizer.fit(data)
+        augmented_data = synthesizer._augment_tables(synthesizer.preprocess(data))
+        synthetic_data = synthesizer.sample(1)
+        report = QualityReport()
+        report.generate(data, synthetic_data, metadata.to_dict(), verbose=False)
+        scores[precision] = report.get_score()
+
+    # Assert
+    assert set(augmented_data['parent'].dtypes) == {np.dtype('float32')}
+    for table_name, table in synthetic_data.items():
+        assert table.dtypes.to_dict() == data[table_name].dtypes.to_dict()
+
+    assert abs(scores['float32'] - scores['float64']) < 0.05
+
+
+def test_hma_arrow_and_categorical_dtypes():
+    """Test that categorical and arrow backed columns are sampled with their original dtypes."""
+    # Setup
+    rng = np.random.default_rng(0)
+    parent = pd.DataFrame({
+        'parent_id': range(50),
+        'category': pd.Series(rng.choice(['a', 'b', 'c'], size=50), dtype='category'),
+        'string': pd.Series(rng.choice(['x', 'y'], size=50), dtype='string[pyarrow]'),
+    })
+    child = pd.DataFrame({
+        'child_id': range(300),
+        'parent_id': rng.integers(0, 50, size=300),
+        'arrow': pd.Series(rng.choice(['u', 'v'], size=300), dtype=pd.ArrowDtype(pa.string())),
+        'amount': pd.Series(rng.gamma(2, size=300), dtype='double[pyarrow]'),
+    })
+    data = {'parent': parent, 'child': child}
+    metadata = Metadata.detect_from_dataframes(data)
+    synthesizer = HMASynthesizer(metadata, verbose=False)
+
+    # Run
+    synthesizer.fit(data)
+    synthetic_data = synthesizer.sample(1)
+
+    # Assert
+    for table_name, table in synthetic_data.items():
+        assert table.dtypes.to_dict() == data[table_name].dtypes.to_dict()
+
+
+def test_fit_n_jobs():
+    """Test that learning the relationships in parallel fits the same synthesizer."""
+    # Setup
+    rng = np.random.default_rng(0)
+    parent = pd.DataFrame({
+        'parent_id': range(40),
+        'value': rng.normal(size=40),
+    })
+    child = pd.DataFrame({
+        'child_id': range(200),
+        'parent_id': rng.integers(0, 40, size=200).astype(float),
+        'amount': rng.gamma(2, size=200),
+        'category': rng.choice(['a', 'b'], size=200),
+    })
+    child.loc[:4, 'parent_id'] = np.nan
+    data = {'parent': parent, 'child': child}
+    metadata = Metadata.detect_from_dataframes(data)
+    synthesizer = HMASynthesizer(metadata, verbose=False)
+    parallel_synthesizer = HMASynthesizer(metadata, verbose=False)
+
+    # Run
+    synthesizer.fit(data)
+    parallel_synthesizer.fit(data, n_jobs=2)
+
+    # Assert
+    for table_name, table_synthesizer in synthesizer._table_synthesizers.items():
+        parallel_table_synthesizer = parallel_synthesizer._table_synthesizers[table_name]
+        assert parallel_table_synthesizer._get_parameters() == table_synthesizer._get_parameters()
+
+    null_synthesizer = synthesizer._null_child_synthesizers['__child__parent_id']
+    parallel_null_synthesizer = parallel_synthesizer._null_child_synthesizers['__child__parent_id']
+    assert parallel_null_synthesizer._get_parameters() == null_synthesizer._get_parameters()
+
+
+def test_fit_n_jobs_extended_columns():
+    """Test that fitting the extended columns of each parent in parallel fits the same synthesizer.
+
+    The ``truncnorm`` extended columns of the middle table are learned by maximum likelihood for
+    every parent, so they are fitted in the pool of processes.
+    """
+    # Setup
+    rng = np.random.default_rng(0)
+    grandparent = pd.DataFrame({'grandparent_id': range(30), 'value': rng.normal(size=30)})
+    parent = pd.DataFrame({
+        'parent_id': range(150),
+        'grandparent_id': rng.integers(0, 30, size=150),
+        'value': rng.normal(size=150),
+    })
+    child = pd.DataFrame({
+        'child_id': range(600),
+        'parent_id': rng.integers(0, 150, size=600),
+        'amount': rng.gamma(2, size=600),
+    })
+    data = {'grandparent': grandparent, 'parent': parent, 'child': child}
+    metadata = Metadata.detect_from_dataframes(data)
+    synthesizer = HMASynthesizer(metadata, verbose=False)
+    parallel_synthesizer = HMASynthesizer(metadata, verbose=False)
+
+    # Run
+    synthesizer.fit(data)
+    with patch(
+        'sdv.multi_table.hma._fit_groups_in_parallel', side_effect=_fit_groups_in_parallel
+    ) as mock_fit_groups_in_parallel:
+        parallel_synthesizer.fit(data, n_jobs=2)
+
+    # Assert
+    function = mock_fit_groups_in_parallel.call_args[0][0]
+    assert function == _fit_univariates_per_group
+    for table_name, table_synthesizer in synthesizer._table_synthesizers.items():
+        parallel_table_synthesizer = parallel_synthesizer._table_synthesizers[table_name]
+        assert parallel_table_synthesizer._get_parameters() == table_synthesizer._get_parameters()
+
+
+def test_sample_child_rows_in_batch():
+    """Test that sampling the child rows of all the parents at once matches sampling each one."""
+    # Setup
+    rng = np.random.default_rng(0)
+    parent = pd.DataFrame({
+        'parent_id': range(60),
+        'value': rng.normal(size=60),
+    })
+    child = pd.DataFrame({
+        'child_id': range(300),
+        'parent_id': rng.integers(0, 60, size=300),
+        'amount': rng.gamma(2, size=300).round(2),
+        'date': pd.to_datetime('2020-01-01') + pd.to_timedelta(rng.integers(0, 90, 300), 'D'),
+        'category': rng.choice(['a', 'b', 'c'], size=300),
+    })
+    grandchild = pd.DataFrame({
+        'grandchild_id': range(600),
+        'child_id': rng.integers(0, 300, size=600),
+        'score': rng.uniform(size=600),
+    })
+    data = {'parent': parent, 'child': child, 'grandchild': grandchild}
+    metadata = Metadata.detect_from_dataframes(data)
+    synthesizer = HMASynthesizer(metadata, verbose=False)
+    synthesizer.fit(data)
+
+    # Run
+    synthetic_data = synthesizer.sample(1.5)
+    synthesizer.reset_sampling()
+    with patch.object(HMASynthesizer, '_sample_raw_child_rows', return_value=None):
+        expected_data = synthesizer.sample(1.5)
+
+    # Assert
+    for table_name, table in expected_data.items():
+        pd.testing.assert_frame_equal(synthetic_data[table_name], table)
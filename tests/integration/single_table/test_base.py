@@ -1,7 +1,10 @@
+import asyncio
 import datetime
 import importlib.metadata
+import logging
 import re
 import warnings
+from copy import deepcopy
 from unittest.mock import patch
 
 import numpy as np
@@ -11,11 +14,12 @@ from rdt.transformers import AnonymizedFaker, FloatFormatter, RegexGenerator, Un
 
 from sdv import version
 from sdv.cag import FixedCombinations
+from sdv.data_processing.data_processor import DataProcessor
 from sdv.datasets.demo import download_demo
 from sdv.errors import InvalidDataError, SamplingError, VersionError
 from sdv.metadata import SingleTableMetadata
 from sdv.metadata.metadata import Metadata
-from sdv.sampling import Condition
+from sdv.sampling import AsyncSampler, Condition
 from sdv.single_table import (
     CopulaGANSynthesizer,
     CTGANSynthesizer,
@@ -23,6 +27,7 @@ from sdv.single_table import (
     TVAESynthesizer,
 )
 from sdv.single_table.base import BaseSingleTableSynthesizer
+from tests.utils import catch_sdv_logs
 
 METADATA = Metadata.load_from_dict({
     'METADATA_SPEC_VERSION': 'SINGLE_TABLE_V1',
@@ -285,6 +290,400 @@ def test_sampling_reset_sampling(synthesizer):
     pd.testing.assert_frame_equal(sampled1, sampled2)
 
 
+def test_sample_n_jobs():
+    """Test that sampling in parallel is reproducible and independent of ``n_jobs``."""
+    # Setup
+    data = pd.DataFrame({
+        'id': range(100),
+        'numerical': np.random.default_rng(0).normal(size=100),
+        'categorical': ['a', 'b'] * 50,
+    })
+    metadata = Metadata.load_from_dict({
+        'columns': {
+            'id': {'sdtype': 'id'},
+            'numerical': {'sdtype': 'numerical'},
+            'categorical': {'sdtype': 'categorical'},
+        },
+        'primary_key': 'id',
+    })
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+
+    # Run
+    sampled_two_jobs = synthesizer.sample(100, batch_size=20, n_jobs=2)
+    synthesizer.reset_sampling()
+    sampled_three_jobs = synthesizer.sample(100, batch_size=20, n_jobs=3)
+    sampled_again = synthesizer.sample(100, batch_size=20, n_jobs=3)
+
+    # Assert
+    pd.testing.assert_frame_equal(sampled_two_jobs, sampled_three_jobs)
+    assert len(sampled_two_jobs) == 100
+    assert sampled_two_jobs['id'].is_unique
+    assert list(sampled_two_jobs.columns) == ['id', 'numerical', 'categorical']
+    with pytest.raises(AssertionError):
+        pd.testing.assert_frame_equal(sampled_three_jobs, sampled_again)
+
+
+def test_sampling_profile_n_jobs():
+    """Test that the stages sampled by the worker processes are recorded with their batch."""
+    # Setup
+    data = pd.DataFrame({
+        'numerical': np.random.default_rng(0).normal(size=100),
+        'categorical': ['a', 'b'] * 50,
+    })
+    metadata = Metadata.detect_from_dataframe(data)
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    synthesizer.enable_sampling_profiling(track_memory=False)
+
+    # Run
+    synthesizer.sample(50, batch_size=20, n_jobs=2)
+    profile = synthesizer.get_sampling_profile()
+
+    # Assert
+    model_sample = profile[profile['stage'] == 'model_sample']
+    assert model_sample['batch'].tolist() == [1, 2, 3]
+    assert model_sample['rows_in'].tolist() == [20, 20, 10]
+    assert 'reverse_transform.hyper_transformer' in set(profile['stage'])
+    assert profile['batch'].notna().all()
+
+
+def test_fit_n_jobs():
+    """Test that fitting with ``n_jobs`` learns the same synthesizer as fitting serially."""
+    # Setup
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'id': range(100),
+        'numerical': rng.normal(size=100).round(2),
+        'integer': rng.integers(0, 10, size=100),
+        'categorical': ['a', 'b'] * 50,
+        'date': pd.date_range('2020-01-01', periods=100).strftime('%d/%m/%Y'),
+    })
+    metadata = Metadata.detect_from_dataframe(data)
+    metadata.update_column('id', sdtype='id')
+    metadata.set_primary_key('id')
+    serial_synthesizer = GaussianCopulaSynthesizer(metadata)
+    parallel_synthesizer = GaussianCopulaSynthesizer(metadata)
+
+    # Run
+    serial_synthesizer.fit(data)
+    parallel_synthesizer.fit(data, n_jobs=2)
+
+    # Assert
+    serial_processor = serial_synthesizer._data_processor
+    parallel_processor = parallel_synthesizer._data_processor
+    assert list(parallel_processor.formatters) == list(serial_processor.formatters)
+    for column, formatter in serial_processor.formatters.items():
+        assert parallel_processor.formatters[column].__dict__ == formatter.__dict__
+
+    assert (
+        parallel_synthesizer.get_transformers().keys()
+        == serial_synthesizer.get_transformers().keys()
+    )
+    assert parallel_synthesizer._model.to_dict() == serial_synthesizer._model.to_dict()
+    pd.testing.assert_frame_equal(
+        parallel_synthesizer.sample(50), serial_synthesizer.sample(50), check_exact=True
+    )
+
+
+def test_fit_from_chunks():
+    """Test that the bounds and rounding are learned from all the chunks."""
+    # Setup
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'numerical': rng.uniform(0, 100, size=1000).round(1),
+        'categorical': rng.choice(['a', 'b', 'c'], size=1000),
+    })
+    data.loc[999, 'numerical'] = 1000.123
+    metadata = Metadata.detect_from_dataframe(data)
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    chunks = (data.iloc[start : start + 100] for start in range(0, 1000, 100))
+
+    # Run
+    synthesizer.fit_from_chunks(chunks, max_rows=200)
+    sampled = synthesizer.sample(500)
+
+    # Assert
+    formatter = synthesizer._data_processor.formatters['numerical']
+    assert formatter._min_value == data['numerical'].min()
+    assert formatter._max_value == 1000.123
+    assert formatter._rounding_digits == 3
+    assert len(sampled) == 500
+    assert sampled['numerical'].between(data['numerical'].min(), 1000.123).all()
+    assert set(sampled['categorical']) <= {'a', 'b', 'c'}
+
+
+def test_fit_from_chunks_reproducible():
+    """Test that fitting the same chunks twice gives the same model.
+
+    The sample of the rows should not use nor change the global random state.
+    """
+    # Setup
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'numerical': rng.normal(size=1000),
+        'categorical': rng.choice(['a', 'b', 'c'], size=1000),
+    })
+    metadata = Metadata.detect_from_dataframe(data)
+    synthesizers = [GaussianCopulaSynthesizer(metadata), GaussianCopulaSynthesizer(metadata)]
+    np.random.seed(0)
+    expected_state = np.random.get_state()[1].copy()
+
+    # Run
+    for synthesizer in synthesizers:
+        chunks = (data.iloc[start : start + 100] for start in range(0, 1000, 100))
+        synthesizer.fit_from_chunks(chunks, max_rows=200)
+
+    # Assert
+    np.testing.assert_array_equal(np.random.get_state()[1], expected_state)
+    first_parameters, second_parameters = (
+        synthesizer.get_parameters() for synthesizer in synthesizers
+    )
+    assert first_parameters == second_parameters
+    assert synthesizers[0]._model.to_dict() == synthesizers[1]._model.to_dict()
+
+
+def test_transform_cache():
+    """Test that fitting again on the same data matches a synthesizer without cache.
+
+    The constraints, formatters and unchanged transformers should not be fitted again, and the
+    results should be the same as fitting a synthesizer whose cache is disabled, which is the
+    default.
+    """
+    # Setup
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'numerical': rng.uniform(0, 100, size=500).round(1),
+        'categorical': rng.choice(['a', 'b', 'c'], size=500),
+        'other_categorical': rng.choice(['x', 'y'], size=500),
+    })
+    data.loc[::10, 'numerical'] = np.nan
+    metadata = Metadata.detect_from_dataframe(data)
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.add_constraints([
+        FixedCombinations(column_names=['categorical', 'other_categorical'])
+    ])
+    synthesizer.set_transform_cache_size(2**24)
+    no_cache_synthesizer = GaussianCopulaSynthesizer(metadata)
+    no_cache_synthesizer.add_constraints([
+        FixedCombinations(column_names=['categorical', 'other_categorical'])
+    ])
+    new_transformer = FloatFormatter(missing_value_generation='from_column')
+
+    # Run
+    processed = []
+    sampled = []
+    for instance in (synthesizer, no_cache_synthesizer):
+        instance.auto_assign_transformers(data)
+        instance.preprocess(data)
+        instance.update_transformers({'numerical': deepcopy(new_transformer)})
+        processed.append(instance.preprocess(data))
+        instance.fit(data)
+        sampled.append(instance.sample(100))
+
+    constraint_fit_patch = patch.object(
+        FixedCombinations, 'fit', autospec=True, side_effect=FixedCombinations.fit
+    )
+    get_formatters_patch = patch.object(
+        DataProcessor, '_get_formatters', autospec=True, side_effect=DataProcessor._get_formatters
+    )
+    fit_field_patch = patch.object(
+        DataProcessor, '_fit_field', autospec=True, side_effect=DataProcessor._fit_field
+    )
+    with constraint_fit_patch as mock_constraint_fit, get_formatters_patch as mock_get_formatters:
+        with fit_field_patch as mock_fit_field:
+            synthesizer.update_transformers({'numerical': FloatFormatter()})
+            synthesizer.fit(data)
+
+    no_cache_synthesizer.update_transformers({'numerical': FloatFormatter()})
+    no_cache_synthesizer.fit(data)
+
+    # Assert
+    pd.testing.assert_frame_equal(processed[0], processed[1])
+    pd.testing.assert_frame_equal(sampled[0], sampled[1])
+    pd.testing.assert_frame_equal(synthesizer.sample(100), no_cache_synthesizer.sample(100))
+    assert list(processed[0].columns) == [
+        'numerical',
+        'numerical.is_null',
+        'categorical#other_categorical',
+    ]
+    mock_constraint_fit.assert_not_called()
+    assert all(not args[2] for args, _ in mock_get_formatters.call_args_list)
+    assert [args[2] for args, _ in mock_fit_field.call_args_list] == ['numerical']
+    assert len(no_cache_synthesizer._data_processor._transform_cache) == 0
+    assert len(synthesizer._data_processor._transform_cache) > 0
+    synthesizer.clear_transform_cache()
+    assert len(synthesizer._data_processor._transform_cache) == 0
+
+
+def test_sample_iter():
+    """Test that ``sample_iter`` yields the same rows as ``sample`` in bounded batches."""
+    # Setup
+    data = pd.DataFrame({
+        'id': range(100),
+        'numerical': np.random.default_rng(0).normal(size=100),
+        'categorical': ['a', 'b'] * 50,
+    })
+    metadata = Metadata.load_from_dict({
+        'columns': {
+            'id': {'sdtype': 'id'},
+            'numerical': {'sdtype': 'numerical'},
+            'categorical': {'sdtype': 'categorical'},
+        },
+        'primary_key': 'id',
+    })
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+
+    # Run
+    batches = list(synthesizer.sample_iter(95, batch_size=20))
+    synthesizer.reset_sampling()
+    sampled = synthesizer.sample(95, batch_size=20)
+
+    # Assert
+    assert [len(batch) for batch in batches] == [20, 20, 20, 20, 15]
+    pd.testing.assert_frame_equal(pd.concat(batches), sampled)
+
+
+@pytest.mark.parametrize('extension', ['parquet', 'arrow'])
+def test_sample_output_file_columnar(tmp_path, extension):
+    """Test that the sampled rows can be written to Parquet and Arrow IPC files."""
+    # Setup
+    data = pd.DataFrame({
+        'id': range(100),
+        'numerical': np.random.default_rng(0).normal(size=100),
+        'categorical': ['a', 'b'] * 50,
+    })
+    metadata = Metadata.load_from_dict({
+        'columns': {
+            'id': {'sdtype': 'id'},
+            'numerical': {'sdtype': 'numerical'},
+            'categorical': {'sdtype': 'categorical'},
+        },
+        'primary_key': 'id',
+    })
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    output_file_path = tmp_path / f'sampled.{extension}'
+
+    # Run
+    sampled = synthesizer.sample(95, batch_size=20, output_file_path=str(output_file_path))
+
+    # Assert
+    if extension == 'parquet':
+        stored = pd.read_parquet(output_file_path)
+    else:
+        stored = pd.read_feather(output_file_path)
+
+    pd.testing.assert_frame_equal(stored, sampled)
+
+
+def test_sampling_profile(caplog):
+    """Test that the stages of the sampling calls are profiled when enabled."""
+    # Setup
+    data = pd.DataFrame({
+        'id': range(100),
+        'numerical': np.random.default_rng(0).normal(size=100),
+        'categorical': ['a', 'b'] * 50,
+    })
+    metadata = Metadata.load_from_dict({
+        'columns': {
+            'id': {'sdtype': 'id'},
+            'numerical': {'sdtype': 'numerical'},
+            'categorical': {'sdtype': 'categorical'},
+        },
+        'primary_key': 'id',
+    })
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    synthesizer.enable_sampling_profiling(log_profile=True)
+
+    # Run
+    with catch_sdv_logs(caplog, logging.INFO, logger='SingleTableSynthesizer'):
+        synthesizer.sample(50, batch_size=20)
+        sample_profile = synthesizer.get_sampling_profile()
+        synthesizer.sample_from_conditions([Condition({'categorical': 'a'}, num_rows=10)])
+        conditions_profile = synthesizer.get_sampling_profile()
+        synthesizer.disable_sampling_profiling()
+        synthesizer.sample(10)
+
+    # Assert
+    model_sample = sample_profile[sample_profile['stage'] == 'model_sample']
+    assert model_sample['rows_in'].tolist() == [20, 20, 10]
+    assert model_sample['try'].tolist() == [1, 1, 1]
+    assert set(sample_profile['stage']) == {
+        'model_sample',
+        'reverse_transform',
+        'reverse_transform.hyper_transformer',
+        'reverse_transform.keys',
+        'reverse_transform.dtypes',
+        'reverse_transform.formatters',
+        'reverse_transform_constraints',
+        'filter_valid',
+    }
+    assert (sample_profile['seconds'] >= 0).all()
+    assert sample_profile['allocated_bytes'].notna().all()
+    assert conditions_profile['stage'].tolist()[-1] == 'filter_conditions'
+    assert conditions_profile['rows_out'].iloc[-1] == 10
+
+    profile_logs = list(
+        dict.fromkeys(message for message in caplog.messages if 'Sampling profile' in message)
+    )
+    assert len(profile_logs) == 2
+    assert "'model_sample': {'calls': 3" in profile_logs[0]
+    assert "'filter_conditions': {'calls': 1" in profile_logs[1]
+    with pytest.raises(ValueError, match='Sampling profiling is not enabled'):
+        synthesizer.get_sampling_profile()
+
+
+def test_asample():
+    """Test that concurrent calls are reproducible and do not repeat the keys."""
+    # Setup
+    data = pd.DataFrame({
+        'id': range(100),
+        'numerical': np.random.default_rng(0).normal(size=100),
+        'categorical': ['a', 'b'] * 50,
+        'name': [f'name_{i}' for i in range(100)],
+    })
+    metadata = Metadata.load_from_dict({
+        'columns': {
+            'id': {'sdtype': 'id'},
+            'numerical': {'sdtype': 'numerical'},
+            'categorical': {'sdtype': 'categorical'},
+            'name': {'sdtype': 'first_name', 'pii': True},
+        },
+        'primary_key': 'id',
+    })
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    conditions = [Condition({'categorical': 'a', 'name': 'Bob'}, num_rows=5)]
+
+    async def sample_concurrently(synthesizer):
+        async with AsyncSampler(synthesizer, max_concurrency=2) as sampler:
+            return await asyncio.gather(
+                synthesizer.asample(30, sampler=sampler),
+                synthesizer.asample(30, batch_size=10, sampler=sampler),
+                synthesizer.asample_from_conditions(conditions, sampler=sampler),
+                synthesizer.asample(30, sampler=sampler),
+            )
+
+    # Run
+    first_run = asyncio.run(sample_concurrently(synthesizer))
+    synthesizer.reset_sampling()
+    second_run = asyncio.run(sample_concurrently(synthesizer))
+
+    # Assert
+    for first, second in zip(first_run, second_run):
+        pd.testing.assert_frame_equal(first, second)
+
+    unconditional = pd.concat([first_run[0], first_run[1], first_run[3]])
+    assert len(unconditional) == 90
+    assert unconditional['id'].is_unique
+    assert not first_run[0].equals(first_run[3])
+    assert (first_run[2]['categorical'] == 'a').all()
+    assert (first_run[2]['name'] == 'Bob').all()
+
+
 def test_config_creation_doesnt_raise_error():
     """Test https://github.com/sdv-dev/SDV/issues/1110."""
     # Setup
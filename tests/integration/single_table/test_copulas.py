@@ -1,8 +1,10 @@
 import re
+from unittest.mock import Mock
 from uuid import UUID
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from rdt.transformers import (
     AnonymizedFaker,
@@ -13,8 +15,9 @@ from rdt.transformers import (
     PseudoAnonymizedFaker,
     RegexGenerator,
 )
+from sdmetrics.reports.single_table import QualityReport
 
-from sdv.cag import Inequality
+from sdv.cag import FixedCombinations, Inequality
 from sdv.cag._errors import ConstraintNotMetError
 from sdv.datasets.demo import download_demo
 from sdv.errors import SynthesizerInputError
@@ -639,3 +642,165 @@ def test_datetime_column_mixed_timezones():
 
     # Assert
     assert synth.validate(data) is None
+
+
+def test_sample_remaining_columns_in_batch():
+    """Test that many distinct conditions are sampled in a single pass over the model."""
+    # Setup
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'segment': rng.choice(['a', 'b', 'c', 'd'], size=500),
+        'age': rng.integers(18, 90, size=500),
+        'amount': rng.normal(100, 10, size=500).round(2),
+    })
+    metadata = Metadata.load_from_dict({
+        'columns': {
+            'segment': {'sdtype': 'categorical'},
+            'age': {'sdtype': 'numerical'},
+            'amount': {'sdtype': 'numerical'},
+        }
+    })
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    known_columns = data[['segment', 'age']].sample(200, random_state=0)
+
+    # Run
+    synthesizer._sample_batch = Mock(wraps=synthesizer._sample_batch)
+    sampled = synthesizer.sample_remaining_columns(known_columns)
+
+    # Assert
+    synthesizer._sample_batch.assert_not_called()
+    pd.testing.assert_frame_equal(sampled[['segment', 'age']], known_columns.sort_index())
+    assert sampled['amount'].between(data['amount'].min(), data['amount'].max()).all()
+
+
+def test_precision_float32():
+    """Test that sampling with ``float32`` keeps the quality of sampling with ``float64``."""
+    # Setup
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=1000)
+    data = pd.DataFrame({
+        'numerical': (values * 10 + 50).round(2),
+        'correlated': (values * 3 + rng.normal(size=1000)).round(4),
+        'integer': rng.integers(0, 100, size=1000),
+        'categorical': rng.choice(['a', 'b', 'c'], size=1000),
+        'datetime': pd.to_datetime('2020-01-01')
+        + pd.to_timedelta(rng.integers(0, 1000, size=1000), unit='D'),
+    })
+    metadata = Metadata.detect_from_dataframe(data)
+    table_metadata = metadata.to_dict()['tables']['table']
+    scores = {}
+
+    # Run
+    for precision in ('float64', 'float32'):
+        synthesizer = GaussianCopulaSynthesizer(metadata, precision=precision)
+        synthesizer.fit(data)
+        processed_data = synthesizer._data_processor.transform(data)
+        synthetic_data = synthesizer.sample(1000)
+        report = QualityReport()
+        report.generate(data, synthetic_data, table_metadata, verbose=False)
+        scores[precision] = report.get_score()
+
+    # Assert
+    assert set(processed_data.dtypes) == {np.dtype('float32')}
+    assert synthesizer._model.correlation.dtypes.eq(np.float32).all()
+    assert synthetic_data.dtypes.to_dict() == data.dtypes.to_dict()
+    assert synthetic_data['numerical'].round(2).equals(synthetic_data['numerical'])
+    assert abs(scores['float32'] - scores['float64']) < 0.05
+
+
+def test_correlation_factor_save_and_load(tmp_path):
+    """Test that the factor of the correlation matrix is reused after saving and loading."""
+    # Setup
+    data = pd.DataFrame({
+        'a': np.linspace(0, 1, 100),
+        'b': np.linspace(0, 1, 100) ** 2,
+        'c': np.random.default_rng(0).normal(size=100),
+    })
+    metadata = Metadata.detect_from_dataframe(data)
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+    synthesizer.sample(10)
+    factor = synthesizer._correlation_factor
+
+    # Run
+    synthesizer.save(tmp_path / 'synthesizer.pkl')
+    loaded = GaussianCopulaSynthesizer.load(tmp_path / 'synthesizer.pkl')
+    np.random.seed(0)
+    expected = synthesizer._model.sample(50)
+    np.random.seed(0)
+    sampled = loaded._sample(50)
+
+    # Assert
+    np.testing.assert_array_equal(loaded._correlation_factor, factor)
+    pd.testing.assert_frame_equal(sampled, expected)
+    synthesizer.fit(data)
+    assert synthesizer._correlation_factor is None
+
+
+def test_correlation_rank(tmp_path):
+    """Test that a low rank correlation keeps the quality of the full correlation matrix."""
+    # Setup
+    rng = np.random.default_rng(0)
+    factors = rng.normal(size=(1000, 2))
+    data = pd.DataFrame({
+        f'column_{index}': (factors @ rng.normal(size=2) + rng.normal(size=1000)).round(3)
+        for index in range(20)
+    })
+    data['categorical'] = rng.choice(['a', 'b', 'c'], size=1000)
+    metadata = Metadata.detect_from_dataframe(data)
+    table_metadata = metadata.to_dict()['tables']['table']
+    scores = {}
+
+    # Run
+    for correlation_rank in (None, 2, 0.5):
+        synthesizer = GaussianCopulaSynthesizer(
+            metadata, default_distribution='norm', correlation_rank=correlation_rank
+        )
+        synthesizer.fit(data)
+        synthetic_data = synthesizer.sample(1000)
+        report = QualityReport()
+        report.generate(data, synthetic_data, table_metadata, verbose=False)
+        scores[correlation_rank] = report.get_details('Column Pair Trends')['Score'].mean()
+
+    synthesizer.save(tmp_path / 'synthesizer.pkl')
+    loaded = GaussianCopulaSynthesizer.load(tmp_path / 'synthesizer.pkl')
+    conditioned = loaded.sample_from_conditions([Condition({'categorical': 'a'}, num_rows=10)])
+
+    # Assert
+    model = synthesizer._model
+    assert model.loadings.shape[0] == len(model.columns)
+    assert model.loadings.shape[1] < len(model.columns)
+    np.testing.assert_allclose(np.diag(model.correlation), 1)
+    assert abs(scores[2] - scores[None]) < 0.05
+    assert abs(scores[0.5] - scores[None]) < 0.05
+    assert (conditioned['categorical'] == 'a').all()
+    assert len(conditioned) == 10
+
+
+def test_arrow_and_categorical_dtypes():
+    """Test that categorical and arrow backed columns are sampled with their original dtypes."""
+    # Setup
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'category': pd.Series(rng.choice(['a', 'b', 'c'], size=500), dtype='category'),
+        'string': pd.Series(rng.choice(['x', 'y'], size=500), dtype='string[pyarrow]'),
+        'arrow': pd.Series(rng.choice(['u', 'v', 'w'], size=500), dtype=pd.ArrowDtype(pa.string())),
+        'amount': pd.Series(rng.uniform(0, 1, size=500), dtype='double[pyarrow]'),
+    })
+    metadata = Metadata.detect_from_dataframe(data)
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.add_constraints([FixedCombinations(column_names=['category', 'string'])])
+
+    # Run
+    synthesizer.fit(data)
+    sampled = synthesizer.sample(100)
+    conditional = synthesizer.sample_from_conditions([
+        Condition({'amount': 0.5, 'arrow': 'u'}, num_rows=10)
+    ])
+
+    # Assert
+    assert sampled.dtypes.to_dict() == data.dtypes.to_dict()
+    assert conditional.dtypes.to_dict() == data.dtypes.to_dict()
+    assert (conditional['amount'] == 0.5).all()
+    assert (conditional['arrow'] == 'u').all()
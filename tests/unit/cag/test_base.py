@@ -539,6 +539,32 @@ class TestBaseConstraint:
         })
         pd.testing.assert_frame_equal(reversed_data, expected_table1)
 
+    def test_reverse_transform_preserves_dtypes(self):
+        """Test that only the columns whose dtype changed are cast back."""
+        # Setup
+        data = pd.DataFrame({
+            'category': pd.Series(['a', 'b', 'a'], dtype='category'),
+            'text': pd.Series(['x', 'y', 'z'], dtype='string[pyarrow]'),
+            'number': [1.0, 2.0, 3.0],
+        })
+        instance = BaseConstraint()
+        instance._single_table = True
+        instance._table_name = 'table'
+        instance._dtypes = {'table': {**data.dtypes.to_dict(), 'number': np.dtype('int64')}}
+        instance._original_data_columns = {'table': ['category', 'text', 'number']}
+        instance._reverse_transform = Mock(return_value={'table': data})
+
+        # Run
+        reversed_data = instance.reverse_transform(data)
+
+        # Assert
+        expected = pd.DataFrame({
+            'category': pd.Series(['a', 'b', 'a'], dtype='category'),
+            'text': pd.Series(['x', 'y', 'z'], dtype='string[pyarrow]'),
+            'number': [1, 2, 3],
+        })
+        pd.testing.assert_frame_equal(reversed_data, expected)
+
     def test_reverse_transform_cast_fallback(self, data, caplog):
         """Test ``reverse_transform`` method."""
         # Setup
@@ -16,15 +16,38 @@ from rdt.transformers import (
 )
 
 from sdv.constraints.tabular import Positive, ScalarRange
-from sdv.data_processing.data_processor import DataProcessor
+from sdv.data_processing.data_processor import DataProcessor, _get_bounds_arrays
 from sdv.data_processing.datetime_formatter import DatetimeFormatter
 from sdv.data_processing.errors import InvalidConstraintsError, NotFittedError
 from sdv.data_processing.numerical_formatter import NumericalFormatter
+from sdv.data_processing.transform_cache import TransformCache
 from sdv.errors import SynthesizerInputError
 from sdv.metadata.single_table import SingleTableMetadata
 from tests.utils import DataFrameMatcher
 
 
+def test__get_bounds_arrays():
+    """Test that missing bounds are replaced with the limits of the dtype."""
+    # Setup
+    min_max_formatter = NumericalFormatter(enforce_min_max_values=True)
+    min_max_formatter._min_value = -3
+    min_max_formatter._max_value = np.nan
+    int_formatter = NumericalFormatter(computer_representation='Int64')
+    float_formatter = NumericalFormatter()
+    formatters = [min_max_formatter, int_formatter, float_formatter]
+
+    # Run
+    float_bounds = _get_bounds_arrays(formatters, np.dtype('float64'))
+    int_bounds = _get_bounds_arrays(formatters, np.dtype('int32'))
+
+    # Assert
+    np.testing.assert_array_equal(float_bounds[0], [-3, -(2**63), -np.inf])
+    np.testing.assert_array_equal(float_bounds[1], [np.inf, 2**63 - 1, np.inf])
+    assert int_bounds[0].dtype == np.int32
+    np.testing.assert_array_equal(int_bounds[0], [-3, -(2**31), -(2**31)])
+    np.testing.assert_array_equal(int_bounds[1], [2**31 - 1, 2**31 - 1, 2**31 - 1])
+
+
 class TestDataProcessor:
     def test__update_numerical_transformer(self):
         """Test the ``_update_numerical_transformer`` method.
@@ -217,6 +240,7 @@ class TestDataProcessor:
         detect_multi_column_transformers_mock.assert_called_once()
         assert data_processor.grouped_columns_to_transformers == {}
         assert data_processor._id_columns_use_old_behavior == []
+        assert data_processor._n_jobs == 1
 
     def test___init___with_id_columns_use_old_behavior(self):
         """Test the ``__init__`` method with id_columns_use_old_behavior parameter."""
@@ -975,6 +999,39 @@ class TestDataProcessor:
         address_column_transformer = config['transformers']['address']
         assert isinstance(address_column_transformer, UniformEncoder)
 
+    def test__create_config_n_jobs(self):
+        """Test that the configuration created in parallel is the same as the serial one."""
+        # Setup
+        data = pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['John', 'Doe', 'Johanna'],
+            'city': ['New York', 'Madrid', 'New York'],
+            'amount': [1.5, 2.5, 3.5],
+            'date': ['2021-01-01', '2022-01-01', '2023-01-01'],
+        })
+        metadata = SingleTableMetadata().load_from_dict({
+            'primary_key': 'id',
+            'columns': {
+                'id': {'sdtype': 'id'},
+                'name': {'sdtype': 'name'},
+                'city': {'sdtype': 'categorical'},
+                'amount': {'sdtype': 'numerical'},
+                'date': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'},
+            },
+        })
+
+        # Run
+        serial_config = DataProcessor(metadata)._create_config(data)
+        parallel_config = DataProcessor(metadata, n_jobs=3)._create_config(data)
+
+        # Assert
+        assert parallel_config['sdtypes'] == serial_config['sdtypes']
+        assert list(parallel_config['transformers']) == list(serial_config['transformers'])
+        for column, transformer in serial_config['transformers'].items():
+            parallel_transformer = parallel_config['transformers'][column]
+            assert type(parallel_transformer) is type(transformer)
+            assert repr(parallel_transformer) == repr(transformer)
+
     def test__create_config_with_different_pii_situations(self):
         """Test the ``_create_config`` transformer assignment for different pii scenarios.
 
@@ -1347,6 +1404,210 @@ class TestDataProcessor:
         # Assert
         ht_mock.return_value.fit.assert_called_once_with(data)
 
+    def test__fit_hyper_transformer_cache(self):
+        """Test that every field is fitted on its own and cached when the cache is enabled.
+
+        The transformed data should match the one of the ``HyperTransformer`` fitted on all
+        the data, be reused by ``transform`` right after fitting, and fitting again should only
+        fit the fields whose transformer changed.
+        """
+        # Setup
+        metadata = SingleTableMetadata.load_from_dict({
+            'columns': {'a': {'sdtype': 'numerical'}, 'b': {'sdtype': 'categorical'}}
+        })
+        data = pd.DataFrame({'a': [1.0, np.nan, 3.0, 4.0], 'b': ['x', 'y', 'x', 'z']})
+        dp = DataProcessor(metadata)
+        dp.set_transform_cache_size(2**20)
+        no_cache_dp = DataProcessor(metadata)
+        for instance in (dp, no_cache_dp):
+            instance.prepare_for_fitting(data)
+            instance.update_transformers({
+                'a': FloatFormatter(missing_value_generation='from_column')
+            })
+
+        no_cache_dp.fit(data)
+
+        # Run
+        dp.fit(data)
+        with patch.object(DataProcessor, '_fit_field', wraps=dp._fit_field) as mock_fit_field:
+            transformed = dp.transform(data)
+            dp.update_transformers({
+                'a': FloatFormatter(
+                    missing_value_generation='from_column', enforce_min_max_values=True
+                )
+            })
+            dp.fit(data)
+
+        # Assert
+        expected = no_cache_dp.transform(data)
+        pd.testing.assert_frame_equal(transformed, expected)
+        pd.testing.assert_frame_equal(dp.transform(data), expected)
+        pd.testing.assert_frame_equal(
+            dp.reverse_transform(expected), no_cache_dp.reverse_transform(expected)
+        )
+        mock_fit_field.assert_called_once_with(data, 'a')
+        assert [field for field, _, _ in dp._field_hyper_transformers] == ['a', 'b']
+        assert dp._get_input_columns() == ['a', 'b']
+        assert dp._get_output_columns() == ['a', 'a.is_null', 'b']
+        fitted_transformer = dp._field_hyper_transformers[0][2].field_transformers['a']
+        assert dp._hyper_transformer.field_transformers['a'] is fitted_transformer
+        cached_fields = [key[1] for key in dp._transform_cache._entries if key[0] == 'transformer']
+        assert sorted(cached_fields) == ['a', 'a', 'b']
+
+    def test__fit_hyper_transformer_cache_clashing_columns(self):
+        """Test that all the data is fitted at once if the output columns of a field clash."""
+        # Setup
+        metadata = SingleTableMetadata.load_from_dict({
+            'columns': {'a': {'sdtype': 'numerical'}, 'a.is_null': {'sdtype': 'numerical'}}
+        })
+        data = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'a.is_null': [0.0, 1.0, 0.0]})
+        dp = DataProcessor(metadata)
+        dp.set_transform_cache_size(2**20)
+        dp.prepare_for_fitting(data)
+        dp.update_transformers({'a': FloatFormatter(missing_value_generation='from_column')})
+
+        # Run
+        dp.fit(data)
+
+        # Assert
+        assert dp._field_hyper_transformers is None
+        assert dp._hyper_transformer._fitted
+        assert list(dp.transform(data).columns) == list(dp._hyper_transformer._output_columns)
+
+    def test__get_fields(self):
+        """Test that the columns of a multi-column transformer are grouped in a single field."""
+        # Setup
+        instance = Mock()
+        instance._hyper_transformer.field_transformers = {'a': None, ('b', 'd'): None, 'c': None}
+        data = pd.DataFrame(columns=['a', 'b', 'c', 'd'])
+
+        # Run
+        fields = DataProcessor._get_fields(instance, data)
+
+        # Assert
+        assert fields == ['a', ('b', 'd'), 'c']
+
+    def test__get_field_key(self):
+        """Test that the key depends on the data, sdtype and transformer of the field."""
+        # Setup
+        instance = Mock()
+        instance._hyper_transformer.field_sdtypes = {'a': 'numerical', 'b': 'categorical'}
+        instance._hyper_transformer.field_transformers = {
+            'a': FloatFormatter(learn_rounding_scheme=True),
+            'b': None,
+        }
+
+        # Run
+        key = DataProcessor._get_field_key(instance, 'a', {'a': 'fingerprint'})
+        none_key = DataProcessor._get_field_key(instance, 'b', {'b': 'fingerprint'})
+        missing_key = DataProcessor._get_field_key(instance, 'a', {'a': None})
+
+        # Assert
+        assert key == (
+            'transformer',
+            'a',
+            ('numerical',),
+            'rdt.transformers.numerical',
+            'FloatFormatter',
+            'FloatFormatter(learn_rounding_scheme=True)',
+            ('fingerprint',),
+        )
+        assert none_key[2:6] == (('categorical',), 'builtins', 'NoneType', 'None')
+        assert missing_key is None
+
+    def test__reverse_transform_fields(self):
+        """Test that every field is reversed from its output columns, in the input order."""
+        # Setup
+        first_hyper_transformer = Mock()
+        first_hyper_transformer.reverse_transform_subset.return_value = pd.DataFrame({'a': [1, 2]})
+        second_hyper_transformer = Mock()
+        second_hyper_transformer.reverse_transform_subset.return_value = pd.DataFrame({
+            'c': ['x', 'y'],
+            'b': ['z', 'w'],
+        })
+        unused_hyper_transformer = Mock()
+        instance = Mock()
+        instance._field_input_columns = ['a', 'b', 'c', 'd']
+        instance._field_hyper_transformers = [
+            ('a', ['a', 'a.is_null'], first_hyper_transformer),
+            (('b', 'c'), ['b#c'], second_hyper_transformer),
+            ('d', [], unused_hyper_transformer),
+        ]
+        data = pd.DataFrame({'a': [1.0, 2.0], 'b#c': [0.1, 0.2]})
+
+        # Run
+        reversed_data = DataProcessor._reverse_transform_fields(instance, data)
+
+        # Assert
+        expected = pd.DataFrame({'a': [1, 2], 'b': ['z', 'w'], 'c': ['x', 'y']})
+        pd.testing.assert_frame_equal(reversed_data, expected)
+        pd.testing.assert_frame_equal(
+            first_hyper_transformer.reverse_transform_subset.call_args[0][0], data[['a']]
+        )
+        unused_hyper_transformer.reverse_transform_subset.assert_not_called()
+
+    def test__create_anonymized_columns(self):
+        """Test that the columns are created by the ``HyperTransformer`` of their field."""
+        # Setup
+        first_hyper_transformer = Mock()
+        first_hyper_transformer.create_anonymized_columns.return_value = pd.DataFrame({
+            'id': [1, 2]
+        })
+        second_hyper_transformer = Mock()
+        instance = Mock()
+        instance._field_hyper_transformers = [
+            ('id', [], first_hyper_transformer),
+            ('name', [], second_hyper_transformer),
+        ]
+
+        # Run
+        generated = DataProcessor._create_anonymized_columns(instance, 2, ['id'])
+
+        # Assert
+        pd.testing.assert_frame_equal(generated, pd.DataFrame({'id': [1, 2]}))
+        first_hyper_transformer.create_anonymized_columns.assert_called_once_with(
+            num_rows=2, column_names=['id']
+        )
+        second_hyper_transformer.create_anonymized_columns.assert_not_called()
+        instance._hyper_transformer.create_anonymized_columns.assert_not_called()
+
+    def test_clear_transform_cache(self):
+        """Test that the cache is cleared."""
+        # Setup
+        dp = DataProcessor(SingleTableMetadata())
+        dp.set_transform_cache_size(2**20)
+        dp._transform_cache.set('key', 'value')
+        assert len(dp._transform_cache) == 1
+
+        # Run
+        dp.clear_transform_cache()
+
+        # Assert
+        assert len(dp._transform_cache) == 0
+
+    def test_set_transform_cache_size(self):
+        """Test that the maximum size of the cache is set."""
+        # Setup
+        dp = DataProcessor(SingleTableMetadata())
+
+        # Run
+        dp.set_transform_cache_size(10)
+
+        # Assert
+        assert dp._transform_cache.max_size == 10
+
+    def test__get_transform_cache_missing(self):
+        """Test that the cache is created for data processors pickled without one."""
+        # Setup
+        dp = Mock(spec=[])
+
+        # Run
+        cache = DataProcessor._get_transform_cache(dp)
+
+        # Assert
+        assert isinstance(cache, TransformCache)
+        assert dp._transform_cache is cache
+
     @patch('sdv.data_processing.numerical_formatter.NumericalFormatter.learn_format')
     def test__fit_formatters(self, learn_format_mock):
         """Test the ``_fit_formatters`` method.
@@ -1400,6 +1661,144 @@ class TestDataProcessor:
         assert dp.formatters['date_col2']._dtype == '<M8[ns]'
         assert dp.formatters['date_col2'].datetime_format == '%Y-%d-%M'
 
+    def test_update_numerical_formats(self):
+        """Test that the numerical formats are learned chunk by chunk."""
+        # Setup
+        metadata = SingleTableMetadata()
+        metadata.add_column('id', sdtype='id')
+        metadata.add_column('num', sdtype='numerical', computer_representation='Int16')
+        metadata.add_column('cat', sdtype='categorical')
+        metadata.set_primary_key('id')
+        dp = DataProcessor(metadata)
+        first_chunk = pd.DataFrame({'id': [1, 2], 'num': [5, 3], 'cat': ['a', 'b']})
+        second_chunk = pd.DataFrame({'id': [3], 'num': [10], 'cat': ['c']})
+
+        # Run
+        formatters = dp.update_numerical_formats(first_chunk, {})
+        result = dp.update_numerical_formats(second_chunk, formatters)
+
+        # Assert
+        assert result is formatters
+        assert list(formatters) == ['num']
+        assert formatters['num'].computer_representation == 'Int16'
+        assert formatters['num']._min_value == 3
+        assert formatters['num']._max_value == 10
+        assert formatters['num']._rounding_digits == 0
+
+    def test_set_numerical_formats(self):
+        """Test that the formats of the formatters and ``FloatFormatter`` are replaced."""
+        # Setup
+        dp = DataProcessor(SingleTableMetadata())
+        learned_formatter = NumericalFormatter(enforce_rounding=True, enforce_min_max_values=True)
+        dp.formatters = {'num': learned_formatter}
+        float_formatter = FloatFormatter(learn_rounding_scheme=False, enforce_min_max_values=True)
+        dp._hyper_transformer = Mock()
+        dp._hyper_transformer.field_transformers = {'num': float_formatter, 'other': None}
+        formatter = NumericalFormatter()
+        formatter._min_value = -1
+        formatter._max_value = 100
+        formatter._rounding_digits = 2
+
+        # Run
+        dp.set_numerical_formats({'num': formatter, 'other': formatter})
+
+        # Assert
+        assert learned_formatter._min_value == -1
+        assert learned_formatter._max_value == 100
+        assert learned_formatter._rounding_digits == 2
+        assert float_formatter._min_value == -1
+        assert float_formatter._max_value == 100
+        assert float_formatter._rounding_digits is None
+
+    def test__fit_formatters_n_jobs(self):
+        """Test that the formatters fitted in parallel are the same as the serial ones."""
+        # Setup
+        data = pd.DataFrame({
+            'col1': ['abc', 'def', 'ghi'],
+            'col2': [1.25, 2.5, 3.75],
+            'col3': [3, 4, 5],
+            'date_col': ['16-05-2023', '14-04-2022', '01-01-2020'],
+        })
+        metadata = SingleTableMetadata()
+        metadata.add_column('col1', sdtype='categorical')
+        metadata.add_column('col2', sdtype='numerical')
+        metadata.add_column('col3', sdtype='numerical', computer_representation='Int8')
+        metadata.add_column('date_col', sdtype='datetime')
+        serial = DataProcessor(metadata)
+        parallel = DataProcessor(metadata, n_jobs=2)
+
+        # Run
+        serial._fit_formatters(data)
+        parallel._fit_formatters(data)
+
+        # Assert
+        assert list(parallel.formatters) == list(serial.formatters)
+        for column, formatter in serial.formatters.items():
+            assert parallel.formatters[column].__dict__ == formatter.__dict__
+
+    def test__fit_formatters_cached(self):
+        """Test that only the formatters of the columns that changed are fitted again."""
+        # Setup
+        data = pd.DataFrame({'col1': [1.25, 2.5, 3.75], 'col2': [3, 4, 5]})
+        metadata = SingleTableMetadata()
+        metadata.add_column('col1', sdtype='numerical')
+        metadata.add_column('col2', sdtype='numerical')
+        dp = DataProcessor(metadata)
+        dp.set_transform_cache_size(2**20)
+        dp._fit_formatters(data)
+        formatter = dp.formatters['col1']
+        get_formatters = dp._get_formatters
+        dp._get_formatters = Mock(side_effect=get_formatters)
+        new_data = data.assign(col2=[30, 40, 50])
+
+        # Run
+        dp._fit_formatters(new_data)
+
+        # Assert
+        dp._get_formatters.assert_called_once_with(new_data, ['col2'])
+        assert list(dp.formatters) == ['col1', 'col2']
+        assert dp.formatters['col1'] is not formatter
+        assert dp.formatters['col1'].__dict__ == formatter.__dict__
+        assert dp.formatters['col2']._max_value == 50
+
+    @patch('sdv.data_processing.data_processor.ProcessPoolExecutor')
+    def test__map_column_chunks(self, mock_process_pool_executor):
+        """Test that the columns are split in contiguous chunks, one per process."""
+        # Setup
+        data = pd.DataFrame({'a': [1], 'b': [2], 'c': [3], 'd': [4], 'e': [5]})
+        dp = DataProcessor(SingleTableMetadata(), n_jobs=2)
+        executor = mock_process_pool_executor.return_value.__enter__.return_value
+        executor.map.return_value = iter(['first', 'second'])
+        method = Mock()
+
+        # Run
+        result = dp._map_column_chunks(method, data, ['e', 'a', 'b', 'c', 'd'])
+
+        # Assert
+        assert result == ['first', 'second']
+        mock_process_pool_executor.assert_called_once_with(max_workers=2)
+        called_method, chunk_data, chunks = executor.map.call_args[0]
+        assert called_method == method
+        assert chunks == [['e', 'a', 'b'], ['c', 'd']]
+        pd.testing.assert_frame_equal(chunk_data[0], data[['e', 'a', 'b']])
+        pd.testing.assert_frame_equal(chunk_data[1], data[['c', 'd']])
+
+    @patch('sdv.data_processing.data_processor.ProcessPoolExecutor')
+    def test__map_column_chunks_serial(self, mock_process_pool_executor):
+        """Test that the method is called on all the columns when ``n_jobs`` is 1."""
+        # Setup
+        data = pd.DataFrame({'a': [1], 'b': [2]})
+        dp = DataProcessor(SingleTableMetadata())
+        method = Mock()
+
+        # Run
+        result = dp._map_column_chunks(method, data, ['a', 'b'])
+
+        # Assert
+        assert result == [method.return_value]
+        method.assert_called_once_with(data, ['a', 'b'])
+        mock_process_pool_executor.assert_not_called()
+
     @patch('sdv.data_processing.data_processor.LOGGER')
     def test_prepare_for_fitting(self, log_mock):
         """Test the steps before fitting.
@@ -1532,6 +1931,7 @@ class TestDataProcessor:
         data = pd.DataFrame({'a': [1, 2, 3]}, dtype=np.int64)
         dp = Mock()
         dp.table_name = 'fake_table'
+        dp._get_transform_cache.return_value = TransformCache()
 
         # Run
         DataProcessor.fit(dp, data)
@@ -1540,6 +1940,28 @@ class TestDataProcessor:
         dp.prepare_for_fitting.assert_called_once_with(data)
         dp._fit_hyper_transformer.assert_called_once_with(data)
         log_mock.info.assert_called_once_with('Fitting HyperTransformer for table fake_table')
+        assert dp._sampling_plan is None
+
+    def test__get_sampling_plan(self):
+        """Test that the plan is computed from the metadata and dtypes only once."""
+        # Setup
+        dp = Mock()
+        dp._sampling_plan = None
+        dp.metadata.columns = {'b': {'sdtype': 'categorical'}, 'a': {'sdtype': 'numerical'}}
+        dp._dtypes = pd.Series({'a': np.dtype('int64'), 'b': np.dtype('O')})
+
+        # Run
+        plan = DataProcessor._get_sampling_plan(dp)
+        dp.metadata.columns = {}
+        second_plan = DataProcessor._get_sampling_plan(dp)
+
+        # Assert
+        assert plan == {
+            'column_order': ['b', 'a'],
+            'dtypes': {'a': np.dtype('int64'), 'b': np.dtype('O')},
+            'is_integer': {'a': True, 'b': False},
+        }
+        assert second_plan is plan
 
     @patch('sdv.data_processing.data_processor.LOGGER')
     def test_transform(self, log_mock):
@@ -1577,11 +1999,50 @@ class TestDataProcessor:
         transformer_call = call('Transforming table table_name')
         log_mock.debug.assert_has_calls([transformer_call])
 
+    def test_transform_precision(self):
+        """Test that the float columns are transformed to the ``precision`` of the processor."""
+        # Setup
+        data = pd.DataFrame({'a': [1.5, 2.5], 'b': [1, 2]})
+        dp = DataProcessor(SingleTableMetadata(), precision='float32')
+        dp._hyper_transformer = Mock()
+        dp._hyper_transformer.transform_subset.return_value = data
+        dp.get_sdtypes = Mock(return_value={'a': 'numerical', 'b': 'numerical'})
+        dp.fitted = True
+
+        # Run
+        result = dp.transform(data)
+        result_condition = dp.transform(data, is_condition=True)
+
+        # Assert
+        assert result['a'].dtype == np.float32
+        assert result['b'].dtype == np.int64
+        assert result_condition['a'].dtype == np.float64
+
+    def test_reverse_transform_precision(self):
+        """Test that the data is cast back to ``float64`` before being reverse transformed."""
+        # Setup
+        dp = DataProcessor(SingleTableMetadata(), precision='float32')
+        dp._hyper_transformer = Mock()
+        dp._hyper_transformer._output_columns = ['a']
+        dp._hyper_transformer.reverse_transform_subset.side_effect = lambda data: data
+        dp.fitted = True
+        dp._dtypes = {'a': 'float64'}
+        dp.metadata = Mock()
+        dp.metadata.columns = {'a': {'sdtype': 'numerical'}}
+        data = pd.DataFrame({'a': np.array([1.1, 2.2], dtype=np.float32)})
+
+        # Run
+        dp.reverse_transform(data)
+
+        # Assert
+        reversed_data = dp._hyper_transformer.reverse_transform_subset.call_args[0][0]
+        assert reversed_data['a'].dtype == np.float64
+
     def test_generate_keys(self):
         """Test the ``genereate_primary_keys``.
 
-        Test that when calling this function this calls the ``instance._hyper_transformer``'s
-        ``create_anonymized_columns`` method with the ``num_rows`` and the
+        Test that when calling this function this calls the ``instance``'s
+        ``_create_anonymized_columns`` method with the ``num_rows`` and the
         ``instance._primary_keys``.
 
         Setup:
@@ -1592,12 +2053,12 @@ class TestDataProcessor:
             - ``num_rows``
 
         Side Effects:
-            - ``instance._hyper_transformer.create_anonymized_columns`` has been called with the
-              input number and ``column_names`` same as the ``instance._primary_keys``.
+            - ``instance._create_anonymized_columns`` has been called with the input number
+              and ``column_names`` same as the ``instance._primary_keys``.
 
         Output:
             - The output should be the return value of the
-              ``instance._hyper_transformer.create_anonymized_columns``.
+              ``instance._create_anonymized_columns``.
         """
         # Setup
         instance = Mock()
@@ -1609,12 +2070,97 @@ class TestDataProcessor:
         result = DataProcessor.generate_keys(instance, 10)
 
         # Assert
-        instance._hyper_transformer.create_anonymized_columns.assert_called_once_with(
+        instance._create_anonymized_columns.assert_called_once_with(
             num_rows=10,
             column_names=['a'],
         )
 
-        assert result == instance._hyper_transformer.create_anonymized_columns.return_value
+        assert result == instance._create_anonymized_columns.return_value
+
+    def test_set_random_state(self):
+        """Test that the ``transform`` and ``reverse_transform`` random states are set."""
+        # Setup
+        instance = Mock()
+        transformer = FloatFormatter()
+        instance._hyper_transformer.field_transformers = {'a': transformer, 'b': None}
+
+        # Run
+        DataProcessor.set_random_state(instance, 10)
+
+        # Assert
+        expected_state = np.random.RandomState(10).get_state()[1]
+        transform_state = transformer.random_states['transform'].get_state()[1]
+        reverse_state = transformer.random_states['reverse_transform'].get_state()[1]
+        np.testing.assert_array_equal(transform_state, expected_state)
+        np.testing.assert_array_equal(reverse_state, expected_state)
+
+    def test_regenerate_anonymized_columns(self):
+        """Test that the generated columns are replaced and cast back to their dtypes."""
+        # Setup
+        instance = Mock()
+        key_transformer = Mock()
+        key_transformer.is_generator.return_value = True
+        numerical_transformer = Mock()
+        numerical_transformer.is_generator.return_value = False
+        instance._hyper_transformer.field_transformers = {
+            'id': key_transformer,
+            'amount': numerical_transformer,
+            ('city', 'state'): key_transformer,
+            'name': None,
+        }
+        instance._create_anonymized_columns.return_value = pd.DataFrame({'id': ['3', '4']})
+        instance._dtypes = pd.Series({'id': np.dtype('int64'), 'amount': np.dtype('float64')})
+        instance.formatters = {}
+        data = pd.DataFrame({'id': [0, 0], 'amount': [1.5, 2.5], 'name': ['a', 'b']}, index=[5, 7])
+
+        # Run
+        result = DataProcessor.regenerate_anonymized_columns(instance, data)
+
+        # Assert
+        instance._create_anonymized_columns.assert_called_once_with(num_rows=2, column_names=['id'])
+        expected = pd.DataFrame(
+            {'id': [3, 4], 'amount': [1.5, 2.5], 'name': ['a', 'b']}, index=[5, 7]
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_regenerate_anonymized_columns_exclude_columns(self):
+        """Test that the excluded columns are not generated again."""
+        # Setup
+        instance = Mock()
+        key_transformer = Mock()
+        key_transformer.is_generator.return_value = True
+        instance._hyper_transformer.field_transformers = {
+            'id': key_transformer,
+            'name': key_transformer,
+        }
+        instance._create_anonymized_columns.return_value = pd.DataFrame({'id': [3, 4]})
+        instance._dtypes = pd.Series({'id': np.dtype('int64'), 'name': np.dtype('O')})
+        instance.formatters = {}
+        data = pd.DataFrame({'id': [0, 0], 'name': ['Bob', 'Bob']})
+
+        # Run
+        result = DataProcessor.regenerate_anonymized_columns(
+            instance, data, exclude_columns={'name'}
+        )
+
+        # Assert
+        instance._create_anonymized_columns.assert_called_once_with(num_rows=2, column_names=['id'])
+        expected = pd.DataFrame({'id': [3, 4], 'name': ['Bob', 'Bob']})
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_regenerate_anonymized_columns_no_generators(self):
+        """Test that the data is returned as is when there are no generated columns."""
+        # Setup
+        instance = Mock()
+        instance._hyper_transformer.field_transformers = {'amount': None}
+        data = pd.DataFrame({'amount': [1.5, 2.5]})
+
+        # Run
+        result = DataProcessor.regenerate_anonymized_columns(instance, data)
+
+        # Assert
+        assert result is data
+        instance._create_anonymized_columns.assert_not_called()
 
     @patch('sdv.data_processing.data_processor.LOGGER')
     def test_transform_primary_key(self, log_mock):
@@ -1721,6 +2267,114 @@ class TestDataProcessor:
         )
         pd.testing.assert_frame_equal(transformed_data, expected_data)
 
+    def test__get_block_key(self):
+        """Test which columns are restored in blocks and how they are grouped."""
+        # Setup
+        dp = DataProcessor(SingleTableMetadata())
+        float_formatter = NumericalFormatter(enforce_rounding=True)
+        float_formatter._dtype = np.dtype('float64')
+        float_formatter._rounding_digits = 2
+        int_formatter = NumericalFormatter(enforce_min_max_values=True)
+        int_formatter._dtype = np.dtype('int64')
+        int_formatter._min_value = np.int64(0)
+        int_formatter._max_value = np.int64(10)
+        float_bounds_formatter = NumericalFormatter(enforce_min_max_values=True)
+        float_bounds_formatter._dtype = np.dtype('int64')
+        float_bounds_formatter._min_value = 0.5
+        dp.formatters = {
+            'float': float_formatter,
+            'int': int_formatter,
+            'float_bounds': float_bounds_formatter,
+            'date': DatetimeFormatter(),
+        }
+        floats = pd.Series([1.5])
+        ints = pd.Series([1])
+        int64 = np.dtype('int64')
+
+        # Run and Assert
+        assert dp._get_block_key('float', floats, np.dtype('float64')) == (
+            np.dtype('float64'),
+            2,
+            True,
+        )
+        assert dp._get_block_key('int', floats, int64) == (int64, None, True)
+        assert dp._get_block_key('int', ints, int64) == (int64, None, False)
+        assert dp._get_block_key('int', ints.astype('int32'), int64) is None
+        assert dp._get_block_key('int', floats, pd.Int64Dtype()) is None
+        assert dp._get_block_key('float_bounds', floats, int64) is None
+        assert dp._get_block_key('date', floats, int64) is None
+        assert dp._get_block_key('categorical', floats, int64) is None
+
+    @patch('sdv.data_processing.data_processor.LOGGER')
+    def test__split_integer_block(self, log_mock):
+        """Test that the columns with NaNs are kept as floats and the invalid ones left out."""
+        # Setup
+        values = np.array([
+            [1.0, np.nan, np.inf, 300.0, 2.0],
+            [2.0, 3.0, 1.0, 1.0, 3.0],
+        ])
+        columns = ['a', 'b', 'c', 'd', 'e']
+
+        # Run
+        blocks = DataProcessor._split_integer_block(columns, values, np.dtype('uint8'))
+
+        # Assert
+        (int_columns, int_block), (nan_columns, nan_block) = blocks
+        assert int_columns == ['a', 'e']
+        assert int_block.dtype == np.uint8
+        np.testing.assert_array_equal(int_block, [[1, 2], [2, 3]])
+        assert nan_columns == ['b']
+        np.testing.assert_array_equal(nan_block, [[np.nan], [3.0]])
+        log_mock.debug.assert_called_once()
+
+    def test__restore_numerical_columns(self):
+        """Test that the restored columns match restoring and formatting them one by one."""
+        # Setup
+        dp = DataProcessor(SingleTableMetadata())
+        data = pd.DataFrame({
+            'float': [1.234, 5.678, 10.0],
+            'float32': np.array([1.5, -2.5, 3.25], dtype='float32'),
+            'int': [2.6, -1.2, 20.0],
+            'int_nans': [2.6, np.nan, 20.0],
+            'int32': np.array([1, 2, 3], dtype='int32'),
+            'category': ['a', 'b', 'c'],
+        })
+        dtypes = {
+            'float': np.dtype('float64'),
+            'float32': np.dtype('float32'),
+            'int': np.dtype('int64'),
+            'int_nans': np.dtype('int64'),
+            'int32': np.dtype('int32'),
+            'category': np.dtype('O'),
+        }
+        learn_data = pd.DataFrame({
+            'float': [1.25, 2.5, 7.75],
+            'float32': np.array([0.5, 1.5, 2.0], dtype='float32'),
+            'int': [0, 5, 10],
+            'int_nans': [0, 5, 10],
+            'int32': np.array([1, 2, 2], dtype='int32'),
+        })
+        for column in learn_data:
+            dp.formatters[column] = NumericalFormatter(
+                enforce_rounding=True, enforce_min_max_values=True
+            )
+            dp.formatters[column].learn_format(learn_data[column])
+
+        # Run
+        result = dp._restore_numerical_columns(data, list(data.columns), dtypes)
+
+        # Assert
+        assert set(result) == {'float', 'float32', 'int', 'int_nans', 'int32'}
+        np.testing.assert_array_equal(result['float'], [1.25, 5.68, 7.75])
+        assert result['float32'].dtype == np.float32
+        np.testing.assert_array_equal(result['float32'], [1.5, 0.5, 2.0])
+        assert result['int'].dtype == np.int64
+        np.testing.assert_array_equal(result['int'], [3, 0, 10])
+        assert result['int_nans'].dtype == np.float64
+        np.testing.assert_array_equal(result['int_nans'], [3, np.nan, 10])
+        assert result['int32'].dtype == np.int32
+        np.testing.assert_array_equal(result['int32'], [1, 2, 2])
+
     def test_reverse_transform(self):
         """Test the ``reverse_transform`` method.
 
@@ -2078,6 +2732,36 @@ class TestDataProcessor:
 
         pd.testing.assert_frame_equal(output, data)
 
+    def test__is_formatted_datetime(self):
+        """Test that only the columns written in the same format by a transformer are skipped."""
+        # Setup
+        dp = DataProcessor(SingleTableMetadata())
+        formatter = DatetimeFormatter('%Y-%m-%d')
+        formatter._dtype = np.dtype('O')
+        dp.formatters = {'date': formatter, 'other_date': formatter, 'num': NumericalFormatter()}
+        dp._hyper_transformer = Mock()
+        dp._hyper_transformer.field_transformers = {
+            'date': UnixTimestampEncoder(datetime_format='%Y-%m-%d'),
+            'other_date': UnixTimestampEncoder(datetime_format='%d/%m/%Y'),
+            'num': FloatFormatter(),
+        }
+        column = pd.Series(['2023-01-01'], dtype=object)
+
+        # Run
+        result = dp._is_formatted_datetime('date', column)
+        result_other_format = dp._is_formatted_datetime('other_date', column)
+        result_other_dtype = dp._is_formatted_datetime('date', pd.Series([1]))
+        result_not_datetime = dp._is_formatted_datetime('num', column)
+        dp._constraints_to_reverse = [Mock()]
+        result_constraints = dp._is_formatted_datetime('date', column)
+
+        # Assert
+        assert result is True
+        assert result_other_format is False
+        assert result_other_dtype is False
+        assert result_not_datetime is False
+        assert result_constraints is False
+
     def test_reverse_transform_datetime_formatter(self):
         """Test that the ``reverse_transform`` calls the ``DatetimeFormatter``.
 
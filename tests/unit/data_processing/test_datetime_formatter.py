@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from sdv.data_processing.datetime_formatter import DatetimeFormatter
@@ -46,6 +47,46 @@ class TestDatetimeFormatter:
         assert formatter._dtype == '<M8[ns]'
         assert formatter.datetime_format == '%m-%d-%Y'
 
+    def test__values_match_format(self):
+        """Test that only the non null values are checked against the format."""
+        # Setup
+        formatter = DatetimeFormatter('%Y-%m-%d')
+
+        # Run
+        result = formatter._values_match_format(pd.Series(['2023-01-01', np.nan, '2023-12-31']))
+        result_empty = formatter._values_match_format(pd.Series([np.nan, None]))
+
+        # Assert
+        assert result is True
+        assert result_empty is True
+
+    def test__values_match_format_does_not_match(self):
+        """Test that the values that do not round trip through the format do not match it."""
+        # Setup
+        formatter = DatetimeFormatter('%Y-%m-%d')
+
+        # Run
+        not_padded = formatter._values_match_format(pd.Series(['2023-01-01', '2023-1-2']))
+        not_parsed = formatter._values_match_format(pd.Series(['2023-01-01', 'abc']))
+        not_string = formatter._values_match_format(pd.Series(['2023-01-01', 20230102]))
+
+        # Assert
+        assert not_padded is False
+        assert not_parsed is False
+        assert not_string is False
+
+    def test__values_match_format_mixed_timezones(self):
+        """Test that values with different offsets are checked one by one."""
+        # Setup
+        formatter = DatetimeFormatter('%Y-%m-%d %H:%M:%S%z')
+        column = pd.Series(['2023-01-01 10:00:00+0100', '2023-01-01 10:00:00+0300'])
+
+        # Run
+        result = formatter._values_match_format(column)
+
+        # Assert
+        assert result is True
+
     def test_format_data(self):
         """Test that formats the input data as expected."""
         # Setup
@@ -362,3 +362,64 @@ class TestNumericalFormatter:
         np.testing.assert_array_equal(
             result, np.array([-128, np.nan, -128, -128, -100, 0, 125, 127, 127])
         )
+
+    def test_update_format(self):
+        """Test that learning the format by chunks is the same as on the whole column."""
+        # Setup
+        column = pd.Series([np.nan, 1.5, 2.25, np.inf, -3.0, 12.125, np.nan])
+        expected = NumericalFormatter(enforce_rounding=True, enforce_min_max_values=True)
+        expected.learn_format(column)
+        formatter = NumericalFormatter(enforce_rounding=True, enforce_min_max_values=True)
+
+        # Run
+        for chunk in (column[:1], column[1:3], column[3:4], column[4:]):
+            formatter.update_format(chunk)
+
+        # Assert
+        assert formatter._dtype == expected._dtype
+        assert formatter._min_value == expected._min_value == -3.0
+        assert formatter._max_value == expected._max_value == np.inf
+        assert formatter._rounding_digits == expected._rounding_digits == 3
+
+    def test_update_format_not_roundable(self):
+        """Test that the data is not rounded if a chunk can not be rounded."""
+        # Setup
+        formatter = NumericalFormatter(enforce_rounding=True)
+
+        # Run
+        formatter.update_format(pd.Series([1.5, 2.0]))
+        formatter.update_format(pd.Series([1 / 3]))
+        formatter.update_format(pd.Series([1.0]))
+
+        # Assert
+        assert formatter._rounding_digits is None
+
+    def test_update_format_too_many_digits(self):
+        """Test that the rounding digits account for the integer digits of all the chunks."""
+        # Setup
+        column = pd.Series([0.123456, 12345678901.0])
+        expected = NumericalFormatter(enforce_rounding=True)
+        expected.learn_format(column)
+        formatter = NumericalFormatter(enforce_rounding=True)
+
+        # Run
+        formatter.update_format(column[:1])
+        formatter.update_format(column[1:])
+
+        # Assert
+        assert expected._rounding_digits is None
+        assert formatter._rounding_digits is None
+
+    def test_get_bounds(self):
+        """Test the bounds for the min and max values and the computer representation."""
+        # Setup
+        min_max_formatter = NumericalFormatter(enforce_min_max_values=True)
+        min_max_formatter._min_value = -3
+        min_max_formatter._max_value = 7
+        int_formatter = NumericalFormatter(computer_representation='UInt8')
+        float_formatter = NumericalFormatter()
+
+        # Run and Assert
+        assert min_max_formatter.get_bounds() == (-3, 7)
+        assert int_formatter.get_bounds() == (0, 255)
+        assert float_formatter.get_bounds() == (None, None)
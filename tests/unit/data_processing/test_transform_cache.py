@@ -0,0 +1,197 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from sdv.data_processing.transform_cache import (
+    ENTRY_OVERHEAD,
+    TransformCache,
+    get_column_fingerprint,
+    get_memory_size,
+)
+
+
+def test_get_column_fingerprint():
+    """Test that the fingerprint depends on the name, dtype and values but not on the index."""
+    # Setup
+    column = pd.Series([1, 2, 3], name='a')
+
+    # Run
+    fingerprint = get_column_fingerprint(column)
+
+    # Assert
+    assert fingerprint == get_column_fingerprint(pd.Series([1, 2, 3], name='a', index=[5, 6, 7]))
+    assert fingerprint != get_column_fingerprint(pd.Series([1, 2, 4], name='a'))
+    assert fingerprint != get_column_fingerprint(pd.Series([1, 2, 3], name='b'))
+    assert fingerprint != get_column_fingerprint(pd.Series([1.0, 2.0, 3.0], name='a'))
+
+
+def test_get_column_fingerprint_unhashable_values():
+    """Test that ``None`` is returned if the values cannot be hashed."""
+    # Setup
+    column = pd.Series([[1], [2]], name='a')
+
+    # Run
+    fingerprint = get_column_fingerprint(column)
+
+    # Assert
+    assert fingerprint is None
+
+
+def test_get_memory_size():
+    """Test that the size of the values of the object columns is estimated."""
+    # Setup
+    data = pd.DataFrame({'num': np.arange(10, dtype=np.int64), 'str': ['a' * 100] * 10})
+
+    # Run
+    size = get_memory_size(data)
+
+    # Assert
+    assert size > data.memory_usage(deep=False).sum() + 1000
+    assert size <= data.memory_usage(deep=True).sum()
+
+
+class TestTransformCache:
+    def test___init__(self):
+        """Test that the cache is disabled by default."""
+        # Run
+        cache = TransformCache()
+        cache.set('key', 'value')
+
+        # Assert
+        assert cache.max_size == 0
+        assert len(cache) == 0
+        assert cache.get_fingerprint(pd.DataFrame({'a': [1]})) is None
+
+    def test_set_get(self):
+        """Test that the values are cached under their key, with an overhead per entry."""
+        # Setup
+        cache = TransformCache(max_size=2**20)
+
+        # Run
+        cache.set('key', 'value', size=10)
+        cache.set(None, 'value', size=10)
+
+        # Assert
+        assert cache.get('key') == 'value'
+        assert cache.get('missing') is None
+        assert cache.get(None) is None
+        assert len(cache) == 1
+        assert cache.size == 10 + ENTRY_OVERHEAD
+
+    def test_set_evicts_least_recently_used(self):
+        """Test that the least recently used entries are evicted when the cache is full."""
+        # Setup
+        cache = TransformCache(max_size=3 * ENTRY_OVERHEAD)
+        cache.set('a', 1, size=ENTRY_OVERHEAD // 2)
+        cache.set('b', 2, size=ENTRY_OVERHEAD // 2)
+        cache.get('a')
+
+        # Run
+        cache.set('c', 3, size=ENTRY_OVERHEAD // 2)
+        cache.set('too_big', 4, size=3 * ENTRY_OVERHEAD)
+
+        # Assert
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+        assert cache.get('too_big') is None
+        assert cache.size == 3 * ENTRY_OVERHEAD
+
+    def test_set_max_size(self):
+        """Test that setting the maximum size to 0 evicts all the entries."""
+        # Setup
+        cache = TransformCache(max_size=2**20)
+        cache.set('a', 1)
+
+        # Run
+        cache.set_max_size(0)
+        cache.set('b', 2)
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.size == 0
+        assert cache.get_fingerprints(pd.DataFrame({'a': [1]})) == {}
+
+    def test_clear(self):
+        """Test that the entries are removed."""
+        # Setup
+        cache = TransformCache(max_size=2**20)
+        cache.set('a', 1)
+        cache.last_fit = ('data', [])
+
+        # Run
+        cache.clear()
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.size == 0
+        assert cache.last_fit is None
+
+    def test_pickle(self):
+        """Test that a pickled cache is empty and keeps its maximum size."""
+        # Setup
+        cache = TransformCache(max_size=100)
+        cache.set('a', 1, size=10)
+        cache.last_fit = ('data', [])
+
+        # Run
+        loaded = pickle.loads(pickle.dumps(cache))
+
+        # Assert
+        assert loaded.max_size == 100
+        assert len(loaded) == 0
+        assert loaded.last_fit is None
+
+    def test_get_fingerprints_scope(self):
+        """Test that the fingerprints are only remembered until leaving the outermost scope."""
+        # Setup
+        cache = TransformCache(max_size=2**20)
+        data = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+
+        # Run
+        with cache.fingerprint_scope():
+            with cache.fingerprint_scope():
+                fingerprints = cache.get_fingerprints(data)
+
+            data.loc[0, 'a'] = 3
+            fingerprints_in_scope = cache.get_fingerprints(data)
+
+        fingerprints_out_of_scope = cache.get_fingerprints(data)
+
+        # Assert
+        assert fingerprints == {
+            'a': get_column_fingerprint(pd.Series([1, 2], name='a')),
+            'b': get_column_fingerprint(data['b']),
+        }
+        assert fingerprints_in_scope is fingerprints
+        assert fingerprints_out_of_scope['a'] == get_column_fingerprint(data['a'])
+
+    def test_remember_fingerprints(self):
+        """Test that the given fingerprints are used for the data inside a scope."""
+        # Setup
+        cache = TransformCache(max_size=2**20)
+        data = pd.DataFrame({'a': [1, 2]})
+
+        # Run
+        with cache.fingerprint_scope():
+            cache.remember_fingerprints(data, {'a': 'fingerprint'})
+            fingerprints = cache.get_fingerprints(data)
+
+        # Assert
+        assert fingerprints == {'a': 'fingerprint'}
+
+    def test_get_fingerprint(self):
+        """Test that the fingerprint of the data depends on its index and values."""
+        # Setup
+        cache = TransformCache(max_size=2**20)
+        data = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+
+        # Run
+        fingerprint = cache.get_fingerprint(data)
+
+        # Assert
+        assert fingerprint == cache.get_fingerprint(data.copy())
+        assert fingerprint != cache.get_fingerprint(data.set_axis([1, 2]))
+        assert fingerprint != cache.get_fingerprint(data[['b', 'a']])
+        assert cache.get_fingerprint(pd.DataFrame({'a': [[1], [2]]})) is None
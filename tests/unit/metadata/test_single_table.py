@@ -9,6 +9,7 @@ from unittest.mock import Mock, call, patch
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from sdv.errors import InvalidDataError
@@ -1215,6 +1216,30 @@ class TestSingleTableMetadata:
         for column in data.columns:
             assert instance.columns[column]['sdtype'] == 'numerical'
 
+    def test__detect_columns_string_dtypes(self):
+        """Test the ``_detect_columns`` method with categorical and arrow string dtypes."""
+        # Setup
+        instance = SingleTableMetadata()
+        data = pd.DataFrame({
+            'category': pd.Series(['a', 'b', 'a', None], dtype='category'),
+            'string': pd.Series(['a', 'b', 'a', None], dtype='string[pyarrow]'),
+            'arrow': pd.Series(['a', 'b', 'a', None], dtype=pd.ArrowDtype(pa.string())),
+            'arrow_date': pd.Series(
+                ['2021-01-01', '2021-01-02', '2021-01-03', None], dtype=pd.ArrowDtype(pa.string())
+            ),
+        })
+
+        # Run
+        instance._detect_columns(data)
+
+        # Assert
+        assert instance.columns == {
+            'category': {'sdtype': 'categorical'},
+            'string': {'sdtype': 'categorical'},
+            'arrow': {'sdtype': 'categorical'},
+            'arrow_date': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'},
+        }
+
     def test__detect_columns_primary_key_detection(self):
         """Test the ``_detect_columns`` primary key detection."""
         # Setup
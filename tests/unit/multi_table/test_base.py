@@ -312,6 +312,8 @@ class TestBaseMultiTableSynthesizer:
                 'enforce_rounding': True,
                 'locales': ['en_US'],
                 'numerical_distributions': {},
+                'precision': 'float64',
+                'correlation_rank': None,
             },
         }
 
@@ -332,6 +334,8 @@ class TestBaseMultiTableSynthesizer:
             'enforce_rounding': True,
             'locales': ['en_US'],
             'numerical_distributions': {},
+            'precision': 'float64',
+            'correlation_rank': None,
         }
 
     def test_get_parameters(self):
@@ -370,6 +374,8 @@ class TestBaseMultiTableSynthesizer:
             'locales': ['en_US'],
             'enforce_rounding': True,
             'numerical_distributions': {},
+            'precision': 'float64',
+            'correlation_rank': None,
         }
 
     def test_set_table_parameters_invalid_enforce_min_max_values(self):
@@ -1127,6 +1133,7 @@ class TestBaseMultiTableSynthesizer:
         instance._augment_tables.assert_called_once_with(processed_data)
         instance._model_tables.assert_called_once_with(instance._augment_tables.return_value)
         assert instance._fitted
+        assert instance._n_jobs == 1
         assert caplog.messages[0] == str({
             'EVENT': 'Fit processed data',
             'TIMESTAMP': '2024-04-19 16:20:10.037183',
@@ -1137,6 +1144,26 @@ class TestBaseMultiTableSynthesizer:
             'TOTAL NUMBER OF COLUMNS': 4,
         })
 
+    def test_fit_processed_data_n_jobs(self):
+        """Test that ``n_jobs`` is validated and stored before augmenting the tables."""
+        # Setup
+        instance = Mock(_fitted_sdv_version=None, _fitted_sdv_enterprise_version=None)
+        processed_data = {'table1': pd.DataFrame({'id': [1, 2, 3]})}
+
+        def augment_tables(data):
+            assert instance._n_jobs == 2
+            return data
+
+        instance._augment_tables.side_effect = augment_tables
+
+        # Run
+        BaseMultiTableSynthesizer.fit_processed_data(instance, processed_data, n_jobs=2)
+        with pytest.raises(SynthesizerInputError, match="Invalid value '0' for parameter"):
+            BaseMultiTableSynthesizer.fit_processed_data(instance, processed_data, n_jobs=0)
+
+        # Assert
+        instance._augment_tables.assert_called_once_with(processed_data)
+
     def test_fit_processed_data_empty_table(self):
         """Test attributes are properly set when data is empty and that _fit is not called."""
         # Setup
@@ -1195,7 +1222,9 @@ class TestBaseMultiTableSynthesizer:
 
         # Assert
         instance.preprocess.assert_called_once_with(data)
-        instance.fit_processed_data.assert_called_once_with(instance.preprocess.return_value)
+        instance.fit_processed_data.assert_called_once_with(
+            instance.preprocess.return_value, n_jobs=1
+        )
         instance._check_metadata_updated.assert_called_once()
         assert caplog.messages[0] == str({
             'EVENT': 'Fit',
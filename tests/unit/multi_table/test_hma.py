@@ -5,12 +5,20 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from sdv._utils import _share_dataframe
 from sdv.errors import SynthesizerInputError
 from sdv.metadata.metadata import Metadata
 from sdv.multi_table.hma import (
     HMASynthesizer,
+    _fit_extension_groupwise,
+    _fit_extension_rows,
+    _fit_groups_in_parallel,
+    _fit_groups_in_worker,
+    _fit_univariates_per_group,
 )
+from sdv.single_table.base import FIXED_RNG_SEED
 from sdv.single_table.copulas import GaussianCopulaSynthesizer
+from sdv.single_table.utils import flatten_dict
 from tests.utils import get_multi_table_data, get_multi_table_metadata
 
 
@@ -34,6 +42,37 @@ class TestHMASynthesizer:
         }
         instance.metadata.validate.assert_called_once_with()
 
+    def test___init__precision(self):
+        """Test that the ``precision`` is passed to the synthesizer of every table."""
+        # Run
+        metadata = get_multi_table_metadata()
+        instance = HMASynthesizer(metadata, precision='float32')
+
+        # Assert
+        assert instance.precision == 'float32'
+        assert instance._table_parameters == {
+            'nesreca': {'precision': 'float32', 'default_distribution': 'norm'},
+            'oseba': {'precision': 'float32', 'default_distribution': 'norm'},
+            'upravna_enota': {'precision': 'float32', 'default_distribution': 'beta'},
+        }
+        for synthesizer in instance._table_synthesizers.values():
+            assert synthesizer.precision == 'float32'
+
+    def test_set_table_parameters_precision(self):
+        """Test that the ``precision`` of the synthesizer is used unless it is given."""
+        # Setup
+        metadata = get_multi_table_metadata()
+        instance = HMASynthesizer(metadata, precision='float32')
+
+        # Run
+        instance.set_table_parameters('nesreca', {'default_distribution': 'uniform'})
+        instance.set_table_parameters('oseba', {'precision': 'float64'})
+
+        # Assert
+        assert instance._table_synthesizers['nesreca'].precision == 'float32'
+        assert instance._table_synthesizers['nesreca'].default_distribution == 'uniform'
+        assert instance._table_synthesizers['oseba'].precision == 'float64'
+
     def test_set_table_parameters_errors_gaussian_kde(self):
         """Test that ``set_table_parameters`` errors with 'gaussian_kde'."""
         # Setup
@@ -79,6 +118,67 @@ class TestHMASynthesizer:
 
         pd.testing.assert_frame_equal(result, expected)
 
+    def test__get_extension_null_foreign_key(self):
+        """Test that the child rows with a null foreign key are fitted to a separate synthesizer.
+
+        The child rows of each parent are fitted in the order in which the parents first
+        appear in the child table.
+        """
+        # Setup
+        metadata = get_multi_table_metadata()
+        child_table = pd.DataFrame({
+            'id_nesreca': [0, 1, 2, 3, 4, 5],
+            'upravna_enota': [2.0, 0.0, np.nan, 2.0, np.nan, 0.0],
+        })
+        instance = HMASynthesizer(metadata)
+
+        # Run
+        result = instance._get_extension('nesreca', child_table, 'upravna_enota', '')
+
+        # Assert
+        expected = pd.DataFrame(
+            {
+                '__nesreca__upravna_enota__univariates__id_nesreca__loc': [1.5, 3.0],
+                '__nesreca__upravna_enota__univariates__id_nesreca__scale': [1.5, 2.0],
+                '__nesreca__upravna_enota__num_rows': [2.0, 2.0],
+            },
+            index=[2.0, 0.0],
+        )
+        pd.testing.assert_frame_equal(result, expected)
+        null_synthesizer = instance._null_child_synthesizers['__nesreca__upravna_enota']
+        assert null_synthesizer._get_parameters()['univariates__id_nesreca__loc'] == 3.0
+
+    @patch('sdv.multi_table.hma._fit_groups_in_parallel')
+    @patch('sdv.multi_table.hma._fit_extension_groupwise', return_value=None)
+    def test__get_extension_n_jobs(self, mock_fit_extension_groupwise, mock_fit_groups_in_parallel):
+        """Test that the extension rows are fitted in parallel when ``n_jobs`` is greater than 1.
+
+        The synthesizers are fitted in parallel only if they can not be fitted groupwise.
+        """
+        # Setup
+        metadata = get_multi_table_metadata()
+        child_table = pd.DataFrame({'id_nesreca': [0, 1, 2], 'upravna_enota': [1, 0, 1]})
+        instance = HMASynthesizer(metadata)
+        instance._n_jobs = 4
+        row = pd.Series({'__nesreca__upravna_enota__num_rows': 2.0})
+        mock_fit_groups_in_parallel.return_value = [(1, row, None), (0, None, None)]
+
+        # Run
+        result = instance._get_extension('nesreca', child_table, 'upravna_enota', '')
+
+        # Assert
+        assert mock_fit_extension_groupwise.call_args[0][-1] == 2
+        function, child_data, groups, arguments, n_jobs, _ = mock_fit_groups_in_parallel.call_args[
+            0
+        ]
+        assert function == _fit_extension_rows
+        pd.testing.assert_frame_equal(child_data, pd.DataFrame({'id_nesreca': [0, 2, 1]}))
+        assert groups == [(1, 0, 2), (0, 2, 3)]
+        assert arguments[0] == GaussianCopulaSynthesizer
+        assert arguments[-1] == '__nesreca__upravna_enota__'
+        assert n_jobs == 2
+        pd.testing.assert_frame_equal(result, pd.DataFrame([row], index=[1]))
+
     def test__get_distributions(self):
         """Test the ``_get_distributions`` method."""
         # Setup
@@ -165,6 +265,8 @@ class TestHMASynthesizer:
         instance._get_pbar_args.return_value = {'desc': "(1/2) Tables 'A' and 'B' ('user_id')"}
         instance.metadata._get_all_foreign_keys.return_value = ['id_upravna_enota']
         instance._table_synthesizers = {'nesreca': Mock()}
+        instance._table_parameters = {'nesreca': {}}
+        instance._n_jobs = 1
         child_table = pd.DataFrame({'id_upravna_enota': [0, 1, 2, 3]})
 
         # Run
@@ -225,6 +327,22 @@ class TestHMASynthesizer:
             desc="(1/3) Tables 'nesreca' and 'oseba' ('id_nesreca')"
         )
 
+    def test__augment_table_precision(self):
+        """Test that the extension columns are stored in the ``precision`` of the synthesizer."""
+        # Setup
+        metadata = get_multi_table_metadata()
+        instance = HMASynthesizer(metadata, precision='float32')
+        data = get_multi_table_data()
+        instance._get_pbar_args = Mock(return_value={})
+
+        # Run
+        result = instance._augment_table(data['nesreca'], data, 'nesreca')
+
+        # Assert
+        extension_columns = [column for column in result.columns if column.startswith('__')]
+        assert extension_columns
+        assert (result[extension_columns].dtypes == np.float32).all()
+
     def test__pop_foreign_keys(self):
         """Test that this method removes the foreign keys from the ``table_data``."""
         # Setup
@@ -258,6 +376,18 @@ class TestHMASynthesizer:
         })
         pd.testing.assert_frame_equal(expected_data, data)
 
+    def test__clear_nans_float32(self):
+        """Test that the ``float32`` columns are filled with their mean."""
+        # Setup
+        data = pd.DataFrame({'numerical': np.array([0, 1, np.nan], dtype=np.float32)})
+
+        # Run
+        HMASynthesizer._clear_nans(data)
+
+        # Assert
+        expected_data = pd.DataFrame({'numerical': np.array([0, 1, 0.5], dtype=np.float32)})
+        pd.testing.assert_frame_equal(expected_data, data)
+
     def test__model_tables(self):
         """Test that ``_model_tables`` performs the modeling.
 
@@ -556,6 +686,84 @@ class TestHMASynthesizer:
             synthesizer, table_name, ['mock_extended_column']
         )
 
+    @pytest.mark.parametrize('precision', ['float64', 'float32'])
+    def test__sample_raw_child_rows(self, precision):
+        """Test that the rows are the ones sampled from each recreated child synthesizer."""
+        # Setup
+        metadata = Metadata.load_from_dict({
+            'tables': {
+                'parent': {
+                    'primary_key': 'id',
+                    'columns': {'id': {'sdtype': 'id'}, 'value': {'sdtype': 'numerical'}},
+                },
+                'child': {
+                    'columns': {
+                        'parent_id': {'sdtype': 'id'},
+                        'a': {'sdtype': 'numerical'},
+                        'b': {'sdtype': 'numerical'},
+                        'c': {'sdtype': 'numerical'},
+                    },
+                },
+            },
+            'relationships': [
+                {
+                    'parent_table_name': 'parent',
+                    'parent_primary_key': 'id',
+                    'child_table_name': 'child',
+                    'child_foreign_key': 'parent_id',
+                }
+            ],
+        })
+        rng = np.random.default_rng(0)
+        parent_ids = np.repeat(np.arange(10), [1, 2, 3, 4, 5, 1, 2, 3, 4, 5])
+        data = {
+            'parent': pd.DataFrame({'id': range(10), 'value': rng.normal(size=10)}),
+            'child': pd.DataFrame({
+                'parent_id': parent_ids,
+                'a': rng.normal(size=len(parent_ids)),
+                'b': rng.uniform(size=len(parent_ids)),
+                'c': np.ones(len(parent_ids)),
+            }),
+        }
+        instance = HMASynthesizer(metadata)
+        instance.set_table_parameters(
+            'child', {'default_distribution': 'truncnorm', 'precision': precision}
+        )
+        instance.fit(data)
+        parent_rows = instance._table_synthesizers['parent']._sample_batch(
+            6, keep_extra_columns=True
+        )
+        num_rows = np.array([3, 0, 1, 4, 2, 2])
+
+        # Run
+        result = instance._sample_raw_child_rows('child', 'parent', parent_rows, num_rows)
+
+        # Assert
+        expected = []
+        for (_, parent_row), rows in zip(parent_rows.iterrows(), num_rows):
+            synthesizer = instance._recreate_child_synthesizer('child', 'parent', parent_row)
+            synthesizer._set_random_state(FIXED_RNG_SEED)
+            expected.append(synthesizer._sample(rows))
+
+        expected = pd.concat(expected, ignore_index=True)
+        assert list(result.dtypes) == [np.dtype(precision)] * 3
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False, rtol=1e-5)
+
+    def test__sample_raw_child_rows_not_gaussian_copula(self):
+        """Test that ``None`` is returned when the child synthesizers are not Gaussian copulas."""
+        # Setup
+        instance = Mock()
+        instance._synthesizer = Mock()
+        parent_rows = pd.DataFrame({'id': [1, 2]})
+
+        # Run
+        result = HMASynthesizer._sample_raw_child_rows(
+            instance, 'child', 'parent', parent_rows, np.array([1, 2])
+        )
+
+        # Assert
+        assert result is None
+
     def test__get_likelihoods(self):
         """Test that ``_get_likelihoods`` computes the likelihoods.
 
@@ -806,7 +1014,7 @@ class TestHMASynthesizer:
         result = instance.get_parameters()
 
         # Assert
-        assert result == {'locales': 'en_CA', 'verbose': True}
+        assert result == {'locales': 'en_CA', 'verbose': True, 'precision': 'float64'}
 
     def test__add_foreign_key_columns(self):
         """Test that the ``_add_foreign_key_columns`` method adds foreign keys."""
@@ -1309,3 +1517,251 @@ class TestHMASynthesizer:
                 num_table_cols -= 1
 
             assert num_table_cols == estimated_num_columns[table_name]
+
+
+def test__fit_extension_rows():
+    """Test that each parent gets the flattened parameters of a synthesizer fitted to its rows.
+
+    The scale parameters are removed for the parents with a single child row, the synthesizer
+    is only returned for the null foreign key, and the parents that fail to fit are skipped.
+    """
+    # Setup
+    metadata = get_multi_table_metadata()
+    table_metadata = metadata.get_table_metadata('nesreca')
+    child_data = pd.DataFrame({'id_nesreca': [1.0, 3.0, 5.0, 7.0, 9.0]})
+    groups = [('a', 0, 2), ('b', 2, 3), (None, 3, 5)]
+    failing_class = Mock(side_effect=ValueError('Failed'))
+
+    # Run
+    result = list(
+        _fit_extension_rows(
+            GaussianCopulaSynthesizer,
+            table_metadata,
+            {'default_distribution': 'norm'},
+            {},
+            '__prefix__',
+            child_data,
+            groups,
+        )
+    )
+    failed = list(
+        _fit_extension_rows(failing_class, table_metadata, {}, {}, '', child_data, groups[:1])
+    )
+
+    # Assert
+    (first_value, first_row, first_synthesizer), second, third = result
+    assert first_value == 'a'
+    assert first_row.to_dict() == {
+        '__prefix__univariates__id_nesreca__loc': 2.0,
+        '__prefix__univariates__id_nesreca__scale': 1.0,
+        '__prefix__num_rows': 2.0,
+    }
+    assert first_synthesizer is None
+    assert second[1].isna().to_dict() == {
+        '__prefix__univariates__id_nesreca__loc': False,
+        '__prefix__univariates__id_nesreca__scale': True,
+        '__prefix__num_rows': False,
+    }
+    assert third[0] is None
+    assert isinstance(third[2], GaussianCopulaSynthesizer)
+    assert third[2]._num_rows == 2
+    assert failed == [('a', None, None)]
+
+
+@patch('sdv.multi_table.hma.ProcessPoolExecutor')
+def test__fit_groups_in_parallel(mock_process_pool_executor):
+    """Test that the parents are fitted in chunks and put back together in order."""
+    # Setup
+    child_data = pd.DataFrame({'a': [1.0, 2.0, 3.0]})
+    groups = [(0, 0, 1), (1, 1, 2), (2, 2, 3)]
+    executor = mock_process_pool_executor.return_value.__enter__.return_value
+    executor.map.return_value = iter([['first'], ['second'], ['third']])
+
+    # Run
+    result = _fit_groups_in_parallel(
+        _fit_extension_rows, child_data, groups, ('arguments',), 1, {'disable': True}
+    )
+
+    # Assert
+    mock_process_pool_executor.assert_called_once_with(max_workers=1)
+    method, function, shared_child_data, chunks, arguments = executor.map.call_args[0]
+    assert method == _fit_groups_in_worker
+    assert next(function) == _fit_extension_rows
+    assert list(chunks) == [[(0, 0, 1)], [(1, 1, 2)], [(2, 2, 3)]]
+    assert next(arguments) == ('arguments',)
+    assert next(shared_child_data)['num_rows'] == 3
+    assert result == ['first', 'second', 'third']
+
+
+def test__fit_groups_in_worker():
+    """Test that the worker fits the extension rows reading the child rows from shared memory."""
+    # Setup
+    metadata = get_multi_table_metadata()
+    table_metadata = metadata.get_table_metadata('nesreca')
+    child_data = pd.DataFrame({'id_nesreca': [1.0, 3.0, 5.0, 7.0]})
+    groups = [(0, 0, 3), (1, 3, 4)]
+    arguments = (GaussianCopulaSynthesizer, table_metadata, {}, {}, '__prefix__')
+
+    # Run
+    with _share_dataframe(child_data) as shared_child_data:
+        result = _fit_groups_in_worker(_fit_extension_rows, shared_child_data, groups, arguments)
+
+    # Assert
+    expected = list(_fit_extension_rows(*arguments, child_data, groups))
+    assert [value for value, _, _ in result] == [0, 1]
+    for (_, row, _), (_, expected_row, _) in zip(result, expected):
+        pd.testing.assert_series_equal(row, expected_row)
+
+
+def test__fit_univariates_per_group():
+    """Test that the univariates are fitted to the child rows of each parent.
+
+    The parents whose univariates fail to fit have no probabilities nor parameters.
+    """
+    # Setup
+    synthesizer = GaussianCopulaSynthesizer(Metadata(), default_distribution='truncnorm')
+    child_data = pd.DataFrame({'a': [1.0, 2.0, 4.0, 3.0, 5.0, 9.0, 7.0]})
+    distributions = synthesizer._get_numerical_distributions(child_data)
+    model = synthesizer._initialize_model(distributions)
+    expected_univariate = model._fit_column(child_data['a'].iloc[:3], distributions['a'], 'a')
+    model._fit_column = Mock(side_effect=[expected_univariate, ValueError()])
+    groups = [(0, 0, 3), (2, 3, 6)]
+
+    # Run
+    result = list(_fit_univariates_per_group(model, distributions, ['a'], child_data, groups))
+
+    # Assert
+    (first_index, probabilities, parameters), second = result
+    assert first_index == 0
+    np.testing.assert_array_equal(
+        probabilities[:, 0], expected_univariate.cdf(np.array([1.0, 2.0, 4.0]))
+    )
+    assert parameters == [flatten_dict(expected_univariate.to_dict())]
+    assert second == (2, None, None)
+
+
+@pytest.mark.parametrize(
+    'table_parameters',
+    [
+        {'default_distribution': 'norm'},
+        {'default_distribution': 'uniform', 'precision': 'float32'},
+        {'default_distribution': 'beta', 'numerical_distributions': {'nesreca_val': 'norm'}},
+    ],
+)
+def test__fit_extension_groupwise(table_parameters):
+    """Test that the extension rows are the ones of a synthesizer fitted to each parent.
+
+    The constant columns have no correlation, the scale parameters are removed for the parents
+    with a single child row, and the null foreign key and the parents with missing values are
+    skipped.
+    """
+    # Setup
+    metadata = get_multi_table_metadata()
+    table_metadata = metadata.get_table_metadata('nesreca')
+    extended_column = '__oseba__id_nesreca__num_rows'
+    child_data = pd.DataFrame({
+        'id_nesreca': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14],
+        'nesreca_val': [1.0, 5.0, 2.0, 7.0, 3.0, 3.0, 3.0, 4.0, 2.0, np.nan, 6.0, 9.0, 1.0, 2, 8],
+        extended_column: [2.0, 1.0, 4.0, 3.0, 1.0, 5.0, 2.0, 1.0, 1.0, 2.0, 4.0, 2.0, 3.0, 1, 6],
+    })
+    groups = [('a', 0, 4), ('b', 4, 7), ('c', 7, 8), ('d', 8, 10), (None, 10, 12), ('e', 12, 15)]
+    arguments = (
+        GaussianCopulaSynthesizer,
+        table_metadata,
+        table_parameters,
+        {extended_column: 'truncnorm'},
+        '__prefix__',
+    )
+
+    # Run
+    result = _fit_extension_groupwise(*arguments, child_data, groups)
+
+    # Assert
+    rows = [
+        row for _, row, _ in _fit_extension_rows(*arguments, child_data, groups[:4] + [groups[5]])
+    ]
+    expected = pd.DataFrame([row for row in rows if row is not None], index=['a', 'b', 'c', 'e'])
+    pd.testing.assert_frame_equal(result, expected)
+    assert (result['__prefix__correlation__0__0'] == 0.0).tolist() == [False, True, True, False]
+
+
+@patch('sdv.multi_table.hma._fit_groups_in_parallel')
+def test__fit_extension_groupwise_n_jobs(mock_fit_groups_in_parallel):
+    """Test that the univariates learned by maximum likelihood are fitted in parallel.
+
+    The ``truncnorm`` extended columns are fitted for each parent in the pool of processes,
+    and the extension is the same as when fitting them in a single process.
+    """
+    # Setup
+    table_metadata = get_multi_table_metadata().get_table_metadata('nesreca')
+    extended_column = '__oseba__id_nesreca__num_rows'
+    child_data = pd.DataFrame({
+        'nesreca_val': [1.0, 5.0, 2.0, 7.0, 3.0, 3.0, 4.0, 2.0, 6.0],
+        extended_column: [2.0, 1.0, 4.0, 3.0, 1.0, 5.0, 2.0, 1.0, 4.0],
+    })
+    groups = [('a', 0, 4), ('b', 4, 7), (None, 7, 9)]
+    arguments = (
+        GaussianCopulaSynthesizer,
+        table_metadata,
+        {'default_distribution': 'norm'},
+        {extended_column: 'truncnorm'},
+        '__prefix__',
+    )
+    mock_fit_groups_in_parallel.side_effect = (
+        lambda function, child_data, groups, arguments, n_jobs, pbar_args: list(
+            function(*arguments, child_data, groups)
+        )
+    )
+
+    # Run
+    result = _fit_extension_groupwise(*arguments, child_data, groups, None, 2)
+
+    # Assert
+    function, _, fitted_groups, fit_arguments, n_jobs, _ = mock_fit_groups_in_parallel.call_args[0]
+    assert function == _fit_univariates_per_group
+    assert fitted_groups == [(0, 0, 4), (1, 4, 7)]
+    assert fit_arguments[2] == [extended_column]
+    assert n_jobs == 2
+    expected = _fit_extension_groupwise(*arguments, child_data, groups)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test__fit_extension_groupwise_foreign_key_only():
+    """Test that only the number of child rows is computed when there are no other columns."""
+    # Setup
+    table_metadata = get_multi_table_metadata().get_table_metadata('nesreca')
+    child_data = pd.DataFrame(index=range(4))
+    groups = [(1, 0, 3), (np.nan, 3, 4)]
+
+    # Run
+    result = _fit_extension_groupwise(
+        GaussianCopulaSynthesizer, table_metadata, {}, {}, '__prefix__', child_data, groups
+    )
+
+    # Assert
+    expected = pd.DataFrame({'__prefix__num_rows': [3]}, index=[1])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'synthesizer_class, table_parameters, values',
+    [
+        (Mock(), {}, [1.0, 2.0]),
+        (GaussianCopulaSynthesizer, {'correlation_rank': 1}, [1.0, 2.0]),
+        (GaussianCopulaSynthesizer, {'default_distribution': 'gaussian_kde'}, [1.0, 2.0]),
+        (GaussianCopulaSynthesizer, {}, [True, False]),
+    ],
+)
+def test__fit_extension_groupwise_unsupported(synthesizer_class, table_parameters, values):
+    """Test that ``None`` is returned when the synthesizer can not be fitted groupwise."""
+    # Setup
+    table_metadata = get_multi_table_metadata().get_table_metadata('nesreca')
+    child_data = pd.DataFrame({'nesreca_val': values})
+
+    # Run
+    result = _fit_extension_groupwise(
+        synthesizer_class, table_metadata, table_parameters, {}, '', child_data, [(0, 0, 2)]
+    )
+
+    # Assert
+    assert result is None
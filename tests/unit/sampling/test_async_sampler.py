@@ -0,0 +1,277 @@
+"""Tests for the sdv.sampling.async_sampler module."""
+
+import asyncio
+import re
+from concurrent.futures import Executor, ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import cloudpickle
+import pytest
+
+from sdv.sampling import async_sampler
+from sdv.sampling.async_sampler import (
+    AsyncSampler,
+    _load_worker_synthesizer,
+    _run_in_worker,
+    discard_default_async_sampler,
+    get_default_async_sampler,
+)
+
+
+class SynchronousExecutor(Executor):
+    """Executor whose calls are run by the test, in the current process."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((future, fn, args))
+        return future
+
+
+class DummySynthesizer:
+    def __init__(self):
+        self.seeds = []
+
+    def _set_sampling_seed(self, seed):
+        self.seeds.append(seed)
+
+    def _sample_with_progress_bar(self, num_rows):
+        return (self.seeds[-1], num_rows)
+
+
+@patch.object(async_sampler, '_WORKER_TOKEN', None)
+@patch.object(async_sampler, '_WORKER_SYNTHESIZER', None)
+def test__load_worker_synthesizer():
+    """Test that the synthesizer is only loaded when the token changes."""
+    # Setup
+    serialized = cloudpickle.dumps(DummySynthesizer())
+
+    # Run
+    first = _load_worker_synthesizer('token', serialized)
+    second = _load_worker_synthesizer('token', None)
+    third = _load_worker_synthesizer('other_token', serialized)
+
+    # Assert
+    assert isinstance(first, DummySynthesizer)
+    assert second is first
+    assert third is not first
+
+
+@patch.object(async_sampler, '_WORKER_TOKEN', None)
+@patch.object(async_sampler, '_WORKER_SYNTHESIZER', None)
+def test__load_worker_synthesizer_not_loaded():
+    """Test that an error is raised if the synthesizer was never sent to the worker."""
+    # Run and Assert
+    with pytest.raises(RuntimeError, match='The synthesizer was not loaded by this worker.'):
+        _load_worker_synthesizer('token', None)
+
+
+@patch('sdv.sampling.async_sampler._load_worker_synthesizer')
+def test__run_in_worker(mock_load_worker_synthesizer):
+    """Test that the worker's synthesizer is seeded before calling the method."""
+    # Setup
+    synthesizer = mock_load_worker_synthesizer.return_value
+
+    # Run
+    result = _run_in_worker('token', b'serialized', 10, 'sample', (5,))
+
+    # Assert
+    mock_load_worker_synthesizer.assert_called_once_with('token', b'serialized')
+    synthesizer._set_sampling_seed.assert_called_once_with(10)
+    synthesizer.sample.assert_called_once_with(5)
+    assert result == synthesizer.sample.return_value
+
+
+class TestAsyncSampler:
+    def test___init__(self):
+        """Test that the synthesizer is serialized and the executor is not created yet."""
+        # Setup
+        synthesizer = DummySynthesizer()
+
+        # Run
+        sampler = AsyncSampler(synthesizer, max_concurrency=2)
+
+        # Assert
+        assert sampler.synthesizer is synthesizer
+        assert sampler.executor is None
+        assert sampler.max_concurrency == 2
+        assert isinstance(cloudpickle.loads(sampler._serialized_synthesizer), DummySynthesizer)
+
+    def test___init__invalid_max_concurrency(self):
+        """Test that an error is raised if ``max_concurrency`` is not positive."""
+        # Run and Assert
+        with pytest.raises(ValueError, match="'max_concurrency' must be a positive integer."):
+            AsyncSampler(DummySynthesizer(), max_concurrency=0)
+
+    def test___init__thread_executor(self):
+        """Test that an error is raised if the executor runs the calls in threads."""
+        # Setup
+        expected_message = re.escape(
+            "The 'executor' must run the calls in separate processes. Please use a "
+            "'concurrent.futures.ProcessPoolExecutor' instead."
+        )
+
+        # Run and Assert
+        with ThreadPoolExecutor(1) as executor:
+            with pytest.raises(ValueError, match=expected_message):
+                AsyncSampler(DummySynthesizer(), executor=executor)
+
+    @patch('sdv.sampling.async_sampler.ProcessPoolExecutor')
+    def test__get_executor(self, mock_process_pool_executor):
+        """Test that a pool of processes that load the synthesizer is created once."""
+        # Setup
+        sampler = AsyncSampler(DummySynthesizer(), max_concurrency=3)
+
+        # Run
+        first = sampler._get_executor()
+        second = sampler._get_executor()
+
+        # Assert
+        assert first is second
+        mock_process_pool_executor.assert_called_once_with(
+            max_workers=3,
+            initializer=_load_worker_synthesizer,
+            initargs=(sampler._token, sampler._serialized_synthesizer),
+        )
+
+    @patch.object(async_sampler, '_WORKER_TOKEN', None)
+    @patch.object(async_sampler, '_WORKER_SYNTHESIZER', None)
+    def test__run_postprocesses_in_call_order(self):
+        """Test that the results are postprocessed in the order in which calls were made."""
+        # Setup
+        synthesizer = Mock()
+        synthesizer._spawn_sampling_seeds.side_effect = [[1], [2], [3]]
+        executor = SynchronousExecutor()
+        sampler = AsyncSampler(DummySynthesizer(), executor=executor, max_concurrency=3)
+        sampler.synthesizer = synthesizer
+        postprocessed = []
+
+        def postprocess(result):
+            postprocessed.append(result[0])
+            return result
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(
+                    sampler._run('_sample_with_progress_bar', num_rows, postprocess=postprocess)
+                )
+                for num_rows in (10, 20, 30)
+            ]
+            while len(executor.pending) < 3:
+                await asyncio.sleep(0)
+
+            for future, fn, args in reversed(executor.pending):
+                future.set_result(fn(*args))
+                await asyncio.sleep(0)
+
+            return await asyncio.gather(*tasks)
+
+        # Run
+        results = asyncio.run(run())
+
+        # Assert
+        assert results == [(1, 10), (2, 20), (3, 30)]
+        assert postprocessed == [1, 2, 3]
+
+    @patch.object(async_sampler, '_WORKER_TOKEN', None)
+    @patch.object(async_sampler, '_WORKER_SYNTHESIZER', None)
+    def test__run_limits_concurrency(self):
+        """Test that only ``max_concurrency`` calls are submitted at the same time."""
+        # Setup
+        synthesizer = Mock()
+        synthesizer._spawn_sampling_seeds.side_effect = [[1], [2]]
+        executor = SynchronousExecutor()
+        sampler = AsyncSampler(DummySynthesizer(), executor=executor, max_concurrency=1)
+        sampler.synthesizer = synthesizer
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(sampler._run('_sample_with_progress_bar', num_rows))
+                for num_rows in (10, 20)
+            ]
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+            num_submitted = len(executor.pending)
+            future, fn, args = executor.pending.pop()
+            future.set_result(fn(*args))
+            while not executor.pending:
+                await asyncio.sleep(0)
+
+            future, fn, args = executor.pending.pop()
+            future.set_result(fn(*args))
+            return num_submitted, await asyncio.gather(*tasks)
+
+        # Run
+        num_submitted, results = asyncio.run(run())
+
+        # Assert
+        assert num_submitted == 1
+        assert results == [(1, 10), (2, 20)]
+
+    @patch.object(async_sampler, '_WORKER_TOKEN', None)
+    @patch.object(async_sampler, '_WORKER_SYNTHESIZER', None)
+    def test__run_error(self):
+        """Test that the errors are raised and do not block the following calls."""
+        # Setup
+        synthesizer = Mock()
+        synthesizer._spawn_sampling_seeds.side_effect = [[1], [2]]
+        executor = SynchronousExecutor()
+        sampler = AsyncSampler(DummySynthesizer(), executor=executor, max_concurrency=2)
+        sampler.synthesizer = synthesizer
+
+        async def run():
+            first = asyncio.ensure_future(sampler._run('_sample_with_progress_bar', 10))
+            second = asyncio.ensure_future(sampler._run('_sample_with_progress_bar', 20))
+            while len(executor.pending) < 2:
+                await asyncio.sleep(0)
+
+            executor.pending[0][0].set_exception(ValueError('error'))
+            future, fn, args = executor.pending[1]
+            future.set_result(fn(*args))
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        # Run
+        first, second = asyncio.run(run())
+
+        # Assert
+        assert isinstance(first, ValueError)
+        assert second == (2, 20)
+
+    def test_close(self):
+        """Test that only the executor created by the sampler is shut down."""
+        # Setup
+        owned = AsyncSampler(DummySynthesizer())
+        owned_executor = Mock()
+        owned.executor = owned_executor
+        executor = Mock()
+        not_owned = AsyncSampler(DummySynthesizer(), executor=executor)
+
+        # Run
+        owned.close()
+        not_owned.close()
+
+        # Assert
+        owned_executor.shutdown.assert_called_once_with(wait=True)
+        assert owned.executor is None
+        executor.shutdown.assert_not_called()
+
+
+def test_get_default_async_sampler():
+    """Test that the same sampler is returned until it is discarded."""
+    # Setup
+    synthesizer = DummySynthesizer()
+
+    # Run
+    first = get_default_async_sampler(synthesizer)
+    second = get_default_async_sampler(synthesizer)
+    discard_default_async_sampler(synthesizer)
+    third = get_default_async_sampler(synthesizer)
+    discard_default_async_sampler(synthesizer)
+
+    # Assert
+    assert first is second
+    assert third is not first
+    assert first.synthesizer is synthesizer
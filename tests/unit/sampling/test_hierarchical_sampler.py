@@ -1,11 +1,11 @@
 from collections import defaultdict
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from sdv.sampling.hierarchical_sampler import BaseHierarchicalSampler
+from sdv.sampling.hierarchical_sampler import BaseHierarchicalSampler, _get_num_rows_adjustments
 from tests.utils import DataFrameMatcher, SeriesMatcher, get_multi_table_metadata
 
 
@@ -96,11 +96,11 @@ class TestBaseHierarchicalSampler:
             'name': ['John', 'Doe', 'Johanna'],
             '__sessions__user_id__num_rows': [10, 10, 10],
         })
-        sampled_data = {}
+        child_rows = []
 
         # Run
         BaseHierarchicalSampler._add_child_rows(
-            instance, 'sessions', 'users', parent_row, sampled_data
+            instance, 'sessions', 'users', parent_row, child_rows
         )
 
         # Assert
@@ -110,12 +110,13 @@ class TestBaseHierarchicalSampler:
             'country': ['us', 'us', 'es'],
             'user_id': [1, 2, 3],
         })
-        pd.testing.assert_frame_equal(sampled_data['sessions'], expected_result)
+        assert len(child_rows) == 1
+        pd.testing.assert_frame_equal(child_rows[0], expected_result)
 
     def test__add_child_rows_with_sampled_data(self):
         """Test adding child rows when sampled data contains values.
 
-        The new sampled data has to be concatenated to the current sampled data.
+        The new sampled data has to be appended to the blocks sampled so far.
         """
         # Setup
         instance = Mock()
@@ -141,28 +142,151 @@ class TestBaseHierarchicalSampler:
             'name': ['John', 'Doe', 'Johanna'],
             '__sessions__user_id__num_rows': [10, 10, 10],
         })
-        sampled_data = {
-            'sessions': pd.DataFrame({
-                'user_id': [0, 1, 0],
-                'session_id': ['d', 'e', 'f'],
-                'os': ['linux', 'mac', 'win'],
-                'country': ['us', 'us', 'es'],
-            })
-        }
+        previous_rows = pd.DataFrame({
+            'user_id': [0, 1, 0],
+            'session_id': ['d', 'e', 'f'],
+            'os': ['linux', 'mac', 'win'],
+            'country': ['us', 'us', 'es'],
+        })
+        child_rows = [previous_rows]
 
         # Run
         BaseHierarchicalSampler._add_child_rows(
-            instance, 'sessions', 'users', parent_row, sampled_data
+            instance, 'sessions', 'users', parent_row, child_rows
         )
 
         # Assert
         expected_result = pd.DataFrame({
-            'user_id': [0, 1, 0, 1, 2, 3],
-            'session_id': ['d', 'e', 'f', 'a', 'b', 'c'],
-            'os': ['linux', 'mac', 'win', 'linux', 'mac', 'win'],
-            'country': ['us', 'us', 'es', 'us', 'us', 'es'],
+            'session_id': ['a', 'b', 'c'],
+            'os': ['linux', 'mac', 'win'],
+            'country': ['us', 'us', 'es'],
+            'user_id': [1, 2, 3],
+        })
+        assert len(child_rows) == 2
+        assert child_rows[0] is previous_rows
+        pd.testing.assert_frame_equal(child_rows[1], expected_result)
+
+    def test__sample_raw_child_rows(self):
+        """Test that by default the child rows can not be sampled at once."""
+        # Setup
+        instance = Mock()
+        parent_rows = pd.DataFrame({'user_id': [1, 2]})
+
+        # Run
+        result = BaseHierarchicalSampler._sample_raw_child_rows(
+            instance, 'sessions', 'users', parent_rows, np.array([1, 2])
+        )
+
+        # Assert
+        assert result is None
+
+    def _get_batch_instance(self):
+        instance = Mock()
+        metadata = Mock()
+        metadata.tables = {'users': Mock(primary_key='user_id'), 'sessions': Mock()}
+        metadata._get_foreign_keys.return_value = ['user_id']
+        instance.metadata = metadata
+        synthesizer = Mock()
+        synthesizer._reverse_transform_sampled.side_effect = lambda data, **kwargs: data * 10
+        synthesizer._data_processor.filter_valid.side_effect = lambda data: data
+        instance._table_synthesizers = {'sessions': synthesizer}
+        return instance, synthesizer
+
+    def test__add_child_rows_in_batch(self):
+        """Test that the child rows of all the parent rows are sampled and reversed at once."""
+        # Setup
+        instance, synthesizer = self._get_batch_instance()
+        instance._sample_raw_child_rows.return_value = pd.DataFrame({'duration': [1, 2, 3]})
+        parent_rows = pd.DataFrame(
+            {'user_id': [1, 2, 3], '__sessions__user_id__num_rows': [2.2, 0.0, 0.9]},
+            index=[5, 6, 7],
+        )
+        child_rows = []
+
+        # Run
+        result = BaseHierarchicalSampler._add_child_rows_in_batch(
+            instance, 'sessions', 'users', parent_rows, child_rows
+        )
+
+        # Assert
+        assert result is True
+        args = instance._sample_raw_child_rows.call_args[0]
+        assert args[:3] == ('sessions', 'users', parent_rows)
+        np.testing.assert_array_equal(args[3], [2, 0, 1])
+        synthesizer._reverse_transform_sampled.assert_called_once_with(
+            DataFrameMatcher(pd.DataFrame({'duration': [1, 2, 3]})), keep_extra_columns=True
+        )
+        instance._recreate_child_synthesizer.assert_not_called()
+        expected = pd.DataFrame({'duration': [10, 20, 30], 'user_id': [1, 1, 3]})
+        assert len(child_rows) == 1
+        pd.testing.assert_frame_equal(child_rows[0], expected)
+
+    def test__add_child_rows_in_batch_resamples_incomplete_parents(self):
+        """Test that the parent rows with invalid child rows are sampled one at a time."""
+        # Setup
+        instance, synthesizer = self._get_batch_instance()
+        instance._sample_raw_child_rows.return_value = pd.DataFrame({'duration': [1, 2, 3]})
+        synthesizer._data_processor.filter_valid.side_effect = lambda data: data.iloc[[0, 2]]
+        instance._sample_rows.return_value = pd.DataFrame({'duration': [-1, -2]})
+        parent_rows = pd.DataFrame({
+            'user_id': [1, 2],
+            '__sessions__user_id__num_rows': [2, 1],
         })
-        pd.testing.assert_frame_equal(sampled_data['sessions'], expected_result)
+        child_rows = []
+
+        # Run
+        result = BaseHierarchicalSampler._add_child_rows_in_batch(
+            instance, 'sessions', 'users', parent_rows, child_rows
+        )
+
+        # Assert
+        assert result is True
+        instance._recreate_child_synthesizer.assert_called_once_with(
+            'sessions',
+            'users',
+            SeriesMatcher(parent_rows.iloc[0].astype(object)),
+        )
+        instance._sample_rows.assert_called_once_with(
+            instance._recreate_child_synthesizer.return_value, 2
+        )
+        expected = pd.DataFrame({'duration': [-1, -2, 30], 'user_id': [1, 1, 2]})
+        assert len(child_rows) == 1
+        pd.testing.assert_frame_equal(child_rows[0], expected)
+
+    def test__add_child_rows_in_batch_no_rows(self):
+        """Test that nothing is sampled when no parent row has child rows."""
+        # Setup
+        instance, _ = self._get_batch_instance()
+        parent_rows = pd.DataFrame({'user_id': [1, 2], '__sessions__user_id__num_rows': [0, 0]})
+        child_rows = []
+
+        # Run
+        result = BaseHierarchicalSampler._add_child_rows_in_batch(
+            instance, 'sessions', 'users', parent_rows, child_rows
+        )
+
+        # Assert
+        assert result is True
+        instance._sample_raw_child_rows.assert_not_called()
+        assert child_rows == []
+
+    def test__add_child_rows_in_batch_not_supported(self):
+        """Test that ``False`` is returned when the rows can not be sampled at once."""
+        # Setup
+        instance, synthesizer = self._get_batch_instance()
+        instance._sample_raw_child_rows.return_value = None
+        parent_rows = pd.DataFrame({'user_id': [1, 2], '__sessions__user_id__num_rows': [1, 3]})
+        child_rows = []
+
+        # Run
+        result = BaseHierarchicalSampler._add_child_rows_in_batch(
+            instance, 'sessions', 'users', parent_rows, child_rows
+        )
+
+        # Assert
+        assert result is False
+        synthesizer._reverse_transform_sampled.assert_not_called()
+        assert child_rows == []
 
     def test__sample_children(self):
         """Test sampling the children of a table.
@@ -177,27 +301,27 @@ class TestBaseHierarchicalSampler:
                 'session_id': ['a', 'a', 'b'],
             })
 
-        def _add_child_rows(child_name, parent_name, parent_row, sampled_data, num_rows=None):
+        def _add_child_rows(child_name, parent_name, parent_row, child_rows, num_rows=None):
             if parent_name == 'users':
                 if parent_row['user_id'] == 1:
-                    sampled_data[child_name] = pd.DataFrame({
-                        'user_id': [1, 1],
-                        'session_id': ['a', 'b'],
-                        'os': ['windows', 'linux'],
-                        'country': ['us', 'us'],
-                    })
+                    child_rows.append(
+                        pd.DataFrame({
+                            'user_id': [1, 1],
+                            'session_id': ['a', 'b'],
+                            'os': ['windows', 'linux'],
+                            'country': ['us', 'us'],
+                        })
+                    )
 
                 if parent_row['user_id'] == 3:
-                    row = pd.DataFrame({
-                        'user_id': [3],
-                        'session_id': ['c'],
-                        'os': ['mac'],
-                        'country': ['es'],
-                    })
-                    sampled_data[child_name] = pd.concat([
-                        sampled_data[child_name],
-                        row,
-                    ]).reset_index(drop=True)
+                    child_rows.append(
+                        pd.DataFrame({
+                            'user_id': [3],
+                            'session_id': ['c'],
+                            'os': ['mac'],
+                            'country': ['es'],
+                        })
+                    )
 
         instance = Mock()
         instance.metadata._get_child_map.return_value = {'users': ['sessions', 'transactions']}
@@ -207,6 +331,7 @@ class TestBaseHierarchicalSampler:
         instance._table_synthesizers = {'users': Mock()}
         instance._sample_children = sample_children
         instance._add_child_rows.side_effect = _add_child_rows
+        instance._add_child_rows_in_batch.return_value = False
         instance._null_child_synthesizers = {}
         instance._null_foreign_key_percentages = {'__sessions__user_id': 0}
 
@@ -222,13 +347,13 @@ class TestBaseHierarchicalSampler:
                 child_name='sessions',
                 parent_name='users',
                 parent_row=SeriesMatcher(pd.Series({'user_id': 1}, name=0, dtype=object)),
-                sampled_data=result,
+                child_rows=ANY,
             ),
             call(
                 child_name='sessions',
                 parent_name='users',
                 parent_row=SeriesMatcher(pd.Series({'user_id': 3}, name=1, dtype=object)),
-                sampled_data=result,
+                child_rows=ANY,
             ),
         ]
         expected_result = {
@@ -244,10 +369,65 @@ class TestBaseHierarchicalSampler:
                 'session_id': ['a', 'a', 'b'],
             }),
         }
+        instance._add_child_rows_in_batch.assert_called_once_with(
+            'sessions', 'users', DataFrameMatcher(pd.DataFrame({'user_id': [1, 3]})), ANY
+        )
         instance._add_child_rows.assert_has_calls(expected_calls)
         for result_frame, expected_frame in zip(result.values(), expected_result.values()):
             pd.testing.assert_frame_equal(result_frame, expected_frame)
 
+    def test__sample_children_in_batch(self):
+        """Test sampling the children of a table when the child rows are sampled at once.
+
+        The rows with a null foreign key are sampled after the rows of the parents, and all the
+        blocks are concatenated once before sampling the children of the child.
+        """
+
+        # Setup
+        def _add_child_rows_in_batch(child_name, parent_name, parent_rows, child_rows):
+            child_rows.append(pd.DataFrame({'user_id': [1, 1, 3], 'session_id': ['a', 'b', 'c']}))
+            return True
+
+        def _add_child_rows(child_name, parent_name, parent_row, child_rows, num_rows=None):
+            child_rows.append(pd.DataFrame({'user_id': [np.nan] * num_rows, 'session_id': 'd'}))
+
+        instance = Mock()
+        instance.metadata._get_child_map.return_value = {'users': ['sessions']}
+        instance.metadata._get_parent_map.return_value = {'users': []}
+        instance.metadata._get_foreign_keys.return_value = ['user_id']
+        instance._table_sizes = {'users': 10, 'sessions': 5}
+        instance._add_child_rows_in_batch.side_effect = _add_child_rows_in_batch
+        instance._add_child_rows.side_effect = _add_child_rows
+        instance._null_foreign_key_percentages = {'__sessions__user_id': 0.4}
+
+        # Run
+        result = {'users': pd.DataFrame({'user_id': [1, 3]})}
+        BaseHierarchicalSampler._sample_children(
+            self=instance, table_name='users', sampled_data=result
+        )
+
+        # Assert
+        instance._add_child_rows_in_batch.assert_called_once_with(
+            'sessions', 'users', DataFrameMatcher(pd.DataFrame({'user_id': [1, 3]})), ANY
+        )
+        instance._add_child_rows.assert_called_once_with(
+            child_name='sessions',
+            parent_name='users',
+            parent_row=None,
+            child_rows=ANY,
+            num_rows=2,
+        )
+        instance._sample_children.assert_called_once_with(
+            table_name='sessions', sampled_data=result, scale=1.0
+        )
+        pd.testing.assert_frame_equal(
+            result['sessions'],
+            pd.DataFrame({
+                'user_id': [1, 1, 3, np.nan, np.nan],
+                'session_id': ['a', 'b', 'c', 'd', 'd'],
+            }),
+        )
+
     def test__sample_children_no_rows_sampled(self):
         """Test sampling the children of a table where no rows created and no ``num_rows`` column.
 
@@ -262,9 +442,9 @@ class TestBaseHierarchicalSampler:
                 'session_id': ['a', 'a'],
             })
 
-        def _add_child_rows(child_name, parent_name, parent_row, sampled_data, num_rows=None):
+        def _add_child_rows(child_name, parent_name, parent_row, child_rows, num_rows=None):
             if num_rows is not None:
-                sampled_data['sessions'] = pd.DataFrame({'user_id': [1], 'session_id': ['a']})
+                child_rows.append(pd.DataFrame({'user_id': [1], 'session_id': ['a']}))
 
         instance = Mock()
         instance.metadata._get_child_map.return_value = {'users': ['sessions', 'transactions']}
@@ -274,6 +454,7 @@ class TestBaseHierarchicalSampler:
         instance._table_synthesizers = {'users': Mock()}
         instance._sample_children = sample_children
         instance._add_child_rows.side_effect = _add_child_rows
+        instance._add_child_rows_in_batch.return_value = False
         instance._null_foreign_key_percentages = {'__sessions__user_id': 0}
 
         # Run
@@ -296,13 +477,13 @@ class TestBaseHierarchicalSampler:
                 child_name='sessions',
                 parent_name='users',
                 parent_row=SeriesMatcher(expected_parent_row),
-                sampled_data=result,
+                child_rows=ANY,
             ),
             call(
                 child_name='sessions',
                 parent_name='users',
                 parent_row=SeriesMatcher(expected_parent_row),
-                sampled_data=result,
+                child_rows=ANY,
                 num_rows=1,
             ),
         ]
@@ -480,6 +661,40 @@ class TestBaseHierarchicalSampler:
             "Could not cast back to column's original dtype, keeping original typing."
         )
 
+    def test__finalize_preserves_dtypes(self):
+        """Test that categorical and arrow columns that already match their dtype are kept."""
+        # Setup
+        instance = Mock()
+        metadata = Mock()
+        metadata.get_column_names = Mock(return_value=['id', 'category', 'text', 'amount'])
+        instance.get_metadata = Mock(return_value=metadata)
+        table = pd.DataFrame({
+            'id': pd.Series([0.0, 1.0, 2.0]),
+            'category': pd.Series(['a', 'b', 'a'], dtype='category'),
+            'text': pd.Series(['x', 'y', None], dtype='string[pyarrow]'),
+            'amount': pd.Series([1.5, None, 2.5], dtype='double[pyarrow]'),
+        })
+        synthesizer = Mock()
+        synthesizer._data_processor._dtypes = {
+            'id': np.dtype('int64'),
+            'category': table['category'].dtype,
+            'text': table['text'].dtype,
+            'amount': table['amount'].dtype,
+        }
+        instance._table_synthesizers = {'table': synthesizer}
+
+        # Run
+        result = BaseHierarchicalSampler._finalize(instance, {'table': table})
+
+        # Assert
+        expected = pd.DataFrame({
+            'id': pd.Series([0, 1, 2]),
+            'category': pd.Series(['a', 'b', 'a'], dtype='category'),
+            'text': pd.Series(['x', 'y', None], dtype='string[pyarrow]'),
+            'amount': pd.Series([1.5, None, 2.5], dtype='double[pyarrow]'),
+        })
+        pd.testing.assert_frame_equal(result['table'], expected)
+
     def test__sample(self):
         """Test that the whole dataset is sampled.
 
@@ -654,3 +869,48 @@ class TestBaseHierarchicalSampler:
 
         # Assert
         assert data['parent']['__child__fk__num_rows'].to_list() == [0, 0, 0]
+
+    def test___enforce_table_size_multiple_rounds(self):
+        """Test the values are increased in rounds, from the lowest to the highest.
+
+        Every round adds 1 to the values below the maximum, and the values are changed by
+        position even if the parent table does not have a default index.
+        """
+        # Setup
+        instance = MagicMock()
+        data = {
+            'parent': pd.DataFrame(
+                {'fk': ['a', 'b', 'c', 'd'], '__child__fk__num_rows': [0, 1, 5, 2]},
+                index=[3, 2, 1, 0],
+            )
+        }
+        instance.metadata._get_foreign_keys.return_value = ['fk']
+        instance._min_child_rows = {'__child__fk__num_rows': 0.0}
+        instance._max_child_rows = {'__child__fk__num_rows': 4.0}
+        instance._table_sizes = {'child': 12}
+        instance._null_foreign_key_percentages = {'__child__fk': 0}
+
+        # Run
+        BaseHierarchicalSampler._enforce_table_size(instance, 'child', 'parent', 1.0, data)
+
+        # Assert
+        assert data['parent']['__child__fk__num_rows'].to_list() == [2, 3, 4, 3]
+
+
+@pytest.mark.parametrize(
+    'capacities, total, expected',
+    [
+        ([2, 2, 2], 1, [1, 0, 0]),
+        ([4, 3, 2, 0], 5, [2, 2, 1, 0]),
+        ([0, 3, 1, 3], 6, [0, 3, 1, 2]),
+        ([1, 0, 1], 6, [3, 1, 2]),
+        ([0, 0], 0, [0, 0]),
+    ],
+)
+def test__get_num_rows_adjustments(capacities, total, expected):
+    """Test the adjustments are distributed in rounds and then spread evenly."""
+    # Run
+    result = _get_num_rows_adjustments(np.array(capacities), total)
+
+    # Assert
+    np.testing.assert_array_equal(result, expected)
@@ -364,6 +364,40 @@ class TestBaseIndependentSampler:
         )
         assert mock_logger.debug.call_args_list == [call(message_users)]
 
+    def test__finalize_preserves_dtypes(self):
+        """Test that categorical and arrow columns that already match their dtype are kept."""
+        # Setup
+        instance = Mock()
+        metadata = Mock()
+        metadata.get_column_names = Mock(return_value=['id', 'category', 'text', 'amount'])
+        instance.get_metadata = Mock(return_value=metadata)
+        table = pd.DataFrame({
+            'id': pd.Series([0.0, 1.0, 2.0]),
+            'category': pd.Series(['a', 'b', 'a'], dtype='category'),
+            'text': pd.Series(['x', 'y', None], dtype='string[pyarrow]'),
+            'amount': pd.Series([1.5, None, 2.5], dtype='double[pyarrow]'),
+        })
+        synthesizer = Mock()
+        synthesizer._data_processor._dtypes = {
+            'id': np.dtype('int64'),
+            'category': table['category'].dtype,
+            'text': table['text'].dtype,
+            'amount': table['amount'].dtype,
+        }
+        instance._table_synthesizers = {'table': synthesizer}
+
+        # Run
+        result = BaseIndependentSampler._finalize(instance, {'table': table})
+
+        # Assert
+        expected = pd.DataFrame({
+            'id': pd.Series([0, 1, 2]),
+            'category': pd.Series(['a', 'b', 'a'], dtype='category'),
+            'text': pd.Series(['x', 'y', None], dtype='string[pyarrow]'),
+            'amount': pd.Series([1.5, None, 2.5], dtype='double[pyarrow]'),
+        })
+        pd.testing.assert_frame_equal(result['table'], expected)
+
     def test__sample(self):
         """Test that the ``_sample_table`` is called for root tables."""
         # Setup
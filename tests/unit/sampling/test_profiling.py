@@ -0,0 +1,263 @@
+"""Tests for the sdv.sampling.profiling module."""
+
+import contextlib
+import tracemalloc
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from sdv.sampling.profiling import PROFILE_COLUMNS, SamplingProfiler, profile_stage
+
+
+class TestSamplingProfiler:
+    def test___init__(self):
+        """Test the default values of the profiler."""
+        # Run
+        profiler = SamplingProfiler()
+
+        # Assert
+        assert profiler.track_memory is True
+        assert profiler.records == []
+        assert profiler.current_try is None
+
+    def test_start_and_stop(self):
+        """Test that the records are cleared and ``tracemalloc`` is started and stopped."""
+        # Setup
+        profiler = SamplingProfiler()
+        profiler.records = [{'stage': 'model_sample'}]
+        profiler.current_try = 3
+
+        # Run
+        profiler.start()
+        is_tracing = tracemalloc.is_tracing()
+        profiler.stop()
+
+        # Assert
+        assert profiler.records == []
+        assert profiler.current_try is None
+        assert is_tracing
+        assert not tracemalloc.is_tracing()
+
+    def test_stop_does_not_stop_external_tracing(self):
+        """Test that ``tracemalloc`` is not stopped if it was started by someone else."""
+        # Setup
+        profiler = SamplingProfiler()
+        tracemalloc.start()
+
+        # Run
+        try:
+            profiler.start()
+            profiler.stop()
+            is_tracing = tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        # Assert
+        assert is_tracing
+
+    @patch('sdv.sampling.profiling.tracemalloc')
+    def test_start_without_memory_tracking(self, mock_tracemalloc):
+        """Test that ``tracemalloc`` is not started when ``track_memory`` is ``False``."""
+        # Setup
+        profiler = SamplingProfiler(track_memory=False)
+
+        # Run
+        profiler.start()
+        profiler.stop()
+
+        # Assert
+        mock_tracemalloc.start.assert_not_called()
+        mock_tracemalloc.stop.assert_not_called()
+
+    def test_stage(self):
+        """Test that the time, rows, try and allocated memory of the stage are recorded."""
+        # Setup
+        profiler = SamplingProfiler()
+        profiler.start()
+        profiler.current_try = 2
+
+        # Run
+        with profiler.stage('reverse_transform', rows_in=10) as record:
+            data = [0] * 100_000
+            record['rows_out'] = 8
+
+        profiler.stop()
+
+        # Assert
+        assert len(data) == 100_000
+        assert len(profiler.records) == 1
+        record = profiler.records[0]
+        assert record['stage'] == 'reverse_transform'
+        assert record['try'] == 2
+        assert record['batch'] is None
+        assert record['rows_in'] == 10
+        assert record['rows_out'] == 8
+        assert record['seconds'] >= 0
+        assert record['allocated_bytes'] > 0
+
+    def test_stage_without_memory_tracking(self):
+        """Test that the allocated memory is not recorded when ``track_memory`` is ``False``."""
+        # Setup
+        profiler = SamplingProfiler(track_memory=False)
+        profiler.start()
+
+        # Run
+        with profiler.stage('model_sample'):
+            pass
+
+        profiler.stop()
+
+        # Assert
+        assert profiler.records[0]['allocated_bytes'] is None
+        assert profiler.records[0]['rows_in'] is None
+
+    def test_stage_records_on_error(self):
+        """Test that the stage is recorded even if it raises an error."""
+        # Setup
+        profiler = SamplingProfiler(track_memory=False)
+
+        # Run
+        with pytest.raises(ValueError, match='error'):
+            with profiler.stage('filter_valid', rows_in=5):
+                raise ValueError('error')
+
+        # Assert
+        assert profiler.records[0]['stage'] == 'filter_valid'
+
+    def test_add_records(self):
+        """Test that the records of another profiler are added tagged with their batch."""
+        # Setup
+        profiler = SamplingProfiler(track_memory=False)
+        profiler.records = [{'stage': 'model_sample', 'try': 1, 'batch': None}]
+        worker_records = [
+            {'stage': 'model_sample', 'try': 1, 'batch': None},
+            {'stage': 'filter_valid', 'try': 1, 'batch': None},
+        ]
+
+        # Run
+        profiler.add_records(worker_records, batch=2)
+
+        # Assert
+        assert profiler.records == [
+            {'stage': 'model_sample', 'try': 1, 'batch': None},
+            {'stage': 'model_sample', 'try': 1, 'batch': 2},
+            {'stage': 'filter_valid', 'try': 1, 'batch': 2},
+        ]
+        assert worker_records[0]['batch'] is None
+
+    def test_get_profile(self):
+        """Test that the records are returned as a DataFrame."""
+        # Setup
+        profiler = SamplingProfiler()
+        profiler.records = [
+            {
+                'stage': 'model_sample',
+                'try': 1,
+                'batch': 3,
+                'rows_in': 10,
+                'rows_out': 10,
+                'seconds': 0.5,
+                'allocated_bytes': 100,
+            }
+        ]
+
+        # Run
+        result = profiler.get_profile()
+
+        # Assert
+        expected = pd.DataFrame(
+            {
+                'stage': ['model_sample'],
+                'try': [1],
+                'batch': [3],
+                'seconds': [0.5],
+                'rows_in': [10],
+                'rows_out': [10],
+                'allocated_bytes': [100],
+            },
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_get_profile_empty(self):
+        """Test that an empty DataFrame is returned when no stages were recorded."""
+        # Run
+        result = SamplingProfiler().get_profile()
+
+        # Assert
+        assert result.empty
+        assert list(result.columns) == PROFILE_COLUMNS
+
+    def test_get_summary(self):
+        """Test that the calls of each stage are aggregated in order of appearance."""
+        # Setup
+        profiler = SamplingProfiler(track_memory=False)
+        profiler.records = [
+            {
+                'stage': 'model_sample',
+                'try': 1,
+                'rows_in': 10,
+                'rows_out': 10,
+                'seconds': 0.5,
+                'allocated_bytes': None,
+            },
+            {
+                'stage': 'filter_valid',
+                'try': 1,
+                'rows_in': 10,
+                'rows_out': 6,
+                'seconds': 0.25,
+                'allocated_bytes': None,
+            },
+            {
+                'stage': 'model_sample',
+                'try': 2,
+                'rows_in': 4,
+                'rows_out': 4,
+                'seconds': 0.25,
+                'allocated_bytes': None,
+            },
+        ]
+
+        # Run
+        result = profiler.get_summary()
+
+        # Assert
+        assert list(result) == ['model_sample', 'filter_valid']
+        assert result['model_sample'] == {
+            'calls': 2,
+            'seconds': 0.75,
+            'rows_in': 14.0,
+            'rows_out': 14.0,
+            'allocated_bytes': None,
+        }
+        assert result['filter_valid'] == {
+            'calls': 1,
+            'seconds': 0.25,
+            'rows_in': 10.0,
+            'rows_out': 6.0,
+            'allocated_bytes': None,
+        }
+
+
+def test_profile_stage_without_profiler():
+    """Test that nothing is recorded when there is no profiler."""
+    # Run
+    with profile_stage(None, 'model_sample', 10) as record:
+        record['rows_out'] = 10
+
+    # Assert
+    assert isinstance(profile_stage(None, 'model_sample'), contextlib.nullcontext)
+
+
+def test_profile_stage():
+    """Test that the stage is recorded with the given profiler."""
+    # Setup
+    profiler = Mock()
+
+    # Run
+    result = profile_stage(profiler, 'model_sample', 10)
+
+    # Assert
+    profiler.stage.assert_called_once_with('model_sample', 10)
+    assert result == profiler.stage.return_value
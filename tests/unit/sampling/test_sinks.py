@@ -0,0 +1,415 @@
+"""Tests for the sdv.sampling.sinks module."""
+
+import re
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from sdv.sampling.sinks import (
+    ArrowIPCSink,
+    BaseArrowSink,
+    CSVSink,
+    ParquetSink,
+    _import_pyarrow,
+    create_sink,
+)
+
+
+@patch.dict('sys.modules', {'pyarrow': None})
+def test__import_pyarrow_missing():
+    """Test that a helpful error is raised when ``pyarrow`` is not installed."""
+    # Run and Assert
+    expected_message = re.escape(
+        "Writing the sampled rows to a Parquet or Arrow file requires 'pyarrow'. "
+        "Please install it using 'pip install pyarrow'."
+    )
+    with pytest.raises(ImportError, match=expected_message):
+        _import_pyarrow()
+
+
+class TestCSVSink:
+    def test_write(self, tmp_path):
+        """Test that the header is only written when the file is empty."""
+        # Setup
+        path = tmp_path / 'sampled.csv'
+        path.touch()
+        sink = CSVSink(path)
+        first_rows = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+        second_rows = pd.DataFrame({'a': [3], 'b': ['z']})
+
+        # Run
+        sink.write(first_rows)
+        sink.write(second_rows)
+        sink.close()
+
+        # Assert
+        expected = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        pd.testing.assert_frame_equal(pd.read_csv(path), expected)
+
+
+def _get_arrow_sink_mock(dtypes=None):
+    """Get a mocked ``BaseArrowSink`` that converts and promotes the types as the real one."""
+    instance = Mock(_pa=pa, _schema=None, _writer=None, _pending_tables=[], dtypes=dtypes)
+    for name in [
+        '_get_dtype_type',
+        '_get_field_type',
+        '_promote_type',
+        '_to_array',
+        '_to_table',
+        '_get_schema',
+        '_get_empty_schema',
+    ]:
+        setattr(instance, name, getattr(BaseArrowSink, name).__get__(instance))
+
+    return instance
+
+
+class TestBaseArrowSink:
+    def test_write(self):
+        """Test that the rows are buffered until there are ``row_group_size`` of them."""
+        # Setup
+        instance = Mock(row_group_size=3, _buffer=[], _num_buffered_rows=0)
+        rows = pd.DataFrame({'a': [1, 2]})
+
+        # Run
+        BaseArrowSink.write(instance, rows)
+        instance._flush.assert_not_called()
+        BaseArrowSink.write(instance, rows)
+        BaseArrowSink.write(instance, rows.head(0))
+
+        # Assert
+        assert instance._buffer == [rows, rows]
+        assert instance._num_buffered_rows == 4
+        instance._flush.assert_called_once_with()
+
+    def test__get_dtype_type(self):
+        """Test that the types of the dtypes are used, with integers as 64 bit integers."""
+        # Setup
+        instance = Mock(_pa=pa)
+
+        # Run
+        types = [
+            BaseArrowSink._get_dtype_type(instance, dtype)
+            for dtype in ['int8', 'uint64', 'float32', 'bool', 'datetime64[ns]', 'object']
+        ]
+
+        # Assert
+        assert types == [
+            pa.int64(),
+            pa.uint64(),
+            pa.float32(),
+            pa.bool_(),
+            pa.timestamp('ns'),
+            None,
+        ]
+
+    @pytest.mark.parametrize(
+        'field_type, other_type, expected',
+        [
+            (pa.int64(), pa.int64(), pa.int64()),
+            (pa.int64(), pa.null(), pa.int64()),
+            (pa.null(), pa.string(), pa.string()),
+            (pa.int64(), pa.float64(), pa.float64()),
+            (pa.float32(), pa.uint64(), pa.float64()),
+            (pa.int64(), pa.string(), pa.string()),
+            (pa.bool_(), pa.int64(), pa.string()),
+        ],
+    )
+    def test__promote_type(self, field_type, other_type, expected):
+        """Test that the types are promoted to ``float64`` if numerical or ``string`` if not."""
+        # Setup
+        instance = Mock(_pa=pa)
+
+        # Run
+        result = BaseArrowSink._promote_type(instance, field_type, other_type)
+
+        # Assert
+        assert result == expected
+
+    def test__to_array(self):
+        """Test that the values that do not fit in the type are converted to their own type."""
+        # Setup
+        instance = Mock(_pa=pa)
+
+        # Run
+        integers = BaseArrowSink._to_array(instance, pd.Series([1.0, np.nan]), pa.int64())
+        floats = BaseArrowSink._to_array(instance, pd.Series([1.5, np.nan]), pa.int64())
+        mixed = BaseArrowSink._to_array(instance, pd.Series([1, 'x', None]), None)
+
+        # Assert
+        assert integers.type == pa.int64()
+        assert integers.to_pylist() == [1, None]
+        assert floats.type == pa.float64()
+        assert mixed.type == pa.string()
+        assert mixed.to_pylist() == ['1', 'x', None]
+
+    def test__flush(self):
+        """Test that the buffered rows are written and the writer is created only once."""
+        # Setup
+        instance = _get_arrow_sink_mock()
+        instance._buffer = [pd.DataFrame({'a': [1, 2]}), pd.DataFrame({'a': [3]})]
+
+        # Run
+        BaseArrowSink._flush(instance)
+
+        # Assert
+        assert instance._buffer == []
+        assert instance._num_buffered_rows == 0
+        assert instance._pending_tables == []
+        assert instance._schema.equals(pa.schema([('a', pa.int64())]))
+        instance._create_writer.assert_called_once_with(instance._schema)
+        table = instance._write_table.call_args[0][0]
+        assert table.column('a').to_pylist() == [1, 2, 3]
+
+    def test__flush_dtypes(self):
+        """Test that the types of the columns are taken from the dtypes."""
+        # Setup
+        instance = _get_arrow_sink_mock(dtypes={'a': 'float64', 'b': 'int8'})
+        instance._buffer = [pd.DataFrame({'a': [1, 2], 'b': [None, None]})]
+
+        # Run
+        BaseArrowSink._flush(instance)
+
+        # Assert
+        assert instance._schema.equals(pa.schema([('a', pa.float64()), ('b', pa.int64())]))
+        instance._write_table.assert_called_once()
+
+    def test__flush_promoted_type(self):
+        """Test that the file is written again if the values do not fit in the written types."""
+        # Setup
+        instance = _get_arrow_sink_mock(dtypes={'a': 'int64'})
+        instance._buffer = [pd.DataFrame({'a': [1, 2]})]
+        BaseArrowSink._flush(instance)
+        instance._buffer = [pd.DataFrame({'a': [1.5, 2.0]})]
+
+        # Run
+        BaseArrowSink._flush(instance)
+
+        # Assert
+        instance._rewrite.assert_called_once_with(pa.schema([('a', pa.float64())]))
+        assert instance._schema.equals(pa.schema([('a', pa.float64())]))
+        table = instance._write_table.call_args[0][0]
+        assert table.column('a').to_pylist() == [1.5, 2.0]
+
+    def test__flush_null_column(self):
+        """Test that the writer waits for a type of the columns that only have missing values.
+
+        The groups are kept until the type is known, and then written with it.
+        """
+        # Setup
+        instance = _get_arrow_sink_mock()
+        instance._buffer = [pd.DataFrame({'a': [None, None], 'b': [1, 2]})]
+
+        # Run
+        BaseArrowSink._flush(instance)
+        instance._create_writer.assert_not_called()
+        instance._buffer = [pd.DataFrame({'a': ['x', 'y'], 'b': [3, 4]})]
+        BaseArrowSink._flush(instance)
+
+        # Assert
+        assert instance._schema.field('a').type == pa.string()
+        instance._create_writer.assert_called_once_with(instance._schema)
+        tables = [call_args[0][0] for call_args in instance._write_table.call_args_list]
+        assert [table.column('a').to_pylist() for table in tables] == [[None, None], ['x', 'y']]
+        assert all(table.schema.equals(instance._schema) for table in tables)
+
+    def test__flush_final_null_column(self):
+        """Test that the columns without values are written as null when closing."""
+        # Setup
+        instance = _get_arrow_sink_mock()
+        instance._buffer = [pd.DataFrame({'a': [None, None]})]
+
+        # Run
+        BaseArrowSink._flush(instance, final=True)
+
+        # Assert
+        assert instance._schema.field('a').type == pa.null()
+        instance._write_table.assert_called_once()
+
+    def test__flush_empty_buffer(self):
+        """Test that nothing is written when there are no buffered rows."""
+        # Setup
+        instance = Mock(_buffer=[], _pending_tables=[])
+
+        # Run
+        BaseArrowSink._flush(instance)
+
+        # Assert
+        instance._write_table.assert_not_called()
+
+    def test__get_empty_schema(self):
+        """Test that the schema of the empty file is built from the dtypes."""
+        # Setup
+        instance = _get_arrow_sink_mock(dtypes={'a': 'int8', 'b': 'float64', 'c': 'object'})
+
+        # Run
+        schema = BaseArrowSink._get_empty_schema(instance)
+
+        # Assert
+        assert schema.names == ['a', 'b', 'c']
+        assert schema.types == [pa.int64(), pa.float64(), pa.null()]
+
+    def test_close(self):
+        """Test that the buffered rows are flushed and the writer is closed."""
+        # Setup
+        instance = Mock()
+        writer = instance._writer
+
+        # Run
+        BaseArrowSink.close(instance)
+
+        # Assert
+        instance._flush.assert_called_once_with(final=True)
+        instance._create_writer.assert_not_called()
+        writer.close.assert_called_once_with()
+        assert instance._writer is None
+
+    def test_close_no_rows(self):
+        """Test that a file with the schema of the dtypes is written if no rows were written."""
+        # Setup
+        instance = Mock(_writer=None)
+        writer = instance._create_writer.return_value
+
+        # Run
+        BaseArrowSink.close(instance)
+
+        # Assert
+        instance._create_writer.assert_called_once_with(instance._get_empty_schema.return_value)
+        writer.close.assert_called_once_with()
+        assert instance._writer is None
+
+
+class TestParquetSink:
+    def test_write_and_close(self, tmp_path):
+        """Test that the rows are written to a Parquet file in row groups."""
+        # Setup
+        path = tmp_path / 'sampled.parquet'
+        sink = ParquetSink(path, row_group_size=2)
+        rows = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+
+        # Run
+        sink.write(rows.head(1))
+        sink.write(rows.tail(2))
+        sink.close()
+
+        # Assert
+        pd.testing.assert_frame_equal(pd.read_parquet(path), rows)
+        assert pq.ParquetFile(path).metadata.num_row_groups == 2
+
+    def test_write_and_close_null_first_group(self, tmp_path):
+        """Test that a column without values in the first row group can get values later."""
+        # Setup
+        path = tmp_path / 'sampled.parquet'
+        sink = ParquetSink(path, row_group_size=2)
+
+        # Run
+        sink.write(pd.DataFrame({'a': [None, None]}))
+        sink.write(pd.DataFrame({'a': ['x', 'y']}))
+        sink.close()
+
+        # Assert
+        expected = pd.DataFrame({'a': [None, None, 'x', 'y']})
+        pd.testing.assert_frame_equal(pd.read_parquet(path), expected)
+
+    def test_close_no_rows(self, tmp_path):
+        """Test that an empty file with the columns of the dtypes is written."""
+        # Setup
+        path = tmp_path / 'sampled.parquet'
+        path.touch()
+        sink = ParquetSink(path, dtypes={'a': 'int64', 'b': 'object'})
+
+        # Run
+        sink.close()
+
+        # Assert
+        expected = pd.DataFrame({'a': pd.Series(dtype='int64'), 'b': pd.Series(dtype='object')})
+        pd.testing.assert_frame_equal(pd.read_parquet(path), expected)
+
+    def test_write_and_close_promoted_types(self, tmp_path):
+        """Test that the types of the columns are promoted when the values of a group change.
+
+        The rows already written should be written again with the promoted types.
+        """
+        # Setup
+        path = tmp_path / 'sampled.parquet'
+        path.touch()
+        sink = ParquetSink(path, row_group_size=2, dtypes={'a': 'int64', 'b': 'object'})
+
+        # Run
+        sink.write(pd.DataFrame({'a': [1, 2], 'b': [1, 2]}))
+        sink.write(pd.DataFrame({'a': [1.5, np.nan], 'b': ['x', 3]}))
+        sink.close()
+
+        # Assert
+        expected = pd.DataFrame({'a': [1.0, 2.0, 1.5, np.nan], 'b': ['1', '2', 'x', '3']})
+        pd.testing.assert_frame_equal(pd.read_parquet(path), expected)
+        assert pq.ParquetFile(path).metadata.num_row_groups == 2
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestArrowIPCSink:
+    def test_write_and_close(self, tmp_path):
+        """Test that the rows are written to an Arrow IPC file."""
+        # Setup
+        path = tmp_path / 'sampled.arrow'
+        sink = ArrowIPCSink(path)
+        rows = pd.DataFrame({'a': [1.5, 2.5], 'b': [True, False]})
+
+        # Run
+        sink.write(rows.head(1))
+        sink.write(rows.tail(1))
+        sink.close()
+
+        # Assert
+        pd.testing.assert_frame_equal(pd.read_feather(path), rows)
+
+    def test_write_and_close_promoted_types(self, tmp_path):
+        """Test that the rows already written are written again with the promoted types."""
+        # Setup
+        path = tmp_path / 'sampled.arrow'
+        path.touch()
+        sink = ArrowIPCSink(path, row_group_size=2, dtypes={'a': 'int64'})
+
+        # Run
+        sink.write(pd.DataFrame({'a': [1, 2]}))
+        sink.write(pd.DataFrame({'a': [1.5, 2.5]}))
+        sink.close()
+
+        # Assert
+        expected = pd.DataFrame({'a': [1.0, 2.0, 1.5, 2.5]})
+        pd.testing.assert_frame_equal(pd.read_feather(path), expected)
+        assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize(
+    'path, expected_class',
+    [
+        ('sampled.csv', CSVSink),
+        ('sampled', CSVSink),
+        ('sampled.PARQUET', ParquetSink),
+        ('sampled.arrow', ArrowIPCSink),
+        ('sampled.feather', ArrowIPCSink),
+        ('sampled.ipc', ArrowIPCSink),
+    ],
+)
+def test_create_sink(path, expected_class):
+    """Test that the sink is chosen from the file extension."""
+    # Run
+    sink = create_sink(path)
+
+    # Assert
+    assert type(sink) is expected_class
+    assert sink.output_file_path == path
+
+
+def test_create_sink_dtypes():
+    """Test that the dtypes are passed to the Arrow based sinks."""
+    # Run
+    sink = create_sink('sampled.parquet', dtypes={'a': 'int64'})
+
+    # Assert
+    assert sink.dtypes == {'a': 'int64'}
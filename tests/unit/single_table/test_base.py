@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import os
 import re
 import warnings
 from datetime import date, datetime
-from unittest.mock import ANY, MagicMock, Mock, call, mock_open, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock, call, mock_open, patch
 
 import numpy as np
 import pandas as pd
@@ -31,6 +32,8 @@ from sdv.errors import (
 from sdv.metadata.errors import InvalidMetadataError
 from sdv.metadata.metadata import Metadata
 from sdv.metadata.single_table import SingleTableMetadata
+from sdv.sampling.profiling import SamplingProfiler
+from sdv.sampling.sinks import CSVSink
 from sdv.sampling.tabular import Condition, DataFrameCondition
 from sdv.single_table import (
     CopulaGANSynthesizer,
@@ -39,6 +42,7 @@ from sdv.single_table import (
     TVAESynthesizer,
 )
 from sdv.single_table.base import COND_IDX, BaseSingleTableSynthesizer, BaseSynthesizer
+from sdv.single_table.utils import _initialize_sampling_worker, _sample_batch_in_worker
 from tests.utils import catch_sdv_logs
 
 
@@ -503,6 +507,56 @@ class TestBaseSynthesizer:
             data=data, metadata=instance._original_metadata
         )
 
+    def test__validate_transform_constraints_cached(self):
+        """Test that the constraints are not fitted again on the same data.
+
+        The data transformed by the constraints should be taken from the cache, both when
+        enforcing the fitting of the constraints and when only transforming the data.
+        """
+        # Setup
+        data = pd.DataFrame({'a': [1, 2, 3]})
+        transformed = pd.DataFrame({'a#b': [1, 2, 3]})
+        instance = BaseSynthesizer(Metadata())
+        instance.set_transform_cache_size(2**20)
+        constraint = Mock()
+        constraint.transform.return_value = transformed
+        instance._chained_constraints = [constraint]
+        instance._validate_transform_constraints(data, enforce_constraint_fitting=True)
+        constraint.reset_mock()
+
+        # Run
+        result = instance._validate_transform_constraints(data.copy())
+        enforced_result = instance._validate_transform_constraints(
+            data.copy(), enforce_constraint_fitting=True
+        )
+        new_result = instance._validate_transform_constraints(data.assign(a=[4, 5, 6]))
+
+        # Assert
+        constraint.fit.assert_not_called()
+        constraint.transform.assert_called_once()
+        pd.testing.assert_frame_equal(result, transformed)
+        pd.testing.assert_frame_equal(enforced_result, transformed)
+        pd.testing.assert_frame_equal(new_result, transformed)
+        assert result is not transformed
+
+    def test__validate_transform_constraints_cache_disabled(self):
+        """Test that the constraints are fitted again when the cache is disabled by default."""
+        # Setup
+        data = pd.DataFrame({'a': [1, 2, 3]})
+        instance = BaseSynthesizer(Metadata())
+        constraint = Mock()
+        constraint.transform.return_value = data
+        instance._chained_constraints = [constraint]
+
+        # Run
+        instance._validate_transform_constraints(data, enforce_constraint_fitting=True)
+        instance._validate_transform_constraints(data, enforce_constraint_fitting=True)
+
+        # Assert
+        assert constraint.fit.call_count == 2
+        assert constraint.transform.call_count == 2
+        assert instance._constraints_fingerprint is None
+
     def test_validate(self):
         """Test the appropriate methods are called.
 
@@ -601,6 +655,7 @@ class TestBaseSynthesizer:
         """Test that the ``DataProcessor.prepare_for_fitting`` is being called."""
         # Setup
         instance = Mock()
+        instance._data_processor = MagicMock()
         data = pd.DataFrame({'name': ['John', 'Doe', 'Johanna'], 'salary': [80.0, 90.0, 120.0]})
         instance._validate_transform_constraints = Mock(return_value=data)
 
@@ -611,6 +666,59 @@ class TestBaseSynthesizer:
         instance.validate.assert_called_once_with(data)
         instance._validate_transform_constraints.assert_called_once_with(data)
         instance._data_processor.prepare_for_fitting.assert_called_once_with(data)
+        assert instance._data_processor._n_jobs == 1
+
+    def test_auto_assign_transformers_n_jobs(self):
+        """Test that ``n_jobs`` is passed to the ``DataProcessor``."""
+        # Setup
+        instance = Mock()
+        instance._data_processor = MagicMock()
+        data = pd.DataFrame({'name': ['John', 'Doe', 'Johanna']})
+        instance._validate_transform_constraints = Mock(return_value=data)
+
+        # Run
+        BaseSynthesizer.auto_assign_transformers(instance, data, n_jobs=2)
+
+        # Assert
+        assert instance._data_processor._n_jobs == 2
+
+    def test_clear_transform_cache(self):
+        """Test that the cache of the ``DataProcessor`` is cleared."""
+        # Setup
+        instance = Mock()
+
+        # Run
+        BaseSynthesizer.clear_transform_cache(instance)
+
+        # Assert
+        instance._data_processor.clear_transform_cache.assert_called_once_with()
+
+    def test_set_transform_cache_size(self):
+        """Test that the maximum size of the cache of the ``DataProcessor`` is set."""
+        # Setup
+        instance = Mock()
+
+        # Run
+        BaseSynthesizer.set_transform_cache_size(instance, 0)
+
+        # Assert
+        instance._data_processor.set_transform_cache_size.assert_called_once_with(0)
+
+    @pytest.mark.parametrize('max_size', [-1, 1.5, True, 'a'])
+    def test_set_transform_cache_size_invalid(self, max_size):
+        """Test that an error is raised if ``max_size`` is not a non-negative integer."""
+        # Setup
+        instance = Mock()
+        expected_message = re.escape(
+            f"Invalid value '{max_size}' for parameter 'max_size'. Please provide a "
+            'non-negative integer.'
+        )
+
+        # Run and Assert
+        with pytest.raises(SynthesizerInputError, match=expected_message):
+            BaseSynthesizer.set_transform_cache_size(instance, max_size)
+
+        instance._data_processor.set_transform_cache_size.assert_not_called()
 
     def test_auto_assign_transformers_with_invalid_data(self):
         """Test that auto_assign_transformer throws useful error about invalid data"""
@@ -743,6 +851,7 @@ class TestBaseSynthesizer:
         """Test the preprocess method."""
         # Setup
         instance = Mock()
+        instance._data_processor = MagicMock()
         instance._fitted = True
         data = pd.DataFrame({'name': ['John', 'Doe', 'John Doe']})
         instance._preprocess_helper.return_value = data
@@ -757,6 +866,24 @@ class TestBaseSynthesizer:
         instance._preprocess_helper.assert_called_once_with(data)
         instance._preprocess.assert_called_once_with(data)
         pd.testing.assert_frame_equal(result, data)
+        assert instance._data_processor._n_jobs == 1
+
+    def test_preprocess_n_jobs(self):
+        """Test that ``n_jobs`` is validated and passed to the ``DataProcessor``."""
+        # Setup
+        instance = Mock()
+        instance._data_processor = MagicMock()
+        instance._store_and_convert_original_cols = Mock(return_value=False)
+        data = pd.DataFrame({'name': ['John', 'Doe', 'John Doe']})
+        expected_message = re.escape("Invalid value '0' for parameter 'n_jobs'.")
+
+        # Run
+        BaseSynthesizer.preprocess(instance, data, n_jobs=3)
+
+        # Assert
+        assert instance._data_processor._n_jobs == 3
+        with pytest.raises(SynthesizerInputError, match=expected_message):
+            BaseSynthesizer.preprocess(instance, data, n_jobs=0)
 
     def test_preprocess_int_columns(self):
         """Test the preprocess method.
@@ -829,6 +956,7 @@ class TestBaseSynthesizer:
 
         # Assert
         instance._fit.assert_called_once_with(processed_data)
+        assert instance._n_jobs == 1
         assert caplog.messages[0] == str({
             'EVENT': 'Fit processed data',
             'TIMESTAMP': '2024-04-19 16:20:10.037183',
@@ -839,6 +967,21 @@ class TestBaseSynthesizer:
             'TOTAL NUMBER OF COLUMNS': 1,
         })
 
+    def test_fit_processed_data_n_jobs(self):
+        """Test that ``n_jobs`` is validated and stored before fitting the model."""
+        # Setup
+        instance = Mock(_fitted_sdv_version=None, _fitted_sdv_enterprise_version=None)
+        processed_data = pd.DataFrame({'column_a': [1, 2, 3]})
+        expected_message = re.escape("Invalid value '0' for parameter 'n_jobs'.")
+
+        # Run
+        BaseSynthesizer.fit_processed_data(instance, processed_data, n_jobs=3)
+
+        # Assert
+        assert instance._n_jobs == 3
+        with pytest.raises(SynthesizerInputError, match=expected_message):
+            BaseSynthesizer.fit_processed_data(instance, processed_data, n_jobs=0)
+
     def test_fit_processed_data_raises_version_error(self):
         """Test that ``fit`` raises ``VersionError``
 
@@ -888,9 +1031,12 @@ class TestBaseSynthesizer:
 
         # Assert
         assert instance._random_state_set is False
+        assert instance._sampling_seed_sequence is None
         instance._data_processor.reset_sampling.assert_called_once_with()
-        instance.preprocess.assert_called_once_with(data)
-        instance.fit_processed_data.assert_called_once_with(instance.preprocess.return_value)
+        instance.preprocess.assert_called_once_with(data, n_jobs=1)
+        instance.fit_processed_data.assert_called_once_with(
+            instance.preprocess.return_value, n_jobs=1
+        )
         instance._check_input_metadata_updated.assert_called_once()
         assert caplog.messages[0] == str({
             'EVENT': 'Fit',
@@ -902,6 +1048,84 @@ class TestBaseSynthesizer:
             'TOTAL NUMBER OF COLUMNS': 2,
         })
 
+    @patch('sdv.single_table.base.update_reservoir_sample')
+    def test_fit_from_chunks(self, mock_update_reservoir_sample):
+        """Test that the formats are learned from all the chunks and the model from a sample."""
+        # Setup
+        instance = Mock(_chained_constraints=[], _reject_sampling_constraints=[])
+        instance._data_processor._constraints = []
+        instance._validate.return_value = []
+        first_chunk = pd.DataFrame({'a': [1, 2]})
+        second_chunk = pd.DataFrame({'a': [3]})
+        sample = pd.DataFrame({'a': [1, 3]})
+        mock_update_reservoir_sample.side_effect = [
+            (first_chunk, np.array([0.1, 0.2])),
+            (sample, np.array([0.1, 0.05])),
+        ]
+
+        # Run
+        BaseSynthesizer.fit_from_chunks(instance, [first_chunk, pd.DataFrame(), second_chunk], 2)
+
+        # Assert
+        instance.validate.assert_not_called()
+        assert instance._validate_original_metadata.call_count == 2
+        assert instance._validate.call_count == 2
+        assert instance._data_processor.update_numerical_formats.call_count == 2
+        formatters = instance._data_processor.update_numerical_formats.call_args[0][1]
+        first_call, second_call = mock_update_reservoir_sample.call_args_list
+        assert second_call[0][0] is first_chunk
+        assert second_call[0][3] == 2
+        assert isinstance(second_call[0][4], np.random.Generator)
+        assert second_call[0][4] is first_call[0][4]
+        instance.fit.assert_called_once_with(sample)
+        instance._data_processor.set_numerical_formats.assert_called_once_with(formatters)
+
+    def test_fit_from_chunks_with_constraints(self):
+        """Test that the numerical formats are not replaced if there are constraints."""
+        # Setup
+        instance = Mock(_chained_constraints=[Mock()], _reject_sampling_constraints=[])
+        instance._validate.return_value = []
+
+        # Run
+        BaseSynthesizer.fit_from_chunks(instance, [pd.DataFrame({'a': [1, 2]})])
+
+        # Assert
+        instance.fit.assert_called_once()
+        instance._data_processor.set_numerical_formats.assert_not_called()
+
+    def test_fit_from_chunks_invalid_chunk(self):
+        """Test that the errors of the synthesizer rules are raised for every chunk."""
+        # Setup
+        instance = Mock()
+        instance._validate.return_value = ['Invalid chunk']
+
+        # Run and Assert
+        with pytest.raises(InvalidDataError, match='Invalid chunk'):
+            BaseSynthesizer.fit_from_chunks(instance, [pd.DataFrame({'a': [1, 2]})])
+
+        instance.fit.assert_not_called()
+
+    def test_fit_from_chunks_empty(self):
+        """Test that an error is raised if the chunks have no rows."""
+        # Setup
+        instance = Mock()
+
+        # Run and Assert
+        with pytest.raises(ValueError, match='The fit dataframe is empty'):
+            BaseSynthesizer.fit_from_chunks(instance, iter([pd.DataFrame()]))
+
+    def test_fit_from_chunks_invalid_max_rows(self):
+        """Test that an error is raised if ``max_rows`` is not a positive integer."""
+        # Setup
+        instance = Mock()
+        expected_message = re.escape(
+            "Invalid value '0' for parameter 'max_rows'. Please provide a positive integer."
+        )
+
+        # Run and Assert
+        with pytest.raises(SynthesizerInputError, match=expected_message):
+            BaseSynthesizer.fit_from_chunks(instance, [], max_rows=0)
+
     def test_fit_raises_version_error(self):
         """Test that ``fit`` raises ``VersionError``
 
@@ -1170,7 +1394,8 @@ class TestBaseSynthesizer:
         assert instance._chained_constraints == [constraint1, constraint2, mock_harness]
         assert instance._reject_sampling_constraints == [constraint3]
         mock_programmable_constraint_harness.assert_called_once_with(constraint4)
-        mock_data_processor.assert_has_calls([
+        assert instance._constraints_fingerprint is None
+        assert mock_data_processor.call_args_list == [
             call(
                 metadata=constraint2.get_updated_metadata()._convert_to_single_table.return_value,
                 enforce_rounding=instance.enforce_rounding,
@@ -1183,7 +1408,9 @@ class TestBaseSynthesizer:
                 enforce_min_max_values=instance.enforce_min_max_values,
                 locales=instance.locales,
             ),
-        ])
+        ]
+        cache_size = mock_data_processor.return_value._get_transform_cache.return_value.max_size
+        mock_data_processor.return_value.set_transform_cache_size.assert_called_with(cache_size)
 
     @patch('sdv.single_table.base.datetime')
     @patch('sdv.single_table.base.cloudpickle')
@@ -1460,8 +1687,149 @@ class TestBaseSingleTableSynthesizer:
 
         # Assert
         assert instance._random_state_set is False
+        assert instance._sampling_seed_sequence is None
         instance._data_processor.reset_sampling.assert_called_once_with()
 
+    def test__spawn_sampling_seeds(self):
+        """Test that the seeds are reproducible and different on consecutive calls."""
+        # Setup
+        instance = Mock(_sampling_seed_sequence=None)
+
+        # Run
+        first_seeds = BaseSingleTableSynthesizer._spawn_sampling_seeds(instance, 3)
+        second_seeds = BaseSingleTableSynthesizer._spawn_sampling_seeds(instance, 3)
+        instance._sampling_seed_sequence = None
+        reset_seeds = BaseSingleTableSynthesizer._spawn_sampling_seeds(instance, 3)
+
+        # Assert
+        assert len(set(first_seeds)) == 3
+        assert all(isinstance(seed, int) for seed in first_seeds)
+        assert first_seeds != second_seeds
+        assert first_seeds == reset_seeds
+
+    def test__set_sampling_seed(self):
+        """Test that the model and the data processor are seeded."""
+        # Setup
+        instance = Mock()
+
+        # Run
+        BaseSingleTableSynthesizer._set_sampling_seed(instance, 10)
+
+        # Assert
+        instance._set_random_state.assert_called_once_with(10)
+        instance._data_processor.set_random_state.assert_called_once_with(10)
+
+    def test_enable_sampling_profiling(self):
+        """Test that a profiler is created with the given options."""
+        # Setup
+        instance = Mock()
+
+        # Run
+        BaseSingleTableSynthesizer.enable_sampling_profiling(
+            instance, log_profile=True, track_memory=False
+        )
+
+        # Assert
+        assert isinstance(instance._sampling_profiler, SamplingProfiler)
+        assert instance._sampling_profiler.track_memory is False
+        assert instance._log_sampling_profile is True
+
+    def test_disable_sampling_profiling(self):
+        """Test that the profiler is removed."""
+        # Setup
+        instance = Mock()
+
+        # Run
+        BaseSingleTableSynthesizer.disable_sampling_profiling(instance)
+
+        # Assert
+        assert instance._sampling_profiler is None
+        assert instance._log_sampling_profile is False
+
+    def test_get_sampling_profile(self):
+        """Test that the profile of the profiler is returned."""
+        # Setup
+        instance = Mock()
+
+        # Run
+        result = BaseSingleTableSynthesizer.get_sampling_profile(instance)
+
+        # Assert
+        assert result == instance._sampling_profiler.get_profile.return_value
+
+    def test_get_sampling_profile_not_enabled(self):
+        """Test that an error is raised if the profiling is not enabled."""
+        # Setup
+        instance = Mock(_sampling_profiler=None)
+
+        # Run and Assert
+        expected_message = re.escape(
+            "Sampling profiling is not enabled. Please call 'enable_sampling_profiling' "
+            'before sampling.'
+        )
+        with pytest.raises(ValueError, match=expected_message):
+            BaseSingleTableSynthesizer.get_sampling_profile(instance)
+
+    def test__profile_sampling_disabled(self):
+        """Test that nothing is recorded when the profiling is not enabled."""
+        # Setup
+        instance = Mock(_sampling_profiler=None)
+
+        # Run
+        with BaseSingleTableSynthesizer._profile_sampling(instance):
+            pass
+
+        # Assert
+        assert instance._data_processor._sampling_profiler is None
+
+    @patch('sdv.single_table.base.datetime')
+    def test__profile_sampling(self, mock_datetime, caplog):
+        """Test that the profiler is started, stopped and its summary is logged."""
+        # Setup
+        mock_datetime.datetime.now.return_value = '2024-04-19 16:20:10.037183'
+        profiler = Mock()
+        profiler.get_summary.return_value = {'model_sample': {'calls': 1}}
+        instance = Mock(
+            _sampling_profiler=profiler,
+            _log_sampling_profile=True,
+            _synthesizer_id='BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5',
+        )
+        instance.__class__.__name__ = 'BaseSingleTableSynthesizer'
+
+        # Run
+        with catch_sdv_logs(caplog, logging.INFO, logger='SingleTableSynthesizer'):
+            with BaseSingleTableSynthesizer._profile_sampling(instance):
+                profiler.start.assert_called_once_with()
+                profiler.stop.assert_not_called()
+
+        # Assert
+        profiler.stop.assert_called_once_with()
+        assert instance._data_processor._sampling_profiler == profiler
+        assert caplog.messages[0] == str({
+            'EVENT': 'Sampling profile',
+            'TIMESTAMP': '2024-04-19 16:20:10.037183',
+            'SYNTHESIZER CLASS NAME': 'BaseSingleTableSynthesizer',
+            'SYNTHESIZER ID': 'BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5',
+            'PROFILE': {'model_sample': {'calls': 1}},
+        })
+
+    def test__profile_sampling_without_logging(self, caplog):
+        """Test that the profiler is stopped on error and nothing is logged."""
+        # Setup
+        profiler = Mock()
+        instance = Mock(_sampling_profiler=profiler, _log_sampling_profile=False)
+
+        # Run
+        with catch_sdv_logs(caplog, logging.INFO, logger='SingleTableSynthesizer'):
+            with pytest.raises(ValueError, match='error'):
+                with BaseSingleTableSynthesizer._profile_sampling(instance):
+                    raise ValueError('error')
+
+        # Assert
+        profiler.stop.assert_called_once_with()
+        profiler.get_summary.assert_not_called()
+        assert caplog.messages == []
+
     def test__filter_conditions(self):
         """Test that the method filters out data that doesn't meet the conditions."""
         # Setup
@@ -1493,6 +1861,49 @@ class TestBaseSingleTableSynthesizer:
         )
         pd.testing.assert_frame_equal(filtered_data, expected_data)
 
+    def test__reverse_transform_sampled(self):
+        """Test that the sampled rows are reverse transformed and then the constraints."""
+        # Setup
+        data = pd.DataFrame({'name': ['John', 'Doe', 'John Doe']})
+        raw_sampled = pd.DataFrame({'name': [0.1, 0.5, 0.9]})
+        instance = Mock()
+        instance._profile_stage = MagicMock()
+        instance._data_processor.reverse_transform.return_value = data
+        instance.reverse_transform_constraints = Mock(side_effect=lambda x: x)
+        conditions = {'name': 'John'}
+
+        # Run
+        sampled = BaseSingleTableSynthesizer._reverse_transform_sampled(
+            instance, raw_sampled, conditions
+        )
+
+        # Assert
+        pd.testing.assert_frame_equal(sampled, data)
+        instance._data_processor.reverse_transform.assert_called_once_with(
+            raw_sampled, conditions=conditions
+        )
+        instance.reverse_transform_constraints.assert_called_once_with(data)
+
+    def test__reverse_transform_sampled_keep_extra_columns(self):
+        """Test that the sampled columns that are not reverse transformed are kept."""
+        # Setup
+        data = pd.DataFrame({'name': ['John', 'John Doe']}, index=[0, 2])
+        raw_sampled = pd.DataFrame({'name': [0.1, 0.5, 0.9], 'extra': [1.0, 2.0, 3.0]})
+        instance = Mock()
+        instance._profile_stage = MagicMock()
+        instance._data_processor.reverse_transform.return_value = data
+        instance._data_processor._get_input_columns.return_value = ['name']
+        instance.reverse_transform_constraints = Mock(side_effect=lambda x: x)
+
+        # Run
+        sampled = BaseSingleTableSynthesizer._reverse_transform_sampled(
+            instance, raw_sampled, keep_extra_columns=True
+        )
+
+        # Assert
+        expected = pd.DataFrame({'name': ['John', 'John Doe'], 'extra': [1.0, 3.0]}, index=[0, 2])
+        pd.testing.assert_frame_equal(sampled, expected)
+
     def test__sample_rows_without_conditions(self):
         """Test that sample rows calls ``_sample`` when conditions is ``None``.
 
@@ -1502,14 +1913,11 @@ class TestBaseSingleTableSynthesizer:
         # Setup
         data = pd.DataFrame({'name': ['John', 'Doe', 'John Doe']})
         instance = Mock()
+        instance._profile_stage = MagicMock()
         instance._random_state_set = False
         instance._sample.return_value = pd.DataFrame()
-        instance._data_processor.reverse_transform.return_value = data
+        instance._reverse_transform_sampled.return_value = data
         instance._data_processor.filter_valid.return_value = data
-        instance._data_processor._hyper_transformer._input_columns = []
-        instance._reject_sampling_constraints = []
-        instance._chained_constraints = []
-        instance.reverse_transform_constraints = Mock(side_effect=lambda x: x)
 
         # Run
         sampled, num_valid = BaseSingleTableSynthesizer._sample_rows(instance, 3)
@@ -1518,15 +1926,10 @@ class TestBaseSingleTableSynthesizer:
         assert num_valid == 3
         pd.testing.assert_frame_equal(sampled, data)
         instance._sample.assert_called_once_with(3)
-        instance._data_processor.reverse_transform.assert_called_once_with(
-            instance._sample.return_value, conditions=None
-        )
-        instance.reverse_transform_constraints.assert_called_once_with(
-            instance._data_processor.reverse_transform.return_value
-        )
-        instance._data_processor.filter_valid.assert_called_once_with(
-            instance._data_processor.reverse_transform.return_value
+        instance._reverse_transform_sampled.assert_called_once_with(
+            instance._sample.return_value, None, False
         )
+        instance._data_processor.filter_valid.assert_called_once_with(data)
         instance._set_random_state.assert_called_once_with(73251)
 
     def test__sample_rows_with_conditions(self):
@@ -1534,16 +1937,13 @@ class TestBaseSingleTableSynthesizer:
         # Setup
         data = pd.DataFrame({'name': ['John', 'Doe', 'John Doe'], 'salary': [90.0, 100.0, 80.0]})
         instance = Mock()
+        instance._profile_stage = MagicMock()
         instance._sample.return_value = pd.DataFrame()
-        instance._data_processor.reverse_transform.return_value = data
-        instance._data_processor._hyper_transformer._input_columns = []
+        instance._reverse_transform_sampled.return_value = data
+        instance._data_processor.filter_valid.return_value = data
         instance._filter_conditions.return_value = data[data.name == 'John Doe']
         conditions = {'salary': 80.0}
         transformed_conditions = {'salary': 80.0}
-        instance._reject_sampling_constraints = []
-        instance._chained_constraints = []
-        instance._formatters = {}
-        instance.reverse_transform_constraints = Mock(side_effect=lambda x: x)
 
         # Run
         sampled, num_valid = BaseSingleTableSynthesizer._sample_rows(
@@ -1554,59 +1954,20 @@ class TestBaseSingleTableSynthesizer:
         assert num_valid == 1
         pd.testing.assert_frame_equal(sampled, data[data.name == 'John Doe'])
         instance._sample.assert_called_once_with(3, {'salary': 80.0})
-        instance._data_processor.reverse_transform.assert_called_once_with(
-            instance._sample.return_value, conditions=conditions
-        )
-        instance._data_processor.filter_valid.assert_called_once_with(
-            instance._data_processor.reverse_transform.return_value
-        )
-
-    def test__sample_rows_with_previous_rows(self):
-        """Test that previous rows are being concatenated when provided to ``_sample``."""
-        # Setup
-        previous_rows = pd.DataFrame({
-            'name': ['John Doe', 'John Doe', 'John Doe'],
-            'salary': [80.0, 80.0, 80.0],
-        })
-        data = pd.DataFrame({'name': ['John', 'Doe', 'John Doe'], 'salary': [90.0, 100.0, 80.0]})
-
-        instance = Mock()
-        instance._sample.return_value = pd.DataFrame()
-        instance._data_processor._hyper_transformer._input_columns = []
-        instance._data_processor.filter_valid = lambda x: x
-        instance._data_processor.reverse_transform.return_value = data
-        instance._reject_sampling_constraints = []
-        instance._chained_constraints = []
-        instance._formatters = {}
-        instance.reverse_transform_constraints = Mock(side_effect=lambda x: x)
-
-        # Run
-        sampled, num_valid = BaseSingleTableSynthesizer._sample_rows(
-            instance, 3, previous_rows=previous_rows
-        )
-
-        # Assert
-        expected_data = pd.DataFrame({
-            'name': ['John Doe', 'John Doe', 'John Doe', 'John', 'Doe', 'John Doe'],
-            'salary': [80.0, 80.0, 80.0, 90.0, 100.0, 80.0],
-        })
-        assert num_valid == 6
-        pd.testing.assert_frame_equal(sampled, expected_data)
-        instance._sample.assert_called_once_with(3)
-        instance._data_processor.reverse_transform.assert_called_once_with(
-            instance._sample.return_value, conditions=None
+        instance._reverse_transform_sampled.assert_called_once_with(
+            instance._sample.return_value, conditions, False
         )
+        instance._data_processor.filter_valid.assert_called_once_with(data)
 
     def test__sample_rows_notimplementederror(self):
         """Test when the model does not support conditional sampling and raises an error."""
         # Setup
         data = pd.DataFrame({'name': ['John', 'Doe', 'John Doe'], 'salary': [90.0, 100.0, 80.0]})
         instance = Mock()
-        instance._data_processor.reverse_transform.return_value = data
-        instance._data_processor._hyper_transformer._input_columns = []
+        instance._profile_stage = MagicMock()
+        instance._reverse_transform_sampled.return_value = data
+        instance._data_processor.filter_valid.return_value = data
         instance._filter_conditions.return_value = data[data.name == 'John Doe']
-        instance._reject_sampling_constraints = []
-        instance._chained_constraints = []
         conditions = {'salary': 80.0}
         transformed_conditions = {'salary': 80.0}
         instance._sample.side_effect = [NotImplementedError, pd.DataFrame()]
@@ -1629,6 +1990,7 @@ class TestBaseSingleTableSynthesizer:
         """
         # Setup
         instance = Mock()
+        instance._profile_stage = MagicMock()
         instance._data_processor.get_sdtypes.return_value = {}
         instance._data_processor.reverse_transform.side_effect = lambda x: x
 
@@ -1660,19 +2022,12 @@ class TestBaseSingleTableSynthesizer:
             transformed_conditions=None,
             float_rtol=0.01,
             progress_bar=None,
-            output_file_path=None,
+            output_sink=None,
         )
 
         # Assert
         pd.testing.assert_frame_equal(result, sampled_data)
-        _sample_rows_args = instance._sample_rows.call_args[0]
-        rows, conditions, trans_cond, float_rtol, sampled, keep_extra_columns = _sample_rows_args
-        assert rows == 3
-        assert conditions is None
-        assert trans_cond is None
-        assert float_rtol == 0.01
-        pd.testing.assert_frame_equal(sampled, pd.DataFrame())
-        assert keep_extra_columns is False
+        instance._sample_rows.assert_called_once_with(3, None, None, 0.01, keep_extra_columns=False)
 
     def test__sample_batch_with_sampled_data_bigger_than_batch_size(self):
         """Test ``sampled_data`` is bigger than the batch size.
@@ -1698,19 +2053,12 @@ class TestBaseSingleTableSynthesizer:
             transformed_conditions=None,
             float_rtol=0.01,
             progress_bar=None,
-            output_file_path=None,
+            output_sink=None,
         )
 
         # Assert
         pd.testing.assert_frame_equal(result, sampled_data.head(3))
-        _sample_rows_args = instance._sample_rows.call_args[0]
-        rows, conditions, trans_cond, float_rtol, sampled, keep_extra_columns = _sample_rows_args
-        assert rows == 3
-        assert conditions is None
-        assert trans_cond is None
-        assert float_rtol == 0.01
-        pd.testing.assert_frame_equal(sampled, pd.DataFrame())
-        assert keep_extra_columns is False
+        instance._sample_rows.assert_called_once_with(3, None, None, 0.01, keep_extra_columns=False)
 
     def test__sample_batch_max_tries_reached(self):
         """Test that when ``max_tries`` is reached, a break occurs."""
@@ -1721,7 +2069,7 @@ class TestBaseSingleTableSynthesizer:
         })
         instance = Mock()
         instance.metadata.columns.keys.return_value = ['name', 'salary']
-        instance._sample_rows.return_value = (sampled_data, 3)
+        instance._sample_rows.return_value = (sampled_data, 4)
 
         # Run
         result = BaseSingleTableSynthesizer._sample_batch(
@@ -1732,15 +2080,12 @@ class TestBaseSingleTableSynthesizer:
             transformed_conditions=None,
             float_rtol=0.01,
             progress_bar=None,
-            output_file_path=None,
+            output_sink=None,
         )
 
         # Assert
-        pd.testing.assert_frame_equal(result, sampled_data)
-        _sample_rows_args = instance._sample_rows.call_args[0]
-        _rows, _conditions, _trans_cond, _float_rtol, _sampled, _keep_extra_columns = (
-            _sample_rows_args
-        )
+        expected_result = pd.concat([sampled_data, sampled_data], ignore_index=True)
+        pd.testing.assert_frame_equal(result, expected_result)
         assert instance._sample_rows.call_count == 2
 
     def test__sample_batch_storing_output_file(self, tmpdir):
@@ -1755,11 +2100,7 @@ class TestBaseSingleTableSynthesizer:
         })
         instance = Mock()
         instance.metadata.columns.keys.return_value = ['name', 'salary']
-        instance._sample_rows.side_effect = [
-            (sampled_data, 4),
-            (sampled_data, 5),
-            (sampled_data, 10),
-        ]
+        instance._sample_rows.return_value = (sampled_data, 4)
         mock_progress_bar = Mock()
 
         path = tmpdir / 'file.csv'
@@ -1775,39 +2116,54 @@ class TestBaseSingleTableSynthesizer:
             transformed_conditions=None,
             float_rtol=0.01,
             progress_bar=mock_progress_bar,
-            output_file_path=path,
+            output_sink=CSVSink(path),
         )
 
         # Assert
-        pd.testing.assert_frame_equal(result, sampled_data)
+        expected_data = pd.concat(
+            [sampled_data, sampled_data, sampled_data.head(2)], ignore_index=True
+        )
+        pd.testing.assert_frame_equal(result, expected_data)
         assert instance._sample_rows.call_count == 3
-        expected_stored_data = pd.DataFrame({
-            'name': [
-                'John',
-                'Doe',
-                'John Doe',
-                'John Doe John',
-                'John Doe John',
-                'John',
-                'Doe',
-                'John Doe',
-                'John Doe John',
-            ],
-            'salary': [
-                80.0,
-                60.0,
-                100.0,
-                300.0,
-                300.0,
-                80.0,
-                60.0,
-                100.0,
-                300.0,
-            ],
-        })
         data = pd.read_csv(path)
-        pd.testing.assert_frame_equal(expected_stored_data, data)
-        mock_progress_bar.update.call_count == 3
+        pd.testing.assert_frame_equal(expected_data, data)
+        assert mock_progress_bar.update.call_args_list == [call(4), call(4), call(2)]
+
+    def test__sample_batch_only_filters_new_rows(self):
+        """Test that each reject-sampling try only samples and filters the new rows.
+
+        The valid rows from previous tries must not be passed back to ``_sample_rows`` and
+        the number of rows to sample must be adjusted to the observed valid rate.
+        """
+        # Setup
+        first_rows = pd.DataFrame({'salary': [80.0, 60.0]})
+        second_rows = pd.DataFrame({'salary': [100.0, 300.0, 200.0, 50.0]})
+        instance = Mock()
+        instance._sample_rows.side_effect = [(first_rows, 2), (second_rows, 4)]
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_batch(instance, batch_size=5, max_tries=10)
+
+        # Assert
+        expected_result = pd.DataFrame({'salary': [80.0, 60.0, 100.0, 300.0, 200.0]})
+        pd.testing.assert_frame_equal(result, expected_result)
+        assert instance._sample_rows.call_args_list == [
+            call(5, None, None, 0.01, keep_extra_columns=False),
+            call(7, None, None, 0.01, keep_extra_columns=False),
+        ]
+
+    def test__sample_batch_no_valid_rows(self):
+        """Test that an empty dataframe with the sampled columns is returned if none are valid."""
+        # Setup
+        instance = Mock()
+        instance._sample_rows.return_value = (pd.DataFrame({'salary': []}), 0)
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_batch(instance, batch_size=5, max_tries=3)
+
+        # Assert
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'salary': []}))
+        assert instance._sample_rows.call_count == 3
 
     def test__make_condition_dfs(self):
         """Test _make_condition_dfs works with Condition conditions."""
@@ -1900,7 +2256,7 @@ class TestBaseSingleTableSynthesizer:
             transformed_conditions='transformed_conditions',
             float_rtol=0.02,
             progress_bar='progress_bar',
-            output_file_path='output_file_path',
+            output_sink='output_sink',
         )
 
         # Assert
@@ -1917,12 +2273,123 @@ class TestBaseSingleTableSynthesizer:
             transformed_conditions='transformed_conditions',
             float_rtol=0.02,
             progress_bar='progress_bar',
-            output_file_path='output_file_path',
+            output_sink='output_sink',
             keep_extra_columns=False,
         )
         assert expected_call == instance._sample_batch.call_args_list[0]
         assert expected_call == instance._sample_batch.call_args_list[1]
 
+    @patch('sdv.single_table.base.cloudpickle')
+    @patch('sdv.single_table.base.ProcessPoolExecutor')
+    def test__sample_in_parallel(self, mock_executor_class, mock_cloudpickle):
+        """Test that the batches are sampled in the pool and gathered in order."""
+        # Setup
+        first_data = pd.DataFrame({'salary': [60.0, 70.0, 80.0]})
+        second_data = pd.DataFrame({'salary': [65.0]})
+        first_future = Mock()
+        first_future.result.return_value = (first_data, None)
+        second_future = Mock()
+        second_future.result.return_value = (second_data, None)
+        mock_executor = mock_executor_class.return_value
+        mock_executor.submit.side_effect = [first_future, second_future]
+        instance = Mock(_sampling_profiler=None)
+        instance._spawn_sampling_seeds.return_value = [1, 2]
+        instance._data_processor.regenerate_anonymized_columns.side_effect = lambda data: data
+        progress_bar = Mock()
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_in_parallel(
+            instance,
+            num_rows=4,
+            batch_size=3,
+            max_tries_per_batch=100,
+            n_jobs=4,
+            progress_bar=progress_bar,
+        )
+
+        # Assert
+        expected_result = pd.DataFrame({'salary': [60.0, 70.0, 80.0, 65.0]})
+        pd.testing.assert_frame_equal(result, expected_result)
+        mock_cloudpickle.dumps.assert_called_once_with(instance)
+        mock_executor_class.assert_called_once_with(
+            max_workers=2,
+            initializer=_initialize_sampling_worker,
+            initargs=(mock_cloudpickle.dumps.return_value,),
+        )
+        assert mock_executor.submit.call_args_list == [
+            call(_sample_batch_in_worker, 3, 100, 1),
+            call(_sample_batch_in_worker, 1, 100, 2),
+        ]
+        instance._spawn_sampling_seeds.assert_called_once_with(2)
+        assert progress_bar.update.call_args_list == [call(3), call(1)]
+        mock_executor.shutdown.assert_called_once_with(wait=True, cancel_futures=True)
+
+    @patch('sdv.single_table.base.cloudpickle')
+    @patch('sdv.single_table.base.ProcessPoolExecutor')
+    def test__sample_in_parallel_profiling(self, mock_executor_class, mock_cloudpickle):
+        """Test that the stages recorded by the workers are added to the profile by batch."""
+        # Setup
+        first_records = [{'stage': 'model_sample'}]
+        second_records = [{'stage': 'model_sample'}, {'stage': 'filter_valid'}]
+        first_future = Mock()
+        first_future.result.return_value = (pd.DataFrame({'salary': [60.0, 70.0]}), first_records)
+        second_future = Mock()
+        second_future.result.return_value = (pd.DataFrame({'salary': [65.0]}), second_records)
+        mock_executor_class.return_value.submit.side_effect = [first_future, second_future]
+        instance = Mock()
+        instance._spawn_sampling_seeds.return_value = [1, 2]
+        instance._data_processor.regenerate_anonymized_columns.side_effect = lambda data: data
+
+        # Run
+        BaseSingleTableSynthesizer._sample_in_parallel(
+            instance, num_rows=3, batch_size=2, max_tries_per_batch=100, n_jobs=2
+        )
+
+        # Assert
+        assert instance._sampling_profiler.add_records.call_args_list == [
+            call(first_records, batch=1),
+            call(second_records, batch=2),
+        ]
+
+    def test__get_sampled_dtypes(self):
+        """Test that the fitted dtypes are returned in the order of the metadata columns."""
+        # Setup
+        instance = Mock(_table_name='table')
+        instance._data_processor._dtypes = pd.Series({'b': 'float64', 'a': 'int64'})
+        instance._original_metadata.get_column_names.return_value = ['a', 'b', 'c']
+
+        # Run
+        dtypes = BaseSingleTableSynthesizer._get_sampled_dtypes(instance)
+
+        # Assert
+        assert dtypes == {'a': 'int64', 'b': 'float64', 'c': 'object'}
+        instance._original_metadata.get_column_names.assert_called_once_with(table_name='table')
+
+    @patch('sdv.single_table.base.tqdm')
+    @patch('sdv.single_table.base.validate_file_path')
+    def test__sample_with_progress_bar_n_jobs(self, mock_validate_file_path, mock_tqdm):
+        """Test that the rows are split across the processes when ``n_jobs`` is given."""
+        # Setup
+        progress_bar = MagicMock()
+        mock_tqdm.tqdm.return_value = progress_bar
+        instance = Mock()
+        mock_validate_file_path.return_value = None
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_with_progress_bar(instance, 10, n_jobs=4)
+
+        # Assert
+        assert result == instance._sample_in_parallel.return_value
+        instance._sample_in_batches.assert_not_called()
+        instance._sample_in_parallel.assert_called_once_with(
+            num_rows=10,
+            batch_size=3,
+            max_tries_per_batch=100,
+            n_jobs=4,
+            progress_bar=progress_bar.__enter__.return_value,
+            output_sink=None,
+        )
+
     def test__conditionally_sample_rows(self):
         """Test when sampled rows is bigger than 0."""
         # Setup
@@ -1959,7 +2426,7 @@ class TestBaseSingleTableSynthesizer:
             transformed_conditions=transformed_condition,
             float_rtol=0.01,
             progress_bar=None,
-            output_file_path=None,
+            output_sink=None,
             keep_extra_columns=False,
         )
 
@@ -2064,10 +2531,11 @@ class TestBaseSingleTableSynthesizer:
         # Assert
         pd.testing.assert_frame_equal(result, pd.DataFrame())
 
+    @patch('sdv.single_table.base.create_sink')
     @patch('sdv.single_table.base.tqdm')
     @patch('sdv.single_table.base.validate_file_path')
     def test__sample_with_progress_bar_returns_sampled_data(
-        self, mock_validate_file_path, mock_tqdm
+        self, mock_validate_file_path, mock_tqdm, mock_create_sink
     ):
         """Test that ``_sample_in_batches`` is being called and it's output is returned."""
         # Setup
@@ -2091,14 +2559,16 @@ class TestBaseSingleTableSynthesizer:
             batch_size=10,
             max_tries_per_batch=100,
             progress_bar=progress_bar.__enter__.return_value,
-            output_file_path=mock_validate_file_path.return_value,
+            output_sink=mock_create_sink.return_value,
         )
+        mock_create_sink.return_value.close.assert_called_once_with()
 
     @patch('sdv.single_table.base.handle_sampling_error')
+    @patch('sdv.single_table.base.create_sink')
     @patch('sdv.single_table.base.tqdm')
     @patch('sdv.single_table.base.validate_file_path')
     def test__sample_with_progress_bar_handle_sampling_error(
-        self, mock_validate_file_path, mock_tqdm, mock_handle_sampling_error
+        self, mock_validate_file_path, mock_tqdm, mock_create_sink, mock_handle_sampling_error
     ):
         """Test the error handling when we are using ``_sample_in_batches``."""
         # Setup
@@ -2122,15 +2592,16 @@ class TestBaseSingleTableSynthesizer:
             batch_size=10,
             max_tries_per_batch=100,
             progress_bar=progress_bar.__enter__.return_value,
-            output_file_path=mock_validate_file_path.return_value,
+            output_sink=mock_create_sink.return_value,
         )
         mock_handle_sampling_error.assert_called_once_with('temp_file', keyboard_error)
+        mock_create_sink.return_value.close.assert_called_once_with()
 
-    @patch('sdv.single_table.base.os')
+    @patch('sdv.single_table.base.create_sink')
     @patch('sdv.single_table.base.tqdm')
     @patch('sdv.single_table.base.validate_file_path')
     def test__sample_with_progress_bar_removing_temp_file(
-        self, mock_validate_file_path, mock_tqdm, mock_os
+        self, mock_validate_file_path, mock_tqdm, mock_create_sink
     ):
         """Test that the temporary file is removed after sampling."""
         # Setup
@@ -2153,8 +2624,9 @@ class TestBaseSingleTableSynthesizer:
             batch_size=10,
             max_tries_per_batch=100,
             progress_bar=progress_bar.__enter__.return_value,
-            output_file_path=mock_validate_file_path.return_value,
+            output_sink=mock_create_sink.return_value,
         )
+        mock_create_sink.return_value.close.assert_called_once_with()
 
     def test_sample_not_fitted(self):
         """Test that ``sample`` raises an error when the synthesizer is not fitted."""
@@ -2212,6 +2684,7 @@ class TestBaseSingleTableSynthesizer:
             _synthesizer_id='BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5',
         )
         instance.get_metadata.return_value._constraints = False
+        instance._profile_sampling = MagicMock()
         instance._sample_with_progress_bar.return_value = pd.DataFrame({'col': [1, 2, 3]})
         instance._reverse_transform_constraints.return_value = pd.DataFrame({'col': [1, 2, 3]})
 
@@ -2227,7 +2700,7 @@ class TestBaseSingleTableSynthesizer:
 
         # Assert
         instance._sample_with_progress_bar.assert_called_once_with(
-            10, 50, 5, 'temp.csv', show_progress_bar=True
+            10, 50, 5, 'temp.csv', show_progress_bar=True, n_jobs=None
         )
         instance._check_input_metadata_updated.assert_called_once_with()
         pd.testing.assert_frame_equal(result, pd.DataFrame({'col': [1, 2, 3]}))
@@ -2241,6 +2714,143 @@ class TestBaseSingleTableSynthesizer:
             'TOTAL NUMBER OF COLUMNS': 1,
         })
 
+    def test_sample_iter(self):
+        """Test that ``sample_iter`` validates the inputs and returns the batch generator."""
+        # Setup
+        instance = Mock()
+        instance._data_processor._constraints = []
+
+        # Run
+        result = BaseSingleTableSynthesizer.sample_iter(instance, 10, 5, max_tries_per_batch=50)
+
+        # Assert
+        assert result == instance._sample_iter.return_value
+        instance._validate_fit_before_sample.assert_called_once_with()
+        instance._check_input_metadata_updated.assert_called_once_with()
+        instance._sample_iter.assert_called_once_with(10, 5, 50, True)
+
+    @pytest.mark.parametrize('batch_size', [None, 0, -1, 2.5])
+    def test_sample_iter_invalid_batch_size(self, batch_size):
+        """Test that ``sample_iter`` raises an error if the batch size is not valid."""
+        # Setup
+        instance = Mock()
+        expected_message = re.escape(f"Invalid value '{batch_size}' for parameter 'batch_size'.")
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=expected_message):
+            BaseSingleTableSynthesizer.sample_iter(instance, 10, batch_size)
+
+    @patch('sdv.single_table.base.tqdm')
+    @patch('sdv.single_table.base.datetime')
+    def test__sample_iter(self, mock_datetime, mock_tqdm, caplog):
+        """Test that the batches are yielded one by one and the sample is logged at the end."""
+        # Setup
+        mock_datetime.datetime.now.return_value = '2024-04-19 16:20:10.037183'
+        progress_bar = MagicMock()
+        mock_tqdm.tqdm.return_value = progress_bar
+        instance = Mock(
+            _synthesizer_id='BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5',
+            _original_columns=pd.Index([]),
+        )
+        instance._profile_sampling = MagicMock()
+        instance._sample_batch.side_effect = [
+            pd.DataFrame({'col': [1, 2]}),
+            pd.DataFrame({'col': []}),
+            pd.DataFrame({'col': [3]}),
+        ]
+
+        # Run
+        with catch_sdv_logs(caplog, logging.INFO, logger='SingleTableSynthesizer'):
+            batches = list(BaseSingleTableSynthesizer._sample_iter(instance, 5, 2, 50, False))
+
+        # Assert
+        assert len(batches) == 2
+        pd.testing.assert_frame_equal(batches[0], pd.DataFrame({'col': [1, 2]}))
+        pd.testing.assert_frame_equal(batches[1], pd.DataFrame({'col': [3]}, index=[2]))
+        assert instance._sample_batch.call_args_list == [
+            call(batch_size=2, max_tries=50, progress_bar=progress_bar.__enter__.return_value),
+            call(batch_size=2, max_tries=50, progress_bar=progress_bar.__enter__.return_value),
+            call(batch_size=1, max_tries=50, progress_bar=progress_bar.__enter__.return_value),
+        ]
+        mock_tqdm.tqdm.assert_called_once_with(total=5, disable=True)
+        assert caplog.messages[0] == str({
+            'EVENT': 'Sample',
+            'TIMESTAMP': '2024-04-19 16:20:10.037183',
+            'SYNTHESIZER CLASS NAME': 'Mock',
+            'SYNTHESIZER ID': 'BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5',
+            'TOTAL NUMBER OF TABLES': 1,
+            'TOTAL NUMBER OF ROWS': 3,
+            'TOTAL NUMBER OF COLUMNS': 1,
+        })
+
+    @patch('sdv.single_table.base.datetime')
+    def test_asample(self, mock_datetime, caplog):
+        """Test that the rows are sampled by the sampler and their keys are generated again."""
+        # Setup
+        mock_datetime.datetime.now.return_value = '2024-04-19 16:20:10.037183'
+        instance = Mock(
+            _synthesizer_id='BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5',
+            _original_columns=pd.Index(['A']),
+        )
+        sampler = Mock()
+        sampler._run = AsyncMock(return_value=pd.DataFrame({'col': [1, 2, 3]}))
+
+        # Run
+        with catch_sdv_logs(caplog, logging.INFO, logger='SingleTableSynthesizer'):
+            result = asyncio.run(
+                BaseSingleTableSynthesizer.asample(instance, 3, 50, 2, sampler=sampler)
+            )
+
+        # Assert
+        instance._validate_fit_before_sample.assert_called_once_with()
+        instance._check_input_metadata_updated.assert_called_once_with()
+        sampler._run.assert_awaited_once_with(
+            '_sample_with_progress_bar',
+            3,
+            50,
+            2,
+            None,
+            False,
+            postprocess=instance._data_processor.regenerate_anonymized_columns,
+        )
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'A': [1, 2, 3]}))
+        assert caplog.messages[0] == str({
+            'EVENT': 'Sample',
+            'TIMESTAMP': '2024-04-19 16:20:10.037183',
+            'SYNTHESIZER CLASS NAME': 'Mock',
+            'SYNTHESIZER ID': 'BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5',
+            'TOTAL NUMBER OF TABLES': 1,
+            'TOTAL NUMBER OF ROWS': 3,
+            'TOTAL NUMBER OF COLUMNS': 1,
+        })
+
+    @patch('sdv.single_table.base.get_default_async_sampler')
+    def test_asample_default_sampler(self, mock_get_default_async_sampler):
+        """Test that the default sampler of the synthesizer is used if none is given."""
+        # Setup
+        instance = Mock(_original_columns=pd.Index([]))
+        sampler = mock_get_default_async_sampler.return_value
+        sampler._run = AsyncMock(return_value=pd.DataFrame({'col': [1]}))
+
+        # Run
+        result = asyncio.run(BaseSingleTableSynthesizer.asample(instance, 1))
+
+        # Assert
+        mock_get_default_async_sampler.assert_called_once_with(instance)
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'col': [1]}))
+
+    def test_asample_num_rows_none(self):
+        """Test that an error is raised if ``num_rows`` is ``None``."""
+        # Setup
+        instance = Mock()
+        expected_message = re.escape(
+            'You must specify the number of rows to sample (e.g. num_rows=100).'
+        )
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=expected_message):
+            asyncio.run(BaseSingleTableSynthesizer.asample(instance, None))
+
     @patch('sdv.single_table.base.datetime')
     def test_sample_warns_if_metadata_updated(self, mock_datetime, caplog):
         """Test that if we call sample with updated metadata a warning will be shown."""
@@ -2441,7 +3051,7 @@ class TestBaseSingleTableSynthesizer:
             'max_tries_per_batch': 10,
             'batch_size': 10,
             'progress_bar': None,
-            'output_file_path': None,
+            'output_sink': None,
             'keep_extra_columns': False,
         }
         assert second_call_kwargs == {
@@ -2450,7 +3060,7 @@ class TestBaseSingleTableSynthesizer:
             'max_tries_per_batch': 10,
             'batch_size': 10,
             'progress_bar': None,
-            'output_file_path': None,
+            'output_sink': None,
             'keep_extra_columns': False,
         }
 
@@ -2490,13 +3100,12 @@ class TestBaseSingleTableSynthesizer:
         # Assert
         pd.testing.assert_frame_equal(result, pd.DataFrame())
 
-    @patch('sdv.single_table.base.os')
     @patch('sdv.single_table.base.check_num_rows')
     @patch('sdv.single_table.base.DataProcessor')
     @patch('sdv.single_table.base.tqdm')
     @patch('sdv.single_table.base.validate_file_path')
     def test_sample_from_conditions(
-        self, mock_validate_file_path, mock_tqdm, mock_data_processor, mock_check_num_rows, mock_os
+        self, mock_validate_file_path, mock_tqdm, mock_data_processor, mock_check_num_rows
     ):
         """Test sample conditions with sampled data and reject sampling.
 
@@ -2527,6 +3136,63 @@ class TestBaseSingleTableSynthesizer:
         # Assert
         pd.testing.assert_frame_equal(result, pd.DataFrame({'name': ['John Doe']}))
 
+    def test__sample_condition_dataframes(self):
+        """Test that every condition dataframe is sampled and the results are concatenated."""
+        # Setup
+        instance = Mock()
+        instance._sample_with_conditions.side_effect = [
+            pd.DataFrame({'name': ['John Doe']}, index=[3]),
+            pd.DataFrame({'name': ['Jane Doe']}, index=[3]),
+        ]
+        conditions = [pd.DataFrame({'name': ['John Doe']}), pd.DataFrame({'name': ['Jane Doe']})]
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_condition_dataframes(
+            instance, conditions, 50, 10
+        )
+
+        # Assert
+        assert instance._sample_with_conditions.call_args_list == [
+            call(conditions[0], 50, 10),
+            call(conditions[1], 50, 10),
+        ]
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'name': ['John Doe', 'Jane Doe']}))
+
+    @patch('sdv.single_table.base.check_num_rows')
+    def test_asample_from_conditions(self, mock_check_num_rows):
+        """Test that the conditions are validated and sampled by the sampler."""
+        # Setup
+        instance = Mock()
+        instance._model = GaussianMultivariate()
+        condition_dataframes = [pd.DataFrame({'name': ['John Doe'] * 2, 'age': [30, 30]})]
+        instance._make_condition_dfs.return_value = condition_dataframes
+        sampled = pd.DataFrame({'name': ['John Doe'] * 2, 'age': [30, 30], 'id': [0, 1]})
+        sampler = Mock()
+        sampler._run = AsyncMock(return_value=sampled)
+        conditions = [Condition({'name': 'John Doe', 'age': 30}, num_rows=2)]
+
+        # Run
+        result = asyncio.run(
+            BaseSingleTableSynthesizer.asample_from_conditions(
+                instance, conditions, 50, 10, sampler=sampler
+            )
+        )
+
+        # Assert
+        assert result is sampled
+        instance._validate_fit_before_sample.assert_called_once_with()
+        instance._make_condition_dfs.assert_called_once_with(conditions)
+        instance._validate_conditions.assert_called_once_with(condition_dataframes)
+        sampler._run.assert_awaited_once_with(
+            '_sample_condition_dataframes', condition_dataframes, 50, 10, postprocess=ANY
+        )
+        postprocess = sampler._run.call_args.kwargs['postprocess']
+        assert postprocess.func == instance._data_processor.regenerate_anonymized_columns
+        assert postprocess.keywords == {'exclude_columns': {'name', 'age'}}
+        mock_check_num_rows.assert_called_once_with(
+            num_rows=2, expected_num_rows=2, is_reject_sampling=False, max_tries_per_batch=50
+        )
+
     @patch('sdv.single_table.base.handle_sampling_error')
     @patch('sdv.single_table.base.tqdm')
     @patch('sdv.single_table.base.validate_file_path')
@@ -2538,6 +3204,7 @@ class TestBaseSingleTableSynthesizer:
         progress_bar = MagicMock()
         mock_tqdm.tqdm.return_value = progress_bar
         instance = Mock()
+        instance._profile_sampling = MagicMock()
         instance._make_condition_dfs.side_effect = lambda x: x
         conditions = [Condition({'name': 'John Doe'})]
         keyboard_error = KeyboardInterrupt()
@@ -2558,13 +3225,12 @@ class TestBaseSingleTableSynthesizer:
         )
         mock_handle_sampling_error.assert_called_once_with('temp_file', keyboard_error)
 
-    @patch('sdv.single_table.base.os')
     @patch('sdv.single_table.base.check_num_rows')
     @patch('sdv.single_table.base.DataProcessor')
     @patch('sdv.single_table.base.tqdm')
     @patch('sdv.single_table.base.validate_file_path')
     def test_sample_remaining_columns(
-        self, mock_validate_file_path, mock_tqdm, mock_data_processor, mock_check_num_rows, mock_os
+        self, mock_validate_file_path, mock_tqdm, mock_data_processor, mock_check_num_rows
     ):
         """Test the this method calls ``_sample_with_conditions`` with the ``known_column."""
         # Setup
@@ -2658,6 +3324,7 @@ class TestBaseSingleTableSynthesizer:
         """Test that ``sample`` calls ``_validate_fit_before_sample``."""
         # Setup
         instance = Mock()
+        instance._profile_sampling = MagicMock()
         instance._fitted = True
         instance._check_input_metadata_updated = Mock()
         instance._sample_with_progress_bar = Mock(return_value=pd.DataFrame())
@@ -1,15 +1,26 @@
+import pickle
 import re
+from collections import OrderedDict
 from unittest.mock import Mock, call, patch
 
 import numpy as np
 import pandas as pd
 import pytest
 import scipy
-from copulas.univariate import BetaUnivariate, GammaUnivariate, TruncatedGaussian, UniformUnivariate
-
+from copulas.multivariate import GaussianMultivariate
+from copulas.univariate import (
+    BetaUnivariate,
+    GammaUnivariate,
+    GaussianUnivariate,
+    TruncatedGaussian,
+    UniformUnivariate,
+)
+
+from sdv.cag import FixedCombinations
 from sdv.errors import SynthesizerInputError
 from sdv.metadata.metadata import Metadata
-from sdv.single_table.copulas import GaussianCopulaSynthesizer
+from sdv.single_table.copulas import GaussianCopulaSynthesizer, LowRankGaussianMultivariate
+from sdv.single_table.utils import _fit_univariates_in_worker
 
 
 class TestGaussianCopulaSynthesizer:
@@ -59,6 +70,8 @@ class TestGaussianCopulaSynthesizer:
         assert instance._default_distribution == BetaUnivariate
         assert instance._numerical_distributions == {}
         assert instance._num_rows is None
+        assert instance.precision == 'float64'
+        assert instance._data_processor._precision == 'float64'
 
     def test___init__with_unified_metadata(self):
         """Test creating an instance of ``GaussianCopulaSynthesizer`` with Metadata."""
@@ -115,6 +128,48 @@ class TestGaussianCopulaSynthesizer:
         assert instance._default_distribution == UniformUnivariate
         assert instance._numerical_distributions == {'field': GammaUnivariate}
 
+    def test___init__precision(self):
+        """Test that the ``precision`` is passed to the data processor."""
+        # Run
+        instance = GaussianCopulaSynthesizer(Metadata(), precision='float32')
+
+        # Assert
+        assert instance.precision == 'float32'
+        assert instance._data_processor._precision == 'float32'
+
+    def test___init__invalid_precision(self):
+        """Test that an error is raised if the ``precision`` is not supported."""
+        # Setup
+        expected_message = re.escape(
+            "Invalid value 'float16' for parameter 'precision'. Please provide one of "
+            "['float64', 'float32']."
+        )
+
+        # Run and Assert
+        with pytest.raises(SynthesizerInputError, match=expected_message):
+            GaussianCopulaSynthesizer(Metadata(), precision='float16')
+
+    def test___init__correlation_rank(self):
+        """Test that the ``correlation_rank`` is stored."""
+        # Run
+        instance = GaussianCopulaSynthesizer(Metadata(), correlation_rank=0.5)
+
+        # Assert
+        assert instance.correlation_rank == 0.5
+
+    @pytest.mark.parametrize('correlation_rank', [0, -1, 1.0, 0.0, True, '5'])
+    def test___init__invalid_correlation_rank(self, correlation_rank):
+        """Test that an error is raised if the ``correlation_rank`` is not valid."""
+        # Setup
+        expected_message = re.escape(
+            f"Invalid value '{correlation_rank}' for parameter 'correlation_rank'. Please "
+            'provide a positive integer, a float between 0 and 1, or None.'
+        )
+
+        # Run and Assert
+        with pytest.raises(SynthesizerInputError, match=expected_message):
+            GaussianCopulaSynthesizer(Metadata(), correlation_rank=correlation_rank)
+
     def test___init__incorrect_numerical_distributions(self):
         """Test it crashes when ``numerical_distributions`` receives a non-dictionary."""
         # Setup
@@ -157,6 +212,8 @@ class TestGaussianCopulaSynthesizer:
             'locales': ['en_US'],
             'numerical_distributions': {},
             'default_distribution': 'beta',
+            'precision': 'float64',
+            'correlation_rank': None,
         }
 
     @patch('sdv.single_table.utils.warnings')
@@ -245,6 +302,8 @@ class TestGaussianCopulaSynthesizer:
         instance._get_numerical_distributions.assert_called_once_with(processed_data)
         instance._initialize_model.assert_called_once_with(numerical_distributions)
         instance._fit_model.assert_called_once_with(processed_data)
+        assert instance._conditional_factors == OrderedDict()
+        assert instance._correlation_factor is None
 
     def test__learn_num_rows(self):
         """Test that the `_learn_num_rows` method returns the correct number of rows."""
@@ -306,6 +365,569 @@ class TestGaussianCopulaSynthesizer:
         # Assert
         instance._model.fit.assert_called_once_with(processed_data)
 
+    def test__initialize_model_correlation_rank(self):
+        """Test that a ``LowRankGaussianMultivariate`` is used if ``correlation_rank`` is set."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(Metadata(), correlation_rank=3)
+
+        # Run
+        model = instance._initialize_model({'a': BetaUnivariate})
+
+        # Assert
+        assert isinstance(model, LowRankGaussianMultivariate)
+        assert model.rank == 3
+        assert model.distribution == {'a': BetaUnivariate}
+
+    def test__fit_model_low_rank_precision(self):
+        """Test that the loadings and uniqueness are stored in the ``precision``."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(
+            Metadata(), precision='float32', correlation_rank=1, default_distribution='norm'
+        )
+        processed_data = pd.DataFrame({'a': [1.0, 2.0, 3.0, 5.0], 'b': [2.0, 1.0, 4.0, 3.0]})
+        numerical_distributions = instance._get_numerical_distributions(processed_data)
+        instance._model = instance._initialize_model(numerical_distributions)
+
+        # Run
+        instance._fit_model(processed_data)
+
+        # Assert
+        assert instance._model.loadings.dtype == np.float32
+        assert instance._model.uniqueness.dtype == np.float32
+        assert instance._model.loadings.shape == (2, 1)
+
+    def test__get_parameters_low_rank(self):
+        """Test that the correlation of a low rank model is returned as a dense triangle."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(
+            Metadata(), correlation_rank=1, default_distribution='norm'
+        )
+        processed_data = pd.DataFrame({'a': [1.0, 2.0, 3.0, 5.0], 'b': [2.0, 1.0, 4.0, 3.0]})
+        numerical_distributions = instance._get_numerical_distributions(processed_data)
+        instance._model = instance._initialize_model(numerical_distributions)
+        instance._model.fit(processed_data)
+        instance._num_rows = 4
+
+        # Run
+        parameters = instance._get_parameters()
+
+        # Assert
+        correlation = instance._model.correlation.to_numpy()
+        assert parameters['correlation__0__0'] == correlation[1, 0]
+        assert parameters['num_rows'] == 4
+        assert not any(key.startswith(('loadings', 'uniqueness', 'rank')) for key in parameters)
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    @pytest.mark.parametrize(
+        'correlation_rank, value, message',
+        [
+            (None, np.nan, 'There are nan values in your data.'),
+            (1, np.nan, 'There are nan values in your data.'),
+            (1, np.inf, 'There are infinite values in your data.'),
+        ],
+    )
+    @patch('sdv.single_table.copulas.ProcessPoolExecutor')
+    def test_fit_processed_data_invalid_values(
+        self, mock_process_pool_executor, correlation_rank, value, message, n_jobs
+    ):
+        """Test that invalid data is rejected with and without fitting in parallel."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(
+            Metadata(), correlation_rank=correlation_rank, default_distribution='norm'
+        )
+        processed_data = pd.DataFrame({'a': [1.0, value, 3.0], 'b': [2.0, 1.0, 4.0]})
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=message):
+            instance.fit_processed_data(processed_data, n_jobs=n_jobs)
+
+        mock_process_pool_executor.assert_not_called()
+
+    @patch('sdv.single_table.copulas.ProcessPoolExecutor')
+    def test__fit_univariates_in_parallel(self, mock_process_pool_executor):
+        """Test that the columns are fitted in contiguous chunks, one per process."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(Metadata())
+        instance._model = Mock()
+        data = pd.DataFrame({'a': [1.0, 2.0], 'b': [2.0, 1.0], 'c': [3.0, 5.0]})
+        executor = mock_process_pool_executor.return_value.__enter__.return_value
+        executor.map.return_value = iter([(['a', 'b'], ['uni_a', 'uni_b']), (['c'], ['uni_c'])])
+
+        # Run
+        instance._fit_univariates_in_parallel(data, 2)
+
+        # Assert
+        mock_process_pool_executor.assert_called_once_with(max_workers=2)
+        method, models, chunks = executor.map.call_args[0]
+        assert method == _fit_univariates_in_worker
+        assert models == [instance._model, instance._model]
+        pd.testing.assert_frame_equal(chunks[0], data[['a', 'b']])
+        pd.testing.assert_frame_equal(chunks[1], data[['c']])
+        assert instance._model.columns == ['a', 'b', 'c']
+        assert instance._model.univariates == ['uni_a', 'uni_b', 'uni_c']
+        instance._model._get_correlation.assert_called_once_with(data)
+        assert instance._model.correlation == instance._model._get_correlation.return_value
+        assert instance._model.fitted is True
+        instance._model.fit.assert_not_called()
+
+    def test__fit_model_n_jobs(self):
+        """Test that the univariates are fitted in parallel when ``n_jobs`` is greater than 1."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(Metadata())
+        instance._model = Mock()
+        instance._n_jobs = 4
+        instance._fit_univariates_in_parallel = Mock()
+        processed_data = pd.DataFrame({'a': [1.0], 'b': [2.0]})
+
+        # Run
+        instance._fit_model(processed_data)
+
+        # Assert
+        instance._fit_univariates_in_parallel.assert_called_once_with(processed_data, 2)
+        instance._model.fit.assert_not_called()
+
+    def test__fit_model_n_jobs_matches_serial(self):
+        """Test that fitting the univariates in parallel learns the same parameters."""
+        # Setup
+        rng = np.random.default_rng(0)
+        processed_data = pd.DataFrame({
+            'beta': rng.beta(2, 5, size=200),
+            'gamma': rng.gamma(2, size=200),
+            'truncnorm': rng.normal(size=200).clip(-1, 1),
+        })
+        numerical_distributions = {'gamma': 'gamma', 'truncnorm': 'truncnorm'}
+        metadata = Metadata.detect_from_dataframe(processed_data)
+        serial = GaussianCopulaSynthesizer(
+            metadata, numerical_distributions=numerical_distributions
+        )
+        parallel = GaussianCopulaSynthesizer(
+            metadata, numerical_distributions=numerical_distributions
+        )
+
+        # Run
+        serial.fit_processed_data(processed_data)
+        parallel.fit_processed_data(processed_data, n_jobs=2)
+
+        # Assert
+        assert parallel._n_jobs == 2
+        assert parallel._model.columns == serial._model.columns
+        assert parallel._model.to_dict() == serial._model.to_dict()
+
+    def test__fit_model_precision(self):
+        """Test that the correlation matrix is stored in the ``precision`` of the synthesizer."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(Metadata(), precision='float32')
+        instance._model = Mock()
+        instance._model.correlation = pd.DataFrame(np.eye(2))
+
+        # Run
+        instance._fit_model(Mock())
+
+        # Assert
+        assert (instance._model.correlation.dtypes == np.float32).all()
+
+    def test_add_constraints_precision(self):
+        """Test that the new data processor keeps the ``precision`` of the synthesizer."""
+        # Setup
+        metadata = Metadata.load_from_dict({
+            'tables': {
+                'table': {
+                    'columns': {'a': {'sdtype': 'categorical'}, 'b': {'sdtype': 'categorical'}}
+                }
+            }
+        })
+        instance = GaussianCopulaSynthesizer(metadata, precision='float32')
+
+        # Run
+        instance.add_constraints([FixedCombinations(column_names=['a', 'b'])])
+
+        # Assert
+        assert instance._data_processor._precision == 'float32'
+
+    def test__sample(self):
+        """Test that the model samples the rows with the default ``precision``."""
+        # Setup
+        instance = Mock(precision='float64')
+
+        # Run
+        result = GaussianCopulaSynthesizer._sample(instance, 5, conditions={'a': 1})
+
+        # Assert
+        instance._sample_conditioned.assert_called_once_with(5, {'a': 1})
+        instance._sample_with_precision.assert_not_called()
+        assert result == instance._sample_conditioned.return_value
+
+    def test__sample_without_conditions(self):
+        """Test that the rows are sampled with the factor of the correlation matrix."""
+        # Setup
+        instance = Mock(precision='float64')
+
+        # Run
+        result = GaussianCopulaSynthesizer._sample(instance, 5)
+
+        # Assert
+        instance._sample_with_precision.assert_called_once_with(5, 'float64')
+        instance._model.sample.assert_not_called()
+        assert result == instance._sample_with_precision.return_value
+
+    def test__sample_precision(self):
+        """Test that the rows are sampled in the ``precision`` of the synthesizer."""
+        # Setup
+        instance = Mock(precision='float32')
+        instance._sample_conditioned.return_value = pd.DataFrame({'a': [1.0, 2.0]})
+
+        # Run
+        result = GaussianCopulaSynthesizer._sample(instance, 5)
+        result_conditions = GaussianCopulaSynthesizer._sample(instance, 2, conditions={'a': 1})
+
+        # Assert
+        instance._sample_with_precision.assert_called_once_with(5, 'float32')
+        assert result == instance._sample_with_precision.return_value
+        pd.testing.assert_frame_equal(
+            result_conditions, pd.DataFrame({'a': np.array([1.0, 2.0], dtype=np.float32)})
+        )
+
+    def test__sample_conditioned(self):
+        """Test that the rows are sampled from the conditioned distribution of the model.
+
+        The conditioned factors should be computed once for the same condition columns, and
+        the condition columns should have the condition values.
+        """
+        # Setup
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(rng.multivariate_normal([0, 0, 0], np.eye(3) * 0.2 + 0.8, 500))
+        data.columns = ['a', 'b', 'c']
+        instance = GaussianCopulaSynthesizer(Metadata(), default_distribution='norm')
+        instance._model = instance._initialize_model(instance._get_numerical_distributions(data))
+        instance._model.fit(data)
+        instance._model.set_random_state(0)
+
+        # Run
+        first = instance._sample_conditioned(5, {'b': 1.0})
+        sampled = instance._sample_conditioned(20000, {'b': 1.0})
+
+        # Assert
+        assert list(sampled.columns) == ['a', 'b', 'c']
+        assert (first['b'] == 1.0).all()
+        assert (sampled['b'] == 1.0).all()
+        assert len(instance._conditional_factors) == 1
+        means, covariance, _ = instance._model._get_conditional_distribution(
+            pd.Series(instance._model._transform_to_normal(pd.Series({'b': 1.0}))[0], index=['b'])
+        )
+        normal = instance._model._transform_to_normal(sampled)[:, [0, 2]]
+        np.testing.assert_allclose(normal.mean(axis=0), means, atol=0.02)
+        np.testing.assert_allclose(np.cov(normal.T), covariance, atol=0.02)
+
+    def test__sample_conditioned_all_columns(self):
+        """Test that conditions on every model column are left to the model to sample."""
+        # Setup
+        instance = Mock()
+        instance._model.columns = ['a', 'b']
+
+        # Run
+        sampled = GaussianCopulaSynthesizer._sample_conditioned(instance, 5, {'a': 1, 'b': 2})
+
+        # Assert
+        assert sampled == instance._model.sample.return_value
+        instance._model.sample.assert_called_once_with(5, conditions={'a': 1, 'b': 2})
+        instance._get_conditional_factors.assert_not_called()
+
+    def test__get_covariance_factor(self):
+        """Test that the factor reproduces the covariance matrix, even if it is singular."""
+        # Setup
+        covariance = np.array([[1.0, 0.5], [0.5, 1.0]])
+        singular_covariance = np.ones((2, 2))
+
+        # Run
+        factor = GaussianCopulaSynthesizer._get_covariance_factor(covariance)
+        singular_factor = GaussianCopulaSynthesizer._get_covariance_factor(singular_covariance)
+
+        # Assert
+        np.testing.assert_allclose(factor @ factor.T, covariance)
+        np.testing.assert_allclose(np.triu(factor, 1), 0)
+        np.testing.assert_allclose(singular_factor @ singular_factor.T, singular_covariance)
+
+    def test__get_correlation_factor(self):
+        """Test that the factor is computed once and reproduces ``multivariate_normal`` samples."""
+        # Setup
+        instance = Mock(_correlation_factor=None)
+        correlation = np.array([[1.0, 0.5, 0.2], [0.5, 1.0, 0.3], [0.2, 0.3, 1.0]])
+        instance._model.correlation = pd.DataFrame(correlation)
+
+        # Run
+        factor = GaussianCopulaSynthesizer._get_correlation_factor(instance)
+        instance._model.correlation = None
+        cached = GaussianCopulaSynthesizer._get_correlation_factor(instance)
+
+        # Assert
+        assert cached is factor
+        np.testing.assert_allclose(factor.T @ factor, correlation)
+        np.random.seed(0)
+        expected = np.random.multivariate_normal(np.zeros(3), correlation, size=10)
+        np.random.seed(0)
+        np.testing.assert_array_equal(np.random.standard_normal(size=(10, 3)) @ factor, expected)
+
+    def test__sample_with_precision_float64(self):
+        """Test that the samples are the same as the ones of the model, with a cached factor."""
+        # Setup
+        data = pd.DataFrame({'a': np.linspace(0, 1, 100), 'b': np.linspace(0, 1, 100) ** 2})
+        instance = GaussianCopulaSynthesizer(Metadata())
+        instance._model = GaussianMultivariate(distribution='copulas.univariate.UniformUnivariate')
+        instance._model.fit(data)
+        np.random.seed(0)
+        expected = instance._model.sample(100)
+
+        # Run
+        np.random.seed(0)
+        result = instance._sample_with_precision(100, 'float64')
+        factor = instance._correlation_factor
+        instance._sample_with_precision(10, 'float64')
+
+        # Assert
+        pd.testing.assert_frame_equal(result, expected)
+        assert instance._correlation_factor is factor
+
+    def test__sample_with_precision(self):
+        """Test that the sampled columns follow the model in the given precision."""
+        # Setup
+        data = pd.DataFrame({'a': np.linspace(0, 1, 100), 'b': np.linspace(0, 1, 100) ** 2})
+        instance = GaussianCopulaSynthesizer(Metadata())
+        instance._model = GaussianMultivariate(distribution='copulas.univariate.UniformUnivariate')
+        instance._model.fit(data)
+        instance._model.set_random_state(0)
+
+        # Run
+        result = instance._sample_with_precision(1000, 'float32')
+
+        # Assert
+        assert list(result.columns) == ['a', 'b']
+        assert (result.dtypes == np.float32).all()
+        assert result.min().min() >= 0
+        assert result.max().max() <= 1
+        assert result.corr().loc['a', 'b'] > 0.9
+
+    def test__get_conditional_factors(self):
+        """Test the regression matrix and covariance factor of the conditioned distribution."""
+        # Setup
+        instance = Mock(_conditional_factors=OrderedDict(), _CONDITIONAL_FACTORS_CACHE_SIZE=2)
+        instance._get_covariance_factor = GaussianCopulaSynthesizer._get_covariance_factor
+        columns = ['a', 'b', 'c']
+        correlation = np.array([[1.0, 0.5, 0.2], [0.5, 1.0, 0.3], [0.2, 0.3, 1.0]])
+        instance._model.columns = columns
+        instance._model.correlation = pd.DataFrame(correlation, index=columns, columns=columns)
+
+        # Run
+        result = GaussianCopulaSynthesizer._get_conditional_factors(instance, ['b'])
+
+        # Assert
+        sampled_columns, regression, covariance_factor = result
+        assert sampled_columns == ['a', 'c']
+        np.testing.assert_allclose(regression, [[0.5], [0.3]])
+        np.testing.assert_allclose(
+            covariance_factor @ covariance_factor.T, [[0.75, 0.05], [0.05, 0.91]]
+        )
+        assert instance._conditional_factors == {frozenset(['b']): result}
+
+    def test__get_conditional_factors_singular_covariance(self):
+        """Test that a factor is found when the sampled columns are perfectly correlated."""
+        # Setup
+        instance = Mock(_conditional_factors=OrderedDict(), _CONDITIONAL_FACTORS_CACHE_SIZE=2)
+        instance._get_covariance_factor = GaussianCopulaSynthesizer._get_covariance_factor
+        columns = ['a', 'b', 'c']
+        correlation = np.array([[1.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        instance._model.columns = columns
+        instance._model.correlation = pd.DataFrame(correlation, index=columns, columns=columns)
+
+        # Run
+        _, _, covariance_factor = GaussianCopulaSynthesizer._get_conditional_factors(
+            instance, ['c']
+        )
+
+        # Assert
+        np.testing.assert_allclose(covariance_factor @ covariance_factor.T, np.ones((2, 2)))
+
+    def test__get_conditional_factors_cache(self):
+        """Test that the factors are cached by column set and the oldest ones are evicted."""
+        # Setup
+        instance = Mock(_conditional_factors=OrderedDict(), _CONDITIONAL_FACTORS_CACHE_SIZE=2)
+        instance._get_covariance_factor = GaussianCopulaSynthesizer._get_covariance_factor
+        columns = ['a', 'b', 'c']
+        instance._model.columns = columns
+        instance._model.correlation = pd.DataFrame(np.eye(3), index=columns, columns=columns)
+
+        # Run
+        first = GaussianCopulaSynthesizer._get_conditional_factors(instance, ['a', 'b'])
+        GaussianCopulaSynthesizer._get_conditional_factors(instance, ['c'])
+        cached = GaussianCopulaSynthesizer._get_conditional_factors(instance, ['b', 'a'])
+        GaussianCopulaSynthesizer._get_conditional_factors(instance, ['a'])
+
+        # Assert
+        assert cached is first
+        assert list(instance._conditional_factors) == [frozenset(['a', 'b']), frozenset(['a'])]
+
+    def test__sample_conditions_in_batch(self):
+        """Test that every row is sampled with the condition values of the same position."""
+        # Setup
+        data = pd.DataFrame({
+            'a': np.random.default_rng(0).normal(size=100),
+            'b': np.random.default_rng(1).normal(size=100),
+            'c': np.random.default_rng(2).normal(size=100),
+        })
+        instance = GaussianCopulaSynthesizer(Metadata())
+        instance._model = GaussianMultivariate(distribution='copulas.univariate.GaussianUnivariate')
+        instance._model.fit(data)
+        instance._model.set_random_state(0)
+        transformed_conditions = pd.DataFrame({'c': [0.1, 0.2, 0.1], 'a': [-1.0, 1.0, -1.0]})
+
+        # Run
+        result = instance._sample_conditions_in_batch(transformed_conditions)
+
+        # Assert
+        assert list(result.columns) == ['a', 'b', 'c']
+        np.testing.assert_array_equal(result['a'], [-1.0, 1.0, -1.0])
+        np.testing.assert_array_equal(result['c'], [0.1, 0.2, 0.1])
+        assert result['b'].notna().all()
+
+    def test__filter_matching_conditions(self):
+        """Test that only the rows matching the conditions of the same position are kept."""
+        # Setup
+        sampled = pd.DataFrame({
+            'category': ['a', 'b', 'a', 'b'],
+            'amount': [10.05, 20.0, 30.0, 40.0],
+        })
+        conditions = pd.DataFrame({'category': ['a', 'a', 'a', 'b'], 'amount': [10, 20, 35, 40]})
+
+        # Run
+        result = GaussianCopulaSynthesizer._filter_matching_conditions(
+            sampled, conditions, float_rtol=0.01
+        )
+
+        # Assert
+        expected = pd.DataFrame({'category': ['a', 'b'], 'amount': [10.0, 40.0]}, index=[0, 3])
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test__filter_matching_conditions_preserves_dtypes(self):
+        """Test that the matched rows keep the categorical and arrow dtypes of the sample."""
+        # Setup
+        sampled = pd.DataFrame({
+            'category': pd.Series(['a', 'b', 'a'], dtype='category'),
+            'amount': pd.Series([10.05, 20.0, 30.0], dtype='double[pyarrow]'),
+        })
+        conditions = pd.DataFrame({'category': ['a', 'a', 'a'], 'amount': [10, 20, 30]})
+
+        # Run
+        result = GaussianCopulaSynthesizer._filter_matching_conditions(
+            sampled, conditions, float_rtol=0.01
+        )
+
+        # Assert
+        expected = pd.DataFrame({
+            'category': pd.Series(pd.Categorical(['a', 'a'], categories=['a', 'b']), index=[0, 2]),
+            'amount': pd.Series([10.0, 30.0], index=[0, 2], dtype='double[pyarrow]'),
+        })
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test__can_sample_conditions_in_batch(self):
+        """Test the conditions that can be sampled in a single pass over the model."""
+        # Setup
+        instance = Mock(_chained_constraints=[])
+        instance._data_processor._constraints = []
+        instance._data_processor.metadata.columns = {
+            'category': {'sdtype': 'categorical'},
+            'amount': {'sdtype': 'numerical'},
+            'date': {'sdtype': 'datetime'},
+        }
+        conditions = pd.DataFrame({'category': ['a', 'b'], 'amount': [1.0, 2.0]})
+
+        # Run
+        result = GaussianCopulaSynthesizer._can_sample_conditions_in_batch(
+            instance, conditions, False
+        )
+        result_extra_columns = GaussianCopulaSynthesizer._can_sample_conditions_in_batch(
+            instance, conditions, True
+        )
+        result_nans = GaussianCopulaSynthesizer._can_sample_conditions_in_batch(
+            instance, pd.DataFrame({'amount': [1.0, np.nan]}), False
+        )
+        result_datetime = GaussianCopulaSynthesizer._can_sample_conditions_in_batch(
+            instance, pd.DataFrame({'date': ['2020-01-01']}), False
+        )
+        instance._chained_constraints = [Mock()]
+        result_constraints = GaussianCopulaSynthesizer._can_sample_conditions_in_batch(
+            instance, conditions, False
+        )
+
+        # Assert
+        assert result is True
+        assert result_extra_columns is False
+        assert result_nans is False
+        assert result_datetime is False
+        assert result_constraints is False
+
+    @patch('sdv.single_table.copulas.BaseSingleTableSynthesizer._sample_with_conditions')
+    def test__sample_with_conditions_not_in_batch(self, mock_sample_with_conditions):
+        """Test that the conditions are sampled by group when they can not be batched."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(Metadata())
+        instance._can_sample_conditions_in_batch = Mock(return_value=False)
+        conditions = pd.DataFrame({'a': [1, 2]})
+
+        # Run
+        result = instance._sample_with_conditions(conditions, 100, None)
+
+        # Assert
+        assert result == mock_sample_with_conditions.return_value
+        mock_sample_with_conditions.assert_called_once_with(
+            conditions,
+            100,
+            None,
+            progress_bar=None,
+            output_sink=None,
+            keep_extra_columns=False,
+        )
+
+    @patch('sdv.single_table.copulas.BaseSingleTableSynthesizer._sample_with_conditions')
+    def test__sample_with_conditions_in_batch(self, mock_sample_with_conditions):
+        """Test that the conditions are sampled together and the unmatched rows by group."""
+        # Setup
+        instance = GaussianCopulaSynthesizer(Metadata())
+        instance._model = Mock(columns=['a', 'b'])
+        instance._data_processor = Mock()
+        instance._can_sample_conditions_in_batch = Mock(return_value=True)
+        instance._transform_conditions = Mock(return_value=pd.DataFrame({'a': [0.1, 0.2]}))
+        instance._set_random_state = Mock()
+        instance._sample_conditions_in_batch = Mock(
+            return_value=pd.DataFrame({'a': [0.1, 0.2, 0.1], 'b': [0.5, 0.6, 0.7]})
+        )
+        instance._data_processor.reverse_transform.return_value = pd.DataFrame({
+            'a': ['x', 'y', 'y'],
+            'b': [5, 6, 7],
+        })
+        instance._data_processor.filter_valid.side_effect = lambda data: data
+        unmatched_rows = pd.DataFrame({'a': ['x'], 'b': [8]}, index=[12])
+        mock_sample_with_conditions.return_value = unmatched_rows
+        conditions = pd.DataFrame({'a': ['x', 'y', 'x']}, index=[10, 11, 12])
+        progress_bar = Mock()
+        output_sink = Mock()
+
+        # Run
+        result = instance._sample_with_conditions(
+            conditions, 100, None, progress_bar=progress_bar, output_sink=output_sink
+        )
+
+        # Assert
+        transformed_conditions = instance._sample_conditions_in_batch.call_args[0][0]
+        expected_transformed = pd.DataFrame({'a': [0.1, 0.2, 0.1]})
+        pd.testing.assert_frame_equal(transformed_conditions, expected_transformed)
+        instance._set_random_state.assert_called_once_with(73251)
+        pd.testing.assert_frame_equal(
+            mock_sample_with_conditions.call_args[0][0], conditions.loc[[12]]
+        )
+        expected = pd.DataFrame({'a': ['x', 'y', 'x'], 'b': [5, 6, 8]}, index=[10, 11, 12])
+        pd.testing.assert_frame_equal(result, expected)
+        progress_bar.update.assert_called_once_with(2)
+        pd.testing.assert_frame_equal(output_sink.write.call_args[0][0], expected.head(2))
+
     def test__get_nearest_correlation_matrix_valid(self):
         """Test ``_get_nearest_correlation_matrix`` with a psd input.
 
@@ -366,6 +988,87 @@ class TestGaussianCopulaSynthesizer:
         assert (not_psd_eigenvalues < 0).any()
         assert (output_eigenvalues >= 0).all()
 
+    def test__get_nearest_correlation_matrix_singular(self):
+        """Test that a singular PSD matrix is not modified.
+
+        The Cholesky decomposition fails for singular matrices, so the eigenvalues are used
+        to check that the matrix is PSD within the tolerance.
+        """
+        # Setup
+        singular_matrix = np.array([
+            [1.0, 0.5, 1.0],
+            [0.5, 1.0, 0.5],
+            [1.0, 0.5, 1.0],
+        ])
+
+        # Run
+        output = GaussianCopulaSynthesizer._get_nearest_correlation_matrix(singular_matrix)
+
+        # Assert
+        assert output is singular_matrix
+
+    def test__get_nearest_correlation_matrix_unit_diagonal(self):
+        """Test that the repaired matrix is PSD, has 1s in the diagonal and is symmetric."""
+        # Setup
+        not_psd_matrix = np.array([
+            [1.0, 0.9, -0.9],
+            [0.9, 1.0, 0.9],
+            [-0.9, 0.9, 1.0],
+        ])
+
+        # Run
+        output = GaussianCopulaSynthesizer._get_nearest_correlation_matrix(not_psd_matrix)
+
+        # Assert
+        np.testing.assert_array_equal(np.diag(output), [1.0, 1.0, 1.0])
+        np.testing.assert_array_equal(output, output.T)
+        assert np.linalg.eigvalsh(output).min() > -1e-12
+        assert np.abs(output - not_psd_matrix).max() < 0.5
+
+    def test__get_nearest_correlation_matrix_tolerance(self):
+        """Test that eigenvalues above ``-tolerance`` are considered non negative."""
+        # Setup
+        matrix = np.array([
+            [1.0, 1.0 + 1e-4],
+            [1.0 + 1e-4, 1.0],
+        ])
+
+        # Run
+        output = GaussianCopulaSynthesizer._get_nearest_correlation_matrix(matrix, tolerance=1e-3)
+        repaired = GaussianCopulaSynthesizer._get_nearest_correlation_matrix(matrix)
+
+        # Assert
+        assert output is matrix
+        np.testing.assert_allclose(repaired, [[1.0, 1.0], [1.0, 1.0]])
+
+    def test__get_nearest_correlation_matrix_batch(self):
+        """Test that many matrices can be repaired at once, leaving the valid ones unmodified."""
+        # Setup
+        valid_matrix = np.array([
+            [1.0, 0.5, 0.2],
+            [0.5, 1.0, 0.3],
+            [0.2, 0.3, 1.0],
+        ])
+        not_psd_matrix = np.array([
+            [1.0, 0.9, -0.9],
+            [0.9, 1.0, 0.9],
+            [-0.9, 0.9, 1.0],
+        ])
+        matrices = np.stack([valid_matrix, not_psd_matrix, np.identity(3) * [1, 1, -1]])
+
+        # Run
+        output = GaussianCopulaSynthesizer._get_nearest_correlation_matrix(matrices)
+
+        # Assert
+        assert output.shape == (3, 3, 3)
+        np.testing.assert_array_equal(output[0], valid_matrix)
+        np.testing.assert_allclose(
+            output[1],
+            GaussianCopulaSynthesizer._get_nearest_correlation_matrix(not_psd_matrix),
+        )
+        np.testing.assert_allclose(output[2], np.identity(3))
+        np.testing.assert_array_equal(matrices[1], not_psd_matrix)
+
     def test__rebuild_correlation_matrix_valid(self):
         """Test ``_rebuild_correlation_matrix`` with a valid correlation input.
 
@@ -406,6 +1109,21 @@ class TestGaussianCopulaSynthesizer:
         expected = [[1.0, 0.5, 1.0], [0.5, 1.0, 0.5], [1.0, 0.5, 1.0]]
         assert expected == correlation
 
+    def test__rebuild_correlation_matrices(self):
+        """Test ``_rebuild_correlation_matrices`` rebuilds every matrix independently."""
+        # Setup
+        lower_triangles = np.array([[0.1, 0.2, 0.3], [1.0, 2.0, 1.0]])
+
+        # Run
+        correlations = GaussianCopulaSynthesizer._rebuild_correlation_matrices(lower_triangles, 3)
+
+        # Assert
+        expected = np.array([
+            [[1.0, 0.1, 0.2], [0.1, 1.0, 0.3], [0.2, 0.3, 1.0]],
+            [[1.0, 0.5, 1.0], [0.5, 1.0, 0.5], [1.0, 0.5, 1.0]],
+        ])
+        np.testing.assert_allclose(correlations, expected)
+
     def test__rebuild_gaussian_copula(self):
         """Test the ``GaussianCopulaSynthesizer._rebuild_gaussian_copula`` method.
 
@@ -527,6 +1245,8 @@ class TestGaussianCopulaSynthesizer:
         model = mock_multivariate.GaussianMultivariate.from_dict.return_value
         assert instance._model == model
         assert instance._num_rows == 5
+        assert instance._conditional_factors == OrderedDict()
+        assert instance._correlation_factor is None
         mock_multivariate.GaussianMultivariate.from_dict.assert_called_once_with(
             instance._rebuild_gaussian_copula.return_value
         )
@@ -627,3 +1347,183 @@ class TestGaussianCopulaSynthesizer:
         # Assert
         assert result == instance._model.probability_density.return_value
         instance._model.probability_density.assert_called_once_with(table_rows)
+
+
+class TestLowRankGaussianMultivariate:
+    def _get_data(self, num_rows=500, num_columns=30, rank=3):
+        rng = np.random.default_rng(0)
+        loadings = rng.normal(size=(num_columns, rank))
+        normal = rng.normal(size=(num_rows, rank)) @ loadings.T
+        normal += rng.normal(size=(num_rows, num_columns))
+        columns = [f'col_{index}' for index in range(num_columns)]
+        return pd.DataFrame(normal, columns=columns)
+
+    def test_fit(self):
+        """Test that the correlation matrix is valid and close to the one of the data.
+
+        The loadings should match the top eigenpairs of the dense correlation matrix, and the
+        diagonal of the matrix should be 1s.
+        """
+        # Setup
+        data = self._get_data()
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=3)
+        dense_model = GaussianMultivariate(distribution=GaussianUnivariate)
+        dense_model.fit(data)
+
+        # Run
+        model.fit(data)
+
+        # Assert
+        correlation = model.correlation.to_numpy()
+        dense_correlation = dense_model.correlation.to_numpy()
+        eigenvalues = np.linalg.eigvalsh(dense_correlation)[::-1]
+        assert model.loadings.shape == (30, 3)
+        np.testing.assert_allclose(np.diag(correlation), 1)
+        assert np.linalg.eigvalsh(correlation).min() > 0
+        np.testing.assert_allclose(
+            np.linalg.svd(model.loadings, compute_uv=False) ** 2, eigenvalues[:3], rtol=1e-6
+        )
+        assert np.abs(correlation - dense_correlation).max() < 0.2
+        assert list(model.correlation.columns) == list(data.columns)
+
+    def test_fit_explained_variance(self):
+        """Test that the rank is the smallest that explains the fraction of the variance."""
+        # Setup
+        data = self._get_data(num_columns=60)
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=0.8)
+        model._INITIAL_RANK = 2
+        dense_model = GaussianMultivariate(distribution=GaussianUnivariate)
+        dense_model.fit(data)
+        eigenvalues = np.linalg.eigvalsh(dense_model.correlation.to_numpy())[::-1]
+        expected_rank = np.searchsorted(np.cumsum(eigenvalues) / eigenvalues.sum(), 0.8) + 1
+
+        # Run
+        model.fit(data)
+
+        # Assert
+        assert model.loadings.shape == (60, expected_rank)
+
+    def test_fit_constant_column(self):
+        """Test that a constant column is not correlated with the others."""
+        # Setup
+        data = self._get_data(num_columns=5).assign(constant=1.0)
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=2)
+
+        # Run
+        model.fit(data)
+
+        # Assert
+        np.testing.assert_array_equal(model.loadings[-1], [0, 0])
+        assert model.uniqueness[-1] == 1
+
+    @pytest.mark.parametrize(
+        'value, message',
+        [(np.nan, 'There are nan values in your data.'), (np.inf, 'There are infinite values')],
+    )
+    def test_fit_invalid_values(self, value, message):
+        """Test that missing and infinite values raise an error instead of being fitted."""
+        # Setup
+        data = self._get_data(num_columns=5)
+        data.loc[3, 'col_1'] = value
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=2)
+
+        # Run and Assert
+        with pytest.raises(ValueError, match=message):
+            model.fit(data)
+
+    def test__get_top_eigenpairs(self):
+        """Test that the randomized eigenpairs are the same as the exact ones."""
+        # Setup
+        data = self._get_data(num_columns=80).to_numpy()
+        data = (data - data.mean(axis=0)) / data.std(axis=0) / np.sqrt(len(data))
+        model = LowRankGaussianMultivariate(rank=3)
+        eigenvalues, eigenvectors = np.linalg.eigh(data.T @ data)
+
+        # Run
+        result_values, result_vectors = model._get_top_eigenpairs(data, 3)
+
+        # Assert
+        np.testing.assert_allclose(result_values, eigenvalues[::-1][:3], rtol=1e-6)
+        np.testing.assert_allclose(
+            np.abs(result_vectors.T @ eigenvectors[:, ::-1][:, :3]), np.eye(3), atol=1e-4
+        )
+
+    def test_sample(self):
+        """Test that the samples follow the low rank correlation matrix."""
+        # Setup
+        data = self._get_data(num_columns=10, rank=2)
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=2, random_state=0)
+        model.fit(data)
+
+        # Run
+        sampled = model.sample(20000)
+
+        # Assert
+        assert list(sampled.columns) == list(data.columns)
+        np.testing.assert_allclose(
+            np.corrcoef(sampled.to_numpy().T), model.correlation.to_numpy(), atol=0.05
+        )
+
+    def test_sample_conditions(self):
+        """Test that sampling with conditions uses the dense correlation matrix."""
+        # Setup
+        data = self._get_data(num_columns=4, rank=1)
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=1)
+        model.fit(data)
+
+        # Run
+        sampled = model.sample(10, conditions={'col_0': 1.5})
+
+        # Assert
+        assert (sampled['col_0'] == 1.5).all()
+        assert sampled.shape == (10, 4)
+
+    def test__sample_normal_dtype(self):
+        """Test that the samples are drawn in the given dtype."""
+        # Setup
+        model = LowRankGaussianMultivariate(rank=1)
+        model.columns = ['a', 'b']
+        model.loadings = np.array([[0.5], [0.5]])
+        model.uniqueness = np.array([0.75, 0.75])
+
+        # Run
+        samples = model._sample_normal(3, dtype='float32')
+
+        # Assert
+        assert samples.dtype == np.float32
+        assert samples.shape == (3, 2)
+
+    def test_to_dict_from_dict(self):
+        """Test that the model is recreated from its parameters."""
+        # Setup
+        data = self._get_data(num_columns=5)
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=2)
+        model.fit(data)
+
+        # Run
+        parameters = model.to_dict()
+        new_model = LowRankGaussianMultivariate.from_dict(parameters)
+
+        # Assert
+        assert parameters['rank'] == 2
+        assert parameters['type'] == 'sdv.single_table.copulas.LowRankGaussianMultivariate'
+        assert 'correlation' not in parameters
+        assert new_model.rank == 2
+        assert new_model.columns == model.columns
+        np.testing.assert_array_equal(new_model.loadings, model.loadings)
+        pd.testing.assert_frame_equal(new_model.correlation, model.correlation)
+
+    def test___getstate__(self):
+        """Test that the dense correlation matrix is not pickled."""
+        # Setup
+        data = self._get_data(num_columns=5)
+        model = LowRankGaussianMultivariate(distribution=GaussianUnivariate, rank=2)
+        model.fit(data)
+        correlation = model.correlation
+
+        # Run
+        loaded = pickle.loads(pickle.dumps(model))
+
+        # Assert
+        assert '_correlation' not in loaded.__dict__
+        pd.testing.assert_frame_equal(loaded.correlation, correlation)
@@ -1,19 +1,24 @@
 import warnings
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from sdv.metadata.single_table import SingleTableMetadata
+from sdv.single_table import utils
 from sdv.single_table.utils import (
+    _fit_univariates_in_worker,
+    _initialize_sampling_worker,
     _key_order,
+    _sample_batch_in_worker,
     check_num_rows,
     detect_discrete_columns,
     flatten_array,
     flatten_dict,
     handle_sampling_error,
     unflatten_dict,
+    update_reservoir_sample,
     validate_file_path,
     warn_missing_numerical_distributions,
 )
@@ -355,6 +360,62 @@ def test_validate_file_path_permission_error(mock_open):
     assert any('Permission denied' in str(warning.message) for warning in warned)
 
 
+@patch('sdv.single_table.utils.cloudpickle')
+def test__initialize_sampling_worker_and__sample_batch_in_worker(mock_cloudpickle):
+    """Test that the worker loads the synthesizer once and seeds it for every batch."""
+    # Setup
+    synthesizer = Mock(_sampling_profiler=None)
+    mock_cloudpickle.loads.return_value = synthesizer
+
+    # Run
+    _initialize_sampling_worker(b'synthesizer')
+    result = _sample_batch_in_worker(10, 50, 123)
+
+    # Assert
+    mock_cloudpickle.loads.assert_called_once_with(b'synthesizer')
+    assert utils._WORKER_SYNTHESIZER is synthesizer
+    synthesizer._set_sampling_seed.assert_called_once_with(123)
+    synthesizer._sample_batch.assert_called_once_with(batch_size=10, max_tries=50)
+    assert result == (synthesizer._sample_batch.return_value, None)
+    utils._WORKER_SYNTHESIZER = None
+
+
+def test__sample_batch_in_worker_profiling():
+    """Test that the stages of the batch are recorded and returned with the sampled data."""
+    # Setup
+    synthesizer = Mock()
+    profiler = synthesizer._sampling_profiler
+    profiler.records = [{'stage': 'model_sample'}]
+    utils._WORKER_SYNTHESIZER = synthesizer
+
+    # Run
+    result = _sample_batch_in_worker(10, 50, 123)
+
+    # Assert
+    assert result == (synthesizer._sample_batch.return_value, [{'stage': 'model_sample'}])
+    assert synthesizer.mock_calls == [
+        call._set_sampling_seed(123),
+        call._sampling_profiler.start(),
+        call._sample_batch(batch_size=10, max_tries=50),
+        call._sampling_profiler.stop(),
+    ]
+    utils._WORKER_SYNTHESIZER = None
+
+
+def test__fit_univariates_in_worker():
+    """Test that the univariates of the columns are fitted by the model."""
+    # Setup
+    model = Mock()
+    data = pd.DataFrame({'a': [1.0, 2.0]})
+
+    # Run
+    result = _fit_univariates_in_worker(model, data)
+
+    # Assert
+    model._fit_columns.assert_called_once_with(data)
+    assert result == model._fit_columns.return_value
+
+
 def test_warn_missing_numerical_distributions():
     """Test the warn_missing_numerical_distributions function."""
     # Setup
@@ -368,3 +429,36 @@ def test_warn_missing_numerical_distributions():
     )
     with pytest.warns(UserWarning, match=message):
         warn_missing_numerical_distributions(numerical_distributions, processed_data_columns)
+
+
+def test_update_reservoir_sample():
+    """Test that the rows with the smallest keys are kept in their original order."""
+    # Setup
+    random_state = Mock()
+    random_state.random.side_effect = [np.array([0.5, 0.1, 0.9]), np.array([0.05, 0.7, 0.2])]
+    first_chunk = pd.DataFrame({'a': [1, 2, 3]}, index=[10, 11, 12])
+    second_chunk = pd.DataFrame({'a': [4, 5, 6]})
+
+    # Run
+    sample, keys = update_reservoir_sample(None, None, first_chunk, 2, random_state)
+    sample, keys = update_reservoir_sample(sample, keys, second_chunk, 2, random_state)
+
+    # Assert
+    pd.testing.assert_frame_equal(sample, pd.DataFrame({'a': [2, 4]}))
+    np.testing.assert_array_equal(keys, [0.1, 0.05])
+
+
+def test_update_reservoir_sample_smaller_than_max_rows():
+    """Test that all the rows are kept while there are less than ``max_rows``."""
+    # Setup
+    first_chunk = pd.DataFrame({'a': [1, 2]})
+    second_chunk = pd.DataFrame({'a': [3]})
+    random_state = np.random.default_rng(0)
+
+    # Run
+    sample, keys = update_reservoir_sample(None, None, first_chunk, 5, random_state)
+    sample, keys = update_reservoir_sample(sample, keys, second_chunk, 5, random_state)
+
+    # Assert
+    pd.testing.assert_frame_equal(sample, pd.DataFrame({'a': [1, 2, 3]}))
+    assert len(keys) == 3
@@ -2,6 +2,7 @@ import operator
 import re
 import string
 from datetime import datetime, timedelta, timezone
+from multiprocessing.shared_memory import SharedMemory
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -13,6 +14,7 @@ from rdt.transformers.numerical import FloatFormatter
 
 from sdv import version
 from sdv._utils import (
+    _cast_float_columns,
     _check_regex_format,
     _compare_versions,
     _convert_to_timedelta,
@@ -24,9 +26,13 @@ from sdv._utils import (
     _get_transformer_init_kwargs,
     _is_datetime_type,
     _is_numerical,
+    _read_shared_dataframe,
+    _share_dataframe,
     _validate_correct_synthesizer_loading,
     _validate_datetime_format,
     _validate_foreign_keys_not_null,
+    _validate_n_jobs,
+    _validate_precision,
     check_sdv_versions_and_warn,
     check_synthesizer_version,
     generate_synthesizer_id,
@@ -1226,3 +1232,94 @@ def test__validate_correct_synthesizer_loading():
 
     with pytest.raises(SynthesizerInputError, match=expected_message):
         _validate_correct_synthesizer_loading(synthesizer_2, GaussianCopulaSynthesizer)
+
+
+@patch('sdv._utils.os.cpu_count', return_value=8)
+def test__validate_n_jobs(mock_cpu_count):
+    """Test the number of processes returned by `_validate_n_jobs`."""
+    # Run and Assert
+    assert _validate_n_jobs(None) == 1
+    assert _validate_n_jobs(1) == 1
+    assert _validate_n_jobs(4) == 4
+    assert _validate_n_jobs(-1) == 8
+    assert _validate_n_jobs(-2) == 7
+    assert _validate_n_jobs(-20) == 1
+
+
+@pytest.mark.parametrize('n_jobs', [0, 1.5, 'all', True])
+def test__validate_n_jobs_invalid(n_jobs):
+    """Test that `_validate_n_jobs` raises an error for invalid values."""
+    # Setup
+    expected_message = re.escape(f"Invalid value '{n_jobs}' for parameter 'n_jobs'.")
+
+    # Run and Assert
+    with pytest.raises(SynthesizerInputError, match=expected_message):
+        _validate_n_jobs(n_jobs)
+
+
+def test__validate_precision():
+    """Test that `_validate_precision` only accepts the supported float dtypes."""
+    # Setup
+    expected_message = re.escape(
+        "Invalid value 'float16' for parameter 'precision'. Please provide one of "
+        "['float64', 'float32']."
+    )
+
+    # Run and Assert
+    _validate_precision('float64')
+    _validate_precision('float32')
+    with pytest.raises(SynthesizerInputError, match=expected_message):
+        _validate_precision('float16')
+
+
+def test__cast_float_columns():
+    """Test that only the columns with the source dtype are cast."""
+    # Setup
+    data = pd.DataFrame({
+        'float64': [1.5, 2.5],
+        'float32': np.array([1.5, 2.5], dtype=np.float32),
+        'int': [1, 2],
+        'object': ['a', 'b'],
+    })
+
+    # Run
+    result = _cast_float_columns(data, 'float64', 'float32')
+    same_dtype = _cast_float_columns(data, 'float64', 'float64')
+    no_columns = _cast_float_columns(data[['int']], 'float64', 'float32')
+
+    # Assert
+    expected = data.astype({'float64': np.float32})
+    pd.testing.assert_frame_equal(result, expected)
+    assert same_dtype is data
+    pd.testing.assert_frame_equal(no_columns, data[['int']])
+
+
+def test__share_dataframe():
+    """Test that the numerical columns are read from shared memory until leaving the context."""
+    # Setup
+    data = pd.DataFrame(
+        {
+            'float': [1.5, 2.5, 3.5],
+            'int': [1, 2, 3],
+            'bool': [True, False, True],
+            'object': ['a', 'b', 'c'],
+            'nullable': pd.array([1, None, 3], dtype='Int64'),
+        },
+        index=[7, 8, 9],
+    )
+
+    # Run
+    with _share_dataframe(data) as description:
+        with _read_shared_dataframe(description) as result:
+            expected = data.reset_index(drop=True)
+            pd.testing.assert_frame_equal(result, expected)
+            assert not result['float'].to_numpy().flags.owndata
+            del result
+
+        names = [name for _, name, _ in description['columns'] if name is not None]
+
+    # Assert
+    assert len(names) == 3
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)